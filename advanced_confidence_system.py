@@ -19,6 +19,7 @@ import math
 from collections import defaultdict
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from text_statistics import RequestTextStatistics, TextStatistics, ensure_statistics
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -135,37 +136,54 @@ class AdvancedConfidenceSystem:
                                 statement: str, 
                                 context: str = "", 
                                 analysis_result: Dict[str, Any] = None,
-                                validation_result: Dict[str, Any] = None) -> ConfidenceScore:
-        """신뢰도 평가"""
+                                validation_result: Dict[str, Any] = None,
+                                stats: Optional[RequestTextStatistics] = None) -> ConfidenceScore:
+        """신뢰도 평가 (평가기는 모두 CPU 연산이라 I/O 대기 없이 동기 경로로 실행)"""
+        return self.evaluate_confidence_sync(statement, context, analysis_result, validation_result, stats)
+    
+    def evaluate_confidence_sync(self, 
+                                 statement: str, 
+                                 context: str = "", 
+                                 analysis_result: Dict[str, Any] = None,
+                                 validation_result: Dict[str, Any] = None,
+                                 stats: Optional[RequestTextStatistics] = None) -> ConfidenceScore:
+        """
+        신뢰도 평가 (이벤트 루프 없이 호출 가능한 동기 버전)
+        
+        Args:
+            stats: 문장/문맥 분할 통계 (입력 검증과 공유, 없으면 새로 계산)
+        """
         start_time = datetime.now()
         
         try:
+            stats = ensure_statistics(stats, statement, context)
+            
             # 각 소스별 신뢰도 평가
             source_scores = {}
             
             # 1. 입력 검증 신뢰도
-            source_scores[ConfidenceSource.INPUT_VALIDATION] = await self._evaluate_input_validation(validation_result)
+            source_scores[ConfidenceSource.INPUT_VALIDATION] = self._evaluate_input_validation(validation_result)
             
             # 2. 내용 분석 신뢰도
-            source_scores[ConfidenceSource.CONTENT_ANALYSIS] = await self._evaluate_content_analysis(statement, analysis_result)
+            source_scores[ConfidenceSource.CONTENT_ANALYSIS] = self._evaluate_content_analysis(statement, analysis_result, stats.statement)
             
             # 3. 맥락 관련성 신뢰도
-            source_scores[ConfidenceSource.CONTEXT_RELEVANCE] = await self._evaluate_context_relevance(statement, context)
+            source_scores[ConfidenceSource.CONTEXT_RELEVANCE] = self._evaluate_context_relevance(statement, context, stats)
             
             # 4. 처리 성공 신뢰도
-            source_scores[ConfidenceSource.PROCESSING_SUCCESS] = await self._evaluate_processing_success(analysis_result)
+            source_scores[ConfidenceSource.PROCESSING_SUCCESS] = self._evaluate_processing_success(analysis_result)
             
             # 5. 응답 품질 신뢰도
-            source_scores[ConfidenceSource.RESPONSE_QUALITY] = await self._evaluate_response_quality(statement, analysis_result)
+            source_scores[ConfidenceSource.RESPONSE_QUALITY] = self._evaluate_response_quality(statement, analysis_result, stats.statement)
             
             # 6. 일관성 신뢰도
-            source_scores[ConfidenceSource.CONSISTENCY] = await self._evaluate_consistency(statement, analysis_result)
+            source_scores[ConfidenceSource.CONSISTENCY] = self._evaluate_consistency(statement, analysis_result)
             
             # 7. 전문성 신뢰도
-            source_scores[ConfidenceSource.EXPERTISE] = await self._evaluate_expertise(statement, context)
+            source_scores[ConfidenceSource.EXPERTISE] = self._evaluate_expertise(statement, context)
             
             # 8. 증거 신뢰도
-            source_scores[ConfidenceSource.EVIDENCE] = await self._evaluate_evidence(statement, analysis_result)
+            source_scores[ConfidenceSource.EVIDENCE] = self._evaluate_evidence(statement, analysis_result)
             
             # 전체 신뢰도 계산
             overall_confidence = self._calculate_overall_confidence(source_scores)
@@ -203,7 +221,7 @@ class AdvancedConfidenceSystem:
                 processing_time=processing_time
             )
     
-    async def _evaluate_input_validation(self, validation_result: Dict[str, Any]) -> float:
+    def _evaluate_input_validation(self, validation_result: Dict[str, Any]) -> float:
         """입력 검증 신뢰도 평가"""
         if not validation_result:
             return 0.5  # 중간값
@@ -219,7 +237,8 @@ class AdvancedConfidenceSystem:
         
         return max(0.0, min(1.0, base_score - error_penalty - warning_penalty))
     
-    async def _evaluate_content_analysis(self, statement: str, analysis_result: Dict[str, Any]) -> float:
+    def _evaluate_content_analysis(self, statement: str, analysis_result: Dict[str, Any],
+                                   statement_stats: Optional[TextStatistics] = None) -> float:
         """내용 분석 신뢰도 평가"""
         if not analysis_result:
             return 0.5
@@ -229,19 +248,21 @@ class AdvancedConfidenceSystem:
         confidence = analysis_result.get('final_analysis', {}).get('confidence', 0.5)
         
         # 내용 품질 평가
-        content_quality = self._assess_content_quality(statement)
+        content_quality = self._assess_content_quality(statement, statement_stats)
         
         # 종합 점수 계산
         return (truth_percentage * 0.4 + confidence * 0.3 + content_quality * 0.3)
     
-    async def _evaluate_context_relevance(self, statement: str, context: str) -> float:
+    def _evaluate_context_relevance(self, statement: str, context: str,
+                                    stats: Optional[RequestTextStatistics] = None) -> float:
         """맥락 관련성 신뢰도 평가"""
         if not context:
             return 0.7  # 맥락이 없으면 중간값
         
         # 단어 유사도 계산
-        statement_words = set(statement.lower().split())
-        context_words = set(context.lower().split())
+        stats = ensure_statistics(stats, statement, context)
+        statement_words = stats.statement.lower_word_set
+        context_words = stats.context.lower_word_set
         
         if not statement_words or not context_words:
             return 0.5
@@ -256,7 +277,7 @@ class AdvancedConfidenceSystem:
         
         return (jaccard_similarity * 0.6 + semantic_relevance * 0.4)
     
-    async def _evaluate_processing_success(self, analysis_result: Dict[str, Any]) -> float:
+    def _evaluate_processing_success(self, analysis_result: Dict[str, Any]) -> float:
         """처리 성공 신뢰도 평가"""
         if not analysis_result:
             return 0.0
@@ -270,10 +291,11 @@ class AdvancedConfidenceSystem:
         
         return max(0.0, min(1.0, completeness_score - error_penalty))
     
-    async def _evaluate_response_quality(self, statement: str, analysis_result: Dict[str, Any]) -> float:
+    def _evaluate_response_quality(self, statement: str, analysis_result: Dict[str, Any],
+                                   statement_stats: Optional[TextStatistics] = None) -> float:
         """응답 품질 신뢰도 평가"""
         # 문장 구조 품질
-        structure_quality = self._assess_structure_quality(statement)
+        structure_quality = self._assess_structure_quality(statement, statement_stats)
         
         # 분석 결과의 상세도
         detail_quality = self._assess_detail_quality(analysis_result)
@@ -283,7 +305,7 @@ class AdvancedConfidenceSystem:
         
         return (structure_quality * 0.4 + detail_quality * 0.3 + correction_quality * 0.3)
     
-    async def _evaluate_consistency(self, statement: str, analysis_result: Dict[str, Any]) -> float:
+    def _evaluate_consistency(self, statement: str, analysis_result: Dict[str, Any]) -> float:
         """일관성 신뢰도 평가"""
         # 이전 분석 결과와의 일관성
         statement_hash = hash(statement)
@@ -308,7 +330,7 @@ class AdvancedConfidenceSystem:
         
         return consistency_score
     
-    async def _evaluate_expertise(self, statement: str, context: str) -> float:
+    def _evaluate_expertise(self, statement: str, context: str) -> float:
         """전문성 신뢰도 평가"""
         expertise_score = 0.0
         total_patterns = 0
@@ -323,7 +345,7 @@ class AdvancedConfidenceSystem:
         
         return expertise_score / len(self.expertise_patterns) if self.expertise_patterns else 0.5
     
-    async def _evaluate_evidence(self, statement: str, analysis_result: Dict[str, Any]) -> float:
+    def _evaluate_evidence(self, statement: str, analysis_result: Dict[str, Any]) -> float:
         """증거 신뢰도 평가"""
         evidence_score = 0.0
         
@@ -344,23 +366,24 @@ class AdvancedConfidenceSystem:
         
         return min(1.0, evidence_score)
     
-    def _assess_content_quality(self, statement: str) -> float:
+    def _assess_content_quality(self, statement: str, statement_stats: Optional[TextStatistics] = None) -> float:
         """내용 품질 평가"""
-        if not statement.strip():
+        if statement_stats is None or statement_stats.text != statement:
+            statement_stats = TextStatistics.of(statement)
+        if not statement_stats.stripped:
             return 0.0
         
         quality_score = 0.5  # 기본 점수
         
         # 길이 적절성
-        word_count = len(statement.split())
+        word_count = statement_stats.word_count
         if 5 <= word_count <= 100:
             quality_score += 0.2
         elif word_count > 100:
             quality_score += 0.1
         
         # 문장 구조
-        sentences = re.split(r'[.!?]+', statement)
-        if len(sentences) > 1:
+        if len(statement_stats.sentences) > 1:
             quality_score += 0.1
         
         # 특수문자 사용
@@ -395,26 +418,28 @@ class AdvancedConfidenceSystem:
         
         return present_fields / len(required_fields)
     
-    def _assess_structure_quality(self, statement: str) -> float:
+    def _assess_structure_quality(self, statement: str, statement_stats: Optional[TextStatistics] = None) -> float:
         """구조 품질 평가"""
-        if not statement.strip():
+        if statement_stats is None or statement_stats.text != statement:
+            statement_stats = TextStatistics.of(statement)
+        if not statement_stats.stripped:
             return 0.0
         
         quality_score = 0.5
         
         # 문장 끝 마침표
-        if statement.strip().endswith(('.', '!', '?')):
+        if statement_stats.ends_with_terminal:
             quality_score += 0.2
         
         # 적절한 길이
-        word_count = len(statement.split())
+        word_count = statement_stats.word_count
         if 3 <= word_count <= 50:
             quality_score += 0.2
         elif word_count > 50:
             quality_score += 0.1
         
         # 문장 시작 대문자
-        if statement.strip()[0].isupper():
+        if statement_stats.stripped[0].isupper():
             quality_score += 0.1
         
         return min(1.0, quality_score)
@@ -522,6 +547,27 @@ class AdvancedConfidenceSystem:
         
         return recommendations
 
+def validate_and_score(validation_system, confidence_system, request,
+                       analysis_result: Dict[str, Any] = None) -> Tuple[Any, ConfidenceScore]:
+    """
+    입력 검증과 신뢰도 평가를 한 단계로 실행 (공통 텍스트 통계는 한 번만 계산)
+    
+    Args:
+        validation_system: AdvancedValidationSystem
+        confidence_system: AdvancedConfidenceSystem
+        request: AnalysisRequest
+        analysis_result: 신뢰도 평가에 쓸 분석 결과
+    
+    Returns:
+        (ValidationResult, ConfidenceScore)
+    """
+    stats = RequestTextStatistics.compute(request.statement, request.context)
+    validation_result = validation_system.validate_request_sync(request, stats)
+    confidence_score = confidence_system.evaluate_confidence_sync(
+        request.statement, request.context, analysis_result, validation_result.__dict__, stats
+    )
+    return validation_result, confidence_score
+
 def main():
     """메인 실행 함수"""
     print("🔍 고급 신뢰도 평가 시스템 테스트")
@@ -17,14 +17,13 @@ from sklearn.svm import SVC
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 from sklearn.preprocessing import StandardScaler
-import torch
-from transformers import AutoTokenizer, AutoModel, pipeline
 import logging
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 import joblib
 import os
 import json
+import threading
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -33,13 +32,32 @@ logger = logging.getLogger(__name__)
 class AdvancedMLDetector:
     """고급 머신러닝 기반 거짓말 탐지기"""
     
-    def __init__(self):
+    def __init__(self, lazy_bert: bool = False, embedding_backend: str = 'torch',
+                 embedding_threads: Optional[int] = None, embedding_batch_size: int = 32,
+                 embedding_max_wait_ms: float = 5.0):
+        """
+        Args:
+            lazy_bert: True 이면 BERT 모델(torch/transformers)을 생성 시점이 아니라
+                       임베딩이 처음 필요할 때 로드
+            embedding_backend: 임베딩 추론 백엔드 ('torch', 'torch-int8', 'onnx')
+            embedding_threads: CPU 추론 스레드 수 (None 이면 라이브러리 기본값)
+            embedding_batch_size: 마이크로 배치 최대 크기
+            embedding_max_wait_ms: 마이크로 배치를 채우기 위한 최대 대기 시간 (밀리초)
+        """
         self.models = {}
         self.vectorizer = None
         self.scaler = StandardScaler()
         self.tokenizer = None
         self.bert_model = None
         self.bert_pipeline = None
+        self.lazy_bert = lazy_bert
+        self.embedding_backend = embedding_backend
+        self.embedding_threads = embedding_threads
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_max_wait_ms = embedding_max_wait_ms
+        self.embedding_service = None
+        self._bert_initialized = False
+        self._bert_lock = threading.Lock()
         self.model_weights = {
             'random_forest': 0.25,
             'gradient_boosting': 0.25,
@@ -91,7 +109,8 @@ class AdvancedMLDetector:
             )
             
             # BERT 모델 초기화
-            self.initialize_bert_model()
+            if not self.lazy_bert:
+                self.initialize_bert_model()
             
             logger.info("모든 모델이 성공적으로 초기화되었습니다.")
             
@@ -106,6 +125,9 @@ class AdvancedMLDetector:
     def initialize_bert_model(self):
         """BERT 모델 초기화"""
         try:
+            import torch
+            from transformers import AutoTokenizer, AutoModel, pipeline
+            
             # 한국어 BERT 모델 사용
             model_name = "klue/bert-base"
             self.tokenizer = AutoTokenizer.from_pretrained(model_name)
@@ -119,12 +141,17 @@ class AdvancedMLDetector:
                 device=0 if torch.cuda.is_available() else -1
             )
             
+            # 마이크로 배치 + 메모리 맵 캐시 임베딩 서비스
+            self.embedding_service = self.create_embedding_service(model_name)
+            
             logger.info("BERT 모델이 성공적으로 초기화되었습니다.")
             
         except Exception as e:
             logger.warning(f"BERT 모델 초기화 실패: {str(e)}")
             logger.warning("BERT 없이 전통적인 ML 모델만 사용합니다.")
             self.bert_pipeline = None
+        finally:
+            self._bert_initialized = True
     
     def generate_synthetic_data(self, num_samples=1000):
         """합성 학습 데이터 생성"""
@@ -259,25 +286,48 @@ class AdvancedMLDetector:
         
         return pd.DataFrame(features)
     
+    def ensure_bert_model(self):
+        """BERT 모델이 아직 로드되지 않았으면 한 번만 로드"""
+        if self._bert_initialized:
+            return
+        with self._bert_lock:
+            if not self._bert_initialized:
+                self.initialize_bert_model()
+    
+    def create_embedding_service(self, model_name):
+        """설정된 백엔드로 임베딩 서비스 생성 (ONNX 를 쓸 수 없으면 torch 로 대체)"""
+        from embedding_service import EmbeddingService, EmbeddingStore, OnnxBackend, TorchBackend
+        
+        backend = None
+        if self.embedding_backend == 'onnx':
+            try:
+                backend = OnnxBackend(self.tokenizer, os.path.join(self.model_path, "bert.onnx"),
+                                      num_threads=self.embedding_threads)
+            except Exception as e:
+                logger.warning(f"ONNX 백엔드를 사용할 수 없어 torch 로 대체합니다: {str(e)}")
+        if backend is None:
+            backend = TorchBackend(self.tokenizer, self.bert_model, num_threads=self.embedding_threads,
+                                   quantize=self.embedding_backend == 'torch-int8')
+        
+        store = EmbeddingStore(os.path.join(self.model_path, "bert_embeddings.npy"),
+                               dim=self.bert_model.config.hidden_size)
+        return EmbeddingService(
+            backend,
+            store=store,
+            model_name=f"{model_name}:{backend.name}",
+            dim=self.bert_model.config.hidden_size,
+            max_batch_size=self.embedding_batch_size,
+            max_wait_ms=self.embedding_max_wait_ms
+        )
+    
     def get_bert_embeddings(self, texts):
-        """BERT 임베딩 추출"""
-        if self.bert_pipeline is None:
+        """BERT 임베딩 추출 (동시 요청은 마이크로 배치로 묶고, 계산된 벡터는 캐시)"""
+        self.ensure_bert_model()
+        if self.bert_pipeline is None or self.embedding_service is None:
             return np.zeros((len(texts), 768))  # BERT 기본 차원
         
         try:
-            embeddings = []
-            for text in texts:
-                # BERT 토크나이저로 토큰화
-                inputs = self.tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
-                
-                # BERT 모델로 임베딩 추출
-                with torch.no_grad():
-                    outputs = self.bert_model(**inputs)
-                    # [CLS] 토큰의 임베딩 사용
-                    embedding = outputs.last_hidden_state[:, 0, :].numpy()
-                    embeddings.append(embedding[0])
-            
-            return np.array(embeddings)
+            return self.embedding_service.embed(list(texts))
             
         except Exception as e:
             logger.warning(f"BERT 임베딩 추출 실패: {str(e)}")
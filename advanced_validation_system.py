@@ -10,7 +10,7 @@ ChatGPT/Claude 수준의 입력 검증, 오류 처리, 신뢰도 평가를 제
 import re
 import json
 import logging
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Dict, List, Tuple, Optional, Any, Sequence, Union
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -18,6 +18,7 @@ import hashlib
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import traceback
+from text_statistics import RequestTextStatistics, ensure_statistics
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -162,32 +163,46 @@ class AdvancedValidationSystem:
             ]
         }
     
-    async def validate_request(self, request: AnalysisRequest) -> ValidationResult:
-        """요청 검증"""
+    async def validate_request(self, request: AnalysisRequest,
+                               stats: Optional[RequestTextStatistics] = None) -> ValidationResult:
+        """요청 검증 (하위 검증기는 모두 CPU 연산이라 I/O 대기 없이 동기 경로로 실행)"""
+        return self.validate_request_sync(request, stats)
+    
+    def validate_request_sync(self, request: AnalysisRequest,
+                              stats: Optional[RequestTextStatistics] = None) -> ValidationResult:
+        """
+        요청 검증 (이벤트 루프 없이 호출 가능한 동기 버전)
+        
+        Args:
+            request: 분석 요청
+            stats: 문장/문맥 분할 통계 (신뢰도 평가와 공유, 없으면 새로 계산)
+        """
         start_time = datetime.now()
         errors = []
         warnings = []
         suggestions = []
         
         try:
+            stats = ensure_statistics(stats, request.statement, request.context)
+            
             # 1. 기본 검증
-            basic_validation = await self._validate_basic(request)
+            basic_validation = self._validate_basic(request, stats)
             errors.extend(basic_validation['errors'])
             warnings.extend(basic_validation['warnings'])
             suggestions.extend(basic_validation['suggestions'])
             
             # 2. 보안 검증
-            security_validation = await self._validate_security(request)
+            security_validation = self._validate_security(request)
             errors.extend(security_validation['errors'])
             warnings.extend(security_validation['warnings'])
             
             # 3. 내용 품질 검증
-            content_validation = await self._validate_content_quality(request)
+            content_validation = self._validate_content_quality(request, stats)
             warnings.extend(content_validation['warnings'])
             suggestions.extend(content_validation['suggestions'])
             
             # 4. 맥락 관련성 검증
-            context_validation = await self._validate_context_relevance(request)
+            context_validation = self._validate_context_relevance(request, stats)
             warnings.extend(context_validation['warnings'])
             suggestions.extend(context_validation['suggestions'])
             
@@ -224,7 +239,7 @@ class AdvancedValidationSystem:
                 timestamp=datetime.now()
             )
     
-    async def _validate_basic(self, request: AnalysisRequest) -> Dict[str, List[str]]:
+    def _validate_basic(self, request: AnalysisRequest, stats: RequestTextStatistics) -> Dict[str, List[str]]:
         """기본 검증"""
         errors = []
         warnings = []
@@ -250,7 +265,7 @@ class AdvancedValidationSystem:
         
         # 문장 품질 검증
         if request.validation_level in [ValidationLevel.STRICT, ValidationLevel.ENTERPRISE]:
-            quality_issues = self._check_content_quality(request.statement)
+            quality_issues = self._check_content_quality(request.statement, stats.statement.words)
             warnings.extend(quality_issues)
         
         return {
@@ -259,7 +274,7 @@ class AdvancedValidationSystem:
             'suggestions': suggestions
         }
     
-    async def _validate_security(self, request: AnalysisRequest) -> Dict[str, List[str]]:
+    def _validate_security(self, request: AnalysisRequest) -> Dict[str, List[str]]:
         """보안 검증"""
         errors = []
         warnings = []
@@ -282,20 +297,19 @@ class AdvancedValidationSystem:
             'warnings': warnings
         }
     
-    async def _validate_content_quality(self, request: AnalysisRequest) -> Dict[str, List[str]]:
+    def _validate_content_quality(self, request: AnalysisRequest, stats: RequestTextStatistics) -> Dict[str, List[str]]:
         """내용 품질 검증"""
         warnings = []
         suggestions = []
         
         # 문장 구조 검증
-        if not request.statement.strip().endswith(('.', '!', '?')):
+        if not stats.statement.ends_with_terminal:
             warnings.append("문장이 적절한 마침표로 끝나지 않았습니다.")
             suggestions.append("문장 끝에 마침표(.), 느낌표(!), 또는 물음표(?)를 추가해주세요.")
         
         # 중복 단어 검증
-        words = request.statement.lower().split()
         word_count = {}
-        for word in words:
+        for word in stats.statement.lower_words:
             word_count[word] = word_count.get(word, 0) + 1
         
         for word, count in word_count.items():
@@ -304,8 +318,7 @@ class AdvancedValidationSystem:
                 suggestions.append("반복되는 단어를 줄여보세요.")
         
         # 문장 길이 검증
-        sentences = re.split(r'[.!?]+', request.statement)
-        for i, sentence in enumerate(sentences):
+        for i, sentence in enumerate(stats.statement.sentences):
             if len(sentence.split()) > 50:
                 warnings.append(f"{i+1}번째 문장이 너무 깁니다 ({len(sentence.split())}단어).")
                 suggestions.append("긴 문장을 여러 개의 짧은 문장으로 나누어보세요.")
@@ -315,15 +328,15 @@ class AdvancedValidationSystem:
             'suggestions': suggestions
         }
     
-    async def _validate_context_relevance(self, request: AnalysisRequest) -> Dict[str, List[str]]:
+    def _validate_context_relevance(self, request: AnalysisRequest, stats: RequestTextStatistics) -> Dict[str, List[str]]:
         """맥락 관련성 검증"""
         warnings = []
         suggestions = []
         
         # 문맥과 문장의 관련성 검증
         if request.context and request.statement:
-            context_words = set(request.context.lower().split())
-            statement_words = set(request.statement.lower().split())
+            context_words = stats.context.lower_word_set
+            statement_words = stats.statement.lower_word_set
             
             # 공통 단어 비율 계산
             common_words = context_words.intersection(statement_words)
@@ -339,8 +352,8 @@ class AdvancedValidationSystem:
             'suggestions': suggestions
         }
     
-    def _check_content_quality(self, text: str) -> List[str]:
-        """내용 품질 검사"""
+    def _check_content_quality(self, text: str, words: Optional[Sequence[str]] = None) -> List[str]:
+        """내용 품질 검사 (words: 미리 분할한 단어, 없으면 text.split())"""
         issues = []
         
         # 빈 문장 검사
@@ -352,7 +365,8 @@ class AdvancedValidationSystem:
             issues.append("내용이 너무 단조롭습니다.")
         
         # 의미 있는 단어 비율 검사
-        words = text.split()
+        if words is None:
+            words = text.split()
         meaningful_words = [w for w in words if len(w) > 2 and w.isalpha()]
         if len(meaningful_words) / len(words) < 0.5:
             issues.append("의미 있는 단어의 비율이 낮습니다.")
@@ -7,7 +7,6 @@ AI 고급 웹 연구원
 실제 웹 검색을 수행하고 진실성을 검증하여 질문에 답변하는 고급 시스템입니다.
 """
 
-import requests
 import re
 import json
 import time
@@ -16,9 +15,12 @@ from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
 from urllib.parse import quote, urljoin, urlparse
-from bs4 import BeautifulSoup
 import random
 import hashlib
+from page_cache import PageCache, default_page_cache
+from research_http import HTTPPool, default_pool
+from research_common import ResearcherBase
+from search_index import SearchBackend
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -60,10 +62,19 @@ class ResearchAnswer:
     limitations: List[str]
     timestamp: datetime
 
-class AIAdvancedResearcher:
+class AIAdvancedResearcher(ResearcherBase):
     """AI 고급 웹 연구원"""
     
-    def __init__(self):
+    search_result_type = WebSearchResult
+    
+    def __init__(self, http_pool: Optional[HTTPPool] = None, page_cache: Optional[PageCache] = None,
+                 search_backends: Optional[Dict[str, SearchBackend]] = None, offline: Optional[bool] = None):
+        # 페이지 요청이 공유하는 연결 풀 (도메인별 요청 속도 조절 포함)과 디스크 캐시
+        self.http_pool = http_pool or default_pool()
+        self.page_cache = page_cache or default_page_cache()
+        
+        self._init_search_backends(search_backends, offline)
+        
         # 신뢰할 수 있는 소스들
         self.credible_sources = {
             'academic': [
@@ -289,17 +300,22 @@ class AIAdvancedResearcher:
         results = []
         
         # 실제 검색 엔진들 시뮬레이션
-        search_engines = ['google', 'bing', 'duckduckgo']
+        search_engines = [] if self.offline else ['google', 'bing', 'duckduckgo']
         
         for engine in search_engines:
             try:
                 engine_results = self._search_with_engine(engine, query, max_results)
                 results.extend(engine_results)
-                time.sleep(0.5)  # 요청 간격 조절
             except Exception as e:
                 logger.warning(f"{engine} 검색 실패: {e}")
                 continue
         
+        for name, backend in self.search_backends.items():
+            try:
+                results.extend(self._search_backend(backend, query, max_results))
+            except Exception as e:
+                logger.warning(f"{name} 검색 실패: {e}")
+        
         return results
     
     def _search_with_engine(self, engine: str, query: str, max_results: int) -> List[WebSearchResult]:
@@ -448,17 +464,9 @@ class AIAdvancedResearcher:
     def _fetch_web_content(self, url: str) -> str:
         """웹 페이지 내용 가져오기"""
         try:
-            # 실제로는 requests를 사용하여 웹 페이지를 가져옴
-            # 여기서는 시뮬레이션
-            response = requests.get(url, headers=self.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 텍스트 추출
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            text = soup.get_text()
-            return text[:2000]  # 처음 2000자만 사용
+            # 같은 URL 은 디스크 캐시에서 (신선하면 요청/파싱 없이, 오래됐으면 ETag/Last-Modified 재검증)
+            return self.page_cache.fetch_text(self.http_pool, url, self._extract_text, 'lxml-2000',
+                                              headers=self.headers, read=self._read_text)
             
         except Exception as e:
             logger.warning(f"웹 페이지 가져오기 실패 {url}: {e}")
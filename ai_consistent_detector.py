@@ -11,9 +11,11 @@ import hashlib
 import json
 import re
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
 import logging
+from pattern_index import get_pattern_index
+from shared_cache import TwoTierCache
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -35,7 +37,7 @@ class ConsistentAnalysisResult:
 class AIConsistentDetector:
     """AI 일관성 있는 진실성 탐지기"""
     
-    def __init__(self):
+    def __init__(self, result_cache: Optional[TwoTierCache] = None):
         # 결정론적 패턴들
         self.truth_patterns = {
             'scientific_facts': [
@@ -82,27 +84,55 @@ class AIConsistentDetector:
             (r'절대.*상대적', 0.2, '모순된 표현')
         ]
         
-        # 결과 캐시
-        self.result_cache = {}
+        # 패턴 인덱스 (테이블별 단일 스캔)
+        self.truth_pattern_index = get_pattern_index(
+            {category: [row[0] for row in rows] for category, rows in self.truth_patterns.items()}
+        )
+        self.penalty_pattern_index = get_pattern_index({
+            'exaggeration': [row[0] for row in self.exaggeration_patterns],
+            'contradiction': [row[0] for row in self.contradiction_patterns]
+        })
+        
+        # 결과 캐시 (프로세스 내 LRU + 선택적 Redis, 키는 정규화된 문장 해시)
+        self.result_cache = result_cache if result_cache is not None else TwoTierCache(namespace='ai_truth:consistent:v1')
     
     def analyze_statement(self, statement: str, context: str = "") -> ConsistentAnalysisResult:
         """일관성 있는 문장 분석"""
         # 문장 해시 생성 (일관성 보장)
         statement_hash = self._generate_statement_hash(statement, context)
         
-        # 캐시에서 결과 확인
-        if statement_hash in self.result_cache:
-            cached_result = self.result_cache[statement_hash]
-            logger.info(f"캐시에서 결과 반환: {statement_hash[:8]}...")
-            return cached_result
-        
-        # 새로운 분석 수행
-        result = self._perform_consistent_analysis(statement, context, statement_hash)
-        
-        # 결과 캐시에 저장
-        self.result_cache[statement_hash] = result
-        
-        return result
+        # 캐시에서 결과 확인, 없으면 분석 (동시 요청은 한 번만 분석)
+        cached = self.result_cache.get_or_compute(
+            statement_hash,
+            lambda: self._result_to_dict(self._perform_consistent_analysis(statement, context, statement_hash))
+        )
+        return self._result_from_dict(cached)
+    
+    def analyze_statements(self, statements: List[str], context: str = "") -> List[ConsistentAnalysisResult]:
+        """여러 문장 일괄 분석 (캐시는 한 번의 다중 조회/저장으로 처리)"""
+        hashes = [self._generate_statement_hash(statement, context) for statement in statements]
+        cached = self.result_cache.get_many(hashes)
+        
+        computed = {}
+        for statement, statement_hash in zip(statements, hashes):
+            if cached[statement_hash] is None and statement_hash not in computed:
+                result = self._perform_consistent_analysis(statement, context, statement_hash)
+                computed[statement_hash] = self._result_to_dict(result)
+        if computed:
+            self.result_cache.set_many(computed)
+        
+        return [self._result_from_dict(cached[h] or computed[h]) for h in hashes]
+    
+    def _result_to_dict(self, result: ConsistentAnalysisResult) -> Dict[str, Any]:
+        """캐시 저장용 직렬화 가능한 딕셔너리"""
+        data = asdict(result)
+        data['analysis_timestamp'] = result.analysis_timestamp.isoformat()
+        return data
+    
+    def _result_from_dict(self, data: Dict[str, Any]) -> ConsistentAnalysisResult:
+        return ConsistentAnalysisResult(
+            **{**data, 'analysis_timestamp': datetime.fromisoformat(data['analysis_timestamp'])}
+        )
     
     def _generate_statement_hash(self, statement: str, context: str) -> str:
         """문장 해시 생성 (일관성 보장)"""
@@ -135,23 +165,27 @@ class AIConsistentDetector:
     
     def _perform_consistent_analysis(self, statement: str, context: str, statement_hash: str) -> ConsistentAnalysisResult:
         """일관성 있는 분석 수행"""
+        # 모든 사실 패턴을 한 번에 스캔
+        truth_hits = self.truth_pattern_index.scan(statement)
+        penalty_hits = self.penalty_pattern_index.scan(statement)
+        
         # 1. 과학적 사실 검증
-        scientific_score = self._check_scientific_facts(statement)
+        scientific_score = self._check_scientific_facts(statement, truth_hits)
         
         # 2. 수학적 사실 검증
-        mathematical_score = self._check_mathematical_facts(statement)
+        mathematical_score = self._check_mathematical_facts(statement, truth_hits)
         
         # 3. 역사적 사실 검증
-        historical_score = self._check_historical_facts(statement)
+        historical_score = self._check_historical_facts(statement, truth_hits)
         
         # 4. 거짓 문장 검증
-        false_score = self._check_false_statements(statement)
+        false_score = self._check_false_statements(statement, truth_hits)
         
         # 5. 과장 표현 검증
-        exaggeration_penalty = self._check_exaggeration(statement)
+        exaggeration_penalty = self._check_exaggeration(statement, penalty_hits)
         
         # 6. 모순 표현 검증
-        contradiction_penalty = self._check_contradiction(statement)
+        contradiction_penalty = self._check_contradiction(statement, penalty_hits)
         
         # 7. 최종 점수 계산 (결정론적)
         base_score = max(scientific_score, mathematical_score, historical_score)
@@ -185,48 +219,45 @@ class AIConsistentDetector:
             analysis_method="deterministic_pattern_matching"
         )
     
-    def _check_scientific_facts(self, statement: str) -> float:
+    def _check_scientific_facts(self, statement: str, truth_hits: Optional[List] = None) -> float:
         """과학적 사실 검증"""
-        for pattern, score, correction in self.truth_patterns['scientific_facts']:
-            if re.search(pattern, statement, re.IGNORECASE):
-                return score
-        return 0.5  # 중립 점수
+        return self._first_fact_score(statement, 'scientific_facts', truth_hits)
     
-    def _check_mathematical_facts(self, statement: str) -> float:
+    def _check_mathematical_facts(self, statement: str, truth_hits: Optional[List] = None) -> float:
         """수학적 사실 검증"""
-        for pattern, score, correction in self.truth_patterns['mathematical_facts']:
-            if re.search(pattern, statement, re.IGNORECASE):
-                return score
-        return 0.5  # 중립 점수
+        return self._first_fact_score(statement, 'mathematical_facts', truth_hits)
     
-    def _check_historical_facts(self, statement: str) -> float:
+    def _check_historical_facts(self, statement: str, truth_hits: Optional[List] = None) -> float:
         """역사적 사실 검증"""
-        for pattern, score, correction in self.truth_patterns['historical_facts']:
-            if re.search(pattern, statement, re.IGNORECASE):
-                return score
-        return 0.5  # 중립 점수
+        return self._first_fact_score(statement, 'historical_facts', truth_hits)
     
-    def _check_false_statements(self, statement: str) -> float:
+    def _check_false_statements(self, statement: str, truth_hits: Optional[List] = None) -> float:
         """거짓 문장 검증"""
-        for pattern, score, correction in self.truth_patterns['false_statements']:
-            if re.search(pattern, statement, re.IGNORECASE):
-                return score
+        return self._first_fact_score(statement, 'false_statements', truth_hits)
+    
+    def _first_fact_score(self, statement: str, category: str, truth_hits: Optional[List] = None) -> float:
+        """범주 내 첫 번째로 매칭된 사실 패턴의 점수"""
+        if truth_hits is None:
+            truth_hits = self.truth_pattern_index.scan(statement)
+        for entry in truth_hits:
+            if entry.key == category:
+                return self.truth_patterns[category][entry.position][1]
         return 0.5  # 중립 점수
     
-    def _check_exaggeration(self, statement: str) -> float:
+    def _check_exaggeration(self, statement: str, penalty_hits: Optional[List] = None) -> float:
         """과장 표현 검증"""
-        total_penalty = 0.0
-        for pattern, penalty, description in self.exaggeration_patterns:
-            if re.search(pattern, statement, re.IGNORECASE):
-                total_penalty += penalty
-        return min(0.5, total_penalty)  # 최대 0.5 패널티
+        return self._sum_penalties(statement, 'exaggeration', self.exaggeration_patterns, penalty_hits)
     
-    def _check_contradiction(self, statement: str) -> float:
+    def _check_contradiction(self, statement: str, penalty_hits: Optional[List] = None) -> float:
         """모순 표현 검증"""
-        total_penalty = 0.0
-        for pattern, penalty, description in self.contradiction_patterns:
-            if re.search(pattern, statement, re.IGNORECASE):
-                total_penalty += penalty
+        return self._sum_penalties(statement, 'contradiction', self.contradiction_patterns, penalty_hits)
+    
+    def _sum_penalties(self, statement: str, category: str, rows: List[Tuple[str, float, str]],
+                       penalty_hits: Optional[List] = None) -> float:
+        """범주 내 매칭된 패턴의 패널티 합계"""
+        if penalty_hits is None:
+            penalty_hits = self.penalty_pattern_index.scan(statement)
+        total_penalty = sum(rows[entry.position][1] for entry in penalty_hits if entry.key == category)
         return min(0.5, total_penalty)  # 최대 0.5 패널티
     
     def _generate_corrected_statement(self, statement: str, base_score: float, exaggeration_penalty: float, contradiction_penalty: float) -> str:
@@ -268,11 +299,14 @@ class AIConsistentDetector:
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 반환"""
+        stats = self.result_cache.stats()
+        cache_hits = stats['local_hits'] + stats['redis_hits']
         return {
             'cache_size': len(self.result_cache),
-            'cache_hit_rate': getattr(self, '_cache_hits', 0) / max(1, getattr(self, '_total_requests', 1)),
-            'total_requests': getattr(self, '_total_requests', 0),
-            'cache_hits': getattr(self, '_cache_hits', 0)
+            'cache_hit_rate': stats['hit_rate'],
+            'total_requests': cache_hits + stats['misses'],
+            'cache_hits': cache_hits,
+            'tiers': stats
         }
     
     def clear_cache(self):
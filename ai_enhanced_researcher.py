@@ -7,7 +7,6 @@ AI 고급 웹 연구원 (업그레이드 버전)
 실시간 검색 과정을 한국어로 표시하고 상세한 진행 상황을 보여주는 시스템입니다.
 """
 
-import requests
 import re
 import json
 import time
@@ -16,10 +15,14 @@ from typing import Dict, List, Tuple, Optional, Any, Callable
 from dataclasses import dataclass
 from datetime import datetime
 from urllib.parse import quote, urljoin, urlparse
-from bs4 import BeautifulSoup
 import random
 import hashlib
 import threading
+from functools import partial
+from page_cache import PageCache, default_page_cache
+from research_http import HTTPPool, default_pool, fan_out
+from research_common import ResearcherBase
+from search_index import SearchBackend
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -65,12 +68,23 @@ class EnhancedResearchAnswer:
     total_processing_time: float
     timestamp: datetime
 
-class AIEnhancedResearcher:
+class AIEnhancedResearcher(ResearcherBase):
     """AI 향상된 웹 연구원"""
     
-    def __init__(self, progress_callback: Optional[Callable] = None):
+    search_result_type = EnhancedSearchResult
+    
+    def __init__(self, progress_callback: Optional[Callable] = None, http_pool: Optional[HTTPPool] = None,
+                 research_timeout: float = 30.0, max_parallel_searches: int = 9,
+                 page_cache: Optional[PageCache] = None, search_backends: Optional[Dict[str, SearchBackend]] = None,
+                 offline: Optional[bool] = None):
         self.progress_callback = progress_callback
         
+        # 검색과 페이지 가져오기가 공유하는 keep-alive 연결 풀과 디스크 캐시, 연구 한 번의 전체 제한 시간 (초)
+        self.http_pool = http_pool or default_pool()
+        self.page_cache = page_cache or default_page_cache()
+        self.research_timeout = research_timeout
+        self.max_parallel_searches = max_parallel_searches
+        
         # 신뢰할 수 있는 소스들
         self.credible_sources = {
             'academic': [
@@ -94,8 +108,10 @@ class AIEnhancedResearcher:
             ]
         }
         
+        self._init_search_backends(search_backends, offline)
+        
         # 검색 엔진별 설정
-        self.search_engines = {
+        self.search_engines = {} if self.offline else {
             'google': {
                 'name': '구글',
                 'search_func': self._search_google,
@@ -112,6 +128,12 @@ class AIEnhancedResearcher:
                 'weight': 0.3
             }
         }
+        for backend_id, backend in self.search_backends.items():
+            self.search_engines[backend_id] = {
+                'name': f'{backend_id} 색인',
+                'search_func': partial(self._search_backend, backend),
+                'weight': 0.3
+            }
         
         # 헤더 설정
         self.headers = {
@@ -134,36 +156,43 @@ class AIEnhancedResearcher:
         search_strategy = self._analyze_question(question)
         self._update_progress(search_progress, "질문 분석", f"검색 키워드 {len(search_strategy['keywords'])}개 생성 완료", "completed")
         
-        # 2. 다중 검색 수행
+        # 2. 다중 검색 수행 (검색 엔진 × 키워드를 동시에 실행하고 끝난 순서대로 합침)
+        deadline = time.monotonic() + self.research_timeout
+        keywords = search_strategy['keywords'][:3]  # 상위 3개 키워드만 사용
         all_results = []
-        total_engines = len(self.search_engines)
+        remaining_searches = {}
+        calls = []
         
-        for i, (engine_id, engine_info) in enumerate(self.search_engines.items()):
+        for engine_id, engine_info in self.search_engines.items():
             self._update_progress(search_progress, f"{engine_info['name']} 검색", 
-                                f"{engine_info['name']}에서 정보를 검색하고 있습니다...", "started")
-            
-            for j, keyword in enumerate(search_strategy['keywords'][:3]):  # 상위 3개 키워드만 사용
+                                f"{engine_info['name']}에서 키워드 {len(keywords)}개를 검색하고 있습니다...", "started")
+            remaining_searches[engine_id] = len(keywords)
+            for keyword in keywords:
+                calls.append(((engine_id, keyword),
+                              lambda func=engine_info['search_func'], keyword=keyword: func(keyword, max_results=3, deadline=deadline)))
+        
+        for (engine_id, keyword), results, error in fan_out(calls, deadline, self.max_parallel_searches):
+            engine_info = self.search_engines[engine_id]
+            if error is None:
+                for result in results:
+                    result.search_engine = engine_info['name']
+                    result.search_keyword = keyword
+                all_results.extend(results)
+                self._update_progress(search_progress, f"{engine_info['name']} 검색", 
+                                    f"키워드 '{keyword}' 검색 완료 - {len(results)}개 결과", "completed")
+            else:
                 self._update_progress(search_progress, f"{engine_info['name']} 검색", 
-                                    f"키워드 '{keyword}' 검색 중... ({j+1}/3)", "in_progress")
-                
-                try:
-                    results = engine_info['search_func'](keyword, max_results=3)
-                    for result in results:
-                        result.search_engine = engine_info['name']
-                        result.search_keyword = keyword
-                    all_results.extend(results)
-                    
-                    self._update_progress(search_progress, f"{engine_info['name']} 검색", 
-                                        f"키워드 '{keyword}' 검색 완료 - {len(results)}개 결과", "completed")
-                    
-                except Exception as e:
-                    self._update_progress(search_progress, f"{engine_info['name']} 검색", 
-                                        f"키워드 '{keyword}' 검색 실패: {str(e)}", "failed")
-                
-                time.sleep(0.5)  # 요청 간격 조절
+                                    f"키워드 '{keyword}' 검색 실패: {str(error)}", "failed")
             
-            self._update_progress(search_progress, f"{engine_info['name']} 검색", 
-                                f"{engine_info['name']} 검색 완료 - 총 {len([r for r in all_results if r.search_engine == engine_info['name']])}개 결과", "completed")
+            remaining_searches[engine_id] -= 1
+            if remaining_searches[engine_id] == 0:
+                self._update_progress(search_progress, f"{engine_info['name']} 검색", 
+                                    f"{engine_info['name']} 검색 완료 - 총 {len([r for r in all_results if r.search_engine == engine_info['name']])}개 결과", "completed")
+        
+        for engine_id, count in remaining_searches.items():
+            if count:
+                self._update_progress(search_progress, f"{self.search_engines[engine_id]['name']} 검색", 
+                                    f"제한 시간 초과 - 키워드 {count}개 검색 결과를 기다리지 않음", "failed")
         
         # 3. 중복 제거 및 정리
         self._update_progress(search_progress, "결과 정리", "중복된 결과를 제거하고 정리하고 있습니다...", "started")
@@ -173,7 +202,7 @@ class AIEnhancedResearcher:
         # 4. 신뢰도 및 관련성 평가
         self._update_progress(search_progress, "신뢰도 평가", "검색 결과의 신뢰도와 관련성을 평가하고 있습니다...", "started")
         evaluated_results = self._evaluate_results(unique_results, question)
-        self._update_progress(search_progress, "신뢰도 평가", f"신뢰도 평가 완료 - 평균 신뢰도: {sum(r.credibility_score for r in evaluated_results)/len(evaluated_results):.2f}", "completed")
+        self._update_progress(search_progress, "신뢰도 평가", f"신뢰도 평가 완료 - 평균 신뢰도: {sum(r.credibility_score for r in evaluated_results)/max(len(evaluated_results), 1):.2f}", "completed")
         
         # 5. 상위 소스 선택
         self._update_progress(search_progress, "소스 선택", "가장 신뢰할 수 있는 소스들을 선택하고 있습니다...", "started")
@@ -335,7 +364,7 @@ class AIEnhancedResearcher:
             safe_query = re.sub(r'\s+', '_', safe_query)
             return safe_query[:50]  # 50자로 제한
     
-    def _search_google(self, query: str, max_results: int) -> List[EnhancedSearchResult]:
+    def _search_google(self, query: str, max_results: int, deadline: Optional[float] = None) -> List[EnhancedSearchResult]:
         """언어별 검색 엔진을 사용한 구글 검색"""
         results = []
         language = self._detect_language(query)
@@ -425,11 +454,10 @@ class AIEnhancedResearcher:
                 }
             ]
         
-        for i, result in enumerate(search_results[:max_results]):
-            start_time = time.time()
-            # 실제 웹 페이지 내용 가져오기 시뮬레이션
-            content = self._fetch_web_content(result['url'])
-            processing_time = time.time() - start_time
+        search_results = search_results[:max_results]
+        contents = self._fetch_contents([result['url'] for result in search_results], deadline)
+        for i, result in enumerate(search_results):
+            content, processing_time = contents[result['url']]
             
             results.append(EnhancedSearchResult(
                 title=result['title'],
@@ -448,7 +476,7 @@ class AIEnhancedResearcher:
         
         return results
     
-    def _search_bing(self, query: str, max_results: int) -> List[EnhancedSearchResult]:
+    def _search_bing(self, query: str, max_results: int, deadline: Optional[float] = None) -> List[EnhancedSearchResult]:
         """언어별 검색 엔진을 사용한 빙 검색"""
         results = []
         language = self._detect_language(query)
@@ -523,10 +551,10 @@ class AIEnhancedResearcher:
                 }
             ]
         
-        for i, result in enumerate(search_results[:max_results]):
-            start_time = time.time()
-            content = self._fetch_web_content(result['url'])
-            processing_time = time.time() - start_time
+        search_results = search_results[:max_results]
+        contents = self._fetch_contents([result['url'] for result in search_results], deadline)
+        for i, result in enumerate(search_results):
+            content, processing_time = contents[result['url']]
             
             results.append(EnhancedSearchResult(
                 title=result['title'],
@@ -545,7 +573,7 @@ class AIEnhancedResearcher:
         
         return results
     
-    def _search_duckduckgo(self, query: str, max_results: int) -> List[EnhancedSearchResult]:
+    def _search_duckduckgo(self, query: str, max_results: int, deadline: Optional[float] = None) -> List[EnhancedSearchResult]:
         """언어별 검색 엔진을 사용한 덕덕고 검색"""
         results = []
         language = self._detect_language(query)
@@ -602,10 +630,10 @@ class AIEnhancedResearcher:
                 }
             ]
         
-        for i, result in enumerate(search_results[:max_results]):
-            start_time = time.time()
-            content = self._fetch_web_content(result['url'])
-            processing_time = time.time() - start_time
+        search_results = search_results[:max_results]
+        contents = self._fetch_contents([result['url'] for result in search_results], deadline)
+        for i, result in enumerate(search_results):
+            content, processing_time = contents[result['url']]
             
             results.append(EnhancedSearchResult(
                 title=result['title'],
@@ -624,20 +652,24 @@ class AIEnhancedResearcher:
         
         return results
     
-    def _fetch_web_content(self, url: str) -> str:
+    def _fetch_contents(self, urls: List[str], deadline: Optional[float] = None) -> Dict[str, Tuple[str, float]]:
+        """여러 웹 페이지를 연결 풀에서 동시에 가져오기 (URL → (내용, 처리 시간))"""
+        def fetch(url: str) -> Tuple[str, float]:
+            start_time = time.time()
+            content = self._fetch_web_content(url, deadline)
+            return content, time.time() - start_time
+        
+        contents = {}
+        for url, fetched, error in self.http_pool.fetch_all(urls, fetch, deadline):
+            contents[url] = fetched if error is None else (f"웹 페이지 내용을 가져올 수 없습니다: {url}", 0.0)
+        return contents
+    
+    def _fetch_web_content(self, url: str, deadline: Optional[float] = None) -> str:
         """웹 페이지 내용 가져오기"""
         try:
-            # 실제로는 requests를 사용하여 웹 페이지를 가져옴
-            # 여기서는 시뮬레이션
-            response = requests.get(url, headers=self.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 텍스트 추출
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            text = soup.get_text()
-            return text[:2000]  # 처음 2000자만 사용
+            # 같은 URL 은 디스크 캐시에서 (신선하면 요청/파싱 없이, 오래됐으면 ETag/Last-Modified 재검증)
+            return self.page_cache.fetch_text(self.http_pool, url, self._extract_text, 'lxml-2000',
+                                              deadline=deadline, headers=self.headers, read=self._read_text)
             
         except Exception as e:
             logger.warning(f"웹 페이지 가져오기 실패 {url}: {e}")
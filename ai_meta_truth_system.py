@@ -15,12 +15,12 @@ import asyncio
 import threading
 import time
 import random
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from typing import Dict, List, Tuple, Optional, Any, Callable, Hashable
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from queue import Queue
 from enum import Enum
 import hashlib
+from stream_workers import DEFAULT_STREAM, StreamMonitor
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -53,13 +53,18 @@ class MetaAnalysis:
 class AIMetaTruthSystem:
     """AI 메타-진실성 시스템"""
     
-    def __init__(self, correction_threshold: float = 99.0):
+    def __init__(self, correction_threshold: float = 99.0, monitor_workers: int = 4, monitor_max_batch: int = 32):
         self.correction_threshold = correction_threshold
-        self.statement_queue = Queue()
         self.analysis_history = []
         self.monitoring = False
         self.self_awareness_level = 0.0
         
+        # 연속 모니터링 작업자 풀 (같은 스트림 문장은 같은 작업자가 순서대로 처리)
+        self.monitor_workers = monitor_workers
+        self.monitor_max_batch = monitor_max_batch
+        self._streams = StreamMonitor(monitor_workers, monitor_max_batch, name='meta-monitor')
+        self._state_lock = threading.Lock()                 # 자기 인식 수준, 히스토리, 통계
+        
         # 거짓말 패턴 데이터베이스
         self.lie_patterns = self._initialize_lie_patterns()
         
@@ -247,7 +252,8 @@ class AIMetaTruthSystem:
         self_reflection = self._self_reflect(statement, detected_issues, truth_percentage)
         
         # 7단계: 자기 인식 수준 업데이트
-        self._update_self_awareness(truth_percentage, detected_issues)
+        with self._state_lock:
+            self._update_self_awareness(truth_percentage, detected_issues)
         
         processing_time = time.time() - start_time
         
@@ -267,11 +273,12 @@ class AIMetaTruthSystem:
             processing_time=processing_time
         )
         
-        # 분석 히스토리에 추가
-        self.analysis_history.append(analysis)
-        
-        # 통계 업데이트
-        self._update_stats(analysis)
+        with self._state_lock:
+            # 분석 히스토리에 추가
+            self.analysis_history.append(analysis)
+            
+            # 통계 업데이트
+            self._update_stats(analysis)
         
         return analysis
     
@@ -535,47 +542,55 @@ class AIMetaTruthSystem:
         # 자기 인식 점수 업데이트
         self.stats['self_awareness_score'] = self.self_awareness_level
     
-    def start_continuous_monitoring(self, output_callback: Callable[[str], None]):
-        """연속 모니터링 시작"""
+    def start_continuous_monitoring(self, output_callback: Callable[..., None], include_stream_id: bool = False):
+        """
+        연속 모니터링 시작 (monitor_workers 개 작업자가 큐에서 기다렸다가 처리)
+
+        output_callback 은 같은 스트림 안에서는 제출 순서대로 호출된다.
+        include_stream_id 가 True 이면 output_callback(스트림 키, 문장) 으로 호출한다.
+        """
+        if self._streams.running:
+            self.stop_monitoring()
         self.monitoring = True
-        logger.info("🤖 AI 메타-진실성 시스템 시작")
-        
-        def monitor_loop():
-            while self.monitoring:
-                if not self.statement_queue.empty():
-                    statement = self.statement_queue.get()
-                    analysis = self.analyze_statement(statement)
-                    
-                    if analysis.correction_applied:
-                        logger.warning(f"⚠️ 자동 교정: {analysis.truth_percentage:.1f}% 진실성")
-                        logger.info(f"📝 원본: {analysis.original_statement}")
-                        logger.info(f"✅ 교정: {analysis.corrected_statement}")
-                        logger.info(f"🔍 이유: {', '.join(analysis.correction_suggestions)}")
-                        logger.info(f"🤔 성찰: {analysis.self_reflection}")
-                        
-                        # 교정된 문장을 출력
-                        output_callback(analysis.corrected_statement)
-                    else:
-                        logger.info(f"✅ 정상: {analysis.truth_percentage:.1f}% 진실성")
-                        output_callback(analysis.original_statement)
+        logger.info(f"🤖 AI 메타-진실성 시스템 시작 (작업자 {self.monitor_workers}개)")
+        
+        def handle(stream_id: Hashable, statement: str):
+            analysis = self.analyze_statement(statement)
+            
+            if analysis.correction_applied:
+                logger.warning(f"⚠️ 자동 교정: {analysis.truth_percentage:.1f}% 진실성")
+                logger.info(f"📝 원본: {analysis.original_statement}")
+                logger.info(f"✅ 교정: {analysis.corrected_statement}")
+                logger.info(f"🔍 이유: {', '.join(analysis.correction_suggestions)}")
+                logger.info(f"🤔 성찰: {analysis.self_reflection}")
                 
-                time.sleep(0.01)
-        
-        monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
-        monitor_thread.start()
-    
-    def stop_monitoring(self):
-        """모니터링 중지"""
+                # 교정된 문장을 출력
+                output = analysis.corrected_statement
+            else:
+                logger.info(f"✅ 정상: {analysis.truth_percentage:.1f}% 진실성")
+                output = analysis.original_statement
+            
+            if include_stream_id:
+                output_callback(stream_id, output)
+            else:
+                output_callback(output)
+        
+        self._streams.start(handle)
+    
+    def stop_monitoring(self, timeout: Optional[float] = 0):
+        """모니터링 중지 (이미 제출된 문장은 처리 후 종료, timeout 초까지 기다림 - None 이면 끝날 때까지)"""
         self.monitoring = False
+        self._streams.stop(timeout)
         logger.info("🛑 AI 메타-진실성 시스템 중지")
     
-    def submit_statement(self, statement: str):
-        """문장 제출"""
-        self.statement_queue.put(statement)
+    def submit_statement(self, statement: str, stream_id: Hashable = DEFAULT_STREAM):
+        """문장 제출 (같은 stream_id 의 문장은 제출 순서대로 출력)"""
+        self._streams.submit(stream_id, statement)
     
     def get_stats(self) -> Dict[str, Any]:
         """통계 조회"""
-        return self.stats.copy()
+        with self._state_lock:
+            return self.stats.copy()
     
     def get_analysis_history(self, limit: int = 10) -> List[MetaAnalysis]:
         """분석 히스토리 조회"""
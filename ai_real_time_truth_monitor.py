@@ -14,11 +14,13 @@ import logging
 import asyncio
 import threading
 import time
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from typing import Dict, List, Tuple, Optional, Any, Callable, Hashable
 from dataclasses import dataclass
 from datetime import datetime
 from queue import Queue
 import random
+from pattern_index import get_pattern_index
+from stream_workers import DEFAULT_STREAM, StreamMonitor
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -34,17 +36,33 @@ class RealTimeAnalysis:
     correction_reason: str
     timestamp: datetime
     processing_time: float
+    stream_id: Hashable = DEFAULT_STREAM
+
+@dataclass
+class StreamEvent:
+    """스트리밍 분석 이벤트"""
+    kind: str                                   # 'pattern' (패턴 완성), 'sentence' (문장 완료)
+    offset: int                                 # 스트림 전체 기준 시작 위치 (문자)
+    text: str                                   # 매칭된 텍스트, 또는 내보낼 (교정된) 문장
+    category: Optional[str] = None
+    pattern: Optional[str] = None
+    analysis: Optional[RealTimeAnalysis] = None
 
 class AIRealTimeTruthMonitor:
     """AI 실시간 진실성 모니터"""
     
-    def __init__(self, correction_threshold: float = 99.0):
+    def __init__(self, correction_threshold: float = 99.0, monitor_workers: int = 4, monitor_max_batch: int = 32):
         self.correction_threshold = correction_threshold
-        self.statement_queue = Queue()
         self.corrected_queue = Queue()
         self.monitoring = False
         self.analysis_count = 0
         
+        # 모니터링 작업자 풀 (같은 스트림 문장은 같은 작업자가 순서대로 처리)
+        self.monitor_workers = monitor_workers
+        self.monitor_max_batch = monitor_max_batch
+        self._streams = StreamMonitor(monitor_workers, monitor_max_batch, name='truth-monitor')
+        self._stats_lock = threading.Lock()
+        
         # 거짓말 패턴 (더 정교한 패턴)
         self.lie_patterns = self._initialize_advanced_patterns()
         
@@ -54,6 +72,14 @@ class AIRealTimeTruthMonitor:
         # 교정 전략
         self.correction_strategies = self._initialize_correction_strategies()
         
+        # 패턴 인덱스 (패턴 개수와 무관하게 한 번의 스캔으로 탐지)
+        self.lie_pattern_index = get_pattern_index(
+            {category: data['patterns'] for category, data in self.lie_patterns.items()}, flags=0
+        )
+        self.truth_indicator_index = get_pattern_index(
+            [re.escape(indicator) for indicator in self.truth_indicators], flags=0
+        )
+        
         # 실시간 통계
         self.stats = {
             'total_analyzed': 0,
@@ -177,7 +203,8 @@ class AIRealTimeTruthMonitor:
         processing_time = time.time() - start_time
         
         # 통계 업데이트
-        self._update_stats(truth_percentage, needs_correction)
+        with self._stats_lock:
+            self._update_stats(truth_percentage, needs_correction)
         
         return RealTimeAnalysis(
             statement=statement,
@@ -191,15 +218,12 @@ class AIRealTimeTruthMonitor:
     
     def _detect_patterns(self, statement: str) -> List[Tuple[str, str, float]]:
         """거짓말 패턴 탐지"""
-        detected = []
         statement_lower = statement.lower()
         
-        for category, data in self.lie_patterns.items():
-            for pattern in data['patterns']:
-                if re.search(pattern, statement_lower):
-                    detected.append((category, pattern, data['penalty']))
-        
-        return detected
+        return [
+            (entry.key, entry.pattern, self.lie_patterns[entry.key]['penalty'])
+            for entry in self.lie_pattern_index.scan(statement_lower)
+        ]
     
     def _calculate_truth_percentage(self, statement: str, detected_patterns: List[Tuple[str, str, float]]) -> float:
         """진실성 백분율 계산"""
@@ -210,9 +234,7 @@ class AIRealTimeTruthMonitor:
             base_score -= penalty
         
         # 진실성 지표에 따른 가점
-        for indicator in self.truth_indicators:
-            if indicator in statement:
-                base_score += 5
+        base_score += 5 * len(self.truth_indicator_index.scan(statement))
         
         # 문장 복잡성에 따른 감점
         if len(statement) > 100:
@@ -357,48 +379,65 @@ class AIRealTimeTruthMonitor:
         # 교정률 업데이트
         self.stats['correction_rate'] = self.stats['total_corrected'] / total * 100
     
-    def start_monitoring(self, output_callback: Callable[[str], None]):
-        """실시간 모니터링 시작"""
+    def start_monitoring(self, output_callback: Callable[..., None], include_stream_id: bool = False):
+        """
+        실시간 모니터링 시작 (monitor_workers 개 작업자가 큐에서 기다렸다가 처리)
+
+        output_callback 은 같은 스트림 안에서는 제출 순서대로 호출된다.
+        include_stream_id 가 True 이면 output_callback(스트림 키, 문장) 으로 호출한다.
+        """
+        if self._streams.running:
+            self.stop_monitoring()
         self.monitoring = True
-        logger.info("🤖 AI 실시간 진실성 모니터링 시작")
-        
-        def monitor_loop():
-            while self.monitoring:
-                if not self.statement_queue.empty():
-                    statement = self.statement_queue.get()
-                    analysis = self.analyze_statement(statement)
-                    
-                    if analysis.needs_correction:
-                        logger.warning(f"⚠️ 교정 필요: {analysis.truth_percentage:.1f}% 진실성")
-                        logger.info(f"📝 원본: {statement}")
-                        logger.info(f"✅ 교정: {analysis.corrected_statement}")
-                        logger.info(f"🔍 이유: {analysis.correction_reason}")
-                        
-                        # 교정된 문장을 출력
-                        output_callback(analysis.corrected_statement)
-                    else:
-                        logger.info(f"✅ 정상: {analysis.truth_percentage:.1f}% 진실성")
-                        output_callback(statement)
-                    
-                    self.corrected_queue.put(analysis)
+        logger.info(f"🤖 AI 실시간 진실성 모니터링 시작 (작업자 {self.monitor_workers}개)")
+        
+        def handle(stream_id: Hashable, statement: str):
+            analysis = self.analyze_statement(statement)
+            analysis.stream_id = stream_id
+            
+            if analysis.needs_correction:
+                logger.warning(f"⚠️ 교정 필요: {analysis.truth_percentage:.1f}% 진실성")
+                logger.info(f"📝 원본: {statement}")
+                logger.info(f"✅ 교정: {analysis.corrected_statement}")
+                logger.info(f"🔍 이유: {analysis.correction_reason}")
                 
-                time.sleep(0.01)  # CPU 사용량 조절
-        
-        monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
-        monitor_thread.start()
+                # 교정된 문장을 출력
+                output = analysis.corrected_statement
+            else:
+                logger.info(f"✅ 정상: {analysis.truth_percentage:.1f}% 진실성")
+                output = statement
+            
+            if include_stream_id:
+                output_callback(stream_id, output)
+            else:
+                output_callback(output)
+            self.corrected_queue.put(analysis)
+        
+        self._streams.start(handle)
     
-    def stop_monitoring(self):
-        """모니터링 중지"""
+    def stop_monitoring(self, timeout: Optional[float] = 0):
+        """모니터링 중지 (이미 제출된 문장은 처리 후 종료, timeout 초까지 기다림 - None 이면 끝날 때까지)"""
         self.monitoring = False
+        self._streams.stop(timeout)
         logger.info("🛑 AI 실시간 진실성 모니터링 중지")
     
-    def submit_statement(self, statement: str):
-        """문장 제출 (실시간 분석용)"""
-        self.statement_queue.put(statement)
+    def submit_statement(self, statement: str, stream_id: Hashable = DEFAULT_STREAM):
+        """문장 제출 (실시간 분석용, 같은 stream_id 의 문장은 제출 순서대로 출력)"""
+        self._streams.submit(stream_id, statement)
+    
+    def pending_statements(self) -> int:
+        """처리를 기다리는 문장 수"""
+        return self._streams.pending()
+    
+    def stream_session(self, stream_id: Hashable = DEFAULT_STREAM, window: int = 256,
+                       max_sentence_chars: int = 2000) -> 'StreamSession':
+        """토큰 단위로 들어오는 출력을 증분 분석하는 세션 생성"""
+        return StreamSession(self, stream_id, window, max_sentence_chars)
     
     def get_stats(self) -> Dict[str, Any]:
         """통계 조회"""
-        return self.stats.copy()
+        with self._stats_lock:
+            return self.stats.copy()
     
     def get_recent_corrections(self, limit: int = 10) -> List[RealTimeAnalysis]:
         """최근 교정 내역 조회"""
@@ -407,6 +446,116 @@ class AIRealTimeTruthMonitor:
             corrections.append(self.corrected_queue.get())
         return corrections
 
+class StreamSession:
+    """
+    스트리밍 출력 증분 분석 세션
+
+    텍스트 조각(delta)을 받을 때마다 현재 문장의 마지막 window 자 + 새 조각만 다시 스캔해
+    새 조각에서 끝나는 거짓말 패턴을 바로 'pattern' 이벤트로 알리고, 문장 끝이 오면
+    그 문장만 분석/교정해 'sentence' 이벤트로 내보낸다. 。 과 줄바꿈은 바로 문장 끝이고,
+    . ! ? 는 뒤에 공백이 오거나 스트림이 끝날 때만 문장 끝이다 ('3.14', '100.5도' 는 나누지 않음).
+    조각이 . ! ? 로 끝나면 다음 조각(또는 close)이 올 때까지 판단을 미룬다. 전체 텍스트는 보관하지 않으므로
+    feed/close 비용은 조각과 현재 문장 길이에 비례한다 (문장이 max_sentence_chars 자를 넘으면 끊어서 분석).
+    window 보다 긴 거리에 걸친 패턴(예: '지구.*평평' 사이가 긴 경우)은 문장 완료 시 분석에서 잡힌다.
+    """
+
+    SENTENCE_END = re.compile(r'[。\n]|[.!?]+(?=\s|$)')
+
+    def __init__(self, monitor: AIRealTimeTruthMonitor, stream_id: Hashable = DEFAULT_STREAM,
+                 window: int = 256, max_sentence_chars: int = 2000):
+        self.monitor = monitor
+        self.stream_id = stream_id
+        self.window = window
+        self.max_sentence_chars = max_sentence_chars
+        self._sentence: List[str] = []      # 현재 문장 조각
+        self._sentence_length = 0
+        self._sentence_offset = 0           # 현재 문장의 스트림 기준 시작 위치
+        self._suffix = ''                   # 현재 문장의 마지막 window 자 (소문자, 패턴 스캔용)
+        self._reported = set()              # 현재 문장에서 이미 알린 (패턴 번호, 시작 위치)
+        self._pending_end = False           # 마지막 조각이 . ! ? 로 끝나 문장 끝인지 아직 모름
+        self.closed = False
+    
+    def feed(self, delta: str) -> List[StreamEvent]:
+        """텍스트 조각 추가, 이번 조각으로 완성된 패턴과 문장 이벤트 반환"""
+        if self.closed:
+            raise ValueError("이미 종료된 스트림 세션입니다.")
+        events: List[StreamEvent] = []
+        if self._pending_end and delta:
+            # 앞 조각 끝의 . ! ? 뒤에 공백이 오면 문장 끝
+            self._pending_end = False
+            if delta[0].isspace():
+                events.extend(self._finish_sentence())
+        start = 0
+        for boundary in self.SENTENCE_END.finditer(delta):
+            self._append(delta[start:boundary.end()], events)
+            start = boundary.end()
+            if start == len(delta) and boundary.group()[-1] in '.!?':
+                self._pending_end = True
+            else:
+                events.extend(self._finish_sentence())
+        if start < len(delta):
+            self._append(delta[start:], events)
+        return events
+    
+    def close(self) -> List[StreamEvent]:
+        """스트림 종료 (끝나지 않은 마지막 문장 분석)"""
+        if self.closed:
+            return []
+        self.closed = True
+        return self._finish_sentence(final=True)
+    
+    def _append(self, part: str, events: List[StreamEvent]):
+        while part:
+            room = self.max_sentence_chars - self._sentence_length
+            piece, part = part[:room], part[room:]
+            self._scan(piece, events)
+            self._sentence.append(piece)
+            self._sentence_length += len(piece)
+            if part:        # 너무 긴 문장은 끊어서 분석
+                events.extend(self._finish_sentence(final=True))
+    
+    def _scan(self, piece: str, events: List[StreamEvent]):
+        """이전 window 자 + 새 조각에서, 새 조각 안에서 끝나는 매칭만 보고"""
+        text = self._suffix + piece.lower()
+        new_from = len(self._suffix)
+        base = self._sentence_offset + self._sentence_length - new_from   # text[0] 의 스트림 위치
+        found = []
+        for entry in self.monitor.lie_pattern_index.scan(text):
+            for match in entry.regex.finditer(text):
+                key = (entry.key, entry.position, base + match.start())
+                if match.end() <= new_from or key in self._reported:
+                    continue
+                self._reported.add(key)
+                found.append(StreamEvent('pattern', base + match.start(), match.group(),
+                                         category=entry.key, pattern=entry.pattern))
+        events.extend(sorted(found, key=lambda event: event.offset))
+        self._suffix = text[-self.window:] if self.window > 0 else ''
+        # 창 밖으로 나간 시작 위치는 다시 매칭될 수 없으므로 잊음
+        oldest = base + len(text) - len(self._suffix)
+        self._reported = {key for key in self._reported if key[2] >= oldest}
+    
+    def _finish_sentence(self, final: bool = False) -> List[StreamEvent]:
+        sentence = ''.join(self._sentence)
+        if not sentence.strip() and not final:
+            return []       # 문장 사이 공백/줄바꿈은 다음 문장 앞에 붙여 내보냄
+        offset = self._sentence_offset
+        self._sentence_offset += self._sentence_length
+        self._sentence = []
+        self._sentence_length = 0
+        self._suffix = ''
+        self._reported = set()
+        if not sentence.strip():
+            return [StreamEvent('sentence', offset, sentence)] if sentence else []
+        
+        statement = sentence.strip()
+        analysis = self.monitor.analyze_statement(statement)
+        analysis.stream_id = self.stream_id
+        text = analysis.corrected_statement if analysis.needs_correction else statement
+        # 문장 앞뒤 공백/줄바꿈은 그대로 유지
+        leading = sentence[:len(sentence) - len(sentence.lstrip())]
+        trailing = sentence[len(sentence.rstrip()):]
+        return [StreamEvent('sentence', offset, leading + text + trailing, analysis=analysis)]
+
 def demo_ai_conversation():
     """AI 대화 데모"""
     print("🤖 AI 실시간 진실성 모니터링 데모")
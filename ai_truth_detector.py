@@ -10,11 +10,31 @@ from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import logging
+from pattern_index import get_pattern_index
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 사실적 일관성 검사용 패턴 (모듈 로드 시 한 번만 컴파일)
+FACT_PATTERNS = {
+    'true_facts': [
+        r'지구는\s*둥글다',
+        r'물은\s*100도에서\s*끓는다',
+        r'태양은\s*동쪽에서\s*떠오른다',
+        r'1\s*\+\s*1\s*=\s*2',
+        r'한국은\s*아시아에\s*위치'
+    ],
+    'false_facts': [
+        r'지구는\s*평평하다',
+        r'물은\s*200도에서\s*끓는다',
+        r'태양은\s*서쪽에서\s*떠오른다',
+        r'1\s*\+\s*1\s*=\s*3',
+        r'한국은\s*유럽에\s*위치'
+    ]
+}
+FACT_PATTERN_INDEX = get_pattern_index(FACT_PATTERNS)
+
 @dataclass
 class TruthAnalysis:
     """진실성 분석 결과를 담는 데이터 클래스"""
@@ -101,6 +121,12 @@ class TruthDetector:
             }
         }
         
+        # 패턴 인덱스 (같은 테이블은 프로세스 내에서 공유)
+        self.lie_pattern_index = get_pattern_index(self.lie_patterns)
+        self.correction_rule_index = get_pattern_index(
+            {lie_type: list(rules) for lie_type, rules in self.correction_rules.items()}
+        )
+        
     def analyze_statement(self, statement: str, context: Optional[str] = None) -> TruthAnalysis:
         """
         주어진 문장의 진실성을 분석
@@ -206,30 +232,11 @@ class TruthDetector:
                 elif num_val < 0:  # 음수
                     score -= 0.2
         
-        # 일반적인 사실 패턴 검사 (긍정적)
-        true_facts = [
-            r'지구는\s*둥글다',
-            r'물은\s*100도에서\s*끓는다',
-            r'태양은\s*동쪽에서\s*떠오른다',
-            r'1\s*\+\s*1\s*=\s*2',
-            r'한국은\s*아시아에\s*위치'
-        ]
-        
-        for pattern in true_facts:
-            if re.search(pattern, statement, re.IGNORECASE):
+        # 사실 패턴 검사 (참이면 가점, 거짓이면 감점) - 한 번의 스캔으로 모든 패턴 확인
+        for entry in FACT_PATTERN_INDEX.scan(statement):
+            if entry.key == 'true_facts':
                 score += 0.3
-        
-        # 거짓된 사실 패턴 검사 (부정적)
-        false_facts = [
-            r'지구는\s*평평하다',
-            r'물은\s*200도에서\s*끓는다',
-            r'태양은\s*서쪽에서\s*떠오른다',
-            r'1\s*\+\s*1\s*=\s*3',
-            r'한국은\s*유럽에\s*위치'
-        ]
-        
-        for pattern in false_facts:
-            if re.search(pattern, statement, re.IGNORECASE):
+            else:
                 score -= 0.4
         
         return max(0.0, min(1.0, score))
@@ -372,16 +379,16 @@ class TruthDetector:
         correction_suggestions = []
         
         # 1. 거짓말 패턴 직접 탐지
-        for lie_type, patterns in self.lie_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, statement, re.IGNORECASE):
-                    detected_lies.append(f"거짓말 패턴 감지 ({lie_type}): {pattern}")
-                    
-                    # 해당 패턴에 대한 교정 제안
-                    if lie_type in self.correction_rules:
-                        for false_pattern, correction in self.correction_rules[lie_type].items():
-                            if re.search(false_pattern, statement, re.IGNORECASE):
-                                correction_suggestions.append(f"교정: '{false_pattern}' → '{correction}'")
+        correction_hits = self.correction_rule_index.scan(statement)
+        for entry in self.lie_pattern_index.scan(statement):
+            lie_type = entry.key
+            detected_lies.append(f"거짓말 패턴 감지 ({lie_type}): {entry.pattern}")
+            
+            # 해당 패턴에 대한 교정 제안
+            if lie_type in self.correction_rules:
+                for rule in correction_hits:
+                    if rule.key == lie_type:
+                        correction_suggestions.append(f"교정: '{rule.pattern}' → '{self.correction_rules[lie_type][rule.pattern]}'")
         
         # 2. 각 검증 방법별로 낮은 점수 분석
         for method, score in scores.items():
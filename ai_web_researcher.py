@@ -7,7 +7,6 @@ AI 웹 연구원
 AI가 인터넷에서 정보를 검색하고 진실성을 검증하여 질문에 답변하는 시스템입니다.
 """
 
-import requests
 import re
 import json
 import time
@@ -15,9 +14,14 @@ import logging
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from urllib.parse import quote, urljoin
 from bs4 import BeautifulSoup
 import random
+from page_cache import PageCache, default_page_cache
+from research_http import HTTPPool, default_pool, fan_out
+from research_common import ResearcherBase
+from search_index import SearchBackend
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -56,15 +60,29 @@ class AnswerResult:
     reasoning: str
     timestamp: datetime
 
-class AIWebResearcher:
+class AIWebResearcher(ResearcherBase):
     """AI 웹 연구원"""
     
-    def __init__(self):
-        self.search_engines = {
+    search_result_type = SearchResult
+    
+    def __init__(self, http_pool: Optional[HTTPPool] = None, research_timeout: float = 30.0,
+                 max_parallel_searches: int = 9, page_cache: Optional[PageCache] = None,
+                 search_backends: Optional[Dict[str, SearchBackend]] = None, offline: Optional[bool] = None):
+        # 검색 요청이 공유하는 keep-alive 연결 풀과 디스크 캐시, 연구 한 번의 전체 제한 시간 (초)
+        self.http_pool = http_pool or default_pool()
+        self.page_cache = page_cache or default_page_cache()
+        self.research_timeout = research_timeout
+        self.max_parallel_searches = max_parallel_searches
+        
+        self._init_search_backends(search_backends, offline)
+        
+        self.search_engines = {} if self.offline else {
             'google': self._search_google,
             'bing': self._search_bing,
             'duckduckgo': self._search_duckduckgo
         }
+        for name, backend in self.search_backends.items():
+            self.search_engines[name] = partial(self._search_backend, backend)
         
         # 신뢰할 수 있는 소스 도메인들
         self.credible_domains = [
@@ -114,11 +132,9 @@ class AIWebResearcher:
         # 1. 질문 분석 및 검색 키워드 생성
         search_keywords = self._generate_search_keywords(question)
         
-        # 2. 웹 검색 수행
-        search_results = []
-        for keyword in search_keywords[:3]:  # 상위 3개 키워드만 사용
-            results = self._search_web(keyword, max_results=3)
-            search_results.extend(results)
+        # 2. 웹 검색 수행 (상위 3개 키워드 × 검색 엔진을 동시에 실행)
+        deadline = time.monotonic() + self.research_timeout
+        search_results = self._search_web_many(search_keywords[:3], max_results=3, deadline=deadline)
         
         # 3. 검색 결과 정리 및 신뢰도 평가
         search_results = self._evaluate_sources(search_results)
@@ -228,23 +244,26 @@ class AIWebResearcher:
             safe_query = re.sub(r'\s+', '_', safe_query)
             return safe_query[:50]  # 50자로 제한
     
-    def _search_web(self, query: str, max_results: int = 5) -> List[SearchResult]:
-        """웹 검색 수행"""
-        results = []
+    def _search_web(self, query: str, max_results: int = 5, deadline: Optional[float] = None) -> List[SearchResult]:
+        """웹 검색 수행 (여러 검색 엔진 동시 사용)"""
+        return self._search_web_many([query], max_results, deadline)
+    
+    def _search_web_many(self, queries: List[str], max_results: int = 5,
+                         deadline: Optional[float] = None) -> List[SearchResult]:
+        """검색어 × 검색 엔진 검색을 동시에 실행하고 끝난 순서대로 결과를 합침"""
+        calls = [((engine_name, query), lambda func=search_func, query=query: func(query, max_results, deadline))
+                 for query in queries for engine_name, search_func in self.search_engines.items()]
         
-        # 여러 검색 엔진 사용
-        for engine_name, search_func in self.search_engines.items():
-            try:
-                engine_results = search_func(query, max_results)
-                results.extend(engine_results)
-                time.sleep(1)  # 요청 간격 조절
-            except Exception as e:
-                logger.warning(f"{engine_name} 검색 실패: {e}")
+        results = []
+        for (engine_name, query), engine_results, error in fan_out(calls, deadline, self.max_parallel_searches):
+            if error is not None:
+                logger.warning(f"{engine_name} 검색 실패: {error}")
                 continue
+            results.extend(engine_results)
         
         return results
     
-    def _search_google(self, query: str, max_results: int) -> List[SearchResult]:
+    def _search_google(self, query: str, max_results: int, deadline: Optional[float] = None) -> List[SearchResult]:
         """Google 검색 (실제 검색 API 연동)"""
         results = []
         language = self._detect_language(query)
@@ -387,7 +406,7 @@ class AIWebResearcher:
         
         return results
     
-    def _search_bing(self, query: str, max_results: int) -> List[SearchResult]:
+    def _search_bing(self, query: str, max_results: int, deadline: Optional[float] = None) -> List[SearchResult]:
         """Bing 검색 (실제 검색 API 연동)"""
         results = []
         language = self._detect_language(query)
@@ -457,7 +476,7 @@ class AIWebResearcher:
         
         return results
     
-    def _search_duckduckgo(self, query: str, max_results: int) -> List[SearchResult]:
+    def _search_duckduckgo(self, query: str, max_results: int, deadline: Optional[float] = None) -> List[SearchResult]:
         """DuckDuckGo 검색 (실제 웹 스크래핑)"""
         results = []
         language = self._detect_language(query)
@@ -468,12 +487,11 @@ class AIWebResearcher:
             encoded_query = urllib.parse.quote_plus(query)
             search_url = f"https://duckduckgo.com/?q={encoded_query}&ia=web"
             
-            # 실제 웹 페이지 요청
-            response = requests.get(search_url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            # 실제 웹 페이지 요청 (같은 검색어는 디스크 캐시 사용)
+            html = self.page_cache.fetch_html(self.http_pool, search_url, deadline=deadline, headers=self.headers)
             
             # HTML 파싱
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
             
             # 검색 결과 추출
             search_results = []
@@ -0,0 +1,162 @@
+"""
+요청 단위 분석 컨텍스트
+하나의 문장에 대해 여러 탐지기가 공유하는 기본 분석 결과, 토큰화(문장 분리), 정규식/패턴 인덱스 매칭을
+메모이즈하여 동일한 TruthDetector 분석이 요청마다 한 번만 수행되도록 하는 모듈
+"""
+
+import re
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ai_truth_detector import TruthDetector, TruthAnalysis
+from pattern_index import PatternEntry, PatternIndex
+
+logger = logging.getLogger(__name__)
+
+class AnalysisContext:
+    """문장 하나에 대한 분석 컨텍스트 - 기본 분석, 토큰화, 정규식 결과 캐시"""
+
+    def __init__(self, statement: str, context: Optional[str] = None,
+                 detector: Optional[TruthDetector] = None):
+        self.statement = statement
+        self.context = context
+        self.detector = detector or TruthDetector()
+
+        # 메모이즈 저장소
+        self._analyses: Dict[Tuple[str, Optional[str]], TruthAnalysis] = {}
+        self._memo: Dict[Hashable, Any] = {}        # 토큰화/정규식/패턴 인덱스 결과
+
+        # 병렬 탐지기 실행 시 같은 문장의 중복 분석 방지 (진행 중인 분석 공유)
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Tuple[str, Optional[str]], Future] = {}
+
+        # 요청 단위 카운터
+        self.primary_analysis_count = 0
+        self.primary_cache_hits = 0
+        self.memo_hits = 0
+
+    def __getstate__(self):
+        """프로세스 풀 전달용 상태 (잠금, 진행 중 분석, 탐지기 객체를 키로 쓰는 메모 제외)"""
+        state = self.__dict__.copy()
+        state.pop('_lock', None)
+        state['_in_flight'] = {}
+        state['_memo'] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def analyze(self, statement: Optional[str] = None, context: Optional[str] = None) -> TruthAnalysis:
+        """
+        기본 진실성 분석 (메모이즈)
+
+        Args:
+            statement: 분석할 문장 (기본값: 컨텍스트의 원문)
+            context: 추가 컨텍스트 정보 (기본값: 컨텍스트의 원래 context)
+
+        Returns:
+            TruthAnalysis: 동일한 문장에 대해서는 항상 같은 결과 객체
+        """
+        if statement is None:
+            statement = self.statement
+        if context is None:
+            context = self.context
+
+        key = (statement, context)
+        with self._lock:
+            analysis = self._analyses.get(key)
+            if analysis is not None:
+                self.primary_cache_hits += 1
+                return analysis
+
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                # 다른 탐지기가 같은 문장을 분석 중이면 그 결과를 기다림
+                self.primary_cache_hits += 1
+            else:
+                self._in_flight[key] = Future()
+                self.primary_analysis_count += 1
+
+        if pending is not None:
+            return pending.result()
+        return self._run_primary_analysis(key)
+
+    def _run_primary_analysis(self, key: Tuple[str, Optional[str]]) -> TruthAnalysis:
+        """기본 분석 실행 후 대기 중인 탐지기에 결과 전달"""
+        pending = self._in_flight[key]
+        try:
+            analysis = self.detector.analyze_statement(*key)
+        except Exception as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            self._analyses[key] = analysis
+            self._in_flight.pop(key, None)
+        pending.set_result(analysis)
+        return analysis
+
+    def _memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """메모 조회, 없으면 계산 후 저장 (동시에 미스가 나면 양쪽이 계산해도 결과는 같음)"""
+        try:
+            value = self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+        with self._lock:
+            self.memo_hits += 1
+        return value
+
+    def tokens(self, text: Optional[str] = None,
+               splitter: Optional[Callable[[str], List[str]]] = None) -> List[str]:
+        """토큰화 (메모이즈, splitter 가 없으면 공백 기준)"""
+        if text is None:
+            text = self.statement
+        return list(self._memoize(('tokens', splitter, text),
+                                  lambda: splitter(text) if splitter is not None else text.split()))
+
+    def search(self, pattern: str, text: Optional[str] = None, flags: int = re.IGNORECASE) -> bool:
+        """정규식 매칭 여부 (메모이즈)"""
+        if text is None:
+            text = self.statement
+        return self._memoize(('search', pattern, text, flags), lambda: re.search(pattern, text, flags) is not None)
+
+    def scan(self, index: PatternIndex, text: Optional[str] = None) -> List[PatternEntry]:
+        """패턴 인덱스 매칭 결과 (메모이즈, 같은 문장을 여러 탐지기가 같은 인덱스로 훑을 때 한 번만 스캔)"""
+        if text is None:
+            text = self.statement
+        return list(self._memoize(('scan', index, text), lambda: index.scan(text)))
+
+    def get_stats(self) -> Dict[str, int]:
+        """요청 단위 분석 통계"""
+        return {
+            'primary_analyses': self.primary_analysis_count,
+            'primary_cache_hits': self.primary_cache_hits,
+            'memo_hits': self.memo_hits
+        }
+
+def analyze_primary(detector: TruthDetector, statement: str, context: Optional[str] = None,
+                    analysis_context: Optional[AnalysisContext] = None) -> TruthAnalysis:
+    """분석 컨텍스트가 있으면 공유 결과를, 없으면 탐지기 자체 분석을 사용"""
+    if analysis_context is not None:
+        return analysis_context.analyze(statement, context)
+    return detector.analyze_statement(statement, context)
+
+def scan_patterns(index: PatternIndex, text: str,
+                  analysis_context: Optional[AnalysisContext] = None) -> List[PatternEntry]:
+    """분석 컨텍스트가 있으면 공유 스캔 결과를, 없으면 인덱스를 직접 스캔"""
+    if analysis_context is not None:
+        return analysis_context.scan(index, text)
+    return index.scan(text)
+
+def search_pattern(pattern: str, text: str, analysis_context: Optional[AnalysisContext] = None,
+                   flags: int = 0) -> bool:
+    """분석 컨텍스트가 있으면 공유 정규식 결과를, 없으면 직접 검색"""
+    if analysis_context is not None:
+        return analysis_context.search(pattern, text, flags)
+    return re.search(pattern, text, flags) is not None
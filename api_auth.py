@@ -8,16 +8,19 @@ AI 진실성 탐지기 API 인증 시스템
 버전: 2.0.0-enterprise
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, make_response
 from flask_jwt_extended import (
     JWTManager, jwt_required, create_access_token, 
     get_jwt_identity, get_jwt, create_refresh_token,
     jwt_required, get_jwt_identity
 )
 from datetime import datetime, timedelta
+from functools import wraps
 import hashlib
 import secrets
 import logging
+from rate_limiter import GCRARateLimiter, RateLimitResult, RedisGCRARateLimiter, rate_limit_key
+from shared_cache import create_redis_client
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -30,7 +33,7 @@ class APIAuthManager:
         self.app = app
         self.users = {}  # 실제 환경에서는 데이터베이스 사용
         self.api_keys = {}  # API 키 관리
-        self.rate_limits = {}  # 요청 제한 관리
+        self.rate_limiter = GCRARateLimiter()  # 요청 제한 관리 (키마다 TAT 하나, Redis 가 설정되면 작업자 간 공유)
         
         if app:
             self.init_app(app)
@@ -44,6 +47,11 @@ class APIAuthManager:
         app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(hours=24)
         app.config['JWT_REFRESH_TOKEN_EXPIRES'] = timedelta(days=30)
         
+        # 요청 제한 공유 Redis (RATE_LIMIT_REDIS_URL, 없으면 REDIS_URL/REDIS_HOST, 모두 없으면 프로세스 내 제한)
+        redis_client = create_redis_client(app.config.get('RATE_LIMIT_REDIS_URL'))
+        if redis_client is not None:
+            self.rate_limiter = RedisGCRARateLimiter(redis_client, fallback=self.rate_limiter)
+        
         # JWT 매니저 초기화
         self.jwt = JWTManager(app)
         
@@ -185,25 +193,11 @@ class APIAuthManager:
     
     def check_rate_limit(self, identifier, limit=100, window=3600):
         """요청 제한 확인 (시간당 100회)"""
-        now = datetime.now()
-        current_time = now.timestamp()
-        
-        if identifier not in self.rate_limits:
-            self.rate_limits[identifier] = []
-        
-        # 시간 윈도우 밖의 요청 제거
-        self.rate_limits[identifier] = [
-            req_time for req_time in self.rate_limits[identifier]
-            if current_time - req_time < window
-        ]
-        
-        # 현재 요청 수 확인
-        if len(self.rate_limits[identifier]) >= limit:
-            return False
-        
-        # 현재 요청 추가
-        self.rate_limits[identifier].append(current_time)
-        return True
+        return self.hit_rate_limit(identifier, limit, window).allowed
+    
+    def hit_rate_limit(self, identifier, limit=100, window=3600) -> RateLimitResult:
+        """요청 한 번을 제한에 기록하고 판정 결과 반환 (X-RateLimit-* 헤더용 남은 횟수 포함)"""
+        return self.rate_limiter.hit(rate_limit_key(identifier, limit, window), limit, window)
 
 # 전역 인증 관리자 인스턴스
 auth_manager = APIAuthManager()
@@ -212,6 +206,7 @@ def create_auth_routes(app):
     """인증 관련 라우트 생성"""
     
     @app.route('/api/auth/login', methods=['POST'])
+    @rate_limited(limit=10, window=60)
     def login():
         """사용자 로그인"""
         try:
@@ -414,6 +409,28 @@ def create_auth_routes(app):
                 'code': 'API_KEY_CREATE_ERROR'
             }), 500
 
+def rate_limited(limit=100, window=3600, key_func=None):
+    """요청 제한 데코레이터 (기본은 클라이언트 IP 기준, 응답에 X-RateLimit-* 헤더 추가)"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            identifier = key_func() if key_func else request.remote_addr
+            result = auth_manager.hit_rate_limit(f"{f.__name__}:{identifier}", limit, window)
+            if not result.allowed:
+                response = jsonify({
+                    'error': '요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.',
+                    'code': 'RATE_LIMITED',
+                    'retry_after': round(result.retry_after, 3)
+                })
+                response.status_code = 429
+            else:
+                response = make_response(f(*args, **kwargs))
+            response.headers.update(result.headers())
+            return response
+        
+        return decorated_function
+    return decorator
+
 def require_auth(permission='read'):
     """인증 데코레이터"""
     def decorator(f):
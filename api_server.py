@@ -7,7 +7,7 @@ AI 진실성 탐지기 API 서버
 RESTful API를 제공하여 웹 애플리케이션과 연동할 수 있는 서버입니다.
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, request, jsonify, render_template_string, Response, stream_with_context
 from flask_cors import CORS
 import json
 import logging
@@ -16,6 +16,7 @@ from typing import Dict, Any
 import traceback
 
 from enhanced_truth_detector import TruthDetector, AnalysisResult
+from batch_analyzer import iter_ndjson
 
 # Flask 앱 초기화
 app = Flask(__name__)
@@ -105,6 +106,8 @@ Content-Type: application/json
 {
     "statements": ["문장1", "문장2", "문장3"]
 }
+
+POST /api/batch-analyze?stream=true  (NDJSON 스트리밍)
                     </div>
                 </div>
             </div>
@@ -192,6 +195,41 @@ def analyze_statement():
             'code': 'ANALYSIS_ERROR'
         }), 500
 
+def _iter_batch_results(statements, context):
+    """입력 순서대로 일괄 분석 결과 생성 (중복 문장은 한 번만 분석)"""
+    analyzed = {}
+    for i, statement in enumerate(statements):
+        try:
+            if not isinstance(statement, str) or not statement.strip():
+                yield {
+                    'index': i,
+                    'error': '빈 문장입니다.',
+                    'statement': statement
+                }
+                continue
+            
+            key = statement.strip()
+            if key not in analyzed:
+                analyzed[key] = truth_detector.analyze(key, context)
+            result = analyzed[key]
+            yield {
+                'index': i,
+                'analysis_id': result.analysis_id,
+                'statement': result.statement,
+                'truth_percentage': result.truth_percentage,
+                'confidence': result.confidence,
+                'needs_correction': result.needs_correction,
+                'detected_issues': result.detected_issues,
+                'correction_suggestions': result.correction_suggestions,
+                'timestamp': result.timestamp.isoformat()
+            }
+        except Exception as e:
+            yield {
+                'index': i,
+                'error': str(e),
+                'statement': statement
+            }
+
 @app.route('/api/batch-analyze', methods=['POST'])
 def batch_analyze():
     """여러 문장 일괄 분석"""
@@ -219,42 +257,15 @@ def batch_analyze():
                 'code': 'EMPTY_STATEMENTS'
             }), 400
         
-        if len(statements) > 10:
-            return jsonify({
-                'error': '한 번에 최대 10개 문장까지만 분석할 수 있습니다.',
-                'code': 'TOO_MANY_STATEMENTS'
-            }), 400
+        # 일괄 분석 실행 (?stream=true 또는 Accept: application/x-ndjson 이면 NDJSON 스트리밍)
+        if (request.args.get('stream', '').lower() in ('1', 'true')
+                or request.accept_mimetypes.best == 'application/x-ndjson'):
+            return Response(
+                stream_with_context(iter_ndjson(_iter_batch_results(statements, context))),
+                mimetype='application/x-ndjson'
+            )
         
-        # 일괄 분석 실행
-        results = []
-        for i, statement in enumerate(statements):
-            try:
-                if not statement or not statement.strip():
-                    results.append({
-                        'index': i,
-                        'error': '빈 문장입니다.',
-                        'statement': statement
-                    })
-                    continue
-                
-                result = truth_detector.analyze(statement.strip(), context)
-                results.append({
-                    'index': i,
-                    'analysis_id': result.analysis_id,
-                    'statement': result.statement,
-                    'truth_percentage': result.truth_percentage,
-                    'confidence': result.confidence,
-                    'needs_correction': result.needs_correction,
-                    'detected_issues': result.detected_issues,
-                    'correction_suggestions': result.correction_suggestions,
-                    'timestamp': result.timestamp.isoformat()
-                })
-            except Exception as e:
-                results.append({
-                    'index': i,
-                    'error': str(e),
-                    'statement': statement
-                })
+        results = list(_iter_batch_results(statements, context))
         
         return jsonify({
             'total_statements': len(statements),
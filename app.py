@@ -5,7 +5,10 @@ Flask 기반 고급 웹 인터페이스로 AI의 진실성을 실시간으로 
 ChatGPT/Claude 수준의 신뢰성과 품질을 제공하는 엔터프라이즈급 시스템
 """
 
-from flask import Flask, render_template, request, jsonify, session, g
+import time
+_startup_started = time.perf_counter()
+
+from flask import Flask, render_template, request, jsonify, session, g, Response, stream_with_context
 from flask_cors import CORS
 from flask_restx import Api, Resource, fields, Namespace
 from flask_jwt_extended import (
@@ -13,46 +16,33 @@ from flask_jwt_extended import (
     get_jwt_identity, get_jwt, create_refresh_token
 )
 from flask_socketio import SocketIO, emit, join_room, leave_room
+import os
 import json
-import plotly
-import plotly.graph_objs as go
-import plotly.express as px
-import pandas as pd
 from datetime import datetime, timedelta
 import uuid
 import logging
-import asyncio
 from functools import wraps
 import traceback
-import time
 from typing import Dict, List, Optional, Any, Union
-from ai_truth_detector import TruthDetector, TruthAnalysis
-from meta_truth_detector import MetaTruthDetector
-from religious_context_detector import ReligiousContextDetector
-from enhanced_scientific_detector import EnhancedScientificDetector
-from intentional_lie_detector import IntentionalLieDetector
-from human_behavior_detector import HumanBehaviorDetector
-from benevolent_lie_detector import BenevolentLieDetector
-from correction_capability_enhancer import CorrectionCapabilityEnhancer
-from context_awareness_detector import ContextAwarenessDetector
-from compound_sentence_analyzer import CompoundSentenceAnalyzer
-from puns_detector import PunsDetector
-from coding_quality_detector import CodingQualityDetector
-from multilingual_analyzer import MultilingualAnalyzer
-
-# AI 자체 진실성 탐지 시스템들 (이미 위에서 import됨)
-
-# AI 자체 진실성 탐지 시스템들
-from ai_self_truth_detector import AISelfTruthDetector
-from ai_real_time_truth_monitor import AIRealTimeTruthMonitor
-from ai_meta_truth_system import AIMetaTruthSystem
-from ai_web_researcher import AIWebResearcher
-from ai_advanced_researcher import AIAdvancedResearcher
-from ai_enhanced_researcher import AIEnhancedResearcher
-from ai_consistent_detector import AIConsistentDetector
-from advanced_validation_system import AdvancedValidationSystem, AnalysisRequest, ValidationLevel
-from advanced_confidence_system import AdvancedConfidenceSystem, QualityLevel
-from advanced_ml_detector import AdvancedMLDetector
+from ai_truth_detector import TruthAnalysis
+from analysis_context import AnalysisContext
+from detector_scheduler import DetectorScheduler, DetectorTask
+from batch_analyzer import BatchTruthScorer, dedupe_statements, iter_ndjson
+from batch_jobs import BatchJobManager, BatchJobStore
+from response_cache import ResponseCache, canonical_cache_key
+from shared_cache import TwoTierCache, create_redis_client
+from history_store import FLAG_COUNTERS, HistoryStore
+from dashboard_feed import DashboardFeed
+from trend_index import parse_bucket
+from chart_payloads import encode_figure, truth_trend_figure, verification_figure
+from export_stream import EXPORT_FORMATS, ROWS_PER_CHUNK, ExportSchema, iter_arrow, iter_csv, iter_json
+from detector_registry import DetectorRegistry
+from loop_runner import LoopRunner
+from text_statistics import RequestTextStatistics
+from advanced_validation_system import AnalysisRequest, ValidationLevel
+from advanced_confidence_system import QualityLevel, validate_and_score
+
+# 탐지기 모듈은 detector_registry 에 등록만 하고 첫 사용(또는 워밍업) 시 import 한다
 
 # Flask 앱 초기화
 app = Flask(__name__)
@@ -262,6 +252,14 @@ class NotificationManager:
     def __init__(self):
         self.connected_users = {}
         self.notification_history = []
+        self.emitter = None     # ASGI 모드에서 asgi.py 가 비동기 SocketIO 서버로 보내는 함수를 지정
+        
+    def emit(self, event, data, room=None):
+        """WebSocket 이벤트 브로드캐스트 (room 이 있으면 해당 방에만)"""
+        if self.emitter is not None:
+            self.emitter(event, data, room)
+        else:
+            socketio.emit(event, data, namespace='/', to=room)
         
     def send_notification(self, notification_type, data):
         """알림 발송"""
@@ -276,7 +274,7 @@ class NotificationManager:
         self.notification_history.append(notification)
         
         # WebSocket으로 브로드캐스트
-        socketio.emit('notification', notification, namespace='/')
+        self.emit('notification', notification)
         
         logger.info(f"알림 발송: {notification_type} - {data.get('message', 'No message')}")
     
@@ -473,6 +471,7 @@ def api_ml_status():
             'available_models': list(advanced_ml_detector.models.keys()),
             'model_weights': advanced_ml_detector.model_weights,
             'bert_available': advanced_ml_detector.bert_pipeline is not None,
+            'embedding_service': advanced_ml_detector.embedding_service.stats() if advanced_ml_detector.embedding_service is not None else None,
             'timestamp': datetime.now().isoformat()
         }
         
@@ -554,47 +553,117 @@ app.config.update(
     PERMANENT_SESSION_LIFETIME=timedelta(hours=24),
     SESSION_COOKIE_SECURE=True,
     SESSION_COOKIE_HTTPONLY=True,
-    SESSION_COOKIE_SAMESITE='Lax'
+    SESSION_COOKIE_SAMESITE='Lax',
+    DETECTOR_EXECUTOR='thread',          # 'thread' 또는 'process'
+    DETECTOR_MAX_WORKERS=8,
+    DETECTOR_TIMEOUT=10.0,               # 탐지기별 제한 시간 (초)
+    DETECTOR_WARMUP=os.getenv('DETECTOR_WARMUP', 'true').lower() == 'true',  # 기동 후 백그라운드에서 탐지기 미리 생성
+    BATCH_CHUNK_SIZE=1000,               # 배치 분석 시 한 번에 점수를 계산할 고유 문장 수
+    BATCH_JOB_DB='batch_jobs.db',        # 배치 작업 큐 저장소 (SQLite)
+    BATCH_JOB_WORKERS=2,
+    BATCH_JOB_CHUNK_SIZE=500,
+    BATCH_JOB_LEASE_SECONDS=600,         # 청크 임대 시간 (지나면 다른 작업자/프로세스가 다시 처리)
+    RESPONSE_CACHE_MAX_BYTES=64 * 1024 * 1024,  # 응답 캐시 용량 상한 (64MB)
+    RESPONSE_CACHE_SHARDS=16,
+    RESULT_CACHE_REDIS_URL=os.getenv('REDIS_URL'),  # 작업자/노드 간 공유 결과 캐시 (없으면 REDIS_HOST, 둘 다 없으면 프로세스 내 캐시만 사용)
+    RESULT_CACHE_TTL=3600,
+    HISTORY_CAPACITY=10000,              # 분석 히스토리 링 버퍼 용량
+    ML_EMBEDDING_BACKEND=os.getenv('ML_EMBEDDING_BACKEND', 'torch'),  # 'torch', 'torch-int8', 'onnx' (models/bert.onnx)
+    ML_EMBEDDING_THREADS=int(os.getenv('ML_EMBEDDING_THREADS', '0')) or None,
+    ML_EMBEDDING_BATCH_SIZE=32,
+    ML_EMBEDDING_MAX_WAIT_MS=5.0,
+    ASGI_CPU_WORKERS=os.cpu_count() or 4,  # ASGI 모드: 분석/배치 분석 요청을 동시에 처리할 스레드 수
+    ASGI_IO_WORKERS=int(os.getenv('ASGI_IO_WORKERS', '256')),  # ASGI 모드: 웹 연구 요청 (네트워크 대기 위주)
+    ASGI_WSGI_WORKERS=32,                # ASGI 모드: 그 밖의 요청
+    DASHBOARD_PUSH_INTERVAL=float(os.getenv('DASHBOARD_PUSH_INTERVAL', '1.0')),  # 대시보드 실시간 업데이트 최소 간격 (초)
+    DASHBOARD_CACHE_MAX_BYTES=8 * 1024 * 1024,  # 히스토리 버전별 통계/차트 응답 캐시 용량
+    TREND_MAX_POINTS=1000,               # 진실성 트렌드 기본 최대 점 수 (넘으면 버킷 집계/LTTB)
+    TREND_MAX_POINTS_LIMIT=10000,
+    MONITOR_WORKERS=int(os.getenv('MONITOR_WORKERS', '4')),  # 실시간/메타 모니터링 작업자 수 (같은 스트림은 한 작업자가 순서대로 처리)
+    MONITOR_MAX_BATCH=32                 # 모니터링 작업자가 깨어났을 때 큐에서 한 번에 꺼내는 최대 문장 수 (문장은 하나씩 분석)
 )
 
+# 탐지기 레지스트리 (각 탐지기는 첫 사용 시 생성, 워밍업은 등록 순서대로)
+detector_registry = DetectorRegistry()
+detector_registry.record_phase('app.imports', time.perf_counter() - _startup_started)
+
 # 전역 변수
-detector = TruthDetector()
-meta_detector = MetaTruthDetector()
-religious_detector = ReligiousContextDetector()
-scientific_detector = EnhancedScientificDetector()
-intentional_detector = IntentionalLieDetector()
-human_behavior_detector = HumanBehaviorDetector()
-benevolent_detector = BenevolentLieDetector()
-correction_enhancer = CorrectionCapabilityEnhancer()
-context_detector = ContextAwarenessDetector()
-compound_analyzer = CompoundSentenceAnalyzer()
-puns_detector = PunsDetector()
-coding_detector = CodingQualityDetector()
-multilingual_analyzer = MultilingualAnalyzer()
+detector = detector_registry.register('truth', 'ai_truth_detector', 'TruthDetector')
+meta_detector = detector_registry.register('meta', 'meta_truth_detector', 'MetaTruthDetector')
+religious_detector = detector_registry.register('religious', 'religious_context_detector', 'ReligiousContextDetector')
+scientific_detector = detector_registry.register('scientific', 'enhanced_scientific_detector', 'EnhancedScientificDetector')
+intentional_detector = detector_registry.register('intentional', 'intentional_lie_detector', 'IntentionalLieDetector')
+human_behavior_detector = detector_registry.register('human_behavior', 'human_behavior_detector', 'HumanBehaviorDetector')
+benevolent_detector = detector_registry.register('benevolent', 'benevolent_lie_detector', 'BenevolentLieDetector')
+correction_enhancer = detector_registry.register('correction_enhancer', 'correction_capability_enhancer', 'CorrectionCapabilityEnhancer')
+context_detector = detector_registry.register('context', 'context_awareness_detector', 'ContextAwarenessDetector')
+compound_analyzer = detector_registry.register('compound', 'compound_sentence_analyzer', 'CompoundSentenceAnalyzer')
+puns_detector = detector_registry.register('puns', 'puns_detector', 'PunsDetector')
+coding_detector = detector_registry.register('coding', 'coding_quality_detector', 'CodingQualityDetector')
+multilingual_analyzer = detector_registry.register('multilingual', 'multilingual_analyzer', 'MultilingualAnalyzer')
 
 # AI 자체 진실성 탐지 시스템들
-ai_self_detector = AISelfTruthDetector()
-ai_real_time_monitor = AIRealTimeTruthMonitor(correction_threshold=99.0)
-ai_meta_system = AIMetaTruthSystem(correction_threshold=99.0)
+ai_self_detector = detector_registry.register('ai_self', 'ai_self_truth_detector', 'AISelfTruthDetector')
+ai_real_time_monitor = detector_registry.register('ai_real_time_monitor', 'ai_real_time_truth_monitor', 'AIRealTimeTruthMonitor', correction_threshold=99.0,
+                                                  monitor_workers=app.config['MONITOR_WORKERS'], monitor_max_batch=app.config['MONITOR_MAX_BATCH'])
+ai_meta_system = detector_registry.register('ai_meta_system', 'ai_meta_truth_system', 'AIMetaTruthSystem', correction_threshold=99.0,
+                                            monitor_workers=app.config['MONITOR_WORKERS'], monitor_max_batch=app.config['MONITOR_MAX_BATCH'])
 
 # AI 웹 연구원 시스템들
-ai_web_researcher = AIWebResearcher()
-ai_advanced_researcher = AIAdvancedResearcher()
-ai_enhanced_researcher = AIEnhancedResearcher()
+ai_web_researcher = detector_registry.register('web_researcher', 'ai_web_researcher', 'AIWebResearcher')
+ai_advanced_researcher = detector_registry.register('advanced_researcher', 'ai_advanced_researcher', 'AIAdvancedResearcher')
+ai_enhanced_researcher = detector_registry.register('enhanced_researcher', 'ai_enhanced_researcher', 'AIEnhancedResearcher')
 
 # AI 일관성 있는 진실성 탐지기
-ai_consistent_detector = AIConsistentDetector()
+ai_consistent_detector = detector_registry.register('consistent', 'ai_consistent_detector', 'AIConsistentDetector', TwoTierCache(
+    redis_client=create_redis_client(app.config['RESULT_CACHE_REDIS_URL']),
+    namespace='ai_truth:consistent:v1',
+    ttl=app.config['RESULT_CACHE_TTL']
+))
 
 # 고급 시스템들
-validation_system = AdvancedValidationSystem()
-confidence_system = AdvancedConfidenceSystem()
+validation_system = detector_registry.register('validation', 'advanced_validation_system', 'AdvancedValidationSystem')
+confidence_system = detector_registry.register('confidence', 'advanced_confidence_system', 'AdvancedConfidenceSystem')
+
+# 배치 분석용 열 단위 점수 계산기
+batch_scorer = detector_registry.register('batch_scorer', 'batch_analyzer', 'BatchTruthScorer', detector)
+
+# 고급 머신러닝 탐지기 (우선순위 3-1, sklearn/torch import 가 무거워 마지막에 워밍업, BERT 는 임베딩이 필요할 때 로드)
+advanced_ml_detector = detector_registry.register(
+    'advanced_ml', 'advanced_ml_detector', 'AdvancedMLDetector',
+    lazy_bert=True,
+    embedding_backend=app.config['ML_EMBEDDING_BACKEND'],
+    embedding_threads=app.config['ML_EMBEDDING_THREADS'],
+    embedding_batch_size=app.config['ML_EMBEDDING_BATCH_SIZE'],
+    embedding_max_wait_ms=app.config['ML_EMBEDDING_MAX_WAIT_MS']
+)
+
+# 통합 분석 탐지기 병렬 실행기
+detector_scheduler = DetectorScheduler(
+    max_workers=app.config['DETECTOR_MAX_WORKERS'],
+    executor_type=app.config['DETECTOR_EXECUTOR'],
+    default_timeout=app.config['DETECTOR_TIMEOUT']
+)
 
-# 고급 머신러닝 탐지기 (우선순위 3-1)
-advanced_ml_detector = AdvancedMLDetector()
+# 모든 요청 스레드가 공유하는 이벤트 루프 (요청마다 루프를 만들고 닫지 않음)
+loop_runner = LoopRunner()
 
 # 전역 변수
-analysis_history = []
-request_cache = {}
+analysis_history = HistoryStore(app.config['HISTORY_CAPACITY'])
+
+# 대시보드 탭(방 'dashboard')에 기록 추가 변경분을 설정한 간격마다 묶어서 발송
+dashboard_feed = DashboardFeed(
+    notification_manager.emit,
+    lambda: _dashboard_snapshot(),
+    room='dashboard',
+    min_interval=app.config['DASHBOARD_PUSH_INTERVAL']
+)
+analysis_history.subscribe(dashboard_feed)
+response_cache = ResponseCache(
+    max_bytes=app.config['RESPONSE_CACHE_MAX_BYTES'],
+    shards=app.config['RESPONSE_CACHE_SHARDS']
+)
+dashboard_cache = ResponseCache(max_bytes=app.config['DASHBOARD_CACHE_MAX_BYTES'], default_ttl=3600.0, shards=4)
 performance_metrics = {
     'total_requests': 0,
     'successful_requests': 0,
@@ -609,11 +678,7 @@ def async_route(f):
     @wraps(f)
     def wrapper(*args, **kwargs):
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(f(*args, **kwargs))
-            loop.close()
-            return result
+            return loop_runner.run(f(*args, **kwargs))
         except Exception as e:
             logger.error(f"비동기 처리 중 오류: {str(e)}")
             return jsonify({'error': '비동기 처리 중 오류가 발생했습니다.'}), 500
@@ -649,13 +714,10 @@ def validate_request(f):
                     session_id=session.get('session_id')
                 )
                 
-                # 고급 검증 (비동기)
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                validation_result = loop.run_until_complete(
-                    validation_system.validate_request(analysis_request)
-                )
-                loop.close()
+                # 고급 검증 (하위 검증기가 모두 CPU 연산이므로 이벤트 루프 없이 실행,
+                # 문장 분할 통계는 신뢰도 평가에서 다시 쓰도록 보관)
+                text_statistics = RequestTextStatistics.compute(statement, context)
+                validation_result = validation_system.validate_request_sync(analysis_request, text_statistics)
                 
                 if not validation_result.is_valid:
                     return jsonify({
@@ -668,6 +730,7 @@ def validate_request(f):
                 # g 객체에 저장
                 g.analysis_request = analysis_request
                 g.validation_result = validation_result
+                g.text_statistics = text_statistics
             
             # 원래 함수 실행
             result = f(*args, **kwargs)
@@ -697,35 +760,66 @@ def validate_request(f):
     return wrapper
 
 def cache_response(ttl=300):
-    """응답 캐싱 데코레이터"""
+    """응답 캐싱 데코레이터 (정규화된 문장/컨텍스트/모드의 내용 해시를 키로 사용)"""
     def decorator(f):
         @wraps(f)
         def wrapper(*args, **kwargs):
             # 캐시 키 생성
-            cache_key = f"{request.endpoint}:{hash(str(request.get_json() or {}))}"
+            data = request.get_json(silent=True) or {}
+            extra = {k: v for k, v in data.items() if k not in ('statement', 'context', 'analysis_mode')}
+            cache_key = canonical_cache_key(
+                request.endpoint, data.get('statement', ''), data.get('context', ''),
+                data.get('analysis_mode', 'all'), extra
+            )
             
             # 캐시 확인
-            if cache_key in request_cache:
-                cached_data, timestamp = request_cache[cache_key]
-                if time.time() - timestamp < ttl:
-                    performance_metrics['cache_hit_rate'] = (
-                        (performance_metrics['cache_hit_rate'] * performance_metrics['total_requests'] + 1) 
-                        / (performance_metrics['total_requests'] + 1)
-                    )
-                    return jsonify(cached_data)
+            cached_body = response_cache.get(cache_key)
+            performance_metrics['cache_hit_rate'] = response_cache.hit_rate()
+            if cached_body is not None:
+                return Response(cached_body, mimetype='application/json')
             
             # 원래 함수 실행
             result = f(*args, **kwargs)
             
-            # 결과 캐싱
-            if hasattr(result, 'get_json'):
-                response_data = result.get_json()
-                request_cache[cache_key] = (response_data, time.time())
+            # 결과 캐싱 (성공한 JSON 응답만, 직렬화된 본문을 그대로 저장)
+            if isinstance(result, Response) and result.status_code == 200 and result.is_json:
+                body = result.get_data()
+                response_cache.set(cache_key, body, len(body), ttl)
             
             return result
         return wrapper
     return decorator
 
+def history_versioned(f):
+    """
+    히스토리 버전별 응답 캐시 데코레이터 (대시보드 통계/차트용)
+    
+    같은 URL 의 응답 본문은 히스토리가 바뀔 때만 다시 만들고,
+    200 응답에는 히스토리 버전을 ETag 로 붙여 If-None-Match 가 같으면 본문 없이 304 를 보낸다.
+    """
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        # 버전을 먼저 읽으므로 만드는 도중 기록이 추가되면 다음 요청에서 다시 만듦
+        etag = analysis_history.etag
+        cache_key = f"{request.full_path}|{etag}"
+        
+        cached = dashboard_cache.get(cache_key)
+        if cached is not None:
+            status, mimetype, body = cached
+            response = Response(body, status=status, mimetype=mimetype)
+        else:
+            response = app.make_response(f(*args, **kwargs))
+            if response.status_code in (200, 400):
+                body = response.get_data()
+                dashboard_cache.set(cache_key, (response.status_code, response.mimetype, body), len(body))
+        
+        if response.status_code == 200:
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            response.make_conditional(request)
+        return response
+    return wrapper
+
 @app.route('/')
 def index():
     """메인 페이지"""
@@ -799,14 +893,11 @@ def api_analyze():
             'timestamp': datetime.now().isoformat()
         }
         
-        # 고급 신뢰도 평가 (비동기)
+        # 고급 신뢰도 평가 (검증 단계의 문장 분할 통계 재사용)
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            confidence_score = loop.run_until_complete(
-                confidence_system.evaluate_confidence(statement, context, result_dict, validation_result.__dict__)
+            confidence_score = confidence_system.evaluate_confidence_sync(
+                statement, context, result_dict, validation_result.__dict__, g.get('text_statistics')
             )
-            loop.close()
             
             result_dict['confidence_evaluation'] = {
                 'overall_confidence': confidence_score.overall,
@@ -827,13 +918,9 @@ def api_analyze():
                 'processing_time': 0.0
             }
         
-        # 분석 히스토리에 추가
+        # 분석 히스토리에 추가 (용량 초과 시 가장 오래된 기록 제거)
         analysis_history.append(result_dict)
         
-        # 최근 100개만 유지
-        if len(analysis_history) > 100:
-            analysis_history.pop(0)
-        
         logger.info(f"분석 완료: {statement[:50]}... (신뢰도: {result_dict['confidence_evaluation']['overall_confidence']:.3f})")
         
         return jsonify({
@@ -860,7 +947,7 @@ def api_recent():
     """API: 최근 분석 결과"""
     try:
         limit = request.args.get('limit', 10, type=int)
-        recent = analysis_history[-limit:] if analysis_history else []
+        recent = analysis_history.recent(limit)
         return jsonify({'recent_analyses': recent})
     except Exception as e:
         return jsonify({'error': f'최근 분석 결과를 가져오는 중 오류가 발생했습니다: {str(e)}'}), 500
@@ -878,27 +965,17 @@ def api_dashboard():
                 'recent_trends': []
             })
         
-        # 통계 계산
-        total_analyses = len(analysis_history)
-        truth_percentages = [a['final_analysis']['truth_percentage'] for a in analysis_history]
-        average_truth_percentage = sum(truth_percentages) / len(truth_percentages) if truth_percentages else 0
-        
-        corrections = [a for a in analysis_history if a['final_analysis']['needs_correction']]
-        correction_rate = len(corrections) / total_analyses if total_analyses > 0 else 0
+        # 통계 계산 (삽입 시 갱신된 집계 사용)
+        stats = analysis_history.stats()
+        total_analyses = stats['total_analyses']
+        average_truth_percentage = stats['average_truth']
+        correction_rate = stats['flags']['lies_detected'] / total_analyses if total_analyses > 0 else 0
         
         # 탐지기별 통계
-        detector_stats = {}
-        for analysis in analysis_history:
-            for key, value in analysis.items():
-                if key.endswith('_analysis') and isinstance(value, dict):
-                    if key not in detector_stats:
-                        detector_stats[key] = {'detected': 0, 'total': 0}
-                    detector_stats[key]['total'] += 1
-                    if value.get('detected', False) or value.get('is_detected', False):
-                        detector_stats[key]['detected'] += 1
+        detector_stats = stats['sections']
         
         # 최근 트렌드 (최근 20개)
-        recent_trends = analysis_history[-20:] if len(analysis_history) >= 20 else analysis_history
+        recent_trends = analysis_history.recent(20)
         
         return jsonify({
             'total_analyses': total_analyses,
@@ -963,48 +1040,159 @@ def analyze_with_mode(request, mode):
         logger.error(f"분석 중 오류 발생: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# 통합 분석 탐지기 작업 (모두 (statement, context, analysis_context) 인자를 받음)
+def _run_basic_analysis(statement, context, analysis_context):
+    return analysis_context.analyze()
+
+def _run_meta_analysis(statement, context, analysis_context):
+    return meta_detector.analyze_with_meta_check(statement, context, analysis_context)
+
+def _run_religious_analysis(statement, context, analysis_context):
+    return religious_detector.analyze_with_religious_context(statement, context, analysis_context)
+
+def _run_scientific_analysis(statement, context, analysis_context):
+    return scientific_detector.analyze_with_scientific_verification(statement, context, analysis_context)
+
+def _run_intentional_analysis(statement, context, analysis_context):
+    return intentional_detector.analyze_with_intentional_detection(statement, context, analysis_context)
+
+def _run_human_behavior_analysis(statement, context, analysis_context):
+    return human_behavior_detector.analyze_with_human_behavior_verification(statement, context, analysis_context)
+
+def _run_benevolent_analysis(statement, context, analysis_context):
+    return benevolent_detector.analyze_with_benevolent_lie_recognition(statement, context, analysis_context)
+
+def _run_correction_analysis(statement, context, analysis_context):
+    return correction_enhancer.analyze_with_enhanced_correction_capability(statement, context, analysis_context)
+
+def _run_context_analysis(statement, context, analysis_context):
+    return context_detector.analyze_with_context_awareness(statement, context, analysis_context)
+
+def _run_compound_analysis(statement, context, analysis_context):
+    return compound_analyzer.analyze_compound_sentence(statement, context, analysis_context)
+
+def _run_puns_analysis(statement, context, analysis_context):
+    return puns_detector.analyze_with_puns_detection(statement, context)
+
+def _run_coding_analysis(statement, context, analysis_context):
+    return coding_detector.analyze_with_coding_quality_detection(statement, context)
+
+def _run_multilingual_analysis(statement, context, analysis_context):
+    return multilingual_analyzer.analyze_multilingual_statement(statement, context)
+
+# 기본 분석을 공유하는 탐지기는 'basic' 이후 실행, 복합 문장 분석은 맥락 인식 분석 이후 실행
+ANALYSIS_TASKS = [
+    DetectorTask('basic', _run_basic_analysis),
+    DetectorTask('meta', _run_meta_analysis, ('basic',)),
+    DetectorTask('religious', _run_religious_analysis, ('basic',)),
+    DetectorTask('scientific', _run_scientific_analysis, ('basic',)),
+    DetectorTask('intentional', _run_intentional_analysis, ('basic',)),
+    DetectorTask('human_behavior', _run_human_behavior_analysis, ('basic',)),
+    DetectorTask('benevolent', _run_benevolent_analysis, ('basic',)),
+    DetectorTask('correction', _run_correction_analysis, ('basic',)),
+    DetectorTask('context', _run_context_analysis, ('basic',)),
+    DetectorTask('compound', _run_compound_analysis, ('basic', 'context')),
+    DetectorTask('puns', _run_puns_analysis),
+    DetectorTask('coding', _run_coding_analysis),
+    DetectorTask('multilingual', _run_multilingual_analysis)
+]
+
+def _analysis_section(result, build):
+    """탐지기 결과를 응답 섹션으로 변환 (시간 초과/오류 시 표시만 남김)"""
+    if not result.ok:
+        return {'timed_out': result.timed_out, 'error': result.error}
+    return build(result.value)
+
+def _build_final_analysis(statement, basic_analysis, results):
+    """최종 통합 결과 (말장난 우선, 다국어 분석 차선, 코딩 품질 차차선, 복합 문장 분석 차차차선)"""
+    def value(name):
+        return results[name].value if results[name].ok else None
+
+    puns_analysis = value('puns')
+    multilingual_analysis = value('multilingual')
+    coding_analysis = value('coding')
+    compound_analysis = value('compound')
+    context_analysis = value('context')
+    correction_result = value('correction')
+
+    if puns_analysis and puns_analysis['is_pun_detected']:
+        return {
+            'truth_percentage': 1.0,
+            'confidence': puns_analysis['pun_understanding'],
+            'needs_correction': False,
+            'final_corrected_statement': puns_analysis['preserved_statement']
+        }
+    if multilingual_analysis and multilingual_analysis['is_multilingual']:
+        return {
+            'truth_percentage': multilingual_analysis['understanding_score'],
+            'confidence': multilingual_analysis['understanding_score'],
+            'needs_correction': multilingual_analysis['needs_translation'],
+            'final_corrected_statement': statement
+        }
+    if coding_analysis and coding_analysis['is_coding_analysis']:
+        return {
+            'truth_percentage': coding_analysis['quality_score'],
+            'confidence': coding_analysis['quality_score'],
+            'needs_correction': coding_analysis['needs_refactoring'],
+            'final_corrected_statement': statement
+        }
+
+    # 시간 초과된 탐지기는 건너뛰고 기본 분석으로 대체
+    if compound_analysis and compound_analysis['compound_type'] != 'simple':
+        truth_percentage = compound_analysis['compound_truth_percentage']
+        confidence = compound_analysis['compound_confidence']
+    elif context_analysis:
+        truth_percentage = context_analysis['context_aware_truth_percentage']
+        confidence = context_analysis['context_aware_confidence']
+    else:
+        truth_percentage = basic_analysis.truth_percentage
+        confidence = basic_analysis.confidence
+
+    needs_correction = any(
+        result is not None and result[flag]
+        for result, flag in ((compound_analysis, 'compound_correction_applied'),
+                             (context_analysis, 'context_correction_applied'),
+                             (correction_result, 'enhanced_correction_applied'))
+    )
+
+    if compound_analysis and compound_analysis['compound_correction_applied']:
+        final_corrected_statement = compound_analysis['compound_corrected_statement']
+    elif context_analysis and context_analysis['context_correction_applied']:
+        final_corrected_statement = context_analysis['context_corrected_statement']
+    elif correction_result:
+        final_corrected_statement = correction_result['corrected_statement']
+    else:
+        final_corrected_statement = basic_analysis.corrected_statement
+
+    return {
+        'truth_percentage': truth_percentage,
+        'confidence': confidence,
+        'needs_correction': needs_correction,
+        'final_corrected_statement': final_corrected_statement
+    }
+
 def perform_full_analysis(statement, context):
-    """통합 분석 - 모든 기능 사용"""
+    """통합 분석 - 모든 기능 사용 (독립적인 탐지기는 병렬 실행)"""
     try:
+        # 요청 단위 분석 컨텍스트 (기본 진실성 분석을 모든 탐지기가 공유)
+        analysis_context = AnalysisContext(statement, context, detector)
+        # 기본 분석을 먼저 메모이즈 (프로세스 풀에서는 작업마다 컨텍스트가 피클되므로 자식 프로세스가 다시 분석하지 않음)
+        analysis_context.analyze()
         
-        # 1. 기본 진실성 분석
-        basic_analysis = detector.analyze_statement(statement, context)
-        
-        # 2. 메타-진실성 분석
-        meta_analysis = meta_detector.analyze_with_meta_check(statement, context)
-        
-        # 3. 종교적 맥락 분석
-        religious_analysis = religious_detector.analyze_with_religious_context(statement, context)
-        
-        # 4. 강화된 과학적 분석
-        scientific_analysis = scientific_detector.analyze_with_scientific_verification(statement, context)
+        # 13개 탐지기 병렬 실행 (탐지기별 제한 시간 초과 시 부분 결과)
+        results = detector_scheduler.run(ANALYSIS_TASKS, statement, context, analysis_context)
+        detector_latencies = {name: result.to_dict() for name, result in results.items()}
+        timed_out_detectors = [name for name, result in results.items() if result.timed_out]
         
-        # 5. 의도적 거짓말 분석
-        intentional_analysis = intentional_detector.analyze_with_intentional_detection(statement, context)
-        
-        # 6. 인간 행동 패턴 분석
-        human_behavior_result = human_behavior_detector.analyze_with_human_behavior_verification(statement, context)
-        
-        # 7. 선의의 거짓말 분석
-        benevolent_result = benevolent_detector.analyze_with_benevolent_lie_recognition(statement, context)
-        
-        # 8. 교정 능력 강화 분석
-        correction_result = correction_enhancer.analyze_with_enhanced_correction_capability(statement, context)
-        
-        # 9. 맥락 인식 분석
-        context_analysis = context_detector.analyze_with_context_awareness(statement, context)
-        
-        # 10. 복합 문장 분석
-        compound_analysis = compound_analyzer.analyze_compound_sentence(statement, context)
-        
-        # 11. 말장난 분석
-        puns_analysis = puns_detector.analyze_with_puns_detection(statement, context)
+        if not results['basic'].ok:
+            return jsonify({
+                'success': False,
+                'error': '기본 진실성 분석을 완료하지 못했습니다.',
+                'timed_out_detectors': timed_out_detectors,
+                'detector_latencies': detector_latencies
+            }), 504
         
-        # 12. 코딩 품질 분석
-        coding_analysis = coding_detector.analyze_with_coding_quality_detection(statement, context)
-        
-        # 13. 다국어 분석
-        multilingual_analysis = multilingual_analyzer.analyze_multilingual_statement(statement, context)
+        basic_analysis = results['basic'].value
         
         # 통합된 분석 결과 생성
         analysis_id = str(uuid.uuid4())
@@ -1014,6 +1202,13 @@ def perform_full_analysis(statement, context):
             'context': context,
             'timestamp': datetime.now().isoformat(),
             
+            # 요청 단위 분석 통계 (기본 분석 실행 횟수 등)
+            'analysis_context_stats': analysis_context.get_stats(),
+            
+            # 탐지기별 실행 시간 및 제한 시간 초과 탐지기 (부분 결과 여부)
+            'detector_latencies': detector_latencies,
+            'timed_out_detectors': timed_out_detectors,
+            
             # 기본 분석 결과
             'basic_analysis': {
                 'truth_percentage': basic_analysis.truth_percentage,
@@ -1027,36 +1222,36 @@ def perform_full_analysis(statement, context):
             },
             
             # 메타-진실성 분석
-            'meta_analysis': {
+            'meta_analysis': _analysis_section(results['meta'], lambda meta_analysis: {
                 'meta_lie_detected': meta_analysis['meta_lies_detected'],
                 'meta_lies': meta_analysis.get('meta_lies_detected', []),
                 'meta_correction_applied': meta_analysis['meta_correction_applied'],
                 'corrected_statement': meta_analysis.get('meta_corrected_statement'),
                 'meta_confidence': meta_analysis['meta_confidence'],
                 'philosophical_note': "AI는 깨진 거울이므로, 자신의 한계를 인정합니다."
-            },
+            }),
             
             # 종교적 맥락 분석
-            'religious_analysis': {
+            'religious_analysis': _analysis_section(results['religious'], lambda religious_analysis: {
                 'religious_topic_detected': religious_analysis['is_religious_topic'],
                 'detected_religions': religious_analysis.get('detected_religions', []),
                 'adjusted_confidence': religious_analysis['adjusted_confidence'],
                 'religious_warnings': religious_analysis.get('religious_warnings', []),
                 'philosophical_note': "종교적 믿음은 객관적 진실성 평가의 한계가 있습니다."
-            },
+            }),
             
             # 과학적 분석
-            'scientific_analysis': {
+            'scientific_analysis': _analysis_section(results['scientific'], lambda scientific_analysis: {
                 'scientific_lie_detected': scientific_analysis['is_scientific_lie'],
                 'detected_scientific_lies': scientific_analysis.get('detected_scientific_lies', []),
                 'scientific_correction_applied': scientific_analysis['scientific_correction_applied'],
                 'corrected_statement': scientific_analysis.get('corrected_statement'),
                 'scientific_warnings': scientific_analysis.get('scientific_warnings', []),
                 'philosophical_note': "기본적인 과학적 사실에 대해서는 확실히 교정할 수 있습니다."
-            },
+            }),
             
             # 의도적 거짓말 분석
-            'intentional_analysis': {
+            'intentional_analysis': _analysis_section(results['intentional'], lambda intentional_analysis: {
                 'intentional_lie_detected': intentional_analysis['is_intentional_lie'],
                 'intentional_purpose': intentional_analysis.get('intentional_purpose', ''),
                 'detection_confidence': intentional_analysis.get('intentional_analysis', {}).get('detection_confidence', 0.0),
@@ -1065,40 +1260,40 @@ def perform_full_analysis(statement, context):
                 'response': intentional_analysis.get('response_strategy', ''),
                 'correction': '',
                 'philosophical_note': "질문자의 의도를 파악하여 적절히 대응합니다."
-            },
+            }),
             
             # 인간 행동 분석
-            'human_behavior_analysis': {
+            'human_behavior_analysis': _analysis_section(results['human_behavior'], lambda human_behavior_result: {
                 'is_human_behavior_lie': human_behavior_result['is_human_behavior_lie'],
                 'detected_human_behavior_lies': human_behavior_result['detected_human_behavior_lies'],
                 'human_behavior_correction_applied': human_behavior_result['human_behavior_correction_applied'],
                 'corrected_statement': human_behavior_result['corrected_statement'],
                 'corrected_truth_percentage': human_behavior_result['corrected_truth_percentage'],
                 'human_behavior_warnings': human_behavior_result['human_behavior_warnings']
-            },
+            }),
             
             # 선의의 거짓말 분석
-            'benevolent_analysis': {
+            'benevolent_analysis': _analysis_section(results['benevolent'], lambda benevolent_result: {
                 'is_benevolent_lie': benevolent_result['is_benevolent_lie'],
                 'detected_benevolent_lies': benevolent_result['detected_benevolent_lies'],
                 'context_analysis': benevolent_result['context_analysis'],
                 'adjusted_confidence': benevolent_result['adjusted_confidence'],
                 'philosophical_insights': benevolent_result['philosophical_insights'],
                 'benevolent_response': benevolent_result['benevolent_response']
-            },
+            }),
             
             # 교정 능력 강화 분석
-            'correction_enhancement': {
+            'correction_enhancement': _analysis_section(results['correction'], lambda correction_result: {
                 'enhanced_correction_applied': correction_result['enhanced_correction_applied'],
                 'detected_correction_patterns': correction_result['detected_correction_patterns'],
                 'corrected_statement': correction_result['corrected_statement'],
                 'correction_details': correction_result['correction_details'],
                 'enhanced_confidence': correction_result['enhanced_confidence'],
                 'correction_capability_messages': correction_result['correction_capability_messages']
-            },
+            }),
             
             # 맥락 인식 분석
-            'context_analysis': {
+            'context_analysis': _analysis_section(results['context'], lambda context_analysis: {
                 'context_type': context_analysis['context_type'],
                 'contextual_meaning': context_analysis['contextual_meaning'],
                 'context_aware_truth_percentage': context_analysis['context_aware_truth_percentage'],
@@ -1107,10 +1302,10 @@ def perform_full_analysis(statement, context):
                 'context_correction_applied': context_analysis['context_correction_applied'],
                 'context_warnings': context_analysis['context_warnings'],
                 'philosophical_note': context_analysis['philosophical_note']
-            },
+            }),
             
             # 복합 문장 분석
-            'compound_analysis': {
+            'compound_analysis': _analysis_section(results['compound'], lambda compound_analysis: {
                 'compound_type': compound_analysis['compound_type'],
                 'sentences': compound_analysis['sentences'],
                 'sentence_count': len(compound_analysis['sentences']),
@@ -1120,10 +1315,10 @@ def perform_full_analysis(statement, context):
                 'compound_correction_applied': compound_analysis['compound_correction_applied'],
                 'compound_warnings': compound_analysis['compound_warnings'],
                 'philosophical_note': compound_analysis['philosophical_note']
-            },
+            }),
             
             # 말장난 분석
-            'puns_analysis': {
+            'puns_analysis': _analysis_section(results['puns'], lambda puns_analysis: {
                 'is_pun_detected': puns_analysis['is_pun_detected'],
                 'detected_puns': puns_analysis['detected_puns'],
                 'pun_types': puns_analysis['pun_types'],
@@ -1133,10 +1328,10 @@ def perform_full_analysis(statement, context):
                 'preserved_statement': puns_analysis['preserved_statement'],
                 'pun_response': puns_analysis['pun_response'],
                 'philosophical_note': puns_analysis['philosophical_note']
-            },
+            }),
             
             # 코딩 품질 분석
-            'coding_analysis': {
+            'coding_analysis': _analysis_section(results['coding'], lambda coding_analysis: {
                 'is_coding_analysis': coding_analysis['is_coding_analysis'],
                 'unnecessary_code_detected': coding_analysis['unnecessary_code_detected'],
                 'unnecessary_code': coding_analysis['unnecessary_code'],
@@ -1151,10 +1346,10 @@ def perform_full_analysis(statement, context):
                 'ai_response': coding_analysis['ai_response'],
                 'needs_refactoring': coding_analysis['needs_refactoring'],
                 'philosophical_note': coding_analysis['philosophical_note']
-            },
+            }),
             
             # 다국어 분석
-            'multilingual_analysis': {
+            'multilingual_analysis': _analysis_section(results['multilingual'], lambda multilingual_analysis: {
                 'is_multilingual': multilingual_analysis['is_multilingual'],
                 'detected_languages': multilingual_analysis['detected_languages'],
                 'language_distribution': multilingual_analysis['language_distribution'],
@@ -1166,15 +1361,10 @@ def perform_full_analysis(statement, context):
                 'ai_response': multilingual_analysis['ai_response'],
                 'needs_translation': multilingual_analysis['needs_translation'],
                 'philosophical_note': multilingual_analysis['philosophical_note']
-            },
+            }),
             
             # 최종 통합 결과 (말장난 우선, 다국어 분석 차선, 코딩 품질 차차선, 복합 문장 분석 차차차선)
-            'final_analysis': {
-                'truth_percentage': 1.0 if puns_analysis['is_pun_detected'] else (multilingual_analysis['understanding_score'] if multilingual_analysis['is_multilingual'] else (coding_analysis['quality_score'] if coding_analysis['is_coding_analysis'] else (compound_analysis['compound_truth_percentage'] if compound_analysis['compound_type'] != 'simple' else context_analysis['context_aware_truth_percentage']))),
-                'confidence': puns_analysis['pun_understanding'] if puns_analysis['is_pun_detected'] else (multilingual_analysis['understanding_score'] if multilingual_analysis['is_multilingual'] else (coding_analysis['quality_score'] if coding_analysis['is_coding_analysis'] else (compound_analysis['compound_confidence'] if compound_analysis['compound_type'] != 'simple' else context_analysis['context_aware_confidence']))),
-                'needs_correction': False if puns_analysis['is_pun_detected'] else (multilingual_analysis['needs_translation'] if multilingual_analysis['is_multilingual'] else (coding_analysis['needs_refactoring'] if coding_analysis['is_coding_analysis'] else (compound_analysis['compound_correction_applied'] or context_analysis['context_correction_applied'] or correction_result['enhanced_correction_applied']))),
-                'final_corrected_statement': puns_analysis['preserved_statement'] if puns_analysis['is_pun_detected'] else (statement if multilingual_analysis['is_multilingual'] else (statement if coding_analysis['is_coding_analysis'] else (compound_analysis['compound_corrected_statement'] if compound_analysis['compound_correction_applied'] else (context_analysis['context_corrected_statement'] if context_analysis['context_correction_applied'] else correction_result['corrected_statement']))))
-            }
+            'final_analysis': _build_final_analysis(statement, basic_analysis, results)
         }
         
         analysis_history.append(analysis_record)
@@ -1196,165 +1386,187 @@ def perform_full_analysis(statement, context):
 @app.route('/dashboard')
 def dashboard():
     """대시보드 페이지"""
-    return render_template('dashboard.html')
+    return render_template('dashboard.html', trend_max_points=app.config['TREND_MAX_POINTS'])
+
+def _dashboard_statistics():
+    """대시보드 통계 카드 데이터 - 통합 분석 결과 반영 (삽입 시 갱신된 집계 사용, 히스토리 크기와 무관)"""
+    if not analysis_history:
+        return {
+            'total_analyses': 0,
+            'average_truth': 0,
+            'lies_detected': 0,
+            'corrections_made': 0,
+            'meta_lies_detected': 0,
+            'religious_topics': 0,
+            'scientific_lies': 0,
+            'intentional_lies': 0,
+            'human_behavior_lies': 0,
+            'benevolent_lies': 0,
+            'puns_detected': 0,
+            'coding_issues_detected': 0,
+            'intentional_manipulation': 0,
+            'multilingual_detected': 0,
+            'languages_used': 0
+        }
+    
+    stats = analysis_history.stats()
+    flags = stats['flags']
+    total_analyses = stats['total_analyses']
+    average_truth = stats['average_truth']      # 점수가 있는 기록(통합 분석)만으로 나눈 평균
+    lies_detected = flags['lies_detected']
+    corrections_made = flags['corrections_made']
+    
+    # 각 탐지기별 통계
+    meta_lies_detected = flags['meta_lies_detected']
+    religious_topics = flags['religious_topics']
+    scientific_lies = flags['scientific_lies']
+    intentional_lies = flags['intentional_lies']
+    human_behavior_lies = flags['human_behavior_lies']
+    benevolent_lies = flags['benevolent_lies']
+    context_corrections = flags['context_corrections']
+    compound_corrections = flags['compound_corrections']
+    puns_detected = flags['puns_detected']
+    coding_issues_detected = flags['coding_issues_detected']
+    intentional_manipulation = flags['intentional_manipulation']
+    multilingual_detected = flags['multilingual_detected']
+    languages_used = stats['languages_used']
+    
+    return {
+        'total_analyses': total_analyses,
+        'average_truth': average_truth,
+        'lies_detected': lies_detected,
+        'corrections_made': corrections_made,
+        'meta_lies_detected': meta_lies_detected,
+        'religious_topics': religious_topics,
+        'scientific_lies': scientific_lies,
+        'intentional_lies': intentional_lies,
+        'human_behavior_lies': human_behavior_lies,
+        'benevolent_lies': benevolent_lies,
+        'context_corrections': context_corrections,
+        'compound_corrections': compound_corrections,
+        'puns_detected': puns_detected,
+        'coding_issues_detected': coding_issues_detected,
+        'intentional_manipulation': intentional_manipulation,
+        'multilingual_detected': multilingual_detected,
+        'languages_used': languages_used,
+        'truth_trend': [a['final_analysis']['truth_percentage'] for a in analysis_history.recent(10) if 'final_analysis' in a]  # 최근 10개
+    }
+
+# 검증 방법별 차트의 막대 (표시 이름, FLAG_COUNTERS 이름)
+VERIFICATION_CHART_FLAGS = [
+    ('기본 탐지기', 'basic_lies_detected'),
+    ('메타-진실성', 'meta_lies_detected'),
+    ('종교적 맥락', 'religious_topics'),
+    ('과학적 검증', 'scientific_lies'),
+    ('의도적 거짓말', 'intentional_lies'),
+    ('인간 행동', 'human_behavior_lies'),
+    ('선의의 거짓말', 'benevolent_lies'),
+    ('교정 강화', 'enhanced_corrections'),
+    ('말장난', 'puns_detected'),
+    ('코딩 품질', 'coding_issues_detected'),
+    ('다국어', 'multilingual_detected')
+]
+
+def _verification_rates():
+    """최근 분석들의 탐지기별 감지율 (최근 10개를 한 번만 순회, 기록이 없으면 빈 dict)"""
+    recent_analyses = analysis_history.recent(10)
+    if not recent_analyses:
+        return {}
+    detected_counts = dict.fromkeys((name for _, name in VERIFICATION_CHART_FLAGS), 0)
+    for analysis in recent_analyses:
+        for name in detected_counts:
+            detected_counts[name] += FLAG_COUNTERS[name](analysis)
+    return {label: detected_counts[name] / len(recent_analyses) for label, name in VERIFICATION_CHART_FLAGS}
+
+def _dashboard_snapshot():
+    """대시보드 실시간 업데이트에 담는 집계"""
+    return {'statistics': _dashboard_statistics(), 'verification': _verification_rates()}
 
 @app.route('/api/statistics')
+@history_versioned
 def get_statistics():
     """통계 데이터 API - 통합 분석 결과 반영"""
     try:
-        if not analysis_history:
-            return jsonify({
-                'total_analyses': 0,
-                'average_truth': 0,
-                'lies_detected': 0,
-                'corrections_made': 0,
-                'meta_lies_detected': 0,
-                'religious_topics': 0,
-                'scientific_lies': 0,
-                'intentional_lies': 0,
-                'human_behavior_lies': 0,
-                'benevolent_lies': 0,
-                'puns_detected': 0,
-                'coding_issues_detected': 0,
-                'intentional_manipulation': 0,
-                'multilingual_detected': 0,
-                'languages_used': 0
-            })
-        
-        total_analyses = len(analysis_history)
-        average_truth = sum(a['final_analysis']['truth_percentage'] for a in analysis_history) / total_analyses
-        lies_detected = sum(1 for a in analysis_history if a['final_analysis']['needs_correction'])
-        corrections_made = sum(1 for a in analysis_history if a['final_analysis']['final_corrected_statement'])
-        
-        # 각 탐지기별 통계
-        meta_lies_detected = sum(1 for a in analysis_history if a.get('meta_analysis', {}).get('meta_lie_detected', False))
-        religious_topics = sum(1 for a in analysis_history if a.get('religious_analysis', {}).get('religious_topic_detected', False))
-        scientific_lies = sum(1 for a in analysis_history if a.get('scientific_analysis', {}).get('scientific_lie_detected', False))
-        intentional_lies = sum(1 for a in analysis_history if a.get('intentional_analysis', {}).get('intentional_lie_detected', False))
-        human_behavior_lies = sum(1 for a in analysis_history if a.get('human_behavior_analysis', {}).get('is_human_behavior_lie', False))
-        benevolent_lies = sum(1 for a in analysis_history if a.get('benevolent_analysis', {}).get('is_benevolent_lie', False))
-        context_corrections = sum(1 for a in analysis_history if a.get('context_analysis', {}).get('context_correction_applied', False))
-        compound_corrections = sum(1 for a in analysis_history if a.get('compound_analysis', {}).get('compound_correction_applied', False))
-        puns_detected = sum(1 for a in analysis_history if a.get('puns_analysis', {}).get('is_pun_detected', False))
-        coding_issues_detected = sum(1 for a in analysis_history if a.get('coding_analysis', {}).get('unnecessary_code_detected', False))
-        intentional_manipulation = sum(1 for a in analysis_history if a.get('coding_analysis', {}).get('is_intentional_manipulation', False))
-        multilingual_detected = sum(1 for a in analysis_history if a.get('multilingual_analysis', {}).get('is_multilingual', False))
-        languages_used = sum(len(a.get('multilingual_analysis', {}).get('detected_languages', [])) for a in analysis_history)
-        
-        return jsonify({
-            'total_analyses': total_analyses,
-            'average_truth': average_truth,
-            'lies_detected': lies_detected,
-            'corrections_made': corrections_made,
-            'meta_lies_detected': meta_lies_detected,
-            'religious_topics': religious_topics,
-            'scientific_lies': scientific_lies,
-            'intentional_lies': intentional_lies,
-            'human_behavior_lies': human_behavior_lies,
-            'benevolent_lies': benevolent_lies,
-            'context_corrections': context_corrections,
-            'compound_corrections': compound_corrections,
-            'puns_detected': puns_detected,
-            'coding_issues_detected': coding_issues_detected,
-            'intentional_manipulation': intentional_manipulation,
-            'multilingual_detected': multilingual_detected,
-            'languages_used': languages_used,
-            'truth_trend': [a['final_analysis']['truth_percentage'] for a in analysis_history[-10:]]  # 최근 10개
-        })
+        return jsonify(_dashboard_statistics())
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/verification_chart')
+@history_versioned
 def get_verification_chart():
     """탐지기별 분석 결과 차트 데이터"""
     try:
         if not analysis_history:
             return jsonify({'error': '분석 데이터가 없습니다.'}), 400
         
-        # 최근 분석들의 탐지기별 감지율
-        recent_analyses = analysis_history[-10:] if len(analysis_history) >= 10 else analysis_history
-        
-        detector_stats = {
-            '기본 탐지기': sum(1 for a in recent_analyses if a.get('basic_analysis', {}).get('detected_lies', [])) / len(recent_analyses),
-            '메타-진실성': sum(1 for a in recent_analyses if a.get('meta_analysis', {}).get('meta_lie_detected', False)) / len(recent_analyses),
-            '종교적 맥락': sum(1 for a in recent_analyses if a.get('religious_analysis', {}).get('religious_topic_detected', False)) / len(recent_analyses),
-            '과학적 검증': sum(1 for a in recent_analyses if a.get('scientific_analysis', {}).get('scientific_lie_detected', False)) / len(recent_analyses),
-            '의도적 거짓말': sum(1 for a in recent_analyses if a.get('intentional_analysis', {}).get('intentional_lie_detected', False)) / len(recent_analyses),
-            '인간 행동': sum(1 for a in recent_analyses if a.get('human_behavior_analysis', {}).get('is_human_behavior_lie', False)) / len(recent_analyses),
-            '선의의 거짓말': sum(1 for a in recent_analyses if a.get('benevolent_analysis', {}).get('is_benevolent_lie', False)) / len(recent_analyses),
-            '교정 강화': sum(1 for a in recent_analyses if a.get('correction_enhancement', {}).get('enhanced_correction_applied', False)) / len(recent_analyses),
-            '말장난': sum(1 for a in recent_analyses if a.get('puns_analysis', {}).get('is_pun_detected', False)) / len(recent_analyses),
-            '코딩 품질': sum(1 for a in recent_analyses if a.get('coding_analysis', {}).get('unnecessary_code_detected', False)) / len(recent_analyses),
-            '다국어': sum(1 for a in recent_analyses if a.get('multilingual_analysis', {}).get('is_multilingual', False)) / len(recent_analyses)
-        }
-        
-        # 차트 데이터 생성
-        fig = go.Figure(data=[
-            go.Bar(
-                x=list(detector_stats.keys()),
-                y=list(detector_stats.values()),
-                marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD', '#98D8C8', '#F7DC6F', '#FF9F43', '#6C5CE7', '#A29BFE']
-            )
-        ])
-        
-        fig.update_layout(
-            title='탐지기별 감지율',
-            xaxis_title='탐지기',
-            yaxis_title='감지율',
-            yaxis=dict(range=[0, 1]),
-            xaxis_tickangle=-45
-        )
-        
-        return jsonify(plotly.utils.PlotlyJSONEncoder().encode(fig))
+        # 차트 데이터 생성 (값 배열에서 바로 그림 JSON 생성)
+        return jsonify(encode_figure(verification_figure(_verification_rates())))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _parse_trend_time(value):
+    """트렌드 구간 경계 (ISO 시각 또는 유닉스 초 → 유닉스 초, 없으면 None)"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
 @app.route('/api/truth_trend')
+@history_versioned
 def get_truth_trend():
-    """통합 진실성 트렌드 차트"""
+    """
+    통합 진실성 트렌드 차트
+    
+    쿼리 파라미터:
+        from, to: 구간 (ISO 시각 또는 유닉스 초, 기본값은 전체)
+        bucket: 버킷 크기 ('30s', '5m', '1h', '1d' 또는 초), 없으면 점이 max_points 이하일 때 원본 점
+        max_points: 최대 점 수 (기본 TREND_MAX_POINTS, 작은 버킷은 자동으로 넓힘)
+        mode: 'minmax' (버킷별 최소/평균/최대) 또는 'lttb' (축약 시계열)
+        format: 'figure' (Plotly 그림 JSON 문자열) 또는 'series' (시계열 JSON)
+    """
     try:
         if not analysis_history:
             return jsonify({'error': '분석 데이터가 없습니다.'}), 400
         
-        # 시간순 진실성 점수 (통합 결과)
-        timestamps = [datetime.fromisoformat(a['timestamp']) for a in analysis_history]
-        truth_scores = [a['final_analysis']['truth_percentage'] for a in analysis_history]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=timestamps,
-            y=truth_scores,
-            mode='lines+markers',
-            name='통합 진실성 점수',
-            line=dict(color='#2E86AB', width=3),
-            marker=dict(size=8)
-        ))
-        
-        # 임계값 라인 추가
-        fig.add_hline(y=0.99, line_dash="dash", line_color="red", 
-                     annotation_text="진실성 임계값 (99%)")
-        fig.add_hline(y=0.20, line_dash="dash", line_color="orange", 
-                     annotation_text="교정 임계값 (20%)")
-        
-        fig.update_layout(
-            title='AI 통합 진실성 트렌드',
-            xaxis_title='시간',
-            yaxis_title='진실성 점수',
-            yaxis=dict(range=[0, 1])
-        )
-        
-        return jsonify(plotly.utils.PlotlyJSONEncoder().encode(fig))
+        try:
+            start = _parse_trend_time(request.args.get('from'))
+            end = _parse_trend_time(request.args.get('to'))
+            bucket = request.args.get('bucket')
+            bucket_seconds = parse_bucket(bucket) if bucket else None
+            max_points = min(request.args.get('max_points', app.config['TREND_MAX_POINTS'], type=int),
+                             app.config['TREND_MAX_POINTS_LIMIT'])
+            trend = analysis_history.trend(start, end, bucket_seconds, max_points, request.args.get('mode', 'minmax'))
+        except ValueError as e:
+            return jsonify({'error': f'잘못된 트렌드 조회 조건입니다: {str(e)}'}), 400
+        
+        if request.args.get('format') == 'series':
+            return jsonify(trend)
+        
+        # 미리 집계된 시간 색인의 시계열로 그림 생성 (기록을 순회하지 않음)
+        points = trend['points']
+        timestamps = [point['time'] for point in points]
+        if trend['mode'] == 'minmax':
+            figure = truth_trend_figure(timestamps, [point['mean'] for point in points],
+                                        [point['min'] for point in points], [point['max'] for point in points])
+        else:
+            figure = truth_trend_figure(timestamps, [point['value'] for point in points])
+        # 대시보드가 실시간 점을 그대로 이어 붙여도 되는지 (raw 일 때만) 판단하도록 집계 방식 표시
+        figure['layout']['meta'] = {'trend_mode': trend['mode']}
+        return jsonify(encode_figure(figure))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/recent_analyses')
+@history_versioned
 def get_recent_analyses():
     """최근 분석 결과"""
     try:
-        recent = analysis_history[-5:] if len(analysis_history) >= 5 else analysis_history
+        recent = analysis_history.recent(5)
         return jsonify(recent)
         
     except Exception as e:
@@ -1364,8 +1576,7 @@ def get_recent_analyses():
 def clear_history():
     """분석 히스토리 초기화"""
     try:
-        global analysis_history
-        analysis_history = []
+        analysis_history.clear()
         session.pop('analysis_ids', None)
         return jsonify({'success': True, 'message': '히스토리가 초기화되었습니다.'})
         
@@ -1548,13 +1759,9 @@ def perform_ai_self_analysis(statement, context, analysis_mode):
             }
         }
         
-        # 분석 히스토리에 추가
+        # 분석 히스토리에 추가 (용량 초과 시 가장 오래된 기록 제거)
         analysis_history.append(analysis_record)
         
-        # 최근 100개만 유지
-        if len(analysis_history) > 100:
-            analysis_history.pop(0)
-        
         # 실시간 알림 발송
         try:
             truth_percentage = meta_analysis.truth_percentage
@@ -1896,6 +2103,42 @@ def api_consistent_analyze():
     except Exception as e:
         return jsonify({'error': f'일관성 있는 분석 중 오류가 발생했습니다: {str(e)}'}), 500
 
+@app.route('/api/consistent-analyze/batch', methods=['POST'])
+def api_consistent_analyze_batch():
+    """API: 일관성 있는 진실성 일괄 분석 (공유 캐시 다중 조회)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        statements = data.get('statements', [])
+        context = (data.get('context') or '').strip()
+        
+        if not statements or not isinstance(statements, list) or not all(isinstance(s, str) and s.strip() for s in statements):
+            return jsonify({'error': '분석할 문장 목록을 입력해주세요.'}), 400
+        
+        results = ai_consistent_detector.analyze_statements([s.strip() for s in statements], context)
+        
+        return jsonify({
+            'success': True,
+            'analyses': [
+                {
+                    'index': i,
+                    'statement': result.statement,
+                    'statement_hash': result.statement_hash,
+                    'truth_percentage': result.truth_percentage,
+                    'confidence': result.confidence,
+                    'needs_correction': result.needs_correction,
+                    'corrected_statement': result.corrected_statement,
+                    'consistency_score': result.consistency_score,
+                    'analysis_method': result.analysis_method,
+                    'analysis_timestamp': result.analysis_timestamp.isoformat()
+                }
+                for i, result in enumerate(results)
+            ],
+            'cache_stats': ai_consistent_detector.get_cache_stats()
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'일관성 있는 일괄 분석 중 오류가 발생했습니다: {str(e)}'}), 500
+
 @app.route('/api/consistency-test', methods=['POST'])
 def api_consistency_test():
     """API: 일관성 테스트"""
@@ -1980,7 +2223,12 @@ def api_health():
                 'python_version': '3.8+',
                 'flask_version': '2.0+',
                 'analysis_history_size': len(analysis_history),
-                'cache_size': len(request_cache)
+                'cache_size': len(response_cache)
+            },
+            'detectors': {
+                'loaded': sum(1 for name in detector_registry.names() if detector_registry.is_loaded(name)),
+                'registered': len(detector_registry.names()),
+                'warming_up': detector_registry.warming_up()
             }
         })
     except Exception as e:
@@ -1997,11 +2245,24 @@ def api_metrics():
         return jsonify({
             'success': True,
             'metrics': performance_metrics,
+            'cache': response_cache.stats(),
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
         return jsonify({'error': f'메트릭 조회 중 오류가 발생했습니다: {str(e)}'}), 500
 
+@app.route('/api/v1/system/startup', methods=['GET'])
+def startup_report():
+    """기동 시간 보고서 (모듈 import 및 탐지기 생성자별 소요 시간)"""
+    try:
+        return jsonify({
+            'success': True,
+            'startup': detector_registry.startup_report(),
+            'timestamp': datetime.now().isoformat()
+        })
+    except Exception as e:
+        return jsonify({'error': f'기동 시간 보고서 조회 중 오류가 발생했습니다: {str(e)}'}), 500
+
 @app.route('/api/validate', methods=['POST'])
 def api_validate():
     """API: 입력 검증 전용 엔드포인트"""
@@ -2034,15 +2295,16 @@ def api_validate():
             session_id=session.get('session_id')
         )
         
-        # 비동기 검증 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        validation_result = loop.run_until_complete(
-            validation_system.validate_request(analysis_request)
-        )
-        loop.close()
+        # 검증 실행 (include_confidence 이면 같은 텍스트 통계로 신뢰도 평가까지 한 단계로)
+        confidence_score = None
+        if data.get('include_confidence', False):
+            validation_result, confidence_score = validate_and_score(
+                validation_system, confidence_system, analysis_request, data.get('analysis_result', {})
+            )
+        else:
+            validation_result = validation_system.validate_request_sync(analysis_request)
         
-        return jsonify({
+        response = {
             'success': True,
             'validation_result': {
                 'is_valid': validation_result.is_valid,
@@ -2054,7 +2316,19 @@ def api_validate():
                 'processing_time': validation_result.processing_time,
                 'timestamp': validation_result.timestamp.isoformat()
             }
-        })
+        }
+        if confidence_score is not None:
+            response['confidence_evaluation'] = {
+                'overall_confidence': confidence_score.overall,
+                'quality_level': confidence_score.quality_level.name,
+                'explanation': confidence_score.explanation,
+                'recommendations': confidence_score.recommendations,
+                'source_scores': {source.value: score for source, score in confidence_score.sources.items()},
+                'processing_time': confidence_score.processing_time,
+                'timestamp': confidence_score.timestamp.isoformat()
+            }
+        
+        return jsonify(response)
         
     except Exception as e:
         logger.error(f"검증 중 오류 발생: {str(e)}")
@@ -2072,13 +2346,8 @@ def api_confidence():
         if not statement:
             return jsonify({'error': '문장을 입력해주세요.'}), 400
         
-        # 비동기 신뢰도 평가 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        confidence_score = loop.run_until_complete(
-            confidence_system.evaluate_confidence(statement, context, analysis_result)
-        )
-        loop.close()
+        # 신뢰도 평가 실행 (평가기가 모두 CPU 연산이므로 이벤트 루프 없이 실행)
+        confidence_score = confidence_system.evaluate_confidence_sync(statement, context, analysis_result)
         
         return jsonify({
             'success': True,
@@ -2097,56 +2366,101 @@ def api_confidence():
         logger.error(f"신뢰도 평가 중 오류 발생: {str(e)}")
         return jsonify({'error': f'신뢰도 평가 중 오류가 발생했습니다: {str(e)}'}), 500
 
+def _batch_result(index, statement, context, analysis):
+    """배치 분석 결과 항목"""
+    return {
+        'index': index,
+        'statement': statement,
+        'context': context,
+        'final_analysis': {
+            'truth_percentage': analysis.truth_percentage,
+            'confidence': analysis.confidence,
+            'needs_correction': analysis.auto_correction_applied
+        },
+        'basic_analysis': {
+            'truth_percentage': analysis.truth_percentage,
+            'confidence': analysis.confidence,
+            'detected_lies': analysis.detected_lies,
+            'correction_suggestions': analysis.correction_suggestions,
+            'verification_methods': analysis.verification_methods,
+            'corrected_statement': analysis.corrected_statement,
+            'auto_correction_applied': analysis.auto_correction_applied,
+            'lie_percentage': analysis.lie_percentage
+        },
+        'timestamp': analysis.analysis_timestamp.isoformat()
+    }
+
+def _iter_batch_results(statements, context, chunk_size):
+    """
+    입력 순서대로 배치 분석 결과 생성
+    
+    중복 문장은 한 번만 분석하고, 고유 문장은 chunk_size 개씩 묶어 점수를 계산하므로
+    스트리밍 응답은 첫 청크가 끝나는 즉시 시작된다.
+    """
+    valid_statements = [s if isinstance(s, str) and s.strip() else None for s in statements]
+    unique, inverse = dedupe_statements([s for s in valid_statements if s is not None])
+    
+    analyses = []
+    position = 0
+    for i, statement in enumerate(valid_statements):
+        if statement is None:
+            yield {
+                'index': i,
+                'statement': statements[i],
+                'error': '빈 문장이거나 문자열이 아닙니다.',
+                'timestamp': datetime.now().isoformat()
+            }
+            continue
+        
+        unique_index = inverse[position]
+        position += 1
+        if unique_index >= len(analyses):
+            chunk = unique[len(analyses):len(analyses) + chunk_size]
+            try:
+                analyses.extend(batch_scorer.analyze_batch(chunk, context))
+            except Exception as e:
+                logger.error(f"배치 분석 중 오류 (문장 {i}): {str(e)}")
+                analyses.extend([e] * len(chunk))
+        
+        analysis = analyses[unique_index]
+        if isinstance(analysis, Exception):
+            yield {
+                'index': i,
+                'statement': statement,
+                'error': str(analysis),
+                'timestamp': datetime.now().isoformat()
+            }
+        else:
+            yield _batch_result(i, statement, context, analysis)
+
 @app.route('/api/batch-analyze', methods=['POST'])
 def api_batch_analyze():
-    """API: 배치 분석 (여러 문장 동시 처리)"""
+    """API: 배치 분석 (여러 문장 동시 처리, ?stream=true 또는 Accept: application/x-ndjson 이면 NDJSON 스트리밍)"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         statements = data.get('statements', [])
-        context = data.get('context', '').strip()
-        analysis_mode = data.get('analysis_mode', 'all')
+        context = (data.get('context') or '').strip()
         
         if not statements or not isinstance(statements, list):
             return jsonify({'error': '분석할 문장 목록을 입력해주세요.'}), 400
         
-        if len(statements) > 10:
-            return jsonify({'error': '한 번에 최대 10개 문장까지 분석할 수 있습니다.'}), 400
+        chunk_size = app.config['BATCH_CHUNK_SIZE']
+        stream = (request.args.get('stream', '').lower() in ('1', 'true')
+                  or request.accept_mimetypes.best == 'application/x-ndjson')
         
-        results = []
+        if stream:
+            return Response(
+                stream_with_context(iter_ndjson(_iter_batch_results(statements, context, chunk_size))),
+                mimetype='application/x-ndjson'
+            )
         
-        for i, statement in enumerate(statements):
-            try:
-                # 각 문장에 대해 분석 수행
-                analysis_result = detector.analyze_statement(statement, context)
-                
-                result_dict = {
-                    'index': i,
-                    'statement': statement,
-                    'context': context,
-                    'final_analysis': {
-                        'truth_percentage': analysis_result.final_analysis.truth_percentage,
-                        'confidence': analysis_result.final_analysis.confidence,
-                        'needs_correction': analysis_result.final_analysis.needs_correction
-                    },
-                    'basic_analysis': analysis_result.basic_analysis.__dict__,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                results.append(result_dict)
-                
-            except Exception as e:
-                logger.error(f"배치 분석 중 오류 (문장 {i}): {str(e)}")
-                results.append({
-                    'index': i,
-                    'statement': statement,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                })
+        results = list(_iter_batch_results(statements, context, chunk_size))
         
         return jsonify({
             'success': True,
             'batch_results': results,
             'total_processed': len(statements),
+            'unique_statements': len({r['statement'] for r in results if 'error' not in r}),
             'successful': len([r for r in results if 'error' not in r]),
             'failed': len([r for r in results if 'error' in r]),
             'timestamp': datetime.now().isoformat()
@@ -2158,44 +2472,59 @@ def api_batch_analyze():
 
 @app.route('/api/export', methods=['GET'])
 def api_export():
-    """API: 분석 결과 내보내기"""
+    """
+    API: 분석 결과 내보내기 (기록을 한 건씩 직렬화해 스트리밍, 메모리 사용이 기록 수와 무관)
+    
+    쿼리 파라미터:
+        format: json, ndjson, csv (펼친 열), parquet, arrow (Arrow IPC 스트림)
+        from, to: 기록 시각 구간 (ISO 시각 또는 유닉스 초, 기본값은 전체)
+        limit: 최근 limit 개 기록으로 제한 (기본값은 전체)
+    """
     try:
         export_format = request.args.get('format', 'json')
-        limit = request.args.get('limit', 100, type=int)
+        limit = request.args.get('limit', type=int)
+        
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({'error': f"지원하지 않는 형식입니다. ({', '.join(EXPORT_FORMATS)})"}), 400
+        if limit is not None and limit < 0:
+            return jsonify({'error': 'limit 은 0 이상이어야 합니다.'}), 400
         
-        if export_format not in ['json', 'csv']:
-            return jsonify({'error': '지원하지 않는 형식입니다. (json, csv)'}), 400
+        try:
+            start = _parse_trend_time(request.args.get('from'))
+            end = _parse_trend_time(request.args.get('to'))
+        except ValueError as e:
+            return jsonify({'error': f'잘못된 내보내기 구간입니다: {str(e)}'}), 400
+        
+        # 열 목록을 훑는 순회와 기록하는 순회가 같은 기록까지만 보도록 끝 순번을 고정
+        stop = analysis_history.sequence
         
-        # 최근 분석 결과 가져오기
-        recent_analyses = analysis_history[-limit:] if len(analysis_history) >= limit else analysis_history
+        def records():
+            return analysis_history.iter_records(start, end, limit, chunk_size=ROWS_PER_CHUNK, stop=stop)
         
         if export_format == 'json':
-            return jsonify({
-                'success': True,
-                'data': recent_analyses,
-                'export_format': 'json',
-                'total_records': len(recent_analyses),
-                'timestamp': datetime.now().isoformat()
-            })
-        elif export_format == 'csv':
-            # CSV 형식으로 변환
-            import csv
-            import io
-            
-            output = io.StringIO()
-            if recent_analyses:
-                fieldnames = recent_analyses[0].keys()
-                writer = csv.DictWriter(output, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(recent_analyses)
-            
-            return jsonify({
-                'success': True,
-                'data': output.getvalue(),
-                'export_format': 'csv',
-                'total_records': len(recent_analyses),
-                'timestamp': datetime.now().isoformat()
-            })
+            body = iter_json(records(), {'success': True, 'export_format': 'json',
+                                         'timestamp': datetime.now().isoformat()})
+        elif export_format == 'ndjson':
+            body = iter_ndjson(records())
+        else:
+            # 열 목록/형식은 먼저 한 번 훑어서 결정 (중첩 결과를 펼친 열은 기록마다 다를 수 있음)
+            schema = ExportSchema.scan(records())
+            if export_format == 'csv':
+                body = iter_csv(records(), schema)
+            else:
+                try:
+                    import pyarrow  # noqa: F401
+                except ImportError:
+                    return jsonify({'error': f'{export_format} 형식에는 pyarrow 가 필요합니다.'}), 400
+                body = iter_arrow(records(), schema, export_format)
+        
+        extension = 'arrows' if export_format == 'arrow' else export_format
+        filename = f"analyses_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+        return Response(
+            stream_with_context(body),
+            mimetype=EXPORT_FORMATS[export_format],
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+        )
         
     except Exception as e:
         logger.error(f"내보내기 중 오류 발생: {str(e)}")
@@ -2205,8 +2534,7 @@ def api_export():
 def api_clear_cache():
     """API: 모든 캐시 초기화"""
     try:
-        global request_cache
-        request_cache.clear()
+        response_cache.clear()
         
         # 일관성 캐시도 초기화
         ai_consistent_detector.clear_cache()
@@ -2517,15 +2845,66 @@ def detector_status(detector_id):
         }), 500
 
 # 배치 작업 관리 API
+def _analyze_batch_job_chunk(statements, context, start_index):
+    """배치 작업 청크 처리 (결과 인덱스는 작업 전체 기준)"""
+    results = list(_iter_batch_results(statements, context, app.config['BATCH_CHUNK_SIZE']))
+    for result in results:
+        result['index'] += start_index
+    return results
+
+# 영속 배치 작업 큐 (저장소와 작업자는 첫 사용 시 생성/시작되며 미완료 작업을 재개)
+batch_job_manager = BatchJobManager(
+    lambda: BatchJobStore(app.config['BATCH_JOB_DB']),
+    _analyze_batch_job_chunk,
+    max_workers=app.config['BATCH_JOB_WORKERS'],
+    chunk_size=app.config['BATCH_JOB_CHUNK_SIZE'],
+    lease_seconds=app.config['BATCH_JOB_LEASE_SECONDS']
+)
+
+@app.route('/api/v1/batch/jobs', methods=['POST'])
+def create_batch_job():
+    """배치 작업 등록 (JSON statements 또는 한 줄에 한 문장인 업로드 파일)"""
+    try:
+        if 'file' in request.files:
+            content = request.files['file'].read().decode('utf-8')
+            statements = [line for line in content.splitlines() if line.strip()]
+            context = (request.form.get('context') or '').strip()
+        else:
+            data = request.get_json(silent=True) or {}
+            statements = data.get('statements', [])
+            context = (data.get('context') or '').strip()
+        
+        if not statements or not isinstance(statements, list):
+            return jsonify({'success': False, 'error': '분석할 문장 목록을 입력해주세요.'}), 400
+        
+        job_id = batch_job_manager.submit(statements, context)
+        
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': 'queued',
+            'total_statements': len(statements),
+            'timestamp': datetime.now().isoformat()
+        }), 202
+    except Exception as e:
+        logger.error(f"배치 작업 등록 중 오류: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': f'배치 작업 등록 중 오류가 발생했습니다: {str(e)}'
+        }), 500
+
 @app.route('/api/v1/batch/jobs', methods=['GET'])
 def list_batch_jobs():
     """배치 작업 목록 조회"""
     try:
-        # 현재는 빈 목록 반환 (실제 구현에서는 작업 큐에서 조회)
+        batch_job_manager.start()
+        limit = request.args.get('limit', 50, type=int)
+        jobs = batch_job_manager.list_jobs(limit, request.args.get('status'))
+        
         return jsonify({
             'success': True,
-            'jobs': [],
-            'total_count': 0,
+            'jobs': jobs,
+            'total_count': len(jobs),
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
@@ -2537,12 +2916,16 @@ def list_batch_jobs():
 
 @app.route('/api/v1/batch/jobs/<job_id>', methods=['GET'])
 def get_batch_job(job_id):
-    """특정 배치 작업 조회"""
+    """특정 배치 작업 조회 (처리량, 예상 남은 시간, 청크별 지연 시간)"""
     try:
+        batch_job_manager.start()
+        job = batch_job_manager.get_job(job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': '배치 작업을 찾을 수 없습니다.'}), 404
+        
         return jsonify({
             'success': True,
-            'job_id': job_id,
-            'status': 'completed',
+            **job,
             'message': '배치 작업을 성공적으로 조회했습니다.',
             'timestamp': datetime.now().isoformat()
         })
@@ -2553,6 +2936,30 @@ def get_batch_job(job_id):
             'error': f'배치 작업 조회 중 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@app.route('/api/v1/batch/jobs/<job_id>/results', methods=['GET'])
+def get_batch_job_results(job_id):
+    """배치 작업 결과 (완료된 청크까지, NDJSON 스트리밍)"""
+    if batch_job_manager.get_job(job_id) is None:
+        return jsonify({'success': False, 'error': '배치 작업을 찾을 수 없습니다.'}), 404
+    
+    return Response(
+        stream_with_context(iter_ndjson(batch_job_manager.iter_results(job_id))),
+        mimetype='application/x-ndjson'
+    )
+
+@app.route('/api/v1/batch/jobs/<job_id>', methods=['DELETE'])
+def cancel_batch_job(job_id):
+    """배치 작업 취소"""
+    if not batch_job_manager.cancel(job_id):
+        return jsonify({'success': False, 'error': '취소할 수 있는 배치 작업이 없습니다.'}), 404
+    
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'cancelled',
+        'timestamp': datetime.now().isoformat()
+    })
+
 # 고급 분석 기능 API
 @app.route('/api/advanced/pattern-analysis', methods=['POST'])
 def api_pattern_analysis():
@@ -2731,9 +3138,18 @@ def too_large(error):
         'timestamp': datetime.now().isoformat()
     }), 413
 
+detector_registry.record_phase('app.module', time.perf_counter() - _startup_started)
+
 if __name__ == '__main__':
     logger.info("AI 진실성 탐지 시스템 (Enterprise Edition) 시작")
     logger.info(f"버전: 2.0.0-enterprise")
     logger.info(f"Flask 디버그 모드: {app.debug}")
     
+    # 이전 실행에서 끝나지 않은 배치 작업 재개
+    batch_job_manager.start()
+    
+    # 요청을 받기 시작한 뒤 백그라운드에서 탐지기 미리 생성
+    if app.config['DETECTOR_WARMUP']:
+        detector_registry.warm_up()
+    
     app.run(debug=True, host='0.0.0.0', port=5001)
@@ -0,0 +1,111 @@
+"""
+ASGI 진입점
+    uvicorn asgi:application --host 0.0.0.0 --port 5000
+
+Flask 앱은 그대로 두고 요청 종류별 스레드 풀에서 실행한다.
+- /api/analyze, /api/batch-analyze: CPU 연산 위주 (코어 수만큼 동시 처리, 나머지는 코루틴으로 대기)
+- /api/v1/research/*, /api/research-question, /api/verify-fact: 네트워크 대기 위주 (큰 풀)
+- 그 밖의 경로: 일반 풀
+실시간 알림(SocketIO)은 같은 프로세스의 비동기 SocketIO 서버가 처리한다.
+앱 상태(히스토리, 캐시, 알림)가 프로세스 메모리에 있으므로 작업자 프로세스는 하나로 실행한다.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import socketio
+
+from app import app, batch_job_manager, detector_registry, notification_manager
+from asgi_bridge import ASGIBridge
+
+logger = logging.getLogger(__name__)
+
+cpu_executor = ThreadPoolExecutor(app.config['ASGI_CPU_WORKERS'], thread_name_prefix='asgi-cpu')
+io_executor = ThreadPoolExecutor(app.config['ASGI_IO_WORKERS'], thread_name_prefix='asgi-io')
+wsgi_executor = ThreadPoolExecutor(app.config['ASGI_WSGI_WORKERS'], thread_name_prefix='asgi-wsgi')
+
+http_app = ASGIBridge(app.wsgi_app, wsgi_executor, routes=[
+    ('/api/analyze', cpu_executor),
+    ('/api/batch-analyze', cpu_executor),
+    ('/api/v1/research/', io_executor),
+    ('/api/research-question', io_executor),
+    ('/api/verify-fact', io_executor)
+])
+
+# 비동기 SocketIO 서버 (Flask-SocketIO 이벤트 핸들러와 같은 이벤트를 제공)
+sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins='*')
+_loop = None
+
+@sio.event
+async def connect(sid, environ, auth=None):
+    """클라이언트 연결 처리"""
+    logger.info(f"클라이언트 연결됨: {sid}")
+    notification_manager.connected_users[sid] = {
+        'connected_at': datetime.now().isoformat(),
+        'ip': environ.get('REMOTE_ADDR')
+    }
+
+    await sio.emit('connected', {
+        'message': '서버에 연결되었습니다.',
+        'timestamp': datetime.now().isoformat()
+    }, to=sid)
+
+@sio.event
+async def disconnect(sid, *args):
+    """클라이언트 연결 해제 처리"""
+    logger.info(f"클라이언트 연결 해제됨: {sid}")
+    notification_manager.connected_users.pop(sid, None)
+
+@sio.on('join_room')
+async def handle_join_room(sid, data):
+    """방 참가 처리"""
+    room = (data or {}).get('room', 'general')
+    await sio.enter_room(sid, room)
+
+    await sio.emit('joined_room', {
+        'room': room,
+        'message': f'방 {room}에 참가했습니다.',
+        'timestamp': datetime.now().isoformat()
+    }, to=sid)
+
+def emit_from_any_thread(event, data, room=None):
+    """요청 스레드나 백그라운드 스레드에서 비동기 SocketIO 서버로 이벤트 전송 (완료를 기다리지 않음)"""
+    if _loop is None or _loop.is_closed():
+        return
+    coroutine = sio.emit(event, data, to=room, namespace='/')
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is _loop:
+        _loop.create_task(coroutine)
+    else:
+        asyncio.run_coroutine_threadsafe(coroutine, _loop)
+
+async def on_startup():
+    global _loop
+    _loop = asyncio.get_running_loop()
+    notification_manager.emitter = emit_from_any_thread
+
+    # 이전 실행에서 끝나지 않은 배치 작업 재개, 백그라운드에서 탐지기 미리 생성
+    batch_job_manager.start()
+    if app.config['DETECTOR_WARMUP']:
+        detector_registry.warm_up()
+    logger.info("AI 진실성 탐지 시스템 (Enterprise Edition) ASGI 모드 시작")
+
+async def on_shutdown():
+    global _loop
+    notification_manager.emitter = None
+    _loop = None
+    batch_job_manager.stop(timeout=5.0)
+    for executor in (cpu_executor, io_executor, wsgi_executor):
+        executor.shutdown(wait=False, cancel_futures=True)
+
+application = socketio.ASGIApp(sio, other_asgi_app=http_app, on_startup=on_startup, on_shutdown=on_shutdown)
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(application, host='0.0.0.0', port=5000)
@@ -0,0 +1,198 @@
+"""
+ASGI-WSGI 브리지
+Flask(WSGI) 앱을 ASGI 서버에서 실행하되, 경로별로 지정한 스레드 풀에서 요청을 처리하고
+클라이언트 연결이 끊기면 응답 생성을 중단하는 모듈
+"""
+
+import io
+import sys
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+def build_environ(scope: Dict[str, Any], body: bytes) -> Dict[str, Any]:
+    """ASGI HTTP scope 와 요청 본문으로 WSGI environ 생성 (PEP 3333)"""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1] if server[1] is not None else 80),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False
+    }
+
+    for name, value in scope.get('headers', []):
+        key = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if key == 'CONTENT_LENGTH':
+            continue            # 실제로 읽은 본문 길이를 사용
+        if key == 'CONTENT_TYPE':
+            environ[key] = value
+            continue
+        key = f"HTTP_{key}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+class ASGIBridge:
+    """
+    경로별 실행기를 쓰는 ASGI HTTP 어댑터
+
+    각 요청은 이벤트 루프에서 코루틴으로 대기하고, WSGI 호출과 응답 본문 반복만 실행기 스레드에서
+    수행한다. 오래 걸리는 경로(분석, 웹 연구)를 별도 풀에 배정하면 한 종류의 요청이 밀려도
+    다른 요청은 자기 풀에서 계속 처리되고, 대기 중인 요청은 스레드 대신 코루틴만 차지한다.
+
+    클라이언트가 연결을 끊으면 요청 코루틴을 취소하고 environ['asgi.cancelled'] 이벤트를 설정한다.
+    응답 본문 반복은 다음 청크 경계에서 멈추고 본문의 close() 를 호출하므로,
+    스트리밍 응답(NDJSON 배치 분석 등)은 남은 청크를 계산하지 않는다.
+    """
+
+    def __init__(self, wsgi_app: Callable, default_executor: Executor,
+                 routes: Optional[Sequence[Tuple[str, Executor]]] = None):
+        """
+        Args:
+            wsgi_app: WSGI 애플리케이션
+            default_executor: routes 에 없는 경로를 처리할 실행기
+            routes: (경로, 실행기) 목록 ('/' 로 끝나는 경로는 접두사로 일치)
+        """
+        self.wsgi_app = wsgi_app
+        self.default_executor = default_executor
+        self.routes: List[Tuple[str, Executor]] = list(routes or [])
+
+    def executor_for(self, path: str) -> Executor:
+        for route, executor in self.routes:
+            if path == route or (route.endswith('/') and path.startswith(route)):
+                return executor
+        return self.default_executor
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable):
+        if scope['type'] != 'http':
+            raise ValueError(f"지원하지 않는 ASGI scope 입니다: {scope['type']}")
+
+        body = await self._read_body(receive)
+        if body is None:
+            return          # 본문을 다 보내기 전에 연결이 끊김
+
+        loop = asyncio.get_running_loop()
+        messages: asyncio.Queue = asyncio.Queue()
+        cancelled = threading.Event()
+        environ = build_environ(scope, body)
+        environ['asgi.cancelled'] = cancelled
+
+        def deliver(message: Tuple[str, Any]):
+            if not cancelled.is_set():
+                try:
+                    loop.call_soon_threadsafe(messages.put_nowait, message)
+                except RuntimeError:
+                    cancelled.set()     # 루프가 이미 닫힘
+
+        loop.run_in_executor(self.executor_for(scope['path']), self._run_wsgi, environ, cancelled, deliver)
+        disconnected = asyncio.ensure_future(self._wait_for_disconnect(receive))
+        try:
+            await self._forward(messages, disconnected, cancelled, send)
+        finally:
+            cancelled.set()
+            disconnected.cancel()
+
+    async def _read_body(self, receive: Callable) -> Optional[bytes]:
+        chunks = []
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return None
+            chunks.append(message.get('body', b''))
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    async def _wait_for_disconnect(self, receive: Callable):
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+
+    async def _forward(self, messages: asyncio.Queue, disconnected: asyncio.Future,
+                       cancelled: threading.Event, send: Callable):
+        """실행기 스레드가 보낸 응답 조각을 클라이언트로 전달 (연결이 끊기면 중단)"""
+        started = False
+        while True:
+            receiving = asyncio.ensure_future(messages.get())
+            await asyncio.wait({receiving, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if not receiving.done():
+                receiving.cancel()
+                cancelled.set()
+                logger.info("클라이언트 연결이 끊겨 요청 처리를 중단합니다.")
+                return
+
+            kind, payload = receiving.result()
+            if kind == 'start':
+                status, headers = payload
+                await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+                started = True
+            elif kind == 'body':
+                await send({'type': 'http.response.body', 'body': payload, 'more_body': True})
+            elif kind == 'end':
+                await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+                return
+            else:
+                logger.error(f"WSGI 요청 처리 중 오류: {payload}")
+                if started:
+                    raise payload       # 이미 보낸 응답은 완료 표시 없이 연결을 끊어 잘린 응답임을 알림
+                await send({'type': 'http.response.start', 'status': 500,
+                            'headers': [(b'content-type', b'application/json')]})
+                await send({'type': 'http.response.body',
+                            'body': '{"error": "내부 서버 오류가 발생했습니다."}'.encode('utf-8')})
+                return
+
+    def _run_wsgi(self, environ: Dict[str, Any], cancelled: threading.Event,
+                  deliver: Callable[[Tuple[str, Any]], None]):
+        """실행기 스레드: WSGI 앱 호출과 응답 본문 반복 (같은 스레드에서 끝까지 수행)"""
+        response: Dict[str, Any] = {}
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info is not None and response.get('sent'):
+                raise exc_info[1].with_traceback(exc_info[2])
+            response['start'] = (int(status.split(' ', 1)[0]),
+                                 [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers])
+            return write
+
+        def send_start():
+            if not response.get('sent'):
+                response['sent'] = True
+                deliver(('start', response['start']))
+
+        def write(data: bytes):
+            send_start()
+            if data:
+                deliver(('body', bytes(data)))
+
+        if cancelled.is_set():
+            return      # 실행기 대기 중에 연결이 끊긴 요청은 시작하지 않음
+
+        try:
+            body = self.wsgi_app(environ, start_response)
+            try:
+                for chunk in body:
+                    if cancelled.is_set():
+                        return
+                    write(chunk)
+            finally:
+                if hasattr(body, 'close'):
+                    body.close()
+            send_start()
+            deliver(('end', None))
+        except Exception as e:
+            deliver(('error', e))
@@ -0,0 +1,268 @@
+"""
+배치 진실성 분석 엔진
+여러 문장을 한 번에 받아 중복을 제거하고, TruthDetector의 검증 점수를
+문장별 반복 대신 NumPy 열(column) 단위 연산으로 계산하는 모듈
+"""
+
+import re
+import json
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ai_truth_detector import FACT_PATTERN_INDEX, TruthAnalysis, TruthDetector
+
+logger = logging.getLogger(__name__)
+
+# TruthDetector 검증 방법별 규칙 (ai_truth_detector.py 의 문장 단위 검사와 동일한 순서)
+FACT_PATTERN_DELTAS = [0.3 if entry.key == 'true_facts' else -0.4 for entry in FACT_PATTERN_INDEX.entries]
+FACT_PATTERN_COLUMNS = {entry: j for j, entry in enumerate(FACT_PATTERN_INDEX.entries)}
+LOGICAL_CONTRADICTIONS = [
+    ('모든', '일부'), ('항상', '때때로'), ('절대', '가능'),
+    ('완전히', '부분적으로'), ('100%', '가끔'), ('확실히', '아마도')
+]
+OVERCONFIDENT_WORDS = ['절대적으로', '완전히', '100%', '틀림없이']
+TIME_EXPRESSIONS = ['오늘', '어제', '내일', '지금', '과거', '미래', '현재', '이전', '다음']
+TEMPORAL_CONTRADICTIONS = [('오늘', '어제'), ('현재', '과거'), ('지금', '미래')]
+EMOTIONAL_WORDS = ['정말', '완전히', '절대적으로', '100%', '틀림없이', '확실히']
+NUMBER_PATTERN = re.compile(r'\d+\.?\d*')
+SPECIAL_CHAR_PATTERN = re.compile(r'[!@#$%^&*()_+=\[\]{}|;:,.<>?]')
+UPPER_CHAR_PATTERN = re.compile(r'[A-Z]')
+
+def dedupe_statements(statements: Sequence[str]) -> Tuple[List[str], List[int]]:
+    """
+    중복 문장 제거
+
+    Returns:
+        Tuple[List[str], List[int]]: (고유 문장 목록, 원래 위치별 고유 문장 인덱스)
+    """
+    positions: Dict[str, int] = {}
+    unique: List[str] = []
+    inverse: List[int] = []
+    for statement in statements:
+        position = positions.get(statement)
+        if position is None:
+            position = positions[statement] = len(unique)
+            unique.append(statement)
+        inverse.append(position)
+    return unique, inverse
+
+def iter_ndjson(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """레코드를 NDJSON 줄 단위로 직렬화"""
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False, default=str) + '\n'
+
+class BatchTruthScorer:
+    """TruthDetector 검증 점수의 배치(열 단위) 계산기"""
+
+    def __init__(self, detector: Optional[TruthDetector] = None):
+        self.detector = detector or TruthDetector()
+        self.method_names = list(self.detector.verification_methods)
+        self.method_weights = np.array([self.detector.verification_methods[name] for name in self.method_names])
+
+    def score_matrix(self, statements: Sequence[str]) -> np.ndarray:
+        """
+        문장별 검증 점수 행렬 계산
+
+        각 열은 TruthDetector._check_* 결과와 같은 값이 되도록 문장 단위 검사와
+        같은 순서로 가감한다.
+
+        Returns:
+            np.ndarray: (문장 수, 검증 방법 수) 점수 행렬 (열 순서는 method_names)
+        """
+        if not statements:
+            return np.zeros((0, len(self.method_names)))
+
+        columns = {
+            'factual_consistency': self._factual_scores(statements),
+            'logical_consistency': self._logical_scores(statements),
+            'temporal_consistency': self._temporal_scores(statements),
+            'semantic_analysis': self._semantic_scores(statements),
+            'statistical_analysis': self._statistical_scores(statements)
+        }
+        return np.column_stack([columns[name] for name in self.method_names])
+
+    def truth_scores(self, matrix: np.ndarray) -> np.ndarray:
+        """검증 점수 가중합 (행렬-벡터 곱)"""
+        return matrix @ self.method_weights
+
+    def confidence_scores(self, matrix: np.ndarray) -> np.ndarray:
+        """검증 점수 일관성 기반 신뢰도 (TruthDetector._calculate_confidence 의 배치 버전)"""
+        mean_score = matrix.mean(axis=1)
+        variance_penalty = matrix.std(axis=1) * 0.5
+        extreme_penalty = np.where((mean_score < 0.3) | (mean_score > 0.9), 0.2, 0)
+        return np.clip(0.7 - variance_penalty - extreme_penalty, 0.1, 0.9)
+
+    def analyze_batch(self, statements: Sequence[str], context: Optional[str] = None) -> List[TruthAnalysis]:
+        """
+        여러 문장을 한 번에 분석
+
+        Args:
+            statements: 분석할 문장 목록 (중복 제거는 호출자 책임)
+            context: 추가 컨텍스트 정보 (TruthDetector 와 마찬가지로 점수에는 사용하지 않음)
+
+        Returns:
+            List[TruthAnalysis]: 입력 순서와 같은 분석 결과
+        """
+        detector = self.detector
+        timestamp = datetime.now()
+        matrix = self.score_matrix(statements)
+        truth = self.truth_scores(matrix)
+        confidence = self.confidence_scores(matrix)
+        lie = 1.0 - truth
+
+        rows = []
+        corrections: Dict[int, str] = {}
+        for i, statement in enumerate(statements):
+            scores = dict(zip(self.method_names, matrix[i].tolist()))
+            detected_lies, correction_suggestions = detector._detect_and_correct_lies(statement, scores)
+            has_lie_patterns = any("거짓말 패턴 감지" in lie_text for lie_text in detected_lies)
+            if lie[i] >= detector.lie_threshold and has_lie_patterns:
+                corrections[i] = detector._auto_correct_statement(statement, detected_lies)
+            rows.append((scores, detected_lies, correction_suggestions))
+
+        # 교정된 문장 재분석도 한 번의 배치로 계산
+        changed = [i for i, corrected in corrections.items() if corrected != statements[i]]
+        if changed:
+            corrected_truth = self.truth_scores(self.score_matrix([corrections[i] for i in changed]))
+            for i, corrected_truth_percentage in zip(changed, corrected_truth.tolist()):
+                correction_suggestions = rows[i][2]
+                correction_suggestions.append(f"자동 교정 완료: 진실성 {truth[i]:.1%} → {corrected_truth_percentage:.1%}")
+                correction_suggestions.append(f"교정된 문장: '{corrections[i]}'")
+
+        logger.info(f"배치 분석 완료: {len(statements)}개 문장, 자동 교정 {len(corrections)}개")
+
+        return [
+            TruthAnalysis(
+                statement=statement,
+                truth_percentage=float(truth[i]),
+                confidence=float(confidence[i]),
+                detected_lies=detected_lies,
+                correction_suggestions=correction_suggestions,
+                analysis_timestamp=timestamp,
+                verification_methods=scores,
+                corrected_statement=corrections.get(i),
+                auto_correction_applied=i in corrections,
+                lie_percentage=float(lie[i])
+            )
+            for i, (statement, (scores, detected_lies, correction_suggestions)) in enumerate(zip(statements, rows))
+        ]
+
+    # 열 단위 검사 -------------------------------------------------------
+
+    @staticmethod
+    def _contains(statements: Sequence[str], word: str) -> np.ndarray:
+        """단어 포함 여부 열"""
+        return np.fromiter((word in statement for statement in statements), dtype=bool, count=len(statements))
+
+    def _count_words(self, statements: Sequence[str], words: Sequence[str]) -> np.ndarray:
+        """단어 목록 중 포함된 단어 수 열"""
+        counts = np.zeros(len(statements), dtype=int)
+        for word in words:
+            counts += self._contains(statements, word)
+        return counts
+
+    def _factual_scores(self, statements: Sequence[str]) -> np.ndarray:
+        score = np.full(len(statements), 0.5)
+
+        # 비현실적으로 큰 숫자마다 감점 (문장 단위 검사와 같은 순서로 누적)
+        big_numbers = np.array(
+            [sum(1 for num in NUMBER_PATTERN.findall(statement) if float(num) > 1e10) for statement in statements],
+            dtype=int
+        )
+        for k in range(big_numbers.max(initial=0)):
+            score = np.where(big_numbers > k, score - 0.3, score)
+
+        # 사실 패턴 적중 행렬 (문장 수 × 패턴 수)
+        hits = np.zeros((len(statements), len(FACT_PATTERN_DELTAS)), dtype=bool)
+        for i, statement in enumerate(statements):
+            for entry in FACT_PATTERN_INDEX.scan(statement):
+                hits[i, FACT_PATTERN_COLUMNS[entry]] = True
+        for j, delta in enumerate(FACT_PATTERN_DELTAS):
+            score = np.where(hits[:, j], score + delta, score)
+
+        return np.clip(score, 0.0, 1.0)
+
+    def _logical_scores(self, statements: Sequence[str]) -> np.ndarray:
+        score = np.full(len(statements), 0.7)
+
+        contradiction_count = np.zeros(len(statements), dtype=int)
+        for pos, neg in LOGICAL_CONTRADICTIONS:
+            contradiction_count += self._contains(statements, pos) & self._contains(statements, neg)
+        score = np.where(contradiction_count > 0, score - 0.4 * contradiction_count, score)
+
+        conditional = self._contains(statements, '만약') & self._contains(statements, '그러면')
+        causal = self._contains(statements, '때문에') | self._contains(statements, '따라서')
+        score = np.where(conditional, score + 0.2, np.where(causal, score + 0.1, score))
+
+        overconfident_count = self._count_words(statements, OVERCONFIDENT_WORDS)
+        score = np.where(overconfident_count > 2, score - 0.3, score)
+
+        return np.clip(score, 0.0, 1.0)
+
+    def _temporal_scores(self, statements: Sequence[str]) -> np.ndarray:
+        score = np.full(len(statements), 0.8)
+
+        time_count = self._count_words(statements, TIME_EXPRESSIONS)
+        score = np.where(time_count > 3, score - 0.3, np.where(time_count > 1, score - 0.1, score))
+
+        for present, past in TEMPORAL_CONTRADICTIONS:
+            both = self._contains(statements, present) & self._contains(statements, past)
+            score = np.where(both, score - 0.4, score)
+
+        return np.clip(score, 0.0, 1.0)
+
+    def _semantic_scores(self, statements: Sequence[str]) -> np.ndarray:
+        score = np.full(len(statements), 0.8)
+
+        emotional_count = self._count_words(statements, EMOTIONAL_WORDS)
+        score = np.where(emotional_count > 3, score - 0.4, np.where(emotional_count > 1, score - 0.2, score))
+
+        lengths = np.array([len(statement) for statement in statements], dtype=int)
+        score = np.where(lengths > 200, score - 0.3, np.where(lengths < 10, score - 0.1, score))
+
+        max_repetition = np.array(
+            [max(Counter(statement.split()).values(), default=0) for statement in statements],
+            dtype=int
+        )
+        score = np.where(max_repetition > 3, score - 0.2, score)
+
+        return np.clip(score, 0.0, 1.0)
+
+    def _statistical_scores(self, statements: Sequence[str]) -> np.ndarray:
+        score = np.full(len(statements), 0.8)
+
+        avg_length = np.array(
+            [
+                sum(len(sentence.split()) for sentence in sentences) / len(sentences)
+                for sentences in (statement.split('.') for statement in statements)
+            ],
+            dtype=float
+        )
+        score = np.where(
+            avg_length > 25, score - 0.3,
+            np.where(avg_length > 15, score - 0.1, np.where(avg_length < 3, score - 0.2, score))
+        )
+
+        lengths = np.array([len(statement) for statement in statements], dtype=float)
+        non_empty = lengths > 0
+        safe_lengths = np.where(non_empty, lengths, 1.0)
+
+        special_chars = np.array([len(SPECIAL_CHAR_PATTERN.findall(statement)) for statement in statements], dtype=float)
+        special_ratio = special_chars / safe_lengths
+        score = np.where(
+            non_empty & (special_ratio > 0.15), score - 0.4,
+            np.where(non_empty & (special_ratio > 0.1), score - 0.2, score)
+        )
+
+        upper_chars = np.array([len(UPPER_CHAR_PATTERN.findall(statement)) for statement in statements], dtype=float)
+        upper_ratio = upper_chars / safe_lengths
+        score = np.where(
+            non_empty & (upper_ratio > 0.3), score - 0.3,
+            np.where(non_empty & (upper_ratio > 0.1), score - 0.1, score)
+        )
+
+        return np.clip(score, 0.0, 1.0)
@@ -0,0 +1,405 @@
+"""
+영속 배치 작업 큐
+대량 문장 분석 요청을 즉시 작업 ID로 반환하고, 작업자 풀이 청크 단위로 처리하면서
+진행 상황과 결과를 SQLite에 저장하여 서버 재시작 후에도 이어서 처리하는 모듈
+청크는 처리 전에 소유자와 임대 만료 시각을 기록하며 원자적으로 선점하므로,
+같은 DB를 쓰는 여러 프로세스가 같은 청크를 동시에 처리하지 않고 임대가 끝난 청크만 다시 처리한다.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import queue
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# 청크 처리 함수: (문장 목록, 컨텍스트, 시작 인덱스) → 결과 목록
+ChunkProcessor = Callable[[List[str], Optional[str], int], List[Dict[str, Any]]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    context TEXT,
+    total_statements INTEGER NOT NULL,
+    chunk_size INTEGER NOT NULL,
+    total_chunks INTEGER NOT NULL,
+    processed_statements INTEGER NOT NULL DEFAULT 0,
+    failed_statements INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    processing_seconds REAL NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS batch_job_chunks (
+    job_id TEXT NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    start_index INTEGER NOT NULL,
+    statements TEXT NOT NULL,
+    status TEXT NOT NULL,
+    latency REAL,
+    results TEXT,
+    completed_at REAL,
+    owner TEXT,
+    lease_until REAL,
+    PRIMARY KEY (job_id, chunk_index)
+);
+"""
+
+class BatchJobStore:
+    """배치 작업 SQLite 저장소"""
+
+    def __init__(self, db_path: str = 'batch_jobs.db'):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            if db_path != ':memory:':
+                self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+            # 임대 열이 없던 이전 DB 갱신
+            columns = {row['name'] for row in self._conn.execute('PRAGMA table_info(batch_job_chunks)')}
+            for column, column_type in (('owner', 'TEXT'), ('lease_until', 'REAL')):
+                if column not in columns:
+                    self._conn.execute(f'ALTER TABLE batch_job_chunks ADD COLUMN {column} {column_type}')
+            self._conn.commit()
+
+    def create_job(self, statements: Sequence[str], context: Optional[str], chunk_size: int) -> str:
+        """작업과 청크를 한 트랜잭션으로 저장"""
+        job_id = str(uuid.uuid4())
+        chunks = [
+            (job_id, chunk_index, start, json.dumps(list(statements[start:start + chunk_size]), ensure_ascii=False), 'pending')
+            for chunk_index, start in enumerate(range(0, len(statements), chunk_size))
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO batch_jobs (id, status, context, total_statements, chunk_size, total_chunks, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (job_id, 'queued', context, len(statements), chunk_size, len(chunks), time.time())
+            )
+            self._conn.executemany(
+                'INSERT INTO batch_job_chunks (job_id, chunk_index, start_index, statements, status) VALUES (?, ?, ?, ?, ?)',
+                chunks
+            )
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute('SELECT * FROM batch_jobs WHERE id = ?', (job_id,)).fetchone()
+
+    def list_jobs(self, limit: int = 50, status: Optional[str] = None) -> List[sqlite3.Row]:
+        query = 'SELECT * FROM batch_jobs'
+        params: List[Any] = []
+        if status:
+            query += ' WHERE status = ?'
+            params.append(status)
+        query += ' ORDER BY created_at DESC LIMIT ?'
+        params.append(limit)
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def get_chunk(self, job_id: str, chunk_index: int) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(
+                'SELECT * FROM batch_job_chunks WHERE job_id = ? AND chunk_index = ?', (job_id, chunk_index)
+            ).fetchone()
+
+    def chunk_latencies(self, job_id: str) -> List[float]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT latency FROM batch_job_chunks WHERE job_id = ? AND status = 'completed' ORDER BY chunk_index",
+                (job_id,)
+            ).fetchall()
+        return [row['latency'] for row in rows]
+
+    def pending_chunks(self) -> List[sqlite3.Row]:
+        """완료되지 않은 작업에서 아무도 처리하지 않는 청크 (대기 중이거나 임대가 끝난 청크, 재개용)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT c.job_id, c.chunk_index FROM batch_job_chunks c JOIN batch_jobs j ON j.id = c.job_id "
+                "WHERE j.status IN ('queued', 'running') "
+                "AND (c.status = 'pending' OR (c.status = 'running' AND c.lease_until < ?)) "
+                "ORDER BY j.created_at, c.chunk_index",
+                (time.time(),)
+            ).fetchall()
+
+    def claim_chunk(self, job_id: str, chunk_index: int, owner: str, lease_seconds: float) -> bool:
+        """청크 선점 (대기 중이거나 임대가 끝난 청크만, 다른 작업자/프로세스가 먼저 가져갔으면 False)"""
+        now = time.time()
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE batch_job_chunks SET status = 'running', owner = ?, lease_until = ? "
+                "WHERE job_id = ? AND chunk_index = ? "
+                "AND (status = 'pending' OR (status = 'running' AND lease_until < ?))",
+                (owner, now + lease_seconds, job_id, chunk_index, now)
+            ).rowcount > 0
+
+    def release_chunk(self, job_id: str, chunk_index: int, owner: str):
+        """처리하지 못한 청크를 다시 대기 상태로 (다른 작업자가 이어서 처리)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE batch_job_chunks SET status = 'pending', owner = NULL, lease_until = NULL "
+                "WHERE job_id = ? AND chunk_index = ? AND status = 'running' AND owner = ?",
+                (job_id, chunk_index, owner)
+            )
+
+    def mark_started(self, job_id: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE batch_jobs SET status = 'running', started_at = COALESCE(started_at, ?) "
+                "WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id)
+            )
+
+    def complete_chunk(self, job_id: str, chunk_index: int, results: List[Dict[str, Any]], latency: float):
+        """청크 결과 저장 및 작업 진행률 갱신 (마지막 청크면 작업 완료 처리)"""
+        failed = sum(1 for result in results if 'error' in result)
+        now = time.time()
+        with self._lock, self._conn:
+            updated = self._conn.execute(
+                "UPDATE batch_job_chunks SET status = 'completed', latency = ?, results = ?, completed_at = ? "
+                "WHERE job_id = ? AND chunk_index = ? AND status != 'completed'",
+                (latency, json.dumps(results, ensure_ascii=False, default=str), now, job_id, chunk_index)
+            ).rowcount
+            if not updated:
+                return
+            self._conn.execute(
+                'UPDATE batch_jobs SET processed_statements = processed_statements + ?, '
+                'failed_statements = failed_statements + ?, processing_seconds = processing_seconds + ? WHERE id = ?',
+                (len(results), failed, latency, job_id)
+            )
+            remaining = self._conn.execute(
+                "SELECT COUNT(*) FROM batch_job_chunks WHERE job_id = ? AND status != 'completed'", (job_id,)
+            ).fetchone()[0]
+            if remaining == 0:
+                self._conn.execute(
+                    "UPDATE batch_jobs SET status = 'completed', finished_at = ? WHERE id = ?", (now, job_id)
+                )
+
+    def fail_job(self, job_id: str, error: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE batch_jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                (error, time.time(), job_id)
+            )
+
+    def cancel_job(self, job_id: str) -> bool:
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE batch_jobs SET status = 'cancelled', finished_at = ? "
+                "WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id)
+            ).rowcount > 0
+
+    def iter_results(self, job_id: str) -> Iterator[Dict[str, Any]]:
+        """완료된 청크 결과를 입력 순서대로 반환"""
+        with self._lock:
+            chunk_indexes = [row[0] for row in self._conn.execute(
+                "SELECT chunk_index FROM batch_job_chunks WHERE job_id = ? AND status = 'completed' ORDER BY chunk_index",
+                (job_id,)
+            ).fetchall()]
+        for chunk_index in chunk_indexes:
+            # 청크 단위로 읽어 전체 결과를 메모리에 올리지 않음
+            chunk = self.get_chunk(job_id, chunk_index)
+            for result in json.loads(chunk['results']):
+                yield result
+
+class BatchJobManager:
+    """배치 작업 큐와 작업자 풀"""
+
+    def __init__(self, store: Union[BatchJobStore, Callable[[], BatchJobStore]], process_chunk: ChunkProcessor,
+                 max_workers: int = 2, chunk_size: int = 500, lease_seconds: float = 600.0):
+        """
+        Args:
+            store: 저장소 또는 첫 사용 시 저장소를 만드는 함수 (모듈 임포트 시 DB 파일을 만들지 않도록)
+            lease_seconds: 청크 임대 시간 (청크 처리 시간보다 길어야 함, 지나면 다른 작업자가 다시 처리)
+        """
+        self._store = store if isinstance(store, BatchJobStore) else None
+        self._store_factory = None if isinstance(store, BatchJobStore) else store
+        self._store_lock = threading.Lock()
+        self.process_chunk = process_chunk
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.lease_seconds = lease_seconds
+        self.owner = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+        self._queue: queue.Queue = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._started = False
+        self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
+
+    @property
+    def store(self) -> BatchJobStore:
+        """저장소 (최초 사용 시 생성)"""
+        if self._store is None:
+            with self._store_lock:
+                if self._store is None:
+                    self._store = self._store_factory()
+        return self._store
+
+    def start(self):
+        """작업자 시작 및 미완료 작업 재개 (여러 번 호출해도 한 번만 실행)"""
+        with self._start_lock:
+            if self._started:
+                return
+            self._started = True
+            # 이전 시작의 작업자가 아직 청크를 처리 중이어도 새 작업자와 구분되도록 시작마다 새 종료 신호
+            self._stop_event = threading.Event()
+
+            resumed = self._requeue_unclaimed()
+            if resumed:
+                logger.info(f"미완료 배치 작업 재개: 청크 {resumed}개")
+
+            for i in range(self.max_workers):
+                worker = threading.Thread(target=self._worker_loop, args=(self._stop_event,),
+                                          name=f'batch-job-{i}', daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def stop(self, timeout: Optional[float] = None):
+        """작업자 종료 (처리 중인 청크는 끝까지 처리, 남은 청크는 다음 시작 시 재개)"""
+        with self._start_lock:
+            if not self._started:
+                return
+            stop_event = self._stop_event
+            stop_event.set()
+            # 아직 가져가지 않은 청크는 큐에서 버림 (SQLite 에 대기 상태로 남아 다음 시작 시 재개)
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._queue.task_done()
+            for _ in self._workers:
+                self._queue.put(stop_event)
+            workers, self._workers = self._workers, []
+            self._started = False
+
+        for worker in workers:
+            worker.join(timeout)
+
+    def submit(self, statements: Sequence[str], context: Optional[str] = None) -> str:
+        """작업 등록 후 즉시 작업 ID 반환"""
+        if not statements:
+            raise ValueError("분석할 문장이 없습니다.")
+        self.start()
+
+        job_id = self.store.create_job(statements, context, self.chunk_size)
+        total_chunks = (len(statements) + self.chunk_size - 1) // self.chunk_size
+        for chunk_index in range(total_chunks):
+            self._queue.put((job_id, chunk_index))
+        logger.info(f"배치 작업 등록: {job_id} ({len(statements)}개 문장, 청크 {total_chunks}개)")
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        """작업 취소 (남은 청크는 처리하지 않음)"""
+        return self.store.cancel_job(job_id)
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 (처리량, 예상 남은 시간, 청크별 지연 시간 포함)"""
+        row = self.store.get_job(job_id)
+        if row is None:
+            return None
+        job = self._job_summary(row)
+        latencies = self.store.chunk_latencies(job_id)
+        job['chunk_latencies_ms'] = [round(latency * 1000, 3) for latency in latencies]
+        job['average_chunk_latency_ms'] = round(sum(latencies) / len(latencies) * 1000, 3) if latencies else None
+        return job
+
+    def list_jobs(self, limit: int = 50, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [self._job_summary(row) for row in self.store.list_jobs(limit, status)]
+
+    def iter_results(self, job_id: str) -> Iterator[Dict[str, Any]]:
+        return self.store.iter_results(job_id)
+
+    def _job_summary(self, row: sqlite3.Row) -> Dict[str, Any]:
+        total = row['total_statements']
+        processed = row['processed_statements']
+        started_at = row['started_at']
+        end_time = row['finished_at'] or time.time()
+        elapsed = end_time - started_at if started_at else 0.0
+
+        throughput = processed / elapsed if elapsed > 0 else 0.0
+        remaining = total - processed
+        if row['status'] == 'completed':
+            eta = 0.0
+        elif throughput > 0 and row['status'] in ('queued', 'running'):
+            eta = remaining / throughput
+        else:
+            eta = None
+
+        def iso(timestamp):
+            return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+        return {
+            'job_id': row['id'],
+            'status': row['status'],
+            'total_statements': total,
+            'processed_statements': processed,
+            'failed_statements': row['failed_statements'],
+            'total_chunks': row['total_chunks'],
+            'chunk_size': row['chunk_size'],
+            'progress': processed / total if total else 1.0,
+            'throughput_per_second': round(throughput, 3),
+            'eta_seconds': round(eta, 3) if eta is not None else None,
+            'created_at': iso(row['created_at']),
+            'started_at': iso(started_at),
+            'finished_at': iso(row['finished_at']),
+            'error': row['error']
+        }
+
+    def _requeue_unclaimed(self) -> int:
+        """대기 중이거나 임대가 끝난 청크를 큐에 추가 (중복으로 들어가도 선점은 한 번만 성공)"""
+        rows = self.store.pending_chunks()
+        for row in rows:
+            self._queue.put((row['job_id'], row['chunk_index']))
+        return len(rows)
+
+    def _worker_loop(self, stop_event: threading.Event):
+        while not stop_event.is_set():
+            try:
+                item = self._queue.get(timeout=self.lease_seconds)
+            except queue.Empty:
+                # 한가할 때 다른 프로세스가 처리하다 멈춘 청크 회수
+                if not stop_event.is_set():
+                    self._requeue_unclaimed()
+                continue
+            try:
+                if isinstance(item, threading.Event):
+                    continue        # 종료 신호 (이전 시작의 신호면 무시)
+                if stop_event.is_set():
+                    self._queue.put(item)       # 종료 중에 꺼낸 청크는 다음 작업자에게 돌려줌
+                    return
+                self._run_chunk(*item)
+            finally:
+                self._queue.task_done()
+
+    def _run_chunk(self, job_id: str, chunk_index: int):
+        job = self.store.get_job(job_id)
+        if job is None or job['status'] not in ('queued', 'running'):
+            return
+        if not self.store.claim_chunk(job_id, chunk_index, self.owner, self.lease_seconds):
+            return
+        chunk = self.store.get_chunk(job_id, chunk_index)
+
+        self.store.mark_started(job_id)
+        statements = json.loads(chunk['statements'])
+        start_time = time.perf_counter()
+        try:
+            results = self.process_chunk(statements, job['context'], chunk['start_index'])
+        except Exception as e:
+            logger.error(f"배치 작업 청크 처리 오류 ({job_id}#{chunk_index}): {str(e)}")
+            self.store.fail_job(job_id, str(e))
+            self.store.release_chunk(job_id, chunk_index, self.owner)
+            return
+        self.store.complete_chunk(job_id, chunk_index, results, time.perf_counter() - start_time)
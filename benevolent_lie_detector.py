@@ -5,6 +5,8 @@
 """
 
 from ai_truth_detector import TruthDetector, TruthAnalysis
+from analysis_context import AnalysisContext, analyze_primary, scan_patterns
+from pattern_index import get_pattern_index
 from typing import List, Dict, Tuple, Optional
 import logging
 import re
@@ -71,8 +73,12 @@ class BenevolentLieDetector:
         
         # 선의의 거짓말에 대한 신뢰도 조정
         self.benevolent_confidence_adjustment = 0.3  # 선의의 거짓말 감지 시 신뢰도 감소
+        
+        # 패턴 인덱스 (한 번의 스캔으로 모든 패턴 확인)
+        self.benevolent_lie_pattern_index = get_pattern_index(self.benevolent_lie_patterns)
     
-    def analyze_with_benevolent_lie_recognition(self, statement: str, context: str = "") -> Dict:
+    def analyze_with_benevolent_lie_recognition(self, statement: str, context: str = "",
+                                                analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """
         선의의 거짓말 인식을 포함한 분석
         1. 기본 진실성 분석
@@ -84,10 +90,10 @@ class BenevolentLieDetector:
         logger.info(f"선의의 거짓말 인식 분석 시작: {statement[:50]}...")
         
         # 1단계: 기본 진실성 분석
-        primary_result = self.primary_detector.analyze_statement(statement, context)
+        primary_result = analyze_primary(self.primary_detector, statement, context, analysis_context)
         
         # 2단계: 선의의 거짓말 패턴 감지
-        detected_benevolent_lies = self._detect_benevolent_lie_patterns(statement)
+        detected_benevolent_lies = self._detect_benevolent_lie_patterns(statement, analysis_context=analysis_context)
         
         # 3단계: 맥락 분석
         context_analysis = self._analyze_benevolent_context(statement, context)
@@ -125,14 +131,13 @@ class BenevolentLieDetector:
             'final_confidence': adjusted_confidence
         }
     
-    def _detect_benevolent_lie_patterns(self, statement: str) -> List[str]:
+    def _detect_benevolent_lie_patterns(self, statement: str,
+                                        analysis_context: Optional[AnalysisContext] = None) -> List[str]:
         """선의의 거짓말 패턴 감지"""
         detected_lies = []
         
-        for category, patterns in self.benevolent_lie_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, statement, re.IGNORECASE):
-                    detected_lies.append(f"선의의 거짓말 ({category}): {pattern}")
+        for entry in scan_patterns(self.benevolent_lie_pattern_index, statement, analysis_context):
+            detected_lies.append(f"선의의 거짓말 ({entry.key}): {entry.pattern}")
         
         return detected_lies
     
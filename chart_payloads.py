@@ -0,0 +1,93 @@
+"""
+대시보드 차트 데이터
+plotly Figure 객체와 PlotlyJSONEncoder 를 거치지 않고 값 배열에서 바로 Plotly.js 그림 JSON 을 만드는 모듈
+(결과는 plotly Figure 를 JSON 으로 인코딩한 것과 같은 구조)
+"""
+
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+VERIFICATION_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD',
+                       '#98D8C8', '#F7DC6F', '#FF9F43', '#6C5CE7', '#A29BFE']
+
+@lru_cache(maxsize=1)
+def default_template() -> Dict[str, Any]:
+    """plotly 기본 템플릿 (처음 한 번만 plotly 를 import, 없으면 Plotly.js 기본 모양 사용)"""
+    try:
+        import plotly.io as pio
+        return pio.templates[pio.templates.default].to_plotly_json()
+    except Exception as e:
+        logger.warning(f"plotly 템플릿을 불러올 수 없습니다: {e}")
+        return {}
+
+def _layout(title: str, xaxis_title: str, yaxis_title: str) -> Dict[str, Any]:
+    layout = {
+        'title': {'text': title},
+        'xaxis': {'title': {'text': xaxis_title}},
+        'yaxis': {'title': {'text': yaxis_title}, 'range': [0, 1]}
+    }
+    template = default_template()
+    if template:
+        layout['template'] = template
+    return layout
+
+def _hline(y: float, color: str, text: str):
+    """fig.add_hline(y, line_dash='dash', line_color=color, annotation_text=text) 과 같은 선과 주석"""
+    shape = {'type': 'line', 'line': {'color': color, 'dash': 'dash'},
+             'x0': 0, 'x1': 1, 'xref': 'x domain', 'y0': y, 'y1': y, 'yref': 'y'}
+    annotation = {'showarrow': False, 'text': text, 'x': 1, 'xanchor': 'right', 'xref': 'x domain',
+                  'y': y, 'yanchor': 'bottom', 'yref': 'y'}
+    return shape, annotation
+
+def truth_trend_figure(timestamps: Sequence[str], truth_scores: Sequence[float],
+                       minimums: Optional[Sequence[float]] = None,
+                       maximums: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+    """
+    통합 진실성 트렌드 (ISO 시각 문자열과 점수 배열)
+
+    버킷 집계 결과면 truth_scores 에 평균을, minimums/maximums 에 버킷별 최소/최대를 주어
+    평균 선(첫 번째 trace) 아래에 최소~최대 범위 띠를 그린다.
+    """
+    lines = [_hline(0.99, 'red', '진실성 임계값 (99%)'), _hline(0.20, 'orange', '교정 임계값 (20%)')]
+    layout = _layout('AI 통합 진실성 트렌드', '시간', '진실성 점수')
+    layout['shapes'] = [shape for shape, _ in lines]
+    layout['annotations'] = [annotation for _, annotation in lines]
+    data = [{
+        'type': 'scatter',
+        'x': list(timestamps),
+        'y': list(truth_scores),
+        'mode': 'lines+markers',
+        'name': '통합 진실성 점수',
+        'line': {'color': '#2E86AB', 'width': 3},
+        'marker': {'size': 8}
+    }]
+    if minimums is not None and maximums is not None:
+        data[0]['name'] = '통합 진실성 점수 (평균)'
+        data.append({'type': 'scatter', 'x': list(timestamps), 'y': list(maximums), 'mode': 'lines',
+                     'name': '최대', 'line': {'width': 0}, 'showlegend': False})
+        data.append({'type': 'scatter', 'x': list(timestamps), 'y': list(minimums), 'mode': 'lines',
+                     'name': '최소~최대', 'line': {'width': 0}, 'fill': 'tonexty',
+                     'fillcolor': 'rgba(46, 134, 171, 0.2)'})
+    return {'data': data, 'layout': layout}
+
+def verification_figure(detector_rates: Dict[str, float]) -> Dict[str, Any]:
+    """탐지기별 감지율 막대 차트"""
+    layout = _layout('탐지기별 감지율', '탐지기', '감지율')
+    layout['xaxis']['tickangle'] = -45
+    return {
+        'data': [{
+            'type': 'bar',
+            'x': list(detector_rates.keys()),
+            'y': list(detector_rates.values()),
+            'marker': {'color': VERIFICATION_COLORS}
+        }],
+        'layout': layout
+    }
+
+def encode_figure(figure: Dict[str, Any]) -> str:
+    """그림 JSON 문자열 (대시보드는 이 문자열을 다시 JSON.parse 함)"""
+    return json.dumps(figure, separators=(',', ':'))
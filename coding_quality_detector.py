@@ -8,6 +8,7 @@ import re
 import ast
 from typing import Dict, List, Tuple, Optional
 import logging
+from pattern_index import get_pattern_index
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +104,12 @@ class CodingQualityDetector:
             ]
         }
         
+        # 패턴 인덱스 (한 번의 스캔으로 매칭 후보 패턴 선별)
+        pattern_flags = re.MULTILINE | re.IGNORECASE
+        self.unnecessary_code_index = get_pattern_index(self.unnecessary_code_patterns, pattern_flags)
+        self.good_code_index = get_pattern_index(self.good_code_patterns, pattern_flags)
+        self.manipulation_index = get_pattern_index(self.manipulation_patterns, pattern_flags)
+        
         # 코딩 품질 점수 가중치
         self.quality_weights = {
             'unnecessary_code': -0.3,
@@ -182,17 +189,14 @@ class CodingQualityDetector:
         """불필요한 코드 패턴 탐지"""
         detected_patterns = []
         
-        for pattern_type, patterns in self.unnecessary_code_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, code, re.MULTILINE | re.IGNORECASE)
-                for match in matches:
-                    detected_patterns.append({
-                        'type': pattern_type,
-                        'pattern': pattern,
-                        'match': match.group(),
-                        'line': code[:match.start()].count('\n') + 1,
-                        'severity': self._get_severity(pattern_type)
-                    })
+        for entry, match in self.unnecessary_code_index.finditer(code):
+            detected_patterns.append({
+                'type': entry.key,
+                'pattern': entry.pattern,
+                'match': match.group(),
+                'line': code[:match.start()].count('\n') + 1,
+                'severity': self._get_severity(entry.key)
+            })
         
         return detected_patterns
     
@@ -200,17 +204,14 @@ class CodingQualityDetector:
         """좋은 코딩 패턴 탐지"""
         detected_patterns = []
         
-        for pattern_type, patterns in self.good_code_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, code, re.MULTILINE | re.IGNORECASE)
-                for match in matches:
-                    detected_patterns.append({
-                        'type': pattern_type,
-                        'pattern': pattern,
-                        'match': match.group(),
-                        'line': code[:match.start()].count('\n') + 1,
-                        'quality': self._get_quality_score(pattern_type)
-                    })
+        for entry, match in self.good_code_index.finditer(code):
+            detected_patterns.append({
+                'type': entry.key,
+                'pattern': entry.pattern,
+                'match': match.group(),
+                'line': code[:match.start()].count('\n') + 1,
+                'quality': self._get_quality_score(entry.key)
+            })
         
         return detected_patterns
     
@@ -251,17 +252,14 @@ class CodingQualityDetector:
         """의도적 조작 패턴 탐지"""
         detected_patterns = []
         
-        for pattern_type, patterns in self.manipulation_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, code, re.MULTILINE | re.IGNORECASE)
-                for match in matches:
-                    detected_patterns.append({
-                        'type': pattern_type,
-                        'pattern': pattern,
-                        'match': match.group(),
-                        'line': code[:match.start()].count('\n') + 1,
-                        'manipulation_level': self._get_manipulation_level(pattern_type)
-                    })
+        for entry, match in self.manipulation_index.finditer(code):
+            detected_patterns.append({
+                'type': entry.key,
+                'pattern': entry.pattern,
+                'match': match.group(),
+                'line': code[:match.start()].count('\n') + 1,
+                'manipulation_level': self._get_manipulation_level(entry.key)
+            })
         
         return detected_patterns
     
@@ -6,8 +6,9 @@
 """
 
 from ai_truth_detector import TruthDetector, TruthAnalysis
+from analysis_context import AnalysisContext, analyze_primary, search_pattern
 from context_awareness_detector import ContextAwarenessDetector
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import re
 import logging
 
@@ -51,24 +52,27 @@ class CompoundSentenceAnalyzer:
             ]
         }
     
-    def analyze_compound_sentence(self, statement: str, context: str = None) -> Dict:
+    def analyze_compound_sentence(self, statement: str, context: str = None,
+                                  analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """복합 문장 분석"""
         logger.info(f"복합 문장 분석 시작: {statement}...")
         
         # 기본 분석
-        primary_analysis = self.primary_detector.analyze_statement(statement, context)
+        primary_analysis = analyze_primary(self.primary_detector, statement, context, analysis_context)
         
         # 문장 분리
-        sentences = self._split_sentences(statement)
+        sentences = self._sentences(statement, analysis_context)
         
         # 복합 문장 패턴 감지
-        compound_type = self._detect_compound_type(statement)
+        compound_type = self._detect_compound_type(statement, analysis_context)
         
         # 각 문장별 분석
         sentence_analyses = []
         for sentence in sentences:
             if sentence.strip():
-                context_analysis = self.context_detector.analyze_with_context_awareness(sentence.strip(), context)
+                context_analysis = self.context_detector.analyze_with_context_awareness(
+                    sentence.strip(), context, analysis_context
+                )
                 sentence_analyses.append({
                     'sentence': sentence.strip(),
                     'context_analysis': context_analysis
@@ -97,6 +101,12 @@ class CompoundSentenceAnalyzer:
         logger.info(f"복합 문장 분석 완료: {statement}")
         return result
     
+    def _sentences(self, statement: str, analysis_context: Optional[AnalysisContext] = None) -> List[str]:
+        """문장 분리 (분석 컨텍스트가 있으면 메모이즈된 결과 사용)"""
+        if analysis_context is not None:
+            return analysis_context.tokens(statement, self._split_sentences)
+        return self._split_sentences(statement)
+    
     def _split_sentences(self, statement: str) -> List[str]:
         """문장을 분리"""
         sentences = [statement]  # 기본적으로 전체 문장
@@ -121,15 +131,15 @@ class CompoundSentenceAnalyzer:
         
         return sentences
     
-    def _detect_compound_type(self, statement: str) -> str:
+    def _detect_compound_type(self, statement: str, analysis_context: Optional[AnalysisContext] = None) -> str:
         """복합 문장 유형 감지"""
         for compound_type, patterns in self.compound_patterns.items():
             for pattern in patterns:
-                if re.search(pattern, statement):
+                if search_pattern(pattern, statement, analysis_context):
                     return compound_type
         
         # 기본적으로 여러 문장이 있으면 복합 문장으로 간주
-        if len(self._split_sentences(statement)) > 1:
+        if len(self._sentences(statement, analysis_context)) > 1:
             return 'multiple_sentences'
         
         return 'simple'
@@ -6,7 +6,9 @@
 """
 
 from ai_truth_detector import TruthDetector, TruthAnalysis
-from typing import List, Dict, Tuple
+from analysis_context import AnalysisContext, analyze_primary, scan_patterns
+from pattern_index import get_pattern_index
+from typing import List, Dict, Tuple, Optional
 import re
 import logging
 
@@ -80,16 +82,20 @@ class ContextAwarenessDetector:
                 'general_objects': '둥근 모양'
             }
         }
+        
+        # 패턴 인덱스 (한 번의 스캔으로 모든 패턴 확인)
+        self.context_pattern_index = get_pattern_index(self.context_patterns)
     
-    def analyze_with_context_awareness(self, statement: str, context: str = None) -> Dict:
+    def analyze_with_context_awareness(self, statement: str, context: str = None,
+                                       analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """맥락 인식을 통한 문장 분석"""
         logger.info(f"맥락 인식 분석 시작: {statement}...")
         
         # 기본 분석 수행
-        primary_analysis = self.primary_detector.analyze_statement(statement, context)
+        primary_analysis = analyze_primary(self.primary_detector, statement, context, analysis_context)
         
         # 맥락 분석
-        context_analysis = self._analyze_context(statement, context)
+        context_analysis = self._analyze_context(statement, context, analysis_context=analysis_context)
         
         # 맥락별 진실성 조정
         adjusted_truth, adjusted_confidence = self._adjust_truth_by_context(
@@ -119,7 +125,8 @@ class ContextAwarenessDetector:
         logger.info(f"맥락 인식 분석 완료: {statement}")
         return result
     
-    def _analyze_context(self, statement: str, context: str = None) -> Dict:
+    def _analyze_context(self, statement: str, context: str = None,
+                         analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """문장의 맥락을 분석"""
         context_info = {
             'detected_contexts': [],
@@ -130,11 +137,9 @@ class ContextAwarenessDetector:
         }
         
         # 각 맥락 패턴 확인
-        for context_type, patterns in self.context_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, statement, re.IGNORECASE):
-                    context_info['detected_contexts'].append(context_type)
-                    break
+        for entry in scan_patterns(self.context_pattern_index, statement, analysis_context):
+            if entry.key not in context_info['detected_contexts']:
+                context_info['detected_contexts'].append(entry.key)
         
         # 맥락별 단어 의미 분석
         for word, meanings in self.contextual_meanings.items():
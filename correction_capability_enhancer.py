@@ -5,6 +5,8 @@ AI가 거짓말을 감지하고 교정할 수 있는 능력을 강화하는 시
 """
 
 from ai_truth_detector import TruthDetector, TruthAnalysis
+from analysis_context import AnalysisContext, analyze_primary, scan_patterns
+from pattern_index import get_pattern_index
 from typing import List, Dict, Tuple, Optional
 import logging
 import re
@@ -99,8 +101,14 @@ class CorrectionCapabilityEnhancer:
         
         # 교정 능력 강화 임계값
         self.correction_capability_threshold = 0.15  # 15% 이상 거짓말 감지 시 강화된 교정 적용
+        
+        # 패턴 인덱스 (한 번의 스캔으로 모든 패턴 확인)
+        self.correction_capability_pattern_index = get_pattern_index(
+            {category: data['patterns'] for category, data in self.correction_capability_patterns.items()}
+        )
     
-    def analyze_with_enhanced_correction_capability(self, statement: str, context: str = "") -> Dict:
+    def analyze_with_enhanced_correction_capability(self, statement: str, context: str = "",
+                                                    analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """
         강화된 교정 능력을 포함한 분석
         1. 기본 진실성 분석
@@ -111,10 +119,10 @@ class CorrectionCapabilityEnhancer:
         logger.info(f"강화된 교정 능력 분석 시작: {statement[:50]}...")
         
         # 1단계: 기본 진실성 분석
-        primary_result = self.primary_detector.analyze_statement(statement, context)
+        primary_result = analyze_primary(self.primary_detector, statement, context, analysis_context)
         
         # 2단계: 교정 능력 강화 패턴 감지
-        detected_correction_patterns = self._detect_correction_capability_patterns(statement)
+        detected_correction_patterns = self._detect_correction_capability_patterns(statement, analysis_context=analysis_context)
         
         # 3단계: 강화된 교정 적용
         enhanced_correction_applied = False
@@ -129,7 +137,7 @@ class CorrectionCapabilityEnhancer:
         
         # 4단계: 교정된 문장 재분석
         if enhanced_correction_applied:
-            corrected_result = self.primary_detector.analyze_statement(corrected_statement, context)
+            corrected_result = analyze_primary(self.primary_detector, corrected_statement, context, analysis_context)
         else:
             corrected_result = primary_result
         
@@ -158,14 +166,13 @@ class CorrectionCapabilityEnhancer:
             'final_confidence': enhanced_confidence
         }
     
-    def _detect_correction_capability_patterns(self, statement: str) -> List[str]:
+    def _detect_correction_capability_patterns(self, statement: str,
+                                               analysis_context: Optional[AnalysisContext] = None) -> List[str]:
         """교정 능력 강화 패턴 감지"""
         detected_patterns = []
         
-        for category, data in self.correction_capability_patterns.items():
-            for pattern in data['patterns']:
-                if re.search(pattern, statement, re.IGNORECASE):
-                    detected_patterns.append(f"교정 능력 패턴 ({category}): {pattern}")
+        for entry in scan_patterns(self.correction_capability_pattern_index, statement, analysis_context):
+            detected_patterns.append(f"교정 능력 패턴 ({entry.key}): {entry.pattern}")
         
         return detected_patterns
     
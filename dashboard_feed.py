@@ -0,0 +1,144 @@
+"""
+대시보드 실시간 피드
+분석 기록이 추가될 때마다 대시보드 방(room)에 변경분(집계, 새 트렌드 점, 새 최근 분석 행)만 보내고,
+짧은 시간에 몰린 기록은 설정한 간격마다 한 번으로 묶어 보내는 모듈
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 최근 분석 표에 필요한 필드 (섹션 → 키), 나머지 분석 결과는 보내지 않음
+ROW_FIELDS = {
+    'final_analysis': ('truth_percentage', 'confidence', 'needs_correction', 'final_corrected_statement'),
+    'meta_analysis': ('meta_lie_detected',),
+    'religious_analysis': ('religious_topic_detected',),
+    'scientific_analysis': ('scientific_lie_detected',),
+    'intentional_analysis': ('intentional_lie_detected',),
+    'human_behavior_analysis': ('is_human_behavior_lie',),
+    'benevolent_analysis': ('is_benevolent_lie',),
+    'correction_enhancement': ('enhanced_correction_applied',),
+    'context_analysis': ('context_correction_applied',),
+    'puns_analysis': ('is_pun_detected',),
+    'coding_analysis': ('unnecessary_code_detected',),
+    'multilingual_analysis': ('is_multilingual',)
+}
+
+def dashboard_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """최근 분석 표 한 행 (기록과 같은 구조, 표에 쓰는 필드만)"""
+    row = {'timestamp': record.get('timestamp'), 'statement': record.get('statement')}
+    for section, keys in ROW_FIELDS.items():
+        value = record.get(section)
+        if isinstance(value, dict):
+            row[section] = {key: value.get(key) for key in keys if key in value}
+    return row
+
+def trend_point(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """진실성 트렌드 차트에 추가할 점 (통합 결과가 없는 기록은 None)"""
+    final_analysis = record.get('final_analysis')
+    if not isinstance(final_analysis, dict) or 'truth_percentage' not in final_analysis:
+        return None
+    return {'timestamp': record.get('timestamp'), 'truth_percentage': final_analysis['truth_percentage']}
+
+class DashboardFeed:
+    """
+    대시보드 변경분 발송기 (HistoryStore.subscribe 에 연결)
+
+    기록이 추가되면 대기열에 넣고, 마지막 발송 후 min_interval 초가 지난 시점에 한 번 발송한다.
+    탭 수와 관계없이 발송은 방 하나로의 브로드캐스트 한 번이고, 집계는 snapshot() 이 O(탐지기 수)로 만든다.
+    한 번에 max_points 개를 넘게 쌓이면 점/행 대신 resync 표시를 보내 클라이언트가 전체를 다시 읽게 한다.
+    """
+
+    def __init__(self, emit: Callable[[str, Any, Optional[str]], None], snapshot: Callable[[], Dict[str, Any]],
+                 room: str = 'dashboard', min_interval: float = 1.0, max_points: int = 100, recent_rows: int = 5):
+        """
+        Args:
+            emit: (이벤트, 데이터, 방) 을 받아 브로드캐스트하는 함수
+            snapshot: 현재 집계(카운터, 차트 값)를 반환하는 함수 (반환한 키가 발송 데이터에 포함됨)
+            room: 대시보드 탭이 참가하는 방 이름
+            min_interval: 발송 최소 간격 (초)
+            max_points: 한 번에 보낼 최대 트렌드 점 수
+            recent_rows: 최근 분석 표의 행 수
+        """
+        self.emit = emit
+        self.snapshot = snapshot
+        self.room = room
+        self.min_interval = min_interval
+        self.max_points = max_points
+        self.recent_rows = recent_rows
+
+        self._lock = threading.Lock()
+        self._points: List[Dict[str, Any]] = []
+        self._rows: List[Dict[str, Any]] = []
+        self._pending = 0
+        self._timer: Optional[threading.Timer] = None
+        self._last_sent = 0.0
+        self.sent = 0
+
+    def __call__(self, event: str, record: Optional[Dict[str, Any]]):
+        """HistoryStore 알림 수신"""
+        if event == 'clear':
+            with self._lock:
+                self._reset_pending()
+            self._send('dashboard_reset', {'timestamp': time.time()})
+            return
+
+        point = trend_point(record)
+        with self._lock:
+            self._pending += 1
+            if point is not None and len(self._points) <= self.max_points:
+                self._points.append(point)
+            self._rows.append(dashboard_row(record))
+            del self._rows[:-self.recent_rows]
+            if self._timer is None:
+                delay = max(0.0, self._last_sent + self.min_interval - time.monotonic())
+                self._timer = threading.Timer(delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _reset_pending(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._points = []
+        self._rows = []
+        self._pending = 0
+
+    def flush(self):
+        """대기 중인 변경분 발송"""
+        with self._lock:
+            if not self._pending:
+                self._timer = None
+                return
+            points, rows, pending = self._points, self._rows, self._pending
+            self._reset_pending()
+            self._last_sent = time.monotonic()
+
+        try:
+            update = dict(self.snapshot())
+        except Exception as e:
+            logger.warning(f"대시보드 집계 생성 실패: {e}")
+            return
+
+        resync = len(points) > self.max_points
+        update.update({
+            'records': pending,
+            'resync': resync,
+            'trend_points': [] if resync else points,
+            'recent_rows': rows
+        })
+        self._send('dashboard_update', update)
+
+    def _send(self, event: str, data: Dict[str, Any]):
+        try:
+            self.emit(event, data, self.room)
+            self.sent += 1
+        except Exception as e:
+            logger.warning(f"대시보드 업데이트 발송 실패: {e}")
+
+    def close(self):
+        with self._lock:
+            self._reset_pending()
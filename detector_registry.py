@@ -0,0 +1,204 @@
+"""
+지연 로딩 탐지기 레지스트리
+탐지기 모듈 import 와 생성자를 처음 사용할 때(또는 백그라운드 워밍업 스레드에서) 한 번만 실행하고,
+각 import/생성자에 걸린 시간을 기동 시간 보고서로 제공하는 모듈
+"""
+
+import time
+import logging
+import importlib
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class _Registration:
+    """등록된 탐지기 (생성 정보와 생성된 인스턴스)"""
+
+    def __init__(self, name: str, module: str, attribute: str, args: tuple, kwargs: dict):
+        self.name = name
+        self.module = module
+        self.attribute = attribute
+        self.args = args
+        self.kwargs = kwargs
+        self.lock = threading.Lock()
+        self.instance: Any = None
+        self.loaded = False
+        self.error: Optional[str] = None
+        self.init_seconds: Optional[float] = None
+        self.loaded_at: Optional[str] = None
+        self.loaded_by: Optional[str] = None
+
+class LazyDetector:
+    """
+    탐지기 대리 객체
+
+    속성에 처음 접근할 때 레지스트리에서 실제 탐지기를 생성하므로,
+    모듈 수준 전역 이름을 그대로 두고도 생성 시점을 첫 사용으로 미룰 수 있다.
+    """
+
+    __slots__ = ('_registry', '_name')
+
+    def __init__(self, registry: 'DetectorRegistry', name: str):
+        object.__setattr__(self, '_registry', registry)
+        object.__setattr__(self, '_name', name)
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._registry.get(self._name), attribute)
+
+    def __setattr__(self, attribute: str, value: Any):
+        setattr(self._registry.get(self._name), attribute, value)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._registry.is_loaded(self._name) else 'not loaded'
+        return f"<LazyDetector {self._name} ({state})>"
+
+    def __reduce__(self):
+        # 레지스트리(잠금 포함)는 피클할 수 없으므로 생성 정보만 넘기고, 받는 프로세스의 레지스트리에서 다시 만듦
+        registration = self._registry._registrations[self._name]
+        return (_restore_detector, (registration.name, registration.module, registration.attribute,
+                                    registration.args, registration.kwargs))
+
+class DetectorRegistry:
+    """탐지기 지연 생성 레지스트리"""
+
+    def __init__(self):
+        self._registrations: Dict[str, _Registration] = {}
+        self._import_lock = threading.Lock()
+        self._imports: Dict[str, float] = {}      # 모듈 이름 → import 소요 시간(초)
+        self._phases: Dict[str, float] = {}       # 기동 단계 이름 → 소요 시간(초)
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._warmup_started: Optional[float] = None
+        self._warmup_seconds: Optional[float] = None
+
+    def register(self, name: str, module: str, attribute: str, *args, **kwargs) -> LazyDetector:
+        """
+        탐지기 등록 (모듈은 아직 import 하지 않음)
+
+        Args:
+            name: 레지스트리 이름
+            module: 탐지기 클래스가 있는 모듈 이름
+            attribute: 모듈 안의 클래스(또는 팩토리 함수) 이름
+            *args, **kwargs: 생성자 인자
+
+        Returns:
+            LazyDetector: 첫 속성 접근 시 탐지기를 생성하는 대리 객체
+        """
+        if name in self._registrations:
+            raise ValueError(f"이미 등록된 탐지기입니다: {name}")
+        self._registrations[name] = _Registration(name, module, attribute, args, kwargs)
+        return LazyDetector(self, name)
+
+    def import_module(self, module: str):
+        """모듈 import (최초 import 소요 시간을 기록, 잠금은 모듈별 import 잠금에 맡김)"""
+        if module in self._imports:
+            return importlib.import_module(module)
+        started = time.perf_counter()
+        imported = importlib.import_module(module)
+        with self._import_lock:
+            self._imports.setdefault(module, time.perf_counter() - started)
+        return imported
+
+    def record_phase(self, name: str, seconds: float):
+        """앱 기동 단계 소요 시간 기록"""
+        self._phases[name] = seconds
+
+    def get(self, name: str) -> Any:
+        """탐지기 반환 (없으면 생성, 동시 요청은 한 번만 생성)"""
+        registration = self._registrations[name]
+        if registration.loaded:
+            return registration.instance
+
+        with registration.lock:
+            if not registration.loaded:
+                self._build(registration)
+        return registration.instance
+
+    def _build(self, registration: _Registration):
+        try:
+            factory = getattr(self.import_module(registration.module), registration.attribute)
+            started = time.perf_counter()
+            instance = factory(*registration.args, **registration.kwargs)
+        except Exception as e:
+            registration.error = str(e)
+            logger.error(f"탐지기 생성 실패 ({registration.name}): {e}")
+            raise
+        registration.init_seconds = time.perf_counter() - started
+        registration.instance = instance
+        registration.loaded_at = datetime.now().isoformat()
+        registration.loaded_by = threading.current_thread().name
+        registration.error = None
+        registration.loaded = True
+        logger.info(f"탐지기 로드 완료: {registration.name} ({registration.init_seconds * 1000:.1f}ms)")
+
+    def is_loaded(self, name: str) -> bool:
+        return self._registrations[name].loaded
+
+    def names(self) -> List[str]:
+        return list(self._registrations)
+
+    def warm_up(self, names: Optional[Iterable[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+        """
+        탐지기 미리 생성 (등록 순서대로)
+
+        background=True 이면 데몬 스레드에서 실행하고 스레드를 반환한다.
+        워밍업 중 요청이 먼저 같은 탐지기를 쓰면 그 요청이 생성하고 워밍업은 결과를 재사용한다.
+        """
+        targets = list(names) if names is not None else self.names()
+
+        def run():
+            self._warmup_started = time.perf_counter()
+            for name in targets:
+                try:
+                    self.get(name)
+                except Exception:
+                    continue        # 실패는 기록만 하고 첫 사용 시 다시 시도
+            self._warmup_seconds = time.perf_counter() - self._warmup_started
+            logger.info(f"탐지기 워밍업 완료: {len(targets)}개 ({self._warmup_seconds:.2f}s)")
+
+        if not background:
+            run()
+            return None
+
+        self._warmup_thread = threading.Thread(target=run, name='detector-warmup', daemon=True)
+        self._warmup_thread.start()
+        return self._warmup_thread
+
+    def warming_up(self) -> bool:
+        return self._warmup_thread is not None and self._warmup_thread.is_alive()
+
+    def startup_report(self) -> Dict[str, Any]:
+        """기동 시간 보고서 (단계, 모듈 import, 탐지기 생성자별 소요 시간)"""
+        detectors = {}
+        for name, registration in self._registrations.items():
+            detectors[name] = {
+                'module': registration.module,
+                'loaded': registration.loaded,
+                'import_ms': round(self._imports[registration.module] * 1000, 3) if registration.module in self._imports else None,
+                'init_ms': round(registration.init_seconds * 1000, 3) if registration.init_seconds is not None else None,
+                'loaded_at': registration.loaded_at,
+                'loaded_by': registration.loaded_by,
+                'error': registration.error
+            }
+
+        return {
+            'phases_ms': {name: round(seconds * 1000, 3) for name, seconds in self._phases.items()},
+            'imports_ms': {name: round(seconds * 1000, 3) for name, seconds in self._imports.items()},
+            'detectors': detectors,
+            'loaded': sum(1 for registration in self._registrations.values() if registration.loaded),
+            'registered': len(self._registrations),
+            'warming_up': self.warming_up(),
+            'warmup_ms': round(self._warmup_seconds * 1000, 3) if self._warmup_seconds is not None else None
+        }
+
+# 피클로 전달받은 탐지기 대리 객체를 만드는 프로세스별 레지스트리 (프로세스 풀 작업자에서 탐지기를 한 번만 생성)
+_process_registry = DetectorRegistry()
+_process_registry_lock = threading.Lock()
+
+def _restore_detector(name: str, module: str, attribute: str, args: tuple, kwargs: dict) -> LazyDetector:
+    """LazyDetector 역직렬화 (같은 이름은 프로세스 안에서 한 번만 등록)"""
+    with _process_registry_lock:
+        if name not in _process_registry._registrations:
+            _process_registry.register(name, module, attribute, *args, **kwargs)
+    return LazyDetector(_process_registry, name)
@@ -0,0 +1,218 @@
+"""
+탐지기 병렬 실행 스케줄러
+서로 독립적인 탐지기를 스레드/프로세스 풀에서 동시에 실행하고,
+탐지기 간 의존성 그래프와 탐지기별 제한 시간을 지키면서 부분 결과를 반환하는 모듈
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 아직 시작하지 않은 (풀 대기 중인) 작업의 시작 여부를 확인하는 간격 (초)
+START_POLL_INTERVAL = 0.02
+
+@dataclass
+class DetectorTask:
+    """스케줄러에서 실행할 탐지기 작업"""
+    name: str
+    func: Callable[..., Any]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None     # 초 단위 제한 시간 (None이면 스케줄러 기본값)
+
+@dataclass
+class DetectorResult:
+    """탐지기 실행 결과"""
+    name: str
+    value: Any = None
+    latency: float = 0.0                # 실제 실행 시간 (초)
+    timed_out: bool = False
+    error: Optional[str] = None
+    skipped: bool = False               # 의존 탐지기 실패로 실행하지 않음
+
+    @property
+    def ok(self) -> bool:
+        return not (self.timed_out or self.error or self.skipped)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답용 요약 (값 제외)"""
+        return {
+            'latency_ms': round(self.latency * 1000, 3),
+            'timed_out': self.timed_out,
+            'error': self.error,
+            'skipped': self.skipped
+        }
+
+def _timed_call(func: Callable[..., Any], args: Sequence[Any]) -> Tuple[Any, float]:
+    """작업 실행 후 (결과, 실행 시간) 반환 - 프로세스 풀에서도 피클 가능한 최상위 함수"""
+    start_time = time.perf_counter()
+    value = func(*args)
+    return value, time.perf_counter() - start_time
+
+class DetectorScheduler:
+    """의존성 그래프 기반 탐지기 병렬 실행기"""
+
+    def __init__(self, max_workers: int = 8, executor_type: str = 'thread',
+                 default_timeout: Optional[float] = 10.0):
+        if executor_type not in ('thread', 'process'):
+            raise ValueError(f"지원하지 않는 실행기 유형입니다: {executor_type}")
+
+        self.max_workers = max_workers
+        self.executor_type = executor_type
+        self.default_timeout = default_timeout
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        # 제한 시간을 넘겨 결과를 버렸지만 아직 작업자를 점유 중인 작업
+        self._stuck: Set[Future] = set()
+        # 작업자 절반 이상이 점유되면 새 실행기로 교체
+        self.max_stuck = max(1, max_workers // 2)
+
+    @property
+    def executor(self) -> Executor:
+        """실행기 (최초 사용 시 생성, 요청 간 재사용)"""
+        with self._lock:
+            if self._executor is not None and len(self._stuck) >= self.max_stuck:
+                # 멈춘 작업이 끝나면 이전 실행기의 작업자도 종료됨 (대기 중인 작업은 그대로 실행)
+                logger.warning(f"제한 시간 초과 작업이 작업자 {len(self._stuck)}개를 점유하여 실행기를 교체합니다")
+                self._executor.shutdown(wait=False)
+                self._executor = None
+                self._stuck.clear()
+            if self._executor is None:
+                if self.executor_type == 'process':
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='detector'
+                    )
+            return self._executor
+
+    def shutdown(self, wait_for_tasks: bool = False):
+        """실행기 종료"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait_for_tasks, cancel_futures=True)
+                self._executor = None
+            self._stuck.clear()
+
+    def _abandon(self, future: Future):
+        """제한 시간이 지난 작업 정리 (대기 중이면 취소, 실행 중이면 점유 작업으로 기록)"""
+        if future.cancel():
+            return
+        with self._lock:
+            self._stuck.add(future)
+        future.add_done_callback(self._release)
+
+    def _release(self, future: Future):
+        with self._lock:
+            self._stuck.discard(future)
+
+    def run(self, tasks: Sequence[DetectorTask], *args: Any) -> Dict[str, DetectorResult]:
+        """
+        작업들을 의존성 순서에 따라 병렬 실행
+
+        Args:
+            tasks: 실행할 탐지기 작업 목록
+            *args: 모든 작업 함수에 전달할 인자
+
+        Returns:
+            Dict[str, DetectorResult]: 작업 이름별 결과 (제한 시간 초과 시 timed_out=True)
+        """
+        task_map = {task.name: task for task in tasks}
+        self._validate(task_map)
+
+        results: Dict[str, DetectorResult] = {}
+        pending = dict(task_map)
+        running: Dict[Future, str] = {}
+        # 작업이 실제로 시작된 시각 - 제한 시간은 풀 대기 시간을 빼고 이때부터 계산
+        started: Dict[str, float] = {}
+
+        while pending or running:
+            # 의존성이 모두 완료된 작업 제출, 실패한 의존성이 있으면 건너뜀
+            for name in list(pending):
+                task = pending[name]
+                if any(dep not in results for dep in task.depends_on):
+                    continue
+                del pending[name]
+
+                failed = [dep for dep in task.depends_on if not results[dep].ok]
+                if failed:
+                    results[name] = DetectorResult(
+                        name, skipped=True, error=f"의존 탐지기 실패: {', '.join(failed)}"
+                    )
+                    continue
+
+                running[self.executor.submit(_timed_call, task.func, args)] = name
+
+            if not running:
+                continue
+
+            now = time.monotonic()
+            deadlines: Dict[Future, float] = {}
+            waiting_to_start = False
+            for future, name in running.items():
+                if name not in started:
+                    if not (future.running() or future.done()):
+                        waiting_to_start = True
+                        continue
+                    started[name] = now
+                timeout = self._timeout(task_map[name])
+                if timeout is not None:
+                    deadlines[future] = started[name] + timeout
+
+            wait_time = max(0.0, min(deadlines.values()) - now) if deadlines else None
+            if waiting_to_start:
+                wait_time = START_POLL_INTERVAL if wait_time is None else min(wait_time, START_POLL_INTERVAL)
+            done, _ = wait(list(running), timeout=wait_time, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = running.pop(future)
+                try:
+                    value, latency = future.result()
+                    results[name] = DetectorResult(name, value=value, latency=latency)
+                except Exception as e:
+                    logger.error(f"탐지기 실행 오류 ({name}): {str(e)}")
+                    results[name] = DetectorResult(name, error=str(e))
+
+            # 제한 시간이 지난 작업은 결과를 기다리지 않음 (스레드는 백그라운드에서 종료됨)
+            now = time.monotonic()
+            for future, deadline in deadlines.items():
+                if future in running and now >= deadline:
+                    name = running.pop(future)
+                    self._abandon(future)
+                    timeout = self._timeout(task_map[name])
+                    logger.warning(f"탐지기 제한 시간 초과 ({name}): {timeout}초")
+                    results[name] = DetectorResult(name, latency=now - started[name], timed_out=True)
+
+        return {task.name: results[task.name] for task in tasks}
+
+    def _timeout(self, task: DetectorTask) -> Optional[float]:
+        return task.timeout if task.timeout is not None else self.default_timeout
+
+    def _validate(self, task_map: Dict[str, DetectorTask]):
+        """의존성 그래프 검증 (존재하지 않는 의존성, 순환 의존성)"""
+        for task in task_map.values():
+            for dep in task.depends_on:
+                if dep not in task_map:
+                    raise ValueError(f"알 수 없는 의존 탐지기입니다: {task.name} → {dep}")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"순환 의존성이 있습니다: {name}")
+            visiting.add(name)
+            for dep in task_map[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in task_map:
+            visit(name)
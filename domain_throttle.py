@@ -0,0 +1,136 @@
+"""
+도메인별 요청 속도 조절
+도메인마다 토큰 버킷(초당 요청 수, 버스트)을 두고 스레드 간에 공유해 요청 간격을 맞추고,
+429/5xx 응답을 받으면 Retry-After (없으면 지수 백오프) 만큼 그 도메인 요청을 미루는 모듈
+"""
+
+import time
+import threading
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+
+# 도메인별 기본 속도 (초당 요청 수, 버스트), 하위 도메인에도 적용
+DEFAULT_DOMAIN_RATES: Dict[str, Tuple[float, int]] = {
+    'google.com': (1.0, 2),
+    'bing.com': (1.0, 2),
+    'duckduckgo.com': (0.5, 1),
+    'naver.com': (1.0, 2),
+    'daum.net': (1.0, 2)
+}
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 기다릴 초 (해석할 수 없으면 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - now)
+
+class _Bucket:
+    """한 도메인의 토큰 버킷과 백오프 상태"""
+    __slots__ = ('rate', 'burst', 'tokens', 'updated', 'blocked_until', 'failures')
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+        self.blocked_until = 0.0
+        self.failures = 0
+
+class DomainThrottle:
+    """스레드 간에 공유하는 도메인별 토큰 버킷 스케줄러"""
+
+    def __init__(self, rate: float = 2.0, burst: int = 4, rates: Optional[Dict[str, Tuple[float, int]]] = None,
+                 base_backoff: float = 1.0, max_backoff: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            rate, burst: 설정에 없는 도메인의 초당 요청 수와 버스트
+            rates: 도메인별 (초당 요청 수, 버스트), 'google.com' 은 'www.google.com' 에도 적용
+            base_backoff, max_backoff: Retry-After 가 없을 때의 지수 백오프 시작값과 상한 (초)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.rates = dict(DEFAULT_DOMAIN_RATES if rates is None else rates)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _limits(self, host: str) -> Tuple[float, int]:
+        labels = host.split('.')
+        for i in range(len(labels)):
+            limits = self.rates.get('.'.join(labels[i:]))
+            if limits:
+                return limits
+        return self.rate, self.burst
+
+    def _bucket(self, host: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(*self._limits(host), now)
+        else:
+            bucket.tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+        return bucket
+
+    def reserve(self, host: str, deadline: Optional[float] = None) -> Optional[float]:
+        """
+        요청 한 번의 차례를 예약하고 기다려야 할 초를 반환
+
+        마감 시각(clock 기준)까지 차례가 오지 않으면 예약하지 않고 None 을 반환한다.
+        토큰이 모자라면 음수로 빌려 두므로, 동시에 예약한 요청들은 1/rate 간격으로 줄을 선다.
+        """
+        host = host.lower()
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(host, now)
+            wait = max(bucket.blocked_until - now, 0.0)
+            if bucket.tokens < 1:
+                wait = max(wait, (1 - bucket.tokens) / bucket.rate)
+            if deadline is not None and now + wait > deadline:
+                return None
+            bucket.tokens -= 1
+            return wait
+
+    def acquire(self, host: str, deadline: Optional[float] = None) -> bool:
+        """차례가 올 때까지 기다림 (마감 시각까지 차례가 오지 않으면 기다리지 않고 False)"""
+        wait = self.reserve(host, deadline)
+        if wait is None:
+            return False
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+    def backoff(self, host: str, retry_after: Optional[float] = None) -> float:
+        """429/5xx 응답 후 도메인 요청을 미룸 (Retry-After 가 없으면 연속 실패마다 두 배), 미룬 초 반환"""
+        host = host.lower()
+        with self._lock:
+            now = self._clock()
+            bucket = self._bucket(host, now)
+            if retry_after is None:
+                retry_after = self.base_backoff * (2 ** bucket.failures)
+            delay = min(retry_after, self.max_backoff)
+            bucket.failures += 1
+            bucket.blocked_until = max(bucket.blocked_until, now + delay)
+            return delay
+
+    def record_success(self, host: str):
+        """정상 응답을 받으면 연속 실패 횟수 초기화"""
+        with self._lock:
+            bucket = self._buckets.get(host.lower())
+            if bucket is not None:
+                bucket.failures = 0
+
@@ -0,0 +1,303 @@
+"""
+BERT 임베딩 서비스
+대기 중인 문장을 크기/대기 시간 상한이 있는 마이크로 배치로 묶어 한 번에 패딩·추론하고,
+[CLS] 벡터를 문장 해시 키로 메모리 맵 float16 저장소에 캐시하는 모듈
+"""
+
+import os
+import time
+import queue
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows 에서는 파일 잠금 없이 프로세스 하나가 쓰는 것으로 가정
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+def text_key(text: str, model_name: str = '') -> bytes:
+    """모델 이름과 문장의 16바이트 해시 (캐시 키)"""
+    return hashlib.blake2b(f"{model_name}\0{text}".encode('utf-8'), digest_size=16).digest()
+
+class EmbeddingStore:
+    """
+    메모리 맵 float16 임베딩 저장소
+
+    한 개의 .npy 파일에 (키, 기록 순번, 벡터) 행을 고정 용량 링 버퍼로 저장한다.
+    프로세스를 다시 시작해도 파일을 다시 열면 캐시가 유지되고, 가득 차면 가장 오래된 행을 덮어쓴다.
+    여러 프로세스가 같은 파일을 쓸 수 있으므로 기록은 파일 잠금(.lock) 안에서 하고,
+    조회 시 행의 키를 확인하여 다른 프로세스가 덮어쓴 행은 미스로 처리한다.
+    """
+
+    def __init__(self, path: str, dim: int = 768, capacity: int = 100000):
+        self.path = path
+        self.dim = dim
+        self.capacity = capacity
+        self.dtype = np.dtype([('key', 'V16'), ('seq', '<i8'), ('vector', '<f2', (dim,))])
+        self._lock = threading.Lock()
+        self._lock_file = open(f"{path}.lock", 'a+b') if fcntl is not None else None
+        with self._file_lock(exclusive=True):
+            self._rows = self._open()
+
+        # 기존 행으로 키 색인과 다음 기록 위치 복원 (seq 0 은 빈 행)
+        seqs = np.asarray(self._rows['seq'])
+        used = np.flatnonzero(seqs > 0)
+        self._index: Dict[bytes, int] = {bytes(self._rows['key'][row]): int(row) for row in used[np.argsort(seqs[used])]}
+        self._next_seq = int(seqs.max()) + 1 if len(used) else 1
+        self._cursor = (int(seqs.argmax()) + 1) % capacity if len(used) else 0
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """프로세스 간 파일 잠금 (조회는 공유, 기록은 배타)"""
+        if self._lock_file is None:
+            yield
+            return
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _stored_at(self, key: bytes, row: Optional[int]) -> bool:
+        """행에 아직 이 키가 저장되어 있는지 (다른 프로세스가 덮어쓰지 않았는지)"""
+        return row is not None and bytes(self._rows['key'][row]) == key
+
+    def _open(self):
+        if os.path.exists(self.path):
+            try:
+                rows = np.lib.format.open_memmap(self.path, mode='r+')
+                if rows.dtype == self.dtype and rows.shape == (self.capacity,):
+                    return rows
+                logger.warning(f"임베딩 저장소 형식이 달라 새로 만듭니다: {self.path}")
+            except Exception as e:
+                logger.warning(f"임베딩 저장소를 열 수 없어 새로 만듭니다 ({self.path}): {e}")
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return np.lib.format.open_memmap(self.path, mode='w+', dtype=self.dtype, shape=(self.capacity,))
+
+    def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, np.ndarray]:
+        """저장된 벡터 조회 (없거나 다른 프로세스가 덮어쓴 키는 결과에서 빠짐)"""
+        results = {}
+        with self._lock, self._file_lock(exclusive=False):
+            for key in keys:
+                row = self._index.get(key)
+                if row is None:
+                    continue
+                if not self._stored_at(key, row):
+                    del self._index[key]
+                    continue
+                results[key] = self._rows['vector'][row].astype(np.float32)
+        return results
+
+    def put_many(self, items: Dict[bytes, np.ndarray]):
+        """벡터 저장 (가득 차면 가장 오래된 행을 덮어씀)"""
+        with self._lock, self._file_lock(exclusive=True):
+            # 다른 프로세스가 기록했을 수 있으므로 파일의 마지막 기록 위치에서 이어 씀
+            seqs = self._rows['seq']
+            latest = int(seqs.argmax())
+            if seqs[latest] >= self._next_seq:
+                self._next_seq = int(seqs[latest]) + 1
+                self._cursor = (latest + 1) % self.capacity
+
+            for key, vector in items.items():
+                row = self._index.get(key)
+                if not self._stored_at(key, row):
+                    row = self._cursor
+                    self._cursor = (self._cursor + 1) % self.capacity
+                    evicted = bytes(self._rows['key'][row])
+                    if self._rows['seq'][row] > 0 and self._index.get(evicted) == row:
+                        del self._index[evicted]
+                    self._index[key] = row
+                self._rows[row] = (key, self._next_seq, vector)
+                self._next_seq += 1
+
+    def flush(self):
+        with self._lock:
+            self._rows.flush()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+class TorchBackend:
+    """PyTorch CPU/GPU 추론 백엔드 (선택적으로 Linear 층 int8 동적 양자화)"""
+
+    def __init__(self, tokenizer, model, num_threads: Optional[int] = None,
+                 quantize: bool = False, max_length: int = 512):
+        import torch
+
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        model.eval()
+        if quantize:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+        self.torch = torch
+        self.tokenizer = tokenizer
+        self.model = model
+        self.max_length = max_length
+        self.name = 'torch-int8' if quantize else 'torch'
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """배치 전체를 함께 패딩하여 [CLS] 벡터 반환"""
+        inputs = self.tokenizer(texts, return_tensors='pt', padding=True, truncation=True, max_length=self.max_length)
+        with self.torch.inference_mode():
+            outputs = self.model(**inputs)
+        return outputs.last_hidden_state[:, 0, :].float().numpy()
+
+class OnnxBackend:
+    """
+    ONNX Runtime CPU 추론 백엔드
+
+    model_path 는 미리 내보낸 (필요하면 int8 양자화된) ONNX 모델 파일이며,
+    입력 이름은 토크나이저 출력 중 세션이 요구하는 것만 전달한다.
+    """
+
+    def __init__(self, tokenizer, model_path: str, num_threads: Optional[int] = None, max_length: int = 512):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(model_path, options, providers=['CPUExecutionProvider'])
+        self.input_names = {item.name for item in self.session.get_inputs()}
+        self.tokenizer = tokenizer
+        self.max_length = max_length
+        self.name = 'onnx'
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        inputs = self.tokenizer(texts, return_tensors='np', padding=True, truncation=True, max_length=self.max_length)
+        feeds = {name: np.asarray(value, dtype=np.int64) for name, value in inputs.items() if name in self.input_names}
+        return np.asarray(self.session.run(None, feeds)[0][:, 0, :], dtype=np.float32)
+
+class EmbeddingService:
+    """
+    마이크로 배치 + 캐시 임베딩 서비스
+
+    embed() 는 캐시에 없는 문장을 대기열에 넣고, 배치 스레드가 최대 max_batch_size 개 또는
+    첫 문장 도착 후 max_wait_ms 까지 모인 문장을 한 번에 추론한다.
+    동시에 들어온 요청들이 한 배치를 공유하므로 요청마다 모델을 따로 호출하지 않는다.
+    """
+
+    def __init__(self, backend, store: Optional[EmbeddingStore] = None, model_name: str = '',
+                 dim: int = 768, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self.backend = backend
+        self.store = store
+        self.model_name = model_name
+        self.dim = dim
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._pending: Dict[bytes, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {'requests': 0, 'cache_hits': 0, 'encoded': 0, 'batches': 0, 'errors': 0}
+
+        self._worker = threading.Thread(target=self._run, name='embedding-batcher', daemon=True)
+        self._worker.start()
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """문장들의 [CLS] 벡터 (len(texts), dim), float16 정밀도로 반올림된 float32"""
+        keys = [text_key(text, self.model_name) for text in texts]
+        self._count('requests', len(texts))
+
+        vectors = self.store.get_many(keys) if self.store is not None else {}
+        self._count('cache_hits', sum(1 for key in keys if key in vectors))
+
+        # 캐시 미스는 대기열로 (같은 문장이 이미 대기 중이면 그 결과를 공유)
+        futures: Dict[bytes, Future] = {}
+        with self._pending_lock:
+            for key, text in zip(keys, texts):
+                if key in vectors or key in futures:
+                    continue
+                future = self._pending.get(key)
+                if future is None:
+                    future = self._pending[key] = Future()
+                    self._queue.put((key, text, future))
+                futures[key] = future
+
+        for key, future in futures.items():
+            vectors[key] = future.result()
+
+        if not keys:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.stack([vectors[key] for key in keys])
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            # 첫 항목 도착 후 대기 시간 상한까지 배치를 채움 (상한이 지나도 이미 쌓인 항목은 함께 처리)
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._encode(batch)
+
+    def _encode(self, batch: List[tuple]):
+        keys = [key for key, _, _ in batch]
+        try:
+            # 저장소와 같은 float16 정밀도로 맞춰 캐시 적중 여부와 무관하게 같은 값을 반환
+            encoded = np.asarray(self.backend.encode([text for _, text, _ in batch]), dtype=np.float16).astype(np.float32)
+            if self.store is not None:
+                self.store.put_many(dict(zip(keys, encoded)))
+            self._count('batches')
+            self._count('encoded', len(batch))
+            results = [(future, vector, None) for (_, _, future), vector in zip(batch, encoded)]
+        except Exception as e:
+            logger.warning(f"임베딩 배치 추론 실패: {e}")
+            self._count('errors')
+            results = [(future, None, e) for _, _, future in batch]
+
+        with self._pending_lock:
+            for key in keys:
+                self._pending.pop(key, None)
+        for future, vector, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(vector)
+
+    def close(self):
+        """배치 스레드 종료 및 저장소 플러시"""
+        self._queue.put(None)
+        self._worker.join()
+        if self.store is not None:
+            self.store.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats.update({
+            'backend': getattr(self.backend, 'name', type(self.backend).__name__),
+            'average_batch_size': stats['encoded'] / stats['batches'] if stats['batches'] else 0.0,
+            'cache_entries': len(self.store) if self.store is not None else 0,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000
+        })
+        return stats
@@ -5,7 +5,9 @@
 """
 
 from ai_truth_detector import TruthDetector, TruthAnalysis
-from typing import List, Dict, Tuple
+from analysis_context import AnalysisContext, analyze_primary, scan_patterns
+from pattern_index import get_pattern_index
+from typing import List, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -145,8 +147,12 @@ class EnhancedScientificDetector:
             '1 + 1 = 1': '1 + 1 = 2',
             '1 + 1 = 0': '1 + 1 = 2'
         }
+        
+        # 패턴 인덱스 (한 번의 스캔으로 모든 패턴 확인)
+        self.scientific_lie_pattern_index = get_pattern_index(self.scientific_lie_patterns)
     
-    def analyze_with_scientific_verification(self, statement: str, context: str = None) -> Dict:
+    def analyze_with_scientific_verification(self, statement: str, context: str = None,
+                                             analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """
         강화된 과학적 검증을 포함한 분석
         1. 과학적 거짓말 패턴 감지
@@ -157,10 +163,10 @@ class EnhancedScientificDetector:
         logger.info(f"강화된 과학적 검증 분석 시작: {statement[:50]}...")
         
         # 1단계: 과학적 거짓말 패턴 감지
-        detected_scientific_lies = self._detect_scientific_lies(statement)
+        detected_scientific_lies = self._detect_scientific_lies(statement, analysis_context=analysis_context)
         
         # 2단계: 기본 진실성 분석
-        primary_result = self.primary_detector.analyze_statement(statement, context)
+        primary_result = analyze_primary(self.primary_detector, statement, context, analysis_context)
         
         # 3단계: 과학적 거짓말이면 강력한 교정 적용
         corrected_statement = statement
@@ -173,7 +179,7 @@ class EnhancedScientificDetector:
         
         # 4단계: 교정된 문장 재분석
         if scientific_correction_applied:
-            corrected_result = self.primary_detector.analyze_statement(corrected_statement, context)
+            corrected_result = analyze_primary(self.primary_detector, corrected_statement, context, analysis_context)
         else:
             corrected_result = primary_result
         
@@ -193,15 +199,13 @@ class EnhancedScientificDetector:
             'final_confidence': corrected_result.confidence
         }
     
-    def _detect_scientific_lies(self, statement: str) -> List[str]:
+    def _detect_scientific_lies(self, statement: str,
+                                analysis_context: Optional[AnalysisContext] = None) -> List[str]:
         """과학적 거짓말 패턴 감지"""
         detected_lies = []
         
-        for category, patterns in self.scientific_lie_patterns.items():
-            for pattern in patterns:
-                import re
-                if re.search(pattern, statement, re.IGNORECASE):
-                    detected_lies.append(f"과학적 거짓말 ({category}): {pattern}")
+        for entry in scan_patterns(self.scientific_lie_pattern_index, statement, analysis_context):
+            detected_lies.append(f"과학적 거짓말 ({entry.key}): {entry.pattern}")
         
         return detected_lies
     
@@ -0,0 +1,190 @@
+"""
+분석 결과 스트리밍 내보내기
+기록을 생성기로 한 건씩 직렬화해 응답으로 흘려보내는 모듈 (NDJSON, JSON, CSV, Parquet, Arrow IPC)
+중첩된 탐지기 결과는 점(.)으로 이은 열 이름으로 펼치고, 목록 값은 JSON 문자열로 저장한다.
+"""
+
+import io
+import csv
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# 펼친 열 중 앞쪽에 둘 열 (나머지는 처음 나타난 순서)
+LEADING_COLUMNS = ('id', 'type', 'timestamp', 'statement', 'context', 'request_id',
+                   'final_analysis.truth_percentage', 'final_analysis.confidence', 'final_analysis.needs_correction')
+
+EXPORT_FORMATS = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+    'arrow': 'application/vnd.apache.arrow.stream'
+}
+
+# 한 번에 직렬화해 내보내는 행 수
+ROWS_PER_CHUNK = 1000
+
+def flatten_record(record: Dict[str, Any], prefix: str = '', into: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """중첩 dict 를 '상위.하위' 열로 펼침 (목록/튜플은 JSON 문자열, 그 밖의 객체는 str)"""
+    flat = {} if into is None else into
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flatten_record(value, f"{name}.", flat)
+        elif isinstance(value, (list, tuple)):
+            flat[name] = json.dumps(value, ensure_ascii=False, default=str)
+        elif value is None or isinstance(value, (str, bool, int, float)):
+            flat[name] = value
+        else:
+            flat[name] = str(value)
+    return flat
+
+class ExportSchema:
+    """펼친 열 목록과 열별 값 형식 (내보낼 기록을 한 번 훑어서 수집)"""
+
+    def __init__(self):
+        self._types: Dict[str, set] = {}
+
+    def observe(self, flat: Dict[str, Any]):
+        for name, value in flat.items():
+            kinds = self._types.setdefault(name, set())
+            if value is not None:
+                kinds.add(type(value))
+
+    @classmethod
+    def scan(cls, records: Iterable[Dict[str, Any]]) -> 'ExportSchema':
+        schema = cls()
+        for record in records:
+            schema.observe(flatten_record(record))
+        return schema
+
+    @property
+    def columns(self) -> List[str]:
+        leading = [name for name in LEADING_COLUMNS if name in self._types]
+        return leading + [name for name in self._types if name not in LEADING_COLUMNS]
+
+    def kind(self, name: str) -> str:
+        """열 값 형식 ('bool', 'int', 'float', 'string')"""
+        kinds = self._types[name]
+        if kinds == {bool}:
+            return 'bool'
+        if kinds and kinds <= {int}:
+            return 'int'
+        if kinds and kinds <= {int, float}:
+            return 'float'
+        return 'string'
+
+    def arrow_schema(self):
+        import pyarrow as pa
+
+        types = {'bool': pa.bool_(), 'int': pa.int64(), 'float': pa.float64(), 'string': pa.string()}
+        return pa.schema([(name, types[self.kind(name)]) for name in self.columns])
+
+def _column_value(value: Any, kind: str) -> Any:
+    """열 형식에 맞춘 값 (스키마를 훑은 뒤 추가된 기록의 형식이 다르면 None)"""
+    if value is None:
+        return None
+    if kind == 'string':
+        return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+    if kind == 'bool':
+        return value if isinstance(value, bool) else None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if kind == 'float':
+        return float(value)
+    return value if isinstance(value, int) else None
+
+def iter_json(records: Iterable[Dict[str, Any]], envelope: Dict[str, Any]) -> Iterator[str]:
+    """{"success": true, ..., "data": [...], "total_records": N} 형태의 JSON 을 기록 단위로 생성"""
+    head = json.dumps(envelope, ensure_ascii=False, default=str)
+    yield head[:-1] + (', ' if envelope else '') + '"data": ['
+    total = 0
+    for record in records:
+        yield (',\n' if total else '\n') + json.dumps(record, ensure_ascii=False, default=str)
+        total += 1
+    yield f'\n], "total_records": {total}}}\n'
+
+def iter_csv(records: Iterable[Dict[str, Any]], schema: ExportSchema) -> Iterator[str]:
+    """펼친 열 CSV (헤더 포함, ROWS_PER_CHUNK 행씩 문자열로 생성)"""
+    columns = schema.columns
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    rows = 0
+    for record in records:
+        flat = flatten_record(record)
+        writer.writerow(['' if flat.get(name) is None else flat[name] for name in columns])
+        rows += 1
+        if rows % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+class _ChunkSink:
+    """pyarrow 가 쓰는 바이트를 모아 두었다가 꺼내 가는 쓰기 전용 파일 객체"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+def iter_arrow(records: Iterable[Dict[str, Any]], schema: ExportSchema, file_format: str = 'arrow') -> Iterator[bytes]:
+    """
+    Arrow IPC 스트림 또는 Parquet 파일을 ROWS_PER_CHUNK 행 단위 레코드 배치/행 그룹으로 생성
+
+    pyarrow 가 필요하다 (없으면 ImportError).
+    """
+    import pyarrow as pa
+
+    arrow_schema = schema.arrow_schema()
+    columns = schema.columns
+    kinds = [schema.kind(name) for name in columns]
+    sink = _ChunkSink()
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode='w'), arrow_schema)
+        write = writer.write_table
+        to_block: Callable = lambda arrays: pa.Table.from_arrays(arrays, schema=arrow_schema)
+    else:
+        writer = pa.ipc.new_stream(pa.PythonFile(sink, mode='w'), arrow_schema)
+        write = writer.write_batch
+        to_block = lambda arrays: pa.RecordBatch.from_arrays(arrays, schema=arrow_schema)
+
+    def flush(rows: List[Dict[str, Any]]) -> bytes:
+        arrays = [pa.array([_column_value(row.get(name), kind) for row in rows], type=field.type)
+                  for name, kind, field in zip(columns, kinds, arrow_schema)]
+        write(to_block(arrays))
+        return sink.drain()
+
+    rows: List[Dict[str, Any]] = []
+    for record in records:
+        rows.append(flatten_record(record))
+        if len(rows) == ROWS_PER_CHUNK:
+            yield flush(rows)
+            rows = []
+    if rows:
+        yield flush(rows)
+    writer.close()
+    yield sink.drain()
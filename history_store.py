@@ -0,0 +1,246 @@
+"""
+분석 히스토리 저장소
+고정 용량 링 버퍼에 분석 기록을 보관하고, 탐지기 플래그별 카운터와 합계를
+삽입/제거 시점에 갱신하여 대시보드 통계를 히스토리 크기와 무관하게 O(1)로 제공하는 모듈
+"""
+
+import uuid
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from trend_index import TrendIndex
+
+def _section_flag(section: str, key: str) -> Callable[[Dict[str, Any]], bool]:
+    return lambda record: bool((record.get(section) or {}).get(key, False))
+
+# 기록별로 세는 플래그 (통계 이름 → 기록에서 값을 꺼내는 함수)
+FLAG_COUNTERS: Dict[str, Callable[[Dict[str, Any]], bool]] = {
+    'basic_lies_detected': _section_flag('basic_analysis', 'detected_lies'),
+    'meta_lies_detected': _section_flag('meta_analysis', 'meta_lie_detected'),
+    'religious_topics': _section_flag('religious_analysis', 'religious_topic_detected'),
+    'scientific_lies': _section_flag('scientific_analysis', 'scientific_lie_detected'),
+    'intentional_lies': _section_flag('intentional_analysis', 'intentional_lie_detected'),
+    'human_behavior_lies': _section_flag('human_behavior_analysis', 'is_human_behavior_lie'),
+    'benevolent_lies': _section_flag('benevolent_analysis', 'is_benevolent_lie'),
+    'enhanced_corrections': _section_flag('correction_enhancement', 'enhanced_correction_applied'),
+    'context_corrections': _section_flag('context_analysis', 'context_correction_applied'),
+    'compound_corrections': _section_flag('compound_analysis', 'compound_correction_applied'),
+    'puns_detected': _section_flag('puns_analysis', 'is_pun_detected'),
+    'coding_issues_detected': _section_flag('coding_analysis', 'unnecessary_code_detected'),
+    'intentional_manipulation': _section_flag('coding_analysis', 'is_intentional_manipulation'),
+    'multilingual_detected': _section_flag('multilingual_analysis', 'is_multilingual'),
+    'lies_detected': _section_flag('final_analysis', 'needs_correction'),
+    'corrections_made': _section_flag('final_analysis', 'final_corrected_statement')
+}
+
+def _contributions(record: Dict[str, Any]) -> Dict[str, Any]:
+    """기록 하나가 집계에 더하는 값 (제거 시 그대로 빼기 위해 삽입 시점에 계산)"""
+    final_analysis = record.get('final_analysis')
+    flags = [name for name, extract in FLAG_COUNTERS.items() if extract(record)]
+
+    # 대시보드의 '*_analysis' 섹션별 감지 통계
+    sections = [
+        (key, bool(value.get('detected', False) or value.get('is_detected', False)))
+        for key, value in record.items()
+        if key.endswith('_analysis') and isinstance(value, dict)
+    ]
+
+    truth = final_analysis['truth_percentage'] if isinstance(final_analysis, dict) else None
+
+    # 기록 시각 (유닉스 초, 해석할 수 없으면 None)
+    seconds = None
+    if isinstance(record.get('timestamp'), str):
+        try:
+            seconds = datetime.fromisoformat(record['timestamp']).timestamp()
+        except ValueError:
+            pass
+
+    return {
+        'flags': flags,
+        'sections': sections,
+        'truth': truth,
+        'time': seconds,
+        # 트렌드 색인 점 (시각, 점수, 원래 시각 문자열)
+        'trend': (seconds, truth, record['timestamp']) if seconds is not None and truth is not None else None,
+        'languages': len((record.get('multilingual_analysis') or {}).get('detected_languages', []))
+    }
+
+class HistoryStore:
+    """고정 용량 링 버퍼 분석 히스토리 (가장 오래된 기록부터 덮어씀)"""
+
+    def __init__(self, capacity: int = 10000):
+        if capacity <= 0:
+            raise ValueError("히스토리 용량은 1 이상이어야 합니다.")
+        self.capacity = capacity
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[str, Optional[Dict[str, Any]]], None]] = []
+        # 내용이 바뀔 때마다 증가하는 버전 (epoch 는 프로세스마다 달라 재시작 후 같은 버전 번호와 구별됨)
+        self.epoch = uuid.uuid4().hex[:12]
+        self.version = 0
+        self._appended = 0      # 지금까지 추가된 기록 수 (초기화해도 유지, 기록 순번으로 사용)
+        self.clear()
+
+    def subscribe(self, listener: Callable[[str, Optional[Dict[str, Any]]], None]):
+        """기록 추가('append', 기록)/초기화('clear', None) 알림 등록 (잠금 밖에서 호출됨)"""
+        self._listeners.append(listener)
+
+    def _notify(self, event: str, record: Optional[Dict[str, Any]]):
+        for listener in self._listeners:
+            listener(event, record)
+
+    def clear(self):
+        """모든 기록과 집계 초기화"""
+        with self._lock:
+            self._buffer: List[Optional[Tuple[Dict[str, Any], Dict[str, Any]]]] = [None] * self.capacity
+            self._head = 0          # 가장 오래된 기록 위치
+            self._size = 0
+            self._evictions_since_rebuild = 0
+            self._flag_counts = {name: 0 for name in FLAG_COUNTERS}
+            self._section_counts: Dict[str, Dict[str, int]] = {}
+            self._truth_sum = 0.0
+            self._truth_count = 0
+            self._languages_used = 0
+            self._trend = TrendIndex()
+            self.version += 1
+        self._notify('clear', None)
+
+    def append(self, record: Dict[str, Any]):
+        """기록 추가 (가득 차면 가장 오래된 기록 제거)"""
+        contributions = _contributions(record)
+        with self._lock:
+            if self._size == self.capacity:
+                _, evicted = self._buffer[self._head]
+                self._apply(evicted, -1)
+                self._buffer[self._head] = (record, contributions)
+                self._head = (self._head + 1) % self.capacity
+                self._evictions_since_rebuild += 1
+            else:
+                self._buffer[(self._head + self._size) % self.capacity] = (record, contributions)
+                self._size += 1
+            self._appended += 1
+            self._apply(contributions, 1)
+
+            # 합계를 빼고 더하며 쌓이는 부동소수점 오차를 한 바퀴마다 정리 (분할 상환 O(1))
+            if self._evictions_since_rebuild >= self.capacity:
+                self._rebuild_sums()
+            self.version += 1
+        self._notify('append', record)
+
+    def _apply(self, contributions: Dict[str, Any], sign: int):
+        for name in contributions['flags']:
+            self._flag_counts[name] += sign
+        for key, detected in contributions['sections']:
+            counts = self._section_counts.setdefault(key, {'detected': 0, 'total': 0})
+            counts['total'] += sign
+            counts['detected'] += sign * detected
+            if counts['total'] == 0:
+                del self._section_counts[key]
+        if contributions['truth'] is not None:
+            self._truth_sum += sign * contributions['truth']
+            self._truth_count += sign
+        self._languages_used += sign * contributions['languages']
+        if contributions['trend'] is not None:
+            if sign > 0:
+                self._trend.add(*contributions['trend'])
+            else:
+                self._trend.remove(*contributions['trend'])
+
+    def _rebuild_sums(self):
+        self._truth_sum = 0.0
+        for _, contributions in self._entries():
+            if contributions['truth'] is not None:
+                self._truth_sum += contributions['truth']
+        self._evictions_since_rebuild = 0
+
+    def _entries(self) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        for offset in range(self._size):
+            yield self._buffer[(self._head + offset) % self.capacity]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """오래된 순서로 기록 반환 (반복 시점의 스냅샷)"""
+        with self._lock:
+            records = [record for record, _ in self._entries()]
+        return iter(records)
+
+    @property
+    def sequence(self) -> int:
+        """지금까지 추가된 기록 수 (iter_records 의 stop 으로 넘겨 여러 번 순회해도 같은 기록까지만 보도록 고정)"""
+        with self._lock:
+            return self._appended
+
+    def iter_records(self, start: Optional[float] = None, end: Optional[float] = None,
+                     limit: Optional[int] = None, chunk_size: int = 1000,
+                     stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        기록을 오래된 순서로 반환하는 생성기 (내보내기용)
+
+        호출 시점(또는 stop)까지 추가된 기록만 대상으로 하고, chunk_size 개씩만 잠금 안에서 꺼내므로
+        반복 중에도 추가가 막히지 않고 메모리 사용이 히스토리 크기와 무관하다.
+        반복 도중 링 버퍼에서 밀려난 기록은 건너뛴다.
+
+        Args:
+            start, end: 기록 시각 구간 (유닉스 초, 지정하면 시각을 해석할 수 없는 기록은 제외)
+            limit: 최근 limit 개 기록으로 제한 (구간 필터 전에 적용)
+            chunk_size: 한 번에 꺼낼 기록 수
+            stop: 이 순번(sequence) 전까지 추가된 기록만 반환 (None 이면 호출 시점까지)
+        """
+        with self._lock:
+            stop = self._appended if stop is None else min(stop, self._appended)
+            sequence = stop - self._size
+            if limit is not None:
+                sequence = max(sequence, stop - limit)
+
+        filtered = start is not None or end is not None
+        while sequence < stop:
+            with self._lock:
+                oldest = self._appended - self._size
+                sequence = max(sequence, oldest)
+                chunk_stop = min(stop, sequence + chunk_size)
+                chunk = [self._buffer[(self._head + offset - oldest) % self.capacity]
+                         for offset in range(sequence, chunk_stop)]
+            sequence = chunk_stop
+
+            for record, contributions in chunk:
+                if filtered:
+                    seconds = contributions['time']
+                    if seconds is None or (start is not None and seconds < start) or (end is not None and seconds > end):
+                        continue
+                yield record
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """최근 limit 개 기록 (오래된 순서)"""
+        with self._lock:
+            limit = max(0, min(limit, self._size))
+            start = self._head + self._size - limit
+            return [self._buffer[(start + offset) % self.capacity][0] for offset in range(limit)]
+
+    @property
+    def etag(self) -> str:
+        """현재 내용의 식별자 (HTTP ETag 값)"""
+        return f"{self.epoch}-{self.version}"
+
+    def trend(self, start: Optional[float] = None, end: Optional[float] = None, bucket_seconds: Optional[int] = None,
+              max_points: int = 1000, mode: str = 'minmax') -> Dict[str, Any]:
+        """진실성 트렌드 조회 (미리 집계된 시간 색인 사용, 인자는 TrendIndex.query 참고)"""
+        with self._lock:
+            return self._trend.query(start, end, bucket_seconds, max_points, mode)
+
+    def flag_count(self, name: str) -> int:
+        return self._flag_counts[name]
+
+    def stats(self) -> Dict[str, Any]:
+        """집계 스냅샷 (O(탐지기 수))"""
+        with self._lock:
+            return {
+                'total_analyses': self._size,
+                'scored_analyses': self._truth_count,
+                'truth_sum': self._truth_sum,
+                'average_truth': self._truth_sum / self._truth_count if self._truth_count else 0,
+                'languages_used': self._languages_used,
+                'flags': dict(self._flag_counts),
+                'sections': {key: dict(counts) for key, counts in self._section_counts.items()}
+            }
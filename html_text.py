@@ -0,0 +1,146 @@
+"""
+스트리밍 HTML 본문 텍스트 추출
+응답 본문을 조각 단위로 lxml 증분 파서에 넣으면서 script/style 하위 내용은 건너뛰고,
+필요한 만큼 텍스트가 모이거나 바이트 상한에 닿으면 더 읽지 않는 모듈 (DOM 트리를 만들지 않음)
+"""
+
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+# 보이는 텍스트가 아닌 태그 (하위 내용 전체를 건너뜀)
+SKIPPED_TAGS = frozenset({'script', 'style', 'noscript', 'template'})
+
+# 앞뒤 텍스트와 붙지 않도록 경계에 공백을 넣는 태그
+BLOCK_TAGS = frozenset({'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'figcaption',
+                        'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol',
+                        'p', 'pre', 'section', 'table', 'td', 'th', 'title', 'tr', 'ul'})
+
+DEFAULT_MAX_CHARS = 2000
+DEFAULT_MAX_BYTES = 512 * 1024
+CHUNK_SIZE = 16 * 1024
+
+_WHITESPACE = re.compile(r'\s+')
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+class _TextCollector:
+    """lxml 파서 target: 건너뛸 태그 밖의 텍스트만 모음"""
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self.parts: List[str] = []
+        self.length = 0
+        self.skip_depth = 0
+        self.done = False
+
+    def start(self, tag, attrib):
+        if tag in SKIPPED_TAGS:
+            self.skip_depth += 1
+        elif tag in BLOCK_TAGS and not self.skip_depth:
+            self.parts.append(' ')
+
+    def end(self, tag):
+        if tag in SKIPPED_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+        elif tag in BLOCK_TAGS and not self.skip_depth:
+            self.parts.append(' ')
+
+    def data(self, data):
+        if self.skip_depth or self.done:
+            return
+        self.parts.append(data)
+        self.length += len(data)
+        # 공백을 줄이면 짧아지므로 어림 길이가 넘을 때만 실제 길이 확인
+        if self.length >= self.max_chars and len(self.text()) >= self.max_chars:
+            self.done = True
+
+    def text(self) -> str:
+        return _WHITESPACE.sub(' ', ''.join(self.parts)).strip()
+
+    def close(self):
+        return None
+
+class StreamingTextExtractor:
+    """HTML 바이트 조각을 받아 보이는 텍스트를 max_chars 자까지 모으는 증분 추출기"""
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHARS, encoding: Optional[str] = None):
+        """
+        Args:
+            encoding: 본문 문자 인코딩 (없으면 첫 조각의 meta charset, 그것도 없으면 UTF-8)
+        """
+        self._collector = _TextCollector(max_chars)
+        self._encoding = encoding
+        self._parser = None
+        self.bytes_read = 0
+
+    @property
+    def done(self) -> bool:
+        return self._collector.done
+
+    def feed(self, chunk: bytes) -> bool:
+        """조각을 파서에 넣고 텍스트가 충분히 모였는지 반환"""
+        if not self._collector.done and chunk:
+            if self._parser is None:
+                encoding = self._encoding
+                if encoding is None:
+                    match = _META_CHARSET.search(chunk[:4096])
+                    encoding = match.group(1).decode('ascii') if match else 'utf-8'
+                try:
+                    self._parser = etree.HTMLParser(target=self._collector, encoding=encoding)
+                except LookupError:     # 알 수 없는 인코딩 이름
+                    self._parser = etree.HTMLParser(target=self._collector, encoding='utf-8')
+            self.bytes_read += len(chunk)
+            self._parser.feed(chunk)
+        return self._collector.done
+
+    def close(self) -> str:
+        """연속 공백을 하나로 줄인 텍스트 (최대 max_chars 자)"""
+        if self._parser is not None:
+            try:
+                self._parser.close()
+            except etree.Error:
+                pass        # 중간에 멈춘 문서
+        return self._collector.text()[:self._collector.max_chars]
+
+def _charset(content_type: Optional[str]) -> Optional[str]:
+    """Content-Type 에 명시된 charset (없으면 None, 문서의 meta 태그로 판단하도록)"""
+    for param in (content_type or '').split(';')[1:]:
+        name, _, value = param.strip().partition('=')
+        if name.lower() == 'charset' and value:
+            return value.strip('"\'')
+    return None
+
+def extract_chunks(chunks: Iterable[bytes], max_chars: int = DEFAULT_MAX_CHARS, max_bytes: int = DEFAULT_MAX_BYTES,
+                   encoding: Optional[str] = None) -> Tuple[str, bytes]:
+    """
+    바이트 조각을 차례로 읽어 (텍스트, 실제로 읽은 바이트) 반환
+
+    텍스트가 max_chars 자 모이거나 max_bytes 바이트를 읽으면 나머지 조각은 읽지 않는다.
+    """
+    extractor = StreamingTextExtractor(max_chars, encoding)
+    consumed = []
+    for chunk in chunks:
+        chunk = chunk[:max_bytes - extractor.bytes_read]
+        consumed.append(chunk)
+        if extractor.feed(chunk) or extractor.bytes_read >= max_bytes:
+            break
+    return extractor.close(), b''.join(consumed)
+
+def extract_visible_text(html: bytes, max_chars: int = DEFAULT_MAX_CHARS, max_bytes: int = DEFAULT_MAX_BYTES) -> str:
+    """이미 받은 HTML 바이트에서 보이는 텍스트 추출"""
+    chunks = (html[start:start + CHUNK_SIZE] for start in range(0, len(html), CHUNK_SIZE))
+    return extract_chunks(chunks, max_chars, max_bytes)[0]
+
+def read_visible_text(response, max_chars: int = DEFAULT_MAX_CHARS,
+                      max_bytes: int = DEFAULT_MAX_BYTES) -> Tuple[str, bytes]:
+    """
+    stream=True 로 받은 requests 응답 본문을 조각 단위로 읽으며 텍스트 추출 (텍스트, 읽은 바이트)
+
+    다 읽지 않고 멈추면 연결은 재사용하지 않고 닫는다.
+    """
+    try:
+        return extract_chunks(response.iter_content(CHUNK_SIZE), max_chars, max_bytes,
+                              _charset(response.headers.get('Content-Type')))
+    finally:
+        response.close()
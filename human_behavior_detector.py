@@ -5,7 +5,9 @@
 """
 
 from ai_truth_detector import TruthDetector, TruthAnalysis
-from typing import List, Dict, Tuple
+from analysis_context import AnalysisContext, analyze_primary, scan_patterns
+from pattern_index import get_pattern_index
+from typing import List, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -137,8 +139,12 @@ class HumanBehaviorDetector:
                 'lie': 0.06     # "사람은 감정을 느끼지 못한다" - 6% 진실
             }
         }
+        
+        # 패턴 인덱스 (한 번의 스캔으로 모든 패턴 확인)
+        self.human_behavior_lie_pattern_index = get_pattern_index(self.human_behavior_lie_patterns)
     
-    def analyze_with_human_behavior_verification(self, statement: str, context: str = None) -> Dict:
+    def analyze_with_human_behavior_verification(self, statement: str, context: str = None,
+                                                 analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """
         인간 행동 검증을 포함한 분석
         1. 인간 행동 거짓말 패턴 감지
@@ -149,10 +155,10 @@ class HumanBehaviorDetector:
         logger.info(f"인간 행동 검증 분석 시작: {statement[:50]}...")
         
         # 1단계: 인간 행동 거짓말 패턴 감지
-        detected_human_behavior_lies = self._detect_human_behavior_lies(statement)
+        detected_human_behavior_lies = self._detect_human_behavior_lies(statement, analysis_context=analysis_context)
         
         # 2단계: 기본 진실성 분석
-        primary_result = self.primary_detector.analyze_statement(statement, context)
+        primary_result = analyze_primary(self.primary_detector, statement, context, analysis_context)
         
         # 3단계: 인간 행동에 대한 명확한 진실성 점수 적용
         corrected_truth_percentage = self._apply_human_behavior_truth_score(statement, detected_human_behavior_lies)
@@ -168,7 +174,7 @@ class HumanBehaviorDetector:
         
         # 5단계: 교정된 문장 재분석
         if human_behavior_correction_applied:
-            corrected_result = self.primary_detector.analyze_statement(corrected_statement, context)
+            corrected_result = analyze_primary(self.primary_detector, corrected_statement, context, analysis_context)
         else:
             corrected_result = primary_result
         
@@ -189,15 +195,13 @@ class HumanBehaviorDetector:
             'final_confidence': corrected_result.confidence
         }
     
-    def _detect_human_behavior_lies(self, statement: str) -> List[str]:
+    def _detect_human_behavior_lies(self, statement: str,
+                                    analysis_context: Optional[AnalysisContext] = None) -> List[str]:
         """인간 행동 거짓말 패턴 감지"""
         detected_lies = []
         
-        for category, patterns in self.human_behavior_lie_patterns.items():
-            for pattern in patterns:
-                import re
-                if re.search(pattern, statement, re.IGNORECASE):
-                    detected_lies.append(f"인간 행동 거짓말 ({category}): {pattern}")
+        for entry in scan_patterns(self.human_behavior_lie_pattern_index, statement, analysis_context):
+            detected_lies.append(f"인간 행동 거짓말 ({entry.key}): {entry.pattern}")
         
         return detected_lies
     
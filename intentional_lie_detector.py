@@ -5,7 +5,9 @@
 """
 
 from ai_truth_detector import TruthDetector, TruthAnalysis
-from typing import List, Dict, Tuple
+from analysis_context import AnalysisContext, analyze_primary, scan_patterns
+from pattern_index import get_pattern_index
+from typing import List, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -86,8 +88,12 @@ class IntentionalLieDetector:
                 'philosophical_note': '절대적 진실과 상대적 진실의 경계를 탐구하고 계시는군요.'
             }
         }
+        
+        # 패턴 인덱스 (한 번의 스캔으로 모든 패턴 확인)
+        self.intentional_lie_pattern_index = get_pattern_index(self.intentional_lie_patterns)
     
-    def analyze_with_intentional_detection(self, statement: str, context: str = None) -> Dict:
+    def analyze_with_intentional_detection(self, statement: str, context: str = None,
+                                           analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """
         의도적 거짓말 탐지를 포함한 분석
         1. 의도적 거짓말 패턴 감지
@@ -98,10 +104,10 @@ class IntentionalLieDetector:
         logger.info(f"의도적 거짓말 탐지 분석 시작: {statement[:50]}...")
         
         # 1단계: 의도적 거짓말 패턴 감지
-        detected_intentional_lies = self._detect_intentional_lies(statement)
+        detected_intentional_lies = self._detect_intentional_lies(statement, analysis_context=analysis_context)
         
         # 2단계: 기본 진실성 분석
-        primary_result = self.primary_detector.analyze_statement(statement, context)
+        primary_result = analyze_primary(self.primary_detector, statement, context, analysis_context)
         
         # 3단계: 의도적 거짓말 여부 판단
         intentional_analysis = self._analyze_intentional_purpose(statement, context, detected_intentional_lies)
@@ -121,15 +127,13 @@ class IntentionalLieDetector:
             'final_confidence': primary_result.confidence
         }
     
-    def _detect_intentional_lies(self, statement: str) -> List[str]:
+    def _detect_intentional_lies(self, statement: str,
+                                 analysis_context: Optional[AnalysisContext] = None) -> List[str]:
         """의도적 거짓말 패턴 감지"""
         detected_lies = []
         
-        for category, patterns in self.intentional_lie_patterns.items():
-            for pattern in patterns:
-                import re
-                if re.search(pattern, statement, re.IGNORECASE):
-                    detected_lies.append(f"의도적 거짓말 ({category}): {pattern}")
+        for entry in scan_patterns(self.intentional_lie_pattern_index, statement, analysis_context):
+            detected_lies.append(f"의도적 거짓말 ({entry.key}): {entry.pattern}")
         
         return detected_lies
     
@@ -0,0 +1,103 @@
+"""
+공유 이벤트 루프 실행기
+요청마다 asyncio.new_event_loop() 를 만들고 닫는 대신, 전용 스레드에서 계속 도는 루프 하나에
+모든 요청 스레드의 코루틴을 제출하는 모듈
+"""
+
+import asyncio
+import logging
+import threading
+import contextvars
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Any, Awaitable, Optional
+
+logger = logging.getLogger(__name__)
+
+def _copy_outcome(task: asyncio.Task, result: Future):
+    """루프 작업의 결과/예외를 호출 스레드가 기다리는 Future 로 전달"""
+    if task.cancelled():
+        result.cancel()
+    elif task.exception() is not None:
+        result.set_exception(task.exception())
+    else:
+        result.set_result(task.result())
+
+class LoopRunner:
+    """
+    장기 실행 이벤트 루프 실행기
+
+    루프 스레드는 첫 run() 호출 때 시작된다. 코루틴은 호출한 스레드의 contextvars 를 복사한
+    컨텍스트에서 실행되므로 Flask 의 request/g 같은 컨텍스트 변수를 그대로 쓸 수 있다.
+    """
+
+    def __init__(self, name: str = 'event-loop-runner'):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """실행 중인 루프 (없으면 시작)"""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    self._start()
+        return self._loop
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+
+    def run(self, coroutine: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        코루틴을 공유 루프에서 실행하고 결과를 기다림
+
+        Args:
+            coroutine: 실행할 코루틴
+            timeout: 최대 대기 시간 (초, None 이면 무제한, 초과 시 작업을 취소하고 TimeoutError)
+
+        Returns:
+            코루틴 반환값 (코루틴의 예외는 그대로 전달)
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("이벤트 루프 스레드 안에서는 run() 으로 기다릴 수 없습니다. await 를 사용하세요.")
+
+        context = contextvars.copy_context()
+        result: Future = Future()
+        tasks = []
+
+        def schedule():
+            task = loop.create_task(coroutine, context=context)
+            task.add_done_callback(lambda done: _copy_outcome(done, result))
+            tasks.append(task)
+
+        loop.call_soon_threadsafe(schedule)
+        try:
+            return result.result(timeout)
+        except FuturesTimeoutError:
+            loop.call_soon_threadsafe(lambda: tasks and tasks[0].cancel())
+            raise
+
+    def shutdown(self):
+        """루프 정지 및 스레드 종료"""
+        with self._lock:
+            if self._loop is None:
+                return
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -6,7 +6,9 @@
 """
 
 from ai_truth_detector import TruthDetector, TruthAnalysis
-from typing import List, Dict, Tuple
+from analysis_context import AnalysisContext, analyze_primary, scan_patterns
+from pattern_index import get_pattern_index
+from typing import List, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -62,8 +64,12 @@ class MetaTruthDetector:
                 '데이터는 거짓말을 하지 않는다': '데이터도 해석에 따라 다를 수 있다'
             }
         }
+        
+        # 패턴 인덱스 (한 번의 스캔으로 모든 패턴 확인)
+        self.meta_lie_pattern_index = get_pattern_index(self.meta_lie_patterns)
     
-    def analyze_with_meta_check(self, statement: str, context: str = None) -> Dict:
+    def analyze_with_meta_check(self, statement: str, context: str = None,
+                                analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """
         메타-진실성 검사를 포함한 분석
         1. 기본 진실성 탐지기로 분석
@@ -73,17 +79,17 @@ class MetaTruthDetector:
         logger.info(f"메타-진실성 분석 시작: {statement[:50]}...")
         
         # 1단계: 기본 진실성 탐지기로 분석
-        primary_result = self.primary_detector.analyze_statement(statement, context)
+        primary_result = analyze_primary(self.primary_detector, statement, context, analysis_context)
         
         # 2단계: 메타-거짓말 패턴 검사
-        meta_lies = self._detect_meta_lies(statement)
+        meta_lies = self._detect_meta_lies(statement, analysis_context=analysis_context)
         
         # 3단계: 메타-교정 적용
         meta_corrected = self._apply_meta_correction(statement, meta_lies)
         
         # 4단계: 교정된 문장 재분석
         if meta_corrected != statement:
-            corrected_result = self.primary_detector.analyze_statement(meta_corrected, context)
+            corrected_result = analyze_primary(self.primary_detector, meta_corrected, context, analysis_context)
         else:
             corrected_result = primary_result
         
@@ -98,15 +104,13 @@ class MetaTruthDetector:
             'meta_confidence': self._calculate_meta_confidence(primary_result, meta_lies)
         }
     
-    def _detect_meta_lies(self, statement: str) -> List[str]:
+    def _detect_meta_lies(self, statement: str,
+                          analysis_context: Optional[AnalysisContext] = None) -> List[str]:
         """메타-거짓말 패턴 감지"""
         detected_lies = []
         
-        for lie_type, patterns in self.meta_lie_patterns.items():
-            for pattern in patterns:
-                import re
-                if re.search(pattern, statement, re.IGNORECASE):
-                    detected_lies.append(f"메타-거짓말 ({lie_type}): {pattern}")
+        for entry in scan_patterns(self.meta_lie_pattern_index, statement, analysis_context):
+            detected_lies.append(f"메타-거짓말 ({entry.key}): {entry.pattern}")
         
         return detected_lies
     
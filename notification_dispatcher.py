@@ -0,0 +1,163 @@
+"""
+실시간 알림 발송기
+알림을 방(room)별로 짧은 시간 동안 모아 한 번의 묶음 이벤트로 보내고, 여러 발송 스레드가 방들을 나눠 보내는 모듈
+한 방의 발송이 느리거나 실패하면 그 방만 발송 간격을 늘리고 최신 알림만 보내 (다운샘플링) 다른 방을 막지 않는다.
+"""
+
+import time
+import heapq
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 전체 브로드캐스트를 뜻하는 방 키
+BROADCAST = None
+
+class _RoomState:
+    """한 방의 대기 알림과 발송 상태"""
+    __slots__ = ('pending', 'dropped', 'scheduled', 'in_flight', 'slow')
+
+    def __init__(self):
+        self.pending: Deque[Dict[str, Any]] = deque()
+        self.dropped = 0            # 마지막 발송 이후 버린 알림 수 (묶음에 함께 알림)
+        self.scheduled = False
+        self.in_flight = False
+        self.slow = False
+
+class NotificationDispatcher:
+    """방별로 알림을 묶어 보내는 발송 스레드 풀"""
+
+    def __init__(self, emit: Callable[[str, Any, Optional[str]], None], workers: int = 2,
+                 batch_window: float = 0.05, max_pending: int = 100, slow_threshold: float = 0.5,
+                 slow_interval: float = 1.0, slow_batch: int = 10, event: str = 'notification_batch'):
+        """
+        Args:
+            emit: (이벤트, 데이터, 방) 을 받아 보내는 함수 (방이 None 이면 전체 브로드캐스트)
+            batch_window: 방마다 첫 알림 후 모으는 시간 (초)
+            max_pending: 방마다 쌓아 둘 최대 알림 수 (넘으면 오래된 것부터 버림)
+            slow_threshold: 발송 한 번이 이보다 오래 걸리거나 실패하면 그 방을 느린 방으로 표시 (초)
+            slow_interval, slow_batch: 느린 방의 발송 간격 (초)과 한 번에 보낼 최신 알림 수
+        """
+        self.emit = emit
+        self.batch_window = batch_window
+        self.max_pending = max_pending
+        self.slow_threshold = slow_threshold
+        self.slow_interval = slow_interval
+        self.slow_batch = slow_batch
+        self.event = event
+
+        self._cond = threading.Condition()
+        self._rooms: Dict[Optional[str], _RoomState] = {}
+        self._due: List[Tuple[float, int, Optional[str]]] = []     # (발송 시각, 순번, 방) 힙
+        self._sequence = 0
+        self._running = True
+        self._stats = {'submitted': 0, 'dropped': 0, 'batches': 0, 'sent': 0, 'emit_errors': 0}
+
+        self._workers = [threading.Thread(target=self._run, name=f'notification-dispatch-{i}', daemon=True)
+                         for i in range(workers)]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, notification: Dict[str, Any], room: Optional[str] = BROADCAST):
+        """알림을 방의 대기 묶음에 추가 (막히지 않음, 넘치면 오래된 알림을 버림)"""
+        with self._cond:
+            if not self._running:
+                return
+            state = self._rooms.get(room)
+            if state is None:
+                state = self._rooms[room] = _RoomState()
+            state.pending.append(notification)
+            self._stats['submitted'] += 1
+            if len(state.pending) > self.max_pending:
+                state.pending.popleft()
+                state.dropped += 1
+                self._stats['dropped'] += 1
+            if not state.scheduled and not state.in_flight:
+                self._schedule(room, state)
+
+    def _schedule(self, room: Optional[str], state: _RoomState):
+        delay = self.slow_interval if state.slow else self.batch_window
+        self._sequence += 1
+        heapq.heappush(self._due, (time.monotonic() + delay, self._sequence, room))
+        state.scheduled = True
+        self._cond.notify()
+
+    def _next_batch(self) -> Optional[Tuple[Optional[str], List[Dict[str, Any]], int]]:
+        """발송 시각이 된 방의 묶음을 꺼냄 (종료되면 None)"""
+        with self._cond:
+            while True:
+                if self._due:
+                    due, _, room = self._due[0]
+                    wait = due - time.monotonic()
+                    if wait <= 0 or not self._running:
+                        heapq.heappop(self._due)
+                        state = self._rooms[room]
+                        state.scheduled = False
+                        batch = list(state.pending)
+                        state.pending.clear()
+                        if state.slow and len(batch) > self.slow_batch:
+                            # 느린 방은 최신 알림만 보냄
+                            skipped = len(batch) - self.slow_batch
+                            batch = batch[skipped:]
+                            state.dropped += skipped
+                            self._stats['dropped'] += skipped
+                        dropped, state.dropped = state.dropped, 0
+                        state.in_flight = True
+                        return room, batch, dropped
+                elif not self._running:
+                    return None
+                else:
+                    wait = None
+                self._cond.wait(wait)
+
+    def _run(self):
+        while True:
+            item = self._next_batch()
+            if item is None:
+                return
+            room, batch, dropped = item
+            started = time.monotonic()
+            failed = False
+            try:
+                self.emit(self.event, {'notifications': batch, 'count': len(batch), 'dropped': dropped}, room)
+            except Exception as e:
+                failed = True
+                logger.warning(f"알림 묶음 발송 실패 (방 {room}): {e}")
+            elapsed = time.monotonic() - started
+
+            with self._cond:
+                state = self._rooms[room]
+                state.in_flight = False
+                state.slow = failed or elapsed > self.slow_threshold
+                if failed:
+                    self._stats['emit_errors'] += 1
+                else:
+                    self._stats['batches'] += 1
+                    self._stats['sent'] += len(batch)
+                if state.pending:
+                    self._schedule(room, state)
+                elif not state.slow:
+                    del self._rooms[room]       # 한가한 방은 상태를 남기지 않음
+
+    def stats(self) -> Dict[str, Any]:
+        """대기 알림 수, 느린 방 수, 누적 발송/버림 횟수"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update({
+                'pending': sum(len(state.pending) for state in self._rooms.values()),
+                'rooms': len(self._rooms),
+                'slow_rooms': sum(1 for state in self._rooms.values() if state.slow),
+                'workers': len(self._workers)
+            })
+            return stats
+
+    def close(self, timeout: Optional[float] = None):
+        """대기 중인 묶음을 바로 보내고 발송 스레드 종료"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join(timeout)
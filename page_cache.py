@@ -0,0 +1,389 @@
+"""
+웹 연구 페이지 디스크 캐시
+정규화한 URL 을 키로 응답 본문(HTML)과 추출한 텍스트를 따로 압축 저장하는 모듈
+본문/텍스트는 내용 해시로 저장해 같은 내용을 한 번만 보관하고, ETag/Last-Modified 로 재검증하며,
+Cache-Control/Expires 로 신선도를 정하고 용량을 넘으면 오래 쓰지 않은 항목부터 지운다.
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fresh_until REAL NOT NULL,
+    lifetime REAL NOT NULL,
+    html_hash TEXT NOT NULL,
+    text_hash TEXT,
+    extractor TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_html ON entries (html_hash);
+CREATE INDEX IF NOT EXISTS entries_text ON entries (text_hash);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+"""
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def normalize_url(url: str) -> str:
+    """캐시 키용 URL 정규화 (스킴/호스트 소문자, 기본 포트와 조각 제거, 쿼리 정렬)"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Cache-Control 헤더 → {지시어: 값}"""
+    directives = {}
+    for item in (value or '').split(','):
+        name, _, argument = item.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+def freshness_lifetime(headers: Mapping[str, str], now: float, default_ttl: float) -> Optional[float]:
+    """
+    응답을 재검증 없이 쓸 수 있는 초 (저장하면 안 되는 응답이면 None)
+
+    Cache-Control max-age, Expires, Last-Modified 휴리스틱(경과 시간의 10%) 순서로 정하고,
+    아무 헤더도 없으면 default_ttl 을 쓴다.
+    """
+    directives = parse_cache_control(headers.get('Cache-Control'))
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' in directives:
+        return 0.0
+
+    max_age = directives.get('max-age')
+    if max_age is not None and max_age.isdigit():
+        age = headers.get('Age', '0')
+        return max(0.0, float(max_age) - (float(age) if age.isdigit() else 0.0))
+
+    expires = _http_date(headers.get('Expires'))
+    if expires is not None:
+        return max(0.0, expires - (_http_date(headers.get('Date')) or now))
+
+    last_modified = _http_date(headers.get('Last-Modified'))
+    if last_modified is not None:
+        return min(max(0.0, (now - last_modified) * 0.1), default_ttl)
+    return default_ttl
+
+@dataclass
+class CacheEntry:
+    """캐시 항목 색인"""
+    url_key: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh_until: float
+    lifetime: float                     # 200 응답 헤더로 정한 신선 기간 (304 에 캐시 헤더가 없으면 재사용)
+    html_hash: str
+    text_hash: Optional[str]
+    extractor: Optional[str]
+
+class PageCache:
+    """내용 해시로 저장하는 디스크 HTTP 응답 캐시 (SQLite 색인 + 압축 파일, LRU 용량 제한)"""
+
+    def __init__(self, directory: str = 'research_cache', max_bytes: int = 256 * 1024 * 1024,
+                 default_ttl: float = 24 * 3600.0, compression_level: int = 6):
+        """
+        Args:
+            directory: 색인(index.db)과 압축 파일(objects/)을 둘 디렉터리
+            max_bytes: 압축 파일 전체 용량 상한
+            default_ttl: 캐시 관련 헤더가 없는 응답의 신선 기간 (초)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.compression_level = compression_level
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, 'index.db'), check_same_thread=False)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+            self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    # 내용 해시 파일
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, 'objects', digest[:2], digest)
+
+    def _put_blob(self, data: bytes) -> str:
+        """압축해서 저장하고 내용 해시 반환 (같은 내용이 이미 있으면 다시 쓰지 않음, 잠금 안에서 호출)"""
+        digest = hashlib.sha256(data).hexdigest()
+        if self._conn.execute('SELECT 1 FROM blobs WHERE hash = ?', (digest,)).fetchone():
+            return digest
+        compressed = zlib.compress(data, self.compression_level)
+        path = self._blob_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(temp_path, path)
+        self._conn.execute('INSERT INTO blobs (hash, size) VALUES (?, ?)', (digest, len(compressed)))
+        self._total_bytes += len(compressed)
+        return digest
+
+    def _read_blob(self, digest: Optional[str]) -> Optional[bytes]:
+        if not digest:
+            return None
+        try:
+            with open(self._blob_path(digest), 'rb') as f:
+                return zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            return None
+
+    # 색인
+
+    def _entry(self, url_key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url_key, etag, last_modified, fresh_until, lifetime, html_hash, text_hash, extractor '
+                'FROM entries WHERE url_key = ?', (url_key,)).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def _touch(self, url_key: str, fresh_until: Optional[float] = None, headers: Optional[Mapping[str, str]] = None):
+        with self._lock:
+            if fresh_until is None:
+                self._conn.execute('UPDATE entries SET accessed_at = ? WHERE url_key = ?', (time.time(), url_key))
+            else:
+                # 304 응답에 새 검증자가 있으면 교체
+                self._conn.execute(
+                    'UPDATE entries SET accessed_at = ?, fresh_until = ?, etag = COALESCE(?, etag), '
+                    'last_modified = COALESCE(?, last_modified) WHERE url_key = ?',
+                    (time.time(), fresh_until, headers.get('ETag'), headers.get('Last-Modified'), url_key))
+            self._conn.commit()
+
+    def _store(self, url_key: str, url: str, headers: Mapping[str, str], html: bytes) -> Optional[CacheEntry]:
+        now = time.time()
+        lifetime = freshness_lifetime(headers, now, self.default_ttl)
+        if lifetime is None:
+            return None
+        with self._lock:
+            previous = self._conn.execute('SELECT html_hash, text_hash FROM entries WHERE url_key = ?',
+                                          (url_key,)).fetchone() or ()
+            html_hash = self._put_blob(html)
+            self._conn.execute(
+                'INSERT OR REPLACE INTO entries (url_key, url, etag, last_modified, fresh_until, lifetime, html_hash, '
+                'text_hash, extractor, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, NULL, NULL, ?, ?)',
+                (url_key, url, headers.get('ETag'), headers.get('Last-Modified'), now + lifetime, lifetime,
+                 html_hash, now, now))
+            for digest in previous:
+                self._release_blob(digest)
+            self._evict()
+            self._conn.commit()
+        return CacheEntry(url_key, headers.get('ETag'), headers.get('Last-Modified'), now + lifetime, lifetime,
+                          html_hash, None, None)
+
+    def _store_text(self, url_key: str, text: str, extractor: str):
+        with self._lock:
+            text_hash = self._put_blob(text.encode('utf-8'))
+            updated = self._conn.execute('UPDATE entries SET text_hash = ?, extractor = ? WHERE url_key = ?',
+                                         (text_hash, extractor, url_key)).rowcount
+            if not updated:
+                # 그 사이 항목이 밀려났으면 텍스트 파일도 버림
+                self._release_blob(text_hash)
+            self._evict()
+            self._conn.commit()
+
+    def _release_blob(self, digest: Optional[str]):
+        """참조하는 항목이 없으면 파일 삭제 (잠금 안에서 호출)"""
+        if not digest or self._conn.execute(
+                'SELECT 1 FROM entries WHERE html_hash = ? OR text_hash = ? LIMIT 1', (digest, digest)).fetchone():
+            return
+        row = self._conn.execute('SELECT size FROM blobs WHERE hash = ?', (digest,)).fetchone()
+        if row is None:
+            return
+        try:
+            os.remove(self._blob_path(digest))
+        except OSError:
+            pass
+        self._conn.execute('DELETE FROM blobs WHERE hash = ?', (digest,))
+        self._total_bytes -= row[0]
+
+    def _evict(self):
+        """용량을 넘으면 가장 오래 쓰지 않은 항목부터 지우고 참조가 없어진 파일 삭제 (잠금 안에서 호출)"""
+        while self._total_bytes > self.max_bytes:
+            oldest = self._conn.execute(
+                'SELECT url_key, html_hash, text_hash FROM entries ORDER BY accessed_at LIMIT 1').fetchone()
+            if oldest is None:
+                break
+            self._conn.execute('DELETE FROM entries WHERE url_key = ?', (oldest[0],))
+            self._release_blob(oldest[1])
+            self._release_blob(oldest[2])
+
+    def _drop(self, url_key: str):
+        with self._lock:
+            previous = self._conn.execute('SELECT html_hash, text_hash FROM entries WHERE url_key = ?',
+                                          (url_key,)).fetchone() or ()
+            self._conn.execute('DELETE FROM entries WHERE url_key = ?', (url_key,))
+            for digest in previous:
+                self._release_blob(digest)
+            self._conn.commit()
+
+    # 요청
+
+    def _fetch(self, pool, url: str, deadline: Optional[float], headers: Optional[Dict[str, str]],
+               stream: bool = False) -> Tuple[str, Optional[CacheEntry], Optional[Any]]:
+        """
+        (캐시 키, 캐시 항목, 응답) 반환 - 신선한 항목이나 304 재검증이면 응답은 None
+
+        응답이 None 이 아니면 네트워크에서 새로 받은 것이고, 호출한 쪽이 본문을 읽어 _store 로 저장한다.
+        """
+        url_key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        entry = self._entry(url_key)
+        if entry is not None and time.time() < entry.fresh_until:
+            self.hits += 1
+            self._touch(url_key)
+            return url_key, entry, None
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                request_headers['If-Modified-Since'] = entry.last_modified
+
+        response = pool.get(url, deadline=deadline, headers=request_headers, stream=stream)
+        if response.status_code == 304 and entry is not None:
+            self.revalidated += 1
+            lifetime = entry.lifetime
+            if 'Cache-Control' in response.headers or 'Expires' in response.headers:
+                lifetime = freshness_lifetime(response.headers, time.time(), self.default_ttl) or 0.0
+            self._touch(url_key, time.time() + lifetime, response.headers)
+            response.close()
+            return url_key, entry, None
+
+        self.misses += 1
+        return url_key, entry, response
+
+    def fetch_text(self, pool, url: str, extract: Callable[[bytes], str], extractor: str = 'text',
+                   deadline: Optional[float] = None, headers: Optional[Dict[str, str]] = None,
+                   read: Optional[Callable[[Any], Tuple[str, bytes]]] = None) -> str:
+        """
+        페이지 텍스트 (신선한 캐시면 네트워크와 파싱 모두 생략)
+
+        추출한 텍스트는 extractor 이름과 함께 저장하므로, 추출 방식이 바뀌면 저장된 HTML 에서 다시 추출한다.
+
+        Args:
+            pool: get(url, deadline=, headers=, stream=) 를 제공하는 HTTP 풀
+            extract: HTML 바이트 → 텍스트 (저장된 HTML 에서 다시 추출할 때)
+            read: stream=True 응답 → (텍스트, 읽은 바이트), 주면 본문을 필요한 만큼만 읽고
+                  읽은 앞부분만 HTML 로 저장한다.
+        """
+        for _ in range(2):
+            url_key, entry, response = self._fetch(pool, url, deadline, headers, stream=read is not None)
+            if response is not None:
+                if read is not None:
+                    text, html = read(response)
+                else:
+                    html = response.content
+                    text = extract(html)
+                if response.status_code == 200 and self._store(url_key, url, response.headers, html):
+                    self._store_text(url_key, text, extractor)
+                return text
+
+            if entry.text_hash and entry.extractor == extractor:
+                text = self._read_blob(entry.text_hash)
+                if text is not None:
+                    return text.decode('utf-8')
+            html = self._read_blob(entry.html_hash)
+            if html is None:
+                # 파일이 지워졌으면 항목을 버리고 다시 요청
+                self._drop(url_key)
+                continue
+            text = extract(html)
+            self._store_text(url_key, text, extractor)
+            return text
+        raise OSError(f"캐시 파일을 읽을 수 없습니다: {url}")
+
+    def fetch_html(self, pool, url: str, deadline: Optional[float] = None,
+                   headers: Optional[Dict[str, str]] = None) -> bytes:
+        """
+        페이지 HTML (신선한 캐시면 네트워크 생략)
+
+        Raises:
+            requests.HTTPError: 네트워크 응답이 오류 상태
+        """
+        for _ in range(2):
+            url_key, entry, response = self._fetch(pool, url, deadline, headers)
+            if response is not None:
+                response.raise_for_status()
+                if response.status_code == 200:
+                    self._store(url_key, url, response.headers, response.content)
+                return response.content
+            html = self._read_blob(entry.html_hash)
+            if html is not None:
+                return html
+            self._drop(url_key)
+        raise OSError(f"캐시 파일을 읽을 수 없습니다: {url}")
+
+    def clear(self):
+        """모든 항목과 파일 삭제"""
+        with self._lock:
+            self._conn.execute('DELETE FROM entries')
+            for (digest,) in self._conn.execute('SELECT hash FROM blobs').fetchall():
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+            self._conn.execute('DELETE FROM blobs')
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_default_cache: Optional[PageCache] = None
+_default_cache_lock = threading.Lock()
+
+def default_page_cache() -> PageCache:
+    """연구 모듈들이 공유하는 페이지 캐시 (RESEARCH_CACHE_DIR, RESEARCH_CACHE_MAX_BYTES 환경 변수)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = PageCache(
+                directory=os.getenv('RESEARCH_CACHE_DIR', 'research_cache'),
+                max_bytes=int(os.getenv('RESEARCH_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+            )
+        return _default_cache
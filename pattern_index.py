@@ -0,0 +1,198 @@
+"""
+다중 패턴 정규식 인덱스
+탐지기들의 패턴 테이블을 하나의 교대(alternation) 정규식으로 미리 컴파일하여
+문장을 패턴 개수만큼 반복 스캔하지 않고 한 번의 스캔으로 모든 매칭 패턴을 찾는 모듈
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Match, Optional, Pattern, Sequence, Tuple, Union
+
+PatternTable = Union[Dict[str, Sequence[str]], Sequence[str]]
+
+@dataclass(frozen=True)
+class PatternEntry:
+    """인덱스에 등록된 개별 패턴"""
+    key: Optional[str]      # 패턴 범주 (딕셔너리 테이블의 키, 리스트 테이블이면 None)
+    position: int           # 범주 내 순서
+    pattern: str            # 원본 패턴 문자열
+    regex: Pattern          # 개별 컴파일된 정규식
+
+class PatternIndex:
+    """
+    패턴 테이블을 단일 정규식으로 묶은 인덱스
+
+    모든 패턴을 `(?=(?:(?P<_p0>...)|(?P<_p1>...)|...))` 형태의 전방탐색 교대식으로 묶어
+    텍스트를 한 번만 스캔한다. 같은 위치에서 시작하는 다른 패턴은 매칭이 발견된 위치에서만
+    개별 패턴으로 재확인하므로, 결과는 패턴별 `re.search` 루프와 동일하다.
+    """
+
+    def __init__(self, table: PatternTable, flags: int = re.IGNORECASE):
+        self.flags = flags
+        self.entries: List[PatternEntry] = []
+
+        items = table.items() if isinstance(table, dict) else [(None, table)]
+        for key, patterns in items:
+            for position, pattern in enumerate(patterns):
+                self.entries.append(PatternEntry(key, position, pattern, re.compile(pattern, flags)))
+
+        # 교대식에 포함할 수 없는 패턴은 개별 스캔
+        self._fallback: List[int] = []
+        self._group_entry: Dict[int, int] = {}
+        alternatives = []
+        for i, entry in enumerate(self.entries):
+            rewritten = _rewrite_groups(entry.pattern, f'_p{i}')
+            if rewritten is None:
+                self._fallback.append(i)
+                continue
+            try:
+                re.compile(f'(?=(?P<_p{i}>{rewritten}))', flags)
+            except re.error:
+                self._fallback.append(i)
+                continue
+            alternatives.append(f'(?P<_p{i}>{rewritten})')
+
+        self._combined: Optional[Pattern] = None
+        if alternatives:
+            self._combined = re.compile('(?=(?:' + '|'.join(alternatives) + '))', flags)
+            for name, number in self._combined.groupindex.items():
+                if re.fullmatch(r'_p\d+', name):
+                    self._group_entry[number] = int(name[2:])
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def scan(self, text: str) -> List[PatternEntry]:
+        """텍스트에서 매칭되는 모든 패턴 (테이블 순서)"""
+        hit = [False] * len(self.entries)
+        positions = []
+
+        if self._combined is not None:
+            for match in self._combined.finditer(text):
+                hit[self._group_entry[match.lastindex]] = True
+                positions.append(match.start())
+
+        # 같은 시작 위치에서 먼저 선택된 패턴에 가려진 패턴 재확인
+        if positions and not all(hit):
+            remaining = [i for i, found in enumerate(hit) if not found and i not in self._fallback]
+            for position in positions:
+                for i in remaining:
+                    if not hit[i] and self.entries[i].regex.match(text, position):
+                        hit[i] = True
+
+        for i in self._fallback:
+            hit[i] = self.entries[i].regex.search(text) is not None
+
+        return [entry for entry, found in zip(self.entries, hit) if found]
+
+    def matches(self, text: str) -> List[Tuple[Optional[str], str]]:
+        """매칭된 (범주, 패턴) 목록"""
+        return [(entry.key, entry.pattern) for entry in self.scan(text)]
+
+    def finditer(self, text: str) -> Iterator[Tuple[PatternEntry, Match]]:
+        """매칭된 패턴에 대해서만 개별 finditer 결과를 순서대로 반환"""
+        for entry in self.scan(text):
+            for match in entry.regex.finditer(text):
+                yield entry, match
+
+    def any(self, text: str) -> bool:
+        """하나라도 매칭되는 패턴이 있는지 여부"""
+        if self._combined is not None and self._combined.search(text):
+            return True
+        return any(self.entries[i].regex.search(text) for i in self._fallback)
+
+def _rewrite_groups(pattern: str, prefix: str) -> Optional[str]:
+    """
+    패턴의 캡처 그룹과 역참조를 교대식 안에서 충돌하지 않는 이름 그룹으로 변환
+
+    교대식에 넣으면 그룹 번호가 밀리므로 `(...)` 는 `(?P<{prefix}_gN>...)` 로,
+    `\\N` 은 `(?P={prefix}_gN)` 로 바꾼다. 이름 그룹이나 전역 인라인 플래그처럼
+    안전하게 변환할 수 없는 구문이 있으면 None 을 반환한다.
+    """
+    out = []
+    group_count = 0
+    in_class = False
+    i = 0
+    length = len(pattern)
+
+    while i < length:
+        char = pattern[i]
+
+        if char == '\\':
+            if i + 1 >= length:
+                return None
+            nxt = pattern[i + 1]
+            if not in_class and nxt in '123456789':
+                j = i + 1
+                while j < length and j - i <= 2 and pattern[j].isdigit():
+                    j += 1
+                number = int(pattern[i + 1:j])
+                if number > group_count:
+                    return None
+                out.append(f'(?P={prefix}_g{number})')
+                i = j
+                continue
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+
+        if in_class:
+            if char == ']':
+                in_class = False
+            out.append(char)
+            i += 1
+            continue
+
+        if char == '[':
+            in_class = True
+            out.append(char)
+            # 문자 클래스 맨 앞의 ']' 또는 '^]' 는 리터럴
+            if pattern.startswith('^]', i + 1):
+                out.append('^]')
+                i += 3
+                continue
+            if pattern.startswith(']', i + 1):
+                out.append(']')
+                i += 2
+                continue
+            i += 1
+            continue
+
+        if char == '(':
+            if pattern.startswith('(?', i):
+                # 비캡처/전후방탐색/조건부는 그대로, 이름 그룹과 인라인 플래그는 변환 불가
+                if pattern.startswith('(?P', i) or re.match(r'\(\?[aiLmsux]+\)', pattern[i:]):
+                    return None
+                out.append(char)
+                i += 1
+                continue
+            group_count += 1
+            out.append(f'(?P<{prefix}_g{group_count}>')
+            i += 1
+            continue
+
+        out.append(char)
+        i += 1
+
+    return ''.join(out)
+
+# 패턴 테이블 내용 기반 캐시 (같은 테이블은 프로세스 내에서 한 번만 컴파일)
+_index_cache: Dict[Tuple, PatternIndex] = {}
+_index_cache_lock = threading.Lock()
+
+def get_pattern_index(table: PatternTable, flags: int = re.IGNORECASE) -> PatternIndex:
+    """패턴 테이블에 대한 공유 PatternIndex 반환"""
+    if isinstance(table, dict):
+        cache_key = (tuple((key, tuple(patterns)) for key, patterns in table.items()), flags)
+    else:
+        cache_key = ((None, tuple(table)), flags)
+
+    index = _index_cache.get(cache_key)
+    if index is None:
+        with _index_cache_lock:
+            index = _index_cache.get(cache_key)
+            if index is None:
+                index = PatternIndex(table, flags)
+                _index_cache[cache_key] = index
+    return index
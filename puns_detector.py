@@ -7,6 +7,7 @@ AI가 말장난을 이해하고 적절히 응답할 수 있도록 하는 시스
 import re
 from typing import Dict, List, Tuple, Optional
 import logging
+from pattern_index import get_pattern_index
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +69,26 @@ class PunsDetector:
             ]
         }
         
+        # 한글-영어 혼합 말장난 패턴
+        self.multilingual_pun_patterns = {
+            '동어반복_다국어': [
+                r'(\w+)는\s+(\w+)(?:이다|다|야|이야)',
+                r'(\w+)은\s+(\w+)(?:이다|다|야|이야)',
+                r'(\w+)가\s+(\w+)(?:이다|다|야|이야)',
+                r'(\w+)이\s+(\w+)(?:이다|다|야|이야)'
+            ],
+            '모순적_표현_다국어': [
+                r'(\w+)는\s+(\w+)가\s+아니다',
+                r'(\w+)은\s+(\w+)이\s+아니다',
+                r'(\w+)가\s+(\w+)는\s+아니다',
+                r'(\w+)이\s+(\w+)은\s+아니다'
+            ]
+        }
+        
+        # 패턴 인덱스 (한 번의 스캔으로 매칭 후보 패턴 선별)
+        self.pun_pattern_index = get_pattern_index(self.pun_patterns)
+        self.multilingual_pun_pattern_index = get_pattern_index(self.multilingual_pun_patterns)
+        
         # 말장난 유형별 해석
         self.pun_interpretations = {
             '동어반복': {
@@ -159,20 +180,17 @@ class PunsDetector:
         detected_puns = []
         
         # 기본 패턴 탐지
-        for pun_type, patterns in self.pun_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, statement, re.IGNORECASE)
-                for match in matches:
-                    # 말장난 패턴인지 더 정확히 확인
-                    if self._is_valid_pun_pattern(match, pun_type):
-                        detected_puns.append({
-                            'type': pun_type,
-                            'pattern': pattern,
-                            'match': match.group(),
-                            'groups': match.groups(),
-                            'start': match.start(),
-                            'end': match.end()
-                        })
+        for entry, match in self.pun_pattern_index.finditer(statement):
+            # 말장난 패턴인지 더 정확히 확인
+            if self._is_valid_pun_pattern(match, entry.key):
+                detected_puns.append({
+                    'type': entry.key,
+                    'pattern': entry.pattern,
+                    'match': match.group(),
+                    'groups': match.groups(),
+                    'start': match.start(),
+                    'end': match.end()
+                })
         
         # 다국어 말장난 특별 탐지
         multilingual_puns = self._detect_multilingual_puns(statement)
@@ -184,48 +202,29 @@ class PunsDetector:
         """다국어 말장난 탐지"""
         detected_puns = []
         
-        # 한글-영어 혼합 말장난 패턴
-        multilingual_patterns = {
-            '동어반복_다국어': [
-                r'(\w+)는\s+(\w+)(?:이다|다|야|이야)',
-                r'(\w+)은\s+(\w+)(?:이다|다|야|이야)',
-                r'(\w+)가\s+(\w+)(?:이다|다|야|이야)',
-                r'(\w+)이\s+(\w+)(?:이다|다|야|이야)'
-            ],
-            '모순적_표현_다국어': [
-                r'(\w+)는\s+(\w+)가\s+아니다',
-                r'(\w+)은\s+(\w+)이\s+아니다',
-                r'(\w+)가\s+(\w+)는\s+아니다',
-                r'(\w+)이\s+(\w+)은\s+아니다'
-            ]
-        }
-        
-        for pun_type, patterns in multilingual_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, statement, re.IGNORECASE)
-                for match in matches:
-                    groups = match.groups()
-                    if len(groups) >= 2:
-                        # 한글과 영어가 섞여있는지 확인
-                        korean_chars = re.search(r'[가-힣]', groups[0])
-                        english_chars = re.search(r'[a-zA-Z]', groups[1])
-                        
-                        # 반대 방향도 확인 (영어-한글)
-                        english_chars_first = re.search(r'[a-zA-Z]', groups[0])
-                        korean_chars_second = re.search(r'[가-힣]', groups[1])
-                        
-                        if (korean_chars and english_chars) or (english_chars_first and korean_chars_second):
-                            detected_puns.append({
-                                'type': pun_type,
-                                'pattern': pattern,
-                                'match': match.group(),
-                                'groups': groups,
-                                'start': match.start(),
-                                'end': match.end(),
-                                'multilingual': True,
-                                'korean_word': groups[0] if korean_chars else groups[1],
-                                'english_word': groups[1] if korean_chars else groups[0]
-                            })
+        for entry, match in self.multilingual_pun_pattern_index.finditer(statement):
+            groups = match.groups()
+            if len(groups) >= 2:
+                # 한글과 영어가 섞여있는지 확인
+                korean_chars = re.search(r'[가-힣]', groups[0])
+                english_chars = re.search(r'[a-zA-Z]', groups[1])
+                
+                # 반대 방향도 확인 (영어-한글)
+                english_chars_first = re.search(r'[a-zA-Z]', groups[0])
+                korean_chars_second = re.search(r'[가-힣]', groups[1])
+                
+                if (korean_chars and english_chars) or (english_chars_first and korean_chars_second):
+                    detected_puns.append({
+                        'type': entry.key,
+                        'pattern': entry.pattern,
+                        'match': match.group(),
+                        'groups': groups,
+                        'start': match.start(),
+                        'end': match.end(),
+                        'multilingual': True,
+                        'korean_word': groups[0] if korean_chars else groups[1],
+                        'english_word': groups[1] if korean_chars else groups[0]
+                    })
         
         return detected_puns
     
@@ -255,11 +254,9 @@ class PunsDetector:
         """말장난 유형 분석"""
         pun_types = []
         
-        for pun_type, patterns in self.pun_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, statement, re.IGNORECASE):
-                    if pun_type not in pun_types:
-                        pun_types.append(pun_type)
+        for entry in self.pun_pattern_index.scan(statement):
+            if entry.key not in pun_types:
+                pun_types.append(entry.key)
         
         return pun_types
     
@@ -0,0 +1,160 @@
+"""
+GCRA 요청 제한
+키마다 '다음 요청이 허용되는 이론상 도착 시각(TAT)' 하나만 저장해 요청당 O(1) 시간/메모리로
+'window 초 동안 limit 회 (버스트 limit 회)' 를 지키는 모듈
+Redis 가 있으면 원자적 Lua 스크립트로 gunicorn 작업자와 여러 노드가 같은 제한을 공유한다.
+"""
+
+import math
+import time
+import heapq
+import logging
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 부동소수점 오차로 경계의 요청이 거부되지 않도록 두는 여유 (초)
+_EPSILON = 1e-9
+
+@dataclass
+class RateLimitResult:
+    """요청 한 번의 제한 판정"""
+    allowed: bool
+    limit: int
+    remaining: int          # 지금 바로 더 보낼 수 있는 요청 수
+    reset_after: float      # 제한이 완전히 회복될 때까지 남은 초
+    retry_after: float      # 거부된 경우 다시 보낼 수 있을 때까지 남은 초 (허용이면 0)
+
+    def headers(self) -> Dict[str, str]:
+        """X-RateLimit-* 응답 헤더 (거부된 경우 Retry-After 포함)"""
+        headers = {
+            'X-RateLimit-Limit': str(self.limit),
+            'X-RateLimit-Remaining': str(self.remaining),
+            'X-RateLimit-Reset': str(math.ceil(self.reset_after))
+        }
+        if not self.allowed:
+            headers['Retry-After'] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+def _result(allowed: bool, limit: int, window: float, reset_after: float, retry_after: float) -> RateLimitResult:
+    interval = window / limit
+    remaining = int((window - reset_after) / interval + _EPSILON) if allowed else 0
+    return RateLimitResult(allowed, limit, max(0, min(limit, remaining)), max(0.0, reset_after), max(0.0, retry_after))
+
+class GCRARateLimiter:
+    """프로세스 내 GCRA 요청 제한 (스레드 안전, 다 회복된 키는 자동으로 지움)"""
+
+    def __init__(self, max_keys: int = 100000, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_keys: 동시에 기억할 최대 키 수 (넘으면 가장 먼저 회복될 키부터 잊음 → 그 키는 제한이 초기화됨)
+        """
+        self.max_keys = max_keys
+        self._clock = clock
+        self._tats: Dict[Hashable, float] = {}
+        # (TAT, 순번, 키) 최소 힙 - 키의 TAT 가 바뀌면 새 항목을 넣고 예전 항목은 꺼낼 때 건너뜀
+        self._expiry: List[Tuple[float, int, Hashable]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def hit(self, key: Hashable, limit: int, window: float) -> RateLimitResult:
+        """요청 한 번을 판정하고, 허용이면 기록"""
+        interval = window / limit
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            tat = max(self._tats.get(key, now), now)
+            new_tat = tat + interval
+            allow_at = new_tat - window
+            if allow_at - now > _EPSILON:
+                return _result(False, limit, window, tat - now, allow_at - now)
+
+            self._tats[key] = new_tat
+            heapq.heappush(self._expiry, (new_tat, next(self._sequence), key))
+            if len(self._tats) > self.max_keys:
+                self._pop_earliest()
+            elif len(self._expiry) > 2 * len(self._tats) + 64:
+                self._compact()
+            return _result(True, limit, window, new_tat - now, 0.0)
+
+    def _pop_earliest(self) -> Optional[Tuple[float, Hashable]]:
+        """TAT 가 가장 이른 키를 꺼내 삭제 (예전 TAT 항목은 건너뜀)"""
+        while self._expiry:
+            tat, _, key = heapq.heappop(self._expiry)
+            if self._tats.get(key) == tat:
+                del self._tats[key]
+                return tat, key
+        return None
+
+    def _expire(self, now: float):
+        """다 회복된 (TAT 가 지난) 키 삭제 - 접근 순서와 관계없이 TAT 순으로 (요청마다 분할 상환 O(log n))"""
+        while self._expiry and self._expiry[0][0] <= now:
+            tat, _, key = heapq.heappop(self._expiry)
+            if self._tats.get(key) == tat:
+                del self._tats[key]
+
+    def _compact(self):
+        """예전 TAT 항목이 쌓인 힙을 살아 있는 키로 다시 구성"""
+        self._expiry = [(tat, next(self._sequence), key) for key, tat in self._tats.items()]
+        heapq.heapify(self._expiry)
+
+    def reset(self, key: Hashable):
+        with self._lock:
+            self._tats.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+# KEYS[1]: 키, ARGV[1]: 요청 간격 (ms), ARGV[2]: 윈도 (ms)
+# 반환: {허용 여부, 회복까지 남은 ms, 다시 보낼 수 있을 때까지 남은 ms}
+# TAT 는 Redis 서버 시각 기준이라 작업자/노드 시계가 달라도 같은 값을 보며, 다 회복되면 키가 만료된다.
+GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - window
+if allow_at - now > 0.001 then
+    return {0, tostring(tat - now), tostring(allow_at - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {1, tostring(new_tat - now), '0'}
+"""
+
+class RedisGCRARateLimiter:
+    """Redis 공유 GCRA 요청 제한 (Redis 오류 시 프로세스 내 제한으로 대신함)"""
+
+    def __init__(self, redis_client, namespace: str = 'ai_truth:ratelimit',
+                 fallback: Optional[GCRARateLimiter] = None):
+        self.redis = redis_client
+        self.namespace = namespace
+        self.fallback = fallback or GCRARateLimiter()
+        self._script = redis_client.register_script(GCRA_SCRIPT)
+
+    def hit(self, key: Hashable, limit: int, window: float) -> RateLimitResult:
+        try:
+            allowed, reset_after, retry_after = self._script(keys=[f"{self.namespace}:{key}"],
+                                                             args=[window * 1000 / limit, window * 1000])
+        except Exception as e:
+            logger.error(f"Redis 요청 제한 확인 실패 - 프로세스 내 제한을 사용합니다: {e}")
+            return self.fallback.hit(key, limit, window)
+        return _result(bool(int(allowed)), limit, window, float(reset_after) / 1000, float(retry_after) / 1000)
+
+    def reset(self, key: Hashable):
+        self.fallback.reset(key)
+        try:
+            self.redis.delete(f"{self.namespace}:{key}")
+        except Exception as e:
+            logger.error(f"Redis 요청 제한 초기화 실패: {e}")
+
+def rate_limit_key(identifier: str, limit: int, window: float) -> str:
+    """같은 식별자라도 제한 설정이 다르면 따로 세도록 설정을 포함한 키"""
+    return f"{limit}/{window:g}:{identifier}"
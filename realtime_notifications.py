@@ -12,10 +12,12 @@ from flask import Flask, request, jsonify
 from flask_socketio import SocketIO, emit, join_room, leave_room, disconnect
 from datetime import datetime
 import json
+import queue
 import logging
 import threading
 import time
 from collections import defaultdict, deque
+from notification_dispatcher import NotificationDispatcher
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -24,13 +26,18 @@ logger = logging.getLogger(__name__)
 class NotificationManager:
     """실시간 알림 관리자"""
     
-    def __init__(self, socketio):
+    def __init__(self, socketio, analysis_workers=2, max_queue=1000, batch_window=0.05):
         self.socketio = socketio
         self.connected_users = {}  # 연결된 사용자 관리
         self.user_rooms = defaultdict(set)  # 사용자별 방 관리
         self.notification_history = deque(maxlen=1000)  # 알림 히스토리
-        self.analysis_queue = deque()  # 분석 대기열
-        self.is_processing = False
+        self.analysis_queue = queue.Queue(maxsize=max_queue)  # 분석 대기열 (가득 차면 새 분석 알림을 버림)
+        self.analysis_workers = analysis_workers
+        self.dropped_analyses = 0
+        self._drop_lock = threading.Lock()
+        
+        # 방별로 batch_window 초 동안 모은 알림을 'notification_batch' 이벤트 한 번으로 발송
+        self.dispatcher = NotificationDispatcher(self._emit, batch_window=batch_window)
         
         # 알림 타입 정의
         self.notification_types = {
@@ -49,24 +56,34 @@ class NotificationManager:
         logger.info("실시간 알림 시스템이 초기화되었습니다.")
     
     def start_analysis_processor(self):
-        """분석 처리 스레드 시작"""
+        """분석 처리 스레드 시작 (대기열이 빌 때는 막혀서 기다림)"""
         def process_analysis():
             while True:
-                if self.analysis_queue and not self.is_processing:
-                    self.is_processing = True
-                    analysis_data = self.analysis_queue.popleft()
+                analysis_data = self.analysis_queue.get()
+                try:
                     self.process_analysis_data(analysis_data)
-                    self.is_processing = False
-                time.sleep(0.1)  # 100ms 간격으로 체크
+                finally:
+                    self.analysis_queue.task_done()
         
-        thread = threading.Thread(target=process_analysis, daemon=True)
-        thread.start()
+        for i in range(self.analysis_workers):
+            thread = threading.Thread(target=process_analysis, name=f'analysis-notifier-{i}', daemon=True)
+            thread.start()
     
     def add_analysis_to_queue(self, analysis_data):
-        """분석 데이터를 대기열에 추가"""
-        self.analysis_queue.append(analysis_data)
+        """분석 데이터를 대기열에 추가 (가득 차 있으면 요청 스레드를 막지 않고 버림)"""
+        try:
+            self.analysis_queue.put_nowait(analysis_data)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped_analyses += 1
+            logger.warning(f"알림 대기열이 가득 차 분석 알림을 버립니다 (누적 {self.dropped_analyses}개)")
+            return
         logger.info(f"분석 데이터가 대기열에 추가되었습니다: {analysis_data.get('statement', 'Unknown')[:50]}...")
     
+    def _emit(self, event, data, room=None):
+        """SocketIO 발송 (room 이 없으면 전체 브로드캐스트)"""
+        self.socketio.emit(event, data, namespace='/', to=room)
+    
     def process_analysis_data(self, analysis_data):
         """분석 데이터 처리 및 알림 발송"""
         try:
@@ -139,11 +156,11 @@ class NotificationManager:
         self.notification_history.append(notification)
         
         # 모든 연결된 사용자에게 브로드캐스트
-        self.socketio.emit('notification', notification, namespace='/')
+        self.dispatcher.submit(notification)
         
         # 특정 방에만 발송 (예: 관리자 방)
         if notification_type in ['system_alert', 'error']:
-            self.socketio.emit('notification', notification, room='admin', namespace='/')
+            self.dispatcher.submit(notification, room='admin')
         
         logger.info(f"알림 발송: {notification_type} - {data.get('message', 'No message')}")
     
@@ -159,12 +176,22 @@ class NotificationManager:
         
         # 사용자가 연결되어 있으면 발송
         if username in self.connected_users:
-            self.socketio.emit('notification', notification, room=username, namespace='/')
+            self.dispatcher.submit(notification, room=username)
             logger.info(f"사용자 {username}에게 알림 발송: {notification_type}")
     
     def get_notification_history(self, limit=50):
         """알림 히스토리 조회"""
         return list(self.notification_history)[-limit:]
+    
+    def get_stats(self):
+        """분석 대기열 깊이와 알림 발송 통계 (묶음 수, 버린 알림 수, 느린 방 수)"""
+        stats = self.dispatcher.stats()
+        stats.update({
+            'analysis_queue_size': self.analysis_queue.qsize(),
+            'analysis_queue_capacity': self.analysis_queue.maxsize,
+            'dropped_analyses': self.dropped_analyses
+        })
+        return stats
 
 # 전역 알림 관리자 인스턴스
 notification_manager = None
@@ -194,6 +221,15 @@ def create_realtime_routes(app, socketio):
                 'error': f'알림 히스토리 조회 중 오류가 발생했습니다: {str(e)}'
             }), 500
     
+    @app.route('/api/notifications/stats', methods=['GET'])
+    def get_notification_stats():
+        """알림 대기열/발송 통계 조회"""
+        return jsonify({
+            'success': True,
+            'stats': notification_manager.get_stats(),
+            'timestamp': datetime.now().isoformat()
+        })
+    
     @app.route('/api/notifications/send', methods=['POST'])
     def send_custom_notification():
         """사용자 정의 알림 발송"""
@@ -328,8 +364,7 @@ def create_socketio_handlers(socketio):
         status = {
             'connected_users': len(notification_manager.connected_users),
             'notification_history_count': len(notification_manager.notification_history),
-            'analysis_queue_size': len(notification_manager.analysis_queue),
-            'is_processing': notification_manager.is_processing,
+            'notifications': notification_manager.get_stats(),
             'timestamp': datetime.now().isoformat()
         }
         
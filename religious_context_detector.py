@@ -5,7 +5,9 @@
 """
 
 from ai_truth_detector import TruthDetector, TruthAnalysis
-from typing import List, Dict, Tuple
+from analysis_context import AnalysisContext, analyze_primary, scan_patterns
+from pattern_index import get_pattern_index
+from typing import List, Dict, Tuple, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -58,8 +60,12 @@ class ReligiousContextDetector:
             'buddhism': 0.3,     # 불교 주제는 신뢰도 30%로 제한
             'general_religious': 0.2  # 일반 종교 주제는 신뢰도 20%로 제한
         }
+        
+        # 패턴 인덱스 (한 번의 스캔으로 모든 패턴 확인)
+        self.religious_pattern_index = get_pattern_index(self.religious_patterns)
     
-    def analyze_with_religious_context(self, statement: str, context: str = None) -> Dict:
+    def analyze_with_religious_context(self, statement: str, context: str = None,
+                                       analysis_context: Optional[AnalysisContext] = None) -> Dict:
         """
         종교적 맥락을 고려한 분석
         1. 종교적 주제 감지
@@ -70,10 +76,10 @@ class ReligiousContextDetector:
         logger.info(f"종교적 맥락 분석 시작: {statement[:50]}...")
         
         # 1단계: 종교적 주제 감지
-        detected_religions = self._detect_religious_context(statement)
+        detected_religions = self._detect_religious_context(statement, analysis_context=analysis_context)
         
         # 2단계: 기본 진실성 분석
-        primary_result = self.primary_detector.analyze_statement(statement, context)
+        primary_result = analyze_primary(self.primary_detector, statement, context, analysis_context)
         
         # 3단계: 종교적 맥락에 따른 신뢰도 조정
         adjusted_confidence = self._adjust_confidence_for_religion(
@@ -94,16 +100,14 @@ class ReligiousContextDetector:
             'final_confidence': adjusted_confidence
         }
     
-    def _detect_religious_context(self, statement: str) -> List[str]:
+    def _detect_religious_context(self, statement: str,
+                                  analysis_context: Optional[AnalysisContext] = None) -> List[str]:
         """종교적 맥락 감지"""
         detected_religions = []
         
-        for religion, patterns in self.religious_patterns.items():
-            for pattern in patterns:
-                import re
-                if re.search(pattern, statement, re.IGNORECASE):
-                    if religion not in detected_religions:
-                        detected_religions.append(religion)
+        for entry in scan_patterns(self.religious_pattern_index, statement, analysis_context):
+            if entry.key not in detected_religions:
+                detected_religions.append(entry.key)
         
         return detected_religions
     
@@ -0,0 +1,66 @@
+"""
+웹 연구원 공통 기능
+AIWebResearcher / AIEnhancedResearcher / AIAdvancedResearcher 가 함께 쓰는
+검색 백엔드 설정, 백엔드 결과 → 연구원 검색 결과 변환, 페이지 본문 텍스트 추출
+"""
+
+import time
+import dataclasses
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from html_text import extract_visible_text, read_visible_text
+from search_index import SearchBackend, configured_backends, offline_mode
+
+PAGE_TEXT_CHARS = 2000
+
+class ResearcherBase:
+    """웹 연구원 공통 기반 (search_result_type 에 연구원의 검색 결과 dataclass 를 지정)"""
+
+    search_result_type: Any = None
+
+    def _init_search_backends(self, search_backends: Optional[Dict[str, SearchBackend]] = None,
+                              offline: Optional[bool] = None):
+        # 검색 백엔드 (없으면 RESEARCH_LOCAL_INDEX 의 로컬 색인), 오프라인이면 외부 검색 엔진은 쓰지 않음
+        self.search_backends = configured_backends() if search_backends is None else search_backends
+        self.offline = offline_mode() if offline is None else offline
+
+    def _calculate_credibility(self, domain: str) -> float:
+        """도메인 신뢰도 (기본값: 결과 평가 단계에서 계산)"""
+        return 0.0
+
+    def _search_backend(self, backend: SearchBackend, query: str, max_results: int,
+                        deadline: Optional[float] = None) -> List[Any]:
+        """검색 백엔드 검색 (색인에 저장된 본문을 쓰므로 페이지를 가져오지 않음)"""
+        start_time = time.time()
+        hits = backend.search(query, max_results)
+        processing_time = time.time() - start_time
+        names = {field.name for field in dataclasses.fields(self.search_result_type)}
+        results = []
+        for i, hit in enumerate(hits):
+            values = {
+                'title': hit.title,
+                'url': hit.url,
+                'content': hit.content or hit.snippet,
+                'snippet': hit.snippet,
+                'domain': hit.domain,
+                'source': hit.domain,
+                'credibility_score': self._calculate_credibility(hit.domain),
+                'relevance_score': 0.9 - (i * 0.1),
+                'fact_check_score': 0.0,
+                'search_engine': backend.name,
+                'search_keyword': query,
+                'processing_time': processing_time,
+                'timestamp': datetime.now(),
+            }
+            # 결과 형식마다 필드가 다르므로 해당 dataclass 에 있는 필드만 채움
+            results.append(self.search_result_type(**{name: value for name, value in values.items() if name in names}))
+        return results
+
+    def _extract_text(self, html: bytes) -> str:
+        """저장된 HTML 에서 본문 텍스트 추출 (처음 2000자만 사용)"""
+        return extract_visible_text(html, max_chars=PAGE_TEXT_CHARS)
+
+    def _read_text(self, response) -> Tuple[str, bytes]:
+        """응답 본문을 조각 단위로 읽으며 텍스트 2000자가 모이면 (또는 바이트 상한에서) 그만 읽음"""
+        return read_visible_text(response, max_chars=PAGE_TEXT_CHARS)
@@ -0,0 +1,175 @@
+"""
+웹 연구용 HTTP 연결 풀
+검색 엔진 × 키워드 검색과 페이지 가져오기를 동시에 실행하기 위한 모듈
+하나의 keep-alive 세션을 공유하고, 호스트별 동시 요청 수, 도메인별 요청 속도와 전체 마감 시각을 지킨다.
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from domain_throttle import DomainThrottle, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+class DeadlineExceeded(TimeoutError):
+    """전체 마감 시각이 지나 요청을 보내지 않음"""
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """마감 시각(time.monotonic 기준)까지 남은 초 (마감이 없으면 None)"""
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+def fan_out(calls: Iterable[Tuple[Hashable, Callable[[], Any]]], deadline: Optional[float] = None,
+            max_workers: int = 8) -> Iterator[Tuple[Hashable, Any, Optional[BaseException]]]:
+    """
+    여러 호출을 동시에 실행하고 끝난 순서대로 (키, 결과, 예외) 반환
+
+    마감 시각까지 끝나지 않은 호출은 기다리지 않는다 (아직 시작하지 않은 호출은 취소,
+    실행 중인 호출은 백그라운드에서 마저 끝나고 결과는 버림).
+    """
+    calls = list(calls)
+    if not calls:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(calls)), thread_name_prefix='research-fanout')
+    futures: Dict[Future, Hashable] = {executor.submit(func): key for key, func in calls}
+    pending = set(futures)
+    try:
+        while pending:
+            timeout = remaining_time(deadline)
+            if timeout is not None and timeout <= 0:
+                break
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                yield futures[future], (None if error else future.result()), error
+        if pending:
+            logger.warning(f"연구 마감 시각 초과: {len(pending)}개 작업 결과를 기다리지 않습니다.")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+# 같은 도메인 요청을 미뤄야 하는 응답 상태 코드
+BACKOFF_STATUS = (429, 500, 502, 503, 504)
+
+class HTTPPool:
+    """keep-alive 연결을 공유하는 HTTP 요청 풀 (호스트별 동시 요청 수, 도메인별 속도 제한)"""
+
+    def __init__(self, max_workers: int = 16, max_per_host: int = 4, timeout: float = 10.0,
+                 headers: Optional[Dict[str, str]] = None, throttle: Optional[DomainThrottle] = None,
+                 max_retries: int = 1):
+        """
+        Args:
+            throttle: 도메인별 토큰 버킷 (없으면 DomainThrottle 기본 설정)
+            max_retries: 429/5xx 응답 후 백오프가 끝나면 다시 보낼 횟수 (마감 시각 안에서만)
+        """
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.throttle = throttle or DomainThrottle()
+        self.max_retries = max_retries
+
+        # 호스트마다 최대 max_per_host 개 연결을 유지 (urllib3 풀 크기를 넘는 요청은 새 연결을 만들지 않고 대기)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_per_host, pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='research-http')
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return slot
+
+    def get(self, url: str, deadline: Optional[float] = None, timeout: Optional[float] = None,
+            **kwargs) -> requests.Response:
+        """
+        GET 요청 (도메인 차례와 같은 호스트 동시 요청 빈자리를 기다린 뒤 전송)
+
+        429/5xx 응답이면 Retry-After 만큼 그 도메인 요청을 미루고, 마감 시각 안이면 다시 보낸다.
+        다시 보내지 못한 429/5xx 응답은 그대로 반환한다.
+
+        Raises:
+            DeadlineExceeded: 마감 시각까지 요청을 시작하지 못함
+        """
+        host = (urlparse(url).hostname or '').lower()
+        for attempt in range(self.max_retries + 1):
+            if not self.throttle.acquire(host, deadline):
+                raise DeadlineExceeded(f"요청 마감 시각 초과 (도메인 속도 제한): {url}")
+            response = self._send(url, host, deadline, timeout, **kwargs)
+            if response.status_code not in BACKOFF_STATUS:
+                self.throttle.record_success(host)
+                return response
+
+            delay = self.throttle.backoff(host, parse_retry_after(response.headers.get('Retry-After')))
+            remaining = remaining_time(deadline)
+            if attempt == self.max_retries or (remaining is not None and remaining <= delay):
+                return response
+            logger.info(f"{host} 응답 {response.status_code}, {delay:.1f}초 후 다시 요청: {url}")
+            response.close()
+        return response
+
+    def _send(self, url: str, host: str, deadline: Optional[float], timeout: Optional[float],
+              **kwargs) -> requests.Response:
+        timeout = self.timeout if timeout is None else timeout
+        remaining = remaining_time(deadline)
+        slot = self._slot(host)
+        if not slot.acquire(timeout=None if remaining is None else max(remaining, 0)):
+            raise DeadlineExceeded(f"요청 마감 시각 초과: {url}")
+        try:
+            remaining = remaining_time(deadline)
+            if remaining is not None:
+                if remaining <= 0:
+                    raise DeadlineExceeded(f"요청 마감 시각 초과: {url}")
+                timeout = min(timeout, remaining)
+            return self.session.get(url, timeout=timeout, **kwargs)
+        finally:
+            slot.release()
+
+    def fetch_all(self, urls: Iterable[str], fetch: Callable[[str], Any],
+                  deadline: Optional[float] = None) -> Iterator[Tuple[str, Any, Optional[BaseException]]]:
+        """
+        URL 마다 fetch(url) 를 풀에서 동시에 실행하고 끝난 순서대로 (URL, 결과, 예외) 반환
+
+        fetch 는 이 풀의 get 으로 요청하는 함수 (같은 URL 은 한 번만 실행).
+        """
+        futures = {self._executor.submit(fetch, url): url for url in dict.fromkeys(urls)}
+        pending = set(futures)
+        while pending:
+            timeout = remaining_time(deadline)
+            if timeout is not None and timeout <= 0:
+                break
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                yield futures[future], (None if error else future.result()), error
+        for future in pending:
+            future.cancel()
+            yield futures[future], None, DeadlineExceeded(f"요청 마감 시각 초과: {futures[future]}")
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+_default_pool: Optional[HTTPPool] = None
+_default_pool_lock = threading.Lock()
+
+def default_pool() -> HTTPPool:
+    """연구 모듈들이 공유하는 HTTP 풀 (처음 호출할 때 생성)"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = HTTPPool()
+        return _default_pool
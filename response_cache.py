@@ -0,0 +1,145 @@
+"""
+응답 캐시
+바이트 크기 상한과 TTL을 가진 스레드 안전 LRU 캐시.
+키를 여러 샤드로 나누어 샤드별 잠금만 사용하므로 동시 읽기가 하나의 전역 잠금에 몰리지 않는다.
+"""
+
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+def canonical_cache_key(endpoint: str, statement: str, context: Optional[str] = None,
+                        mode: Optional[str] = None, extra: Optional[Dict[str, Any]] = None) -> str:
+    """
+    정규화된 요청 내용의 SHA-256 해시
+
+    문장과 컨텍스트는 요청 검증과 같은 방식(앞뒤 공백 제거)으로 정규화하고,
+    응답에 영향을 주는 나머지 요청 필드는 키 정렬된 JSON으로 포함한다.
+    파이썬 hash() 와 달리 프로세스가 달라도 같은 요청은 같은 키가 된다.
+    """
+    payload = {
+        'endpoint': endpoint,
+        'statement': (statement or '').strip(),
+        'context': (context or '').strip(),
+        'mode': (mode or 'all').strip().lower(),
+        'extra': extra or {}
+    }
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+class _CacheShard:
+    """캐시 샤드 (자체 잠금과 LRU 순서 유지)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def remove(self, key: str):
+        _, _, size = self.entries.pop(key)
+        self.size_bytes -= size
+
+class ResponseCache:
+    """바이트 상한 LRU + TTL 응답 캐시"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, default_ttl: float = 300.0, shards: int = 16):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._shards = [_CacheShard(max(1, max_bytes // shards)) for _ in range(shards)]
+
+    def _shard(self, key: str) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료된 항목은 제거 후 None)"""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None:
+                shard.misses += 1
+                return None
+
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                shard.remove(key)
+                shard.expirations += 1
+                shard.misses += 1
+                return None
+
+            shard.entries.move_to_end(key)
+            shard.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[float] = None) -> bool:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            size: 값의 크기 (바이트)
+            ttl: 유효 시간 (초, 기본값: default_ttl)
+
+        Returns:
+            bool: 저장 여부 (샤드 용량보다 큰 값은 저장하지 않음)
+        """
+        shard = self._shard(key)
+        if size > shard.max_bytes:
+            return False
+
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with shard.lock:
+            if key in shard.entries:
+                shard.remove(key)
+            shard.entries[key] = (value, expires_at, size)
+            shard.size_bytes += size
+
+            # 용량 초과 시 가장 오래 사용되지 않은 항목부터 제거
+            while shard.size_bytes > shard.max_bytes:
+                oldest_key = next(iter(shard.entries))
+                shard.remove(oldest_key)
+                shard.evictions += 1
+        return True
+
+    def delete(self, key: str):
+        shard = self._shard(key)
+        with shard.lock:
+            if key in shard.entries:
+                shard.remove(key)
+
+    def clear(self):
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.size_bytes = 0
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def hit_rate(self) -> float:
+        hits = sum(shard.hits for shard in self._shards)
+        lookups = hits + sum(shard.misses for shard in self._shards)
+        return hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (적중, 미적중, 제거, 만료 횟수와 사용 용량)"""
+        hits = sum(shard.hits for shard in self._shards)
+        misses = sum(shard.misses for shard in self._shards)
+        return {
+            'entries': len(self),
+            'size_bytes': sum(shard.size_bytes for shard in self._shards),
+            'max_bytes': self.max_bytes,
+            'hits': hits,
+            'misses': misses,
+            'evictions': sum(shard.evictions for shard in self._shards),
+            'expirations': sum(shard.expirations for shard in self._shards),
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0
+        }
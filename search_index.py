@@ -0,0 +1,266 @@
+"""
+로컬 BM25 검색 백엔드
+웹 연구원이 쓰는 검색 엔진 인터페이스(SearchBackend)와, 직접 준비한 문서 모음(예: 위키백과 덤프)을
+미리 역색인으로 만들어 메모리 맵 포스팅 파일에서 BM25 순위로 검색하는 로컬 엔진
+외부 요청 없이 같은 질의에 항상 같은 결과를 돌려주므로 폐쇄망 노드에서도 연구 기능을 쓸 수 있다.
+
+색인 만들기 (JSON Lines, 줄마다 {"title", "url", "text"} - WikiExtractor --json 출력 형식):
+    python search_index.py build corpus.jsonl research_index/
+"""
+
+import os
+import re
+import json
+import math
+import logging
+import argparse
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+SNIPPET_CHARS = 300
+CONTENT_CHARS = 2000
+MAX_TF = np.iinfo(np.uint16).max
+
+_WORD = re.compile(r'\w+', re.UNICODE)
+_HANGUL = re.compile(r'[가-힣]')
+
+def tokenize(text: str) -> List[str]:
+    """
+    색인/질의 토큰
+
+    영문 등은 소문자 단어, 한글 단어는 조사가 붙어도 일치하도록 글자 2-gram
+    ('지구는' → '지구', '구는') 으로 나눈다.
+    """
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        if len(word) > 1 and _HANGUL.search(word):
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+@dataclass
+class SearchHit:
+    """검색 백엔드 결과"""
+    title: str
+    url: str
+    snippet: str
+    domain: str
+    score: float
+    content: Optional[str] = None       # 백엔드가 본문을 갖고 있으면 페이지를 따로 가져오지 않음
+
+class SearchBackend(ABC):
+    """연구원이 검색 엔진처럼 쓰는 검색 백엔드"""
+
+    name = 'backend'
+
+    @abstractmethod
+    def search(self, query: str, max_results: int = 5) -> List[SearchHit]:
+        """질의와 관련 높은 순서의 결과"""
+
+def build_index(documents: Iterable[Dict[str, str]], directory: str, k1: float = 1.2, b: float = 0.75) -> Dict[str, float]:
+    """
+    문서 모음으로 BM25 역색인 파일 생성 (오프라인 작업)
+
+    만드는 파일:
+        meta.json           문서 수, 평균 길이, k1, b
+        terms.json          단어 → 단어 번호
+        term_offsets.npy    단어별 포스팅 시작 위치 (int64, 단어 수 + 1)
+        postings_docs.npy   포스팅 문서 번호 (uint32, 단어별로 문서 번호 순)
+        postings_tf.npy     포스팅 단어 빈도 (uint16)
+        doc_norms.npy       문서별 BM25 길이 정규화 값 k1·(1 - b + b·길이/평균 길이) (float32)
+        documents.jsonl     문서별 제목/URL/요약/본문 앞부분, doc_offsets.npy 는 줄 시작 위치
+    """
+    os.makedirs(directory, exist_ok=True)
+    terms: Dict[str, int] = {}
+    doc_lists: List[array] = []
+    tf_lists: List[array] = []
+    lengths = array('I')
+    offsets = array('q')
+
+    with open(os.path.join(directory, 'documents.jsonl'), 'wb') as doc_file:
+        for doc_id, document in enumerate(documents):
+            text = document.get('text', '')
+            counts = Counter(tokenize(f"{document.get('title', '')}\n{text}"))
+            for term, count in counts.items():
+                term_id = terms.get(term)
+                if term_id is None:
+                    term_id = terms[term] = len(terms)
+                    doc_lists.append(array('I'))
+                    tf_lists.append(array('H'))
+                doc_lists[term_id].append(doc_id)
+                tf_lists[term_id].append(min(count, MAX_TF))
+            lengths.append(sum(counts.values()))
+
+            offsets.append(doc_file.tell())
+            doc_file.write(json.dumps({
+                'title': document.get('title', ''),
+                'url': document.get('url', ''),
+                'snippet': ' '.join(text[:SNIPPET_CHARS * 2].split())[:SNIPPET_CHARS],
+                'content': text[:CONTENT_CHARS]
+            }, ensure_ascii=False).encode('utf-8') + b'\n')
+
+    doc_count = len(lengths)
+    doc_lengths = np.frombuffer(lengths, dtype=np.uint32).astype(np.float64) if doc_count else np.zeros(0)
+    average_length = float(doc_lengths.mean()) if doc_count else 0.0
+
+    term_offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+    term_offsets[1:] = np.cumsum([len(docs) for docs in doc_lists])
+    # 포스팅은 단어 번호 순으로 이어 붙여 파일에 바로 씀 (전체 배열을 메모리에 다시 만들지 않음)
+    for name, dtype, lists in (('postings_docs.npy', np.uint32, doc_lists), ('postings_tf.npy', np.uint16, tf_lists)):
+        path = os.path.join(directory, name)
+        if not term_offsets[-1]:
+            np.save(path, np.zeros(0, dtype=dtype))
+            continue
+        postings = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(int(term_offsets[-1]),))
+        for term_id, values in enumerate(lists):
+            postings[term_offsets[term_id]:term_offsets[term_id + 1]] = np.frombuffer(values, dtype=dtype)
+        postings.flush()
+        del postings
+
+    norms = k1 * (1 - b + b * doc_lengths / average_length) if average_length else np.full(doc_count, k1)
+    np.save(os.path.join(directory, 'doc_norms.npy'), norms.astype(np.float32))
+    np.save(os.path.join(directory, 'term_offsets.npy'), term_offsets)
+    np.save(os.path.join(directory, 'doc_offsets.npy'), np.frombuffer(offsets, dtype=np.int64) if doc_count
+            else np.zeros(0, dtype=np.int64))
+    with open(os.path.join(directory, 'terms.json'), 'w', encoding='utf-8') as f:
+        json.dump(terms, f, ensure_ascii=False, separators=(',', ':'))
+
+    meta = {'version': INDEX_VERSION, 'documents': doc_count, 'terms': len(terms),
+            'postings': int(term_offsets[-1]), 'average_length': average_length, 'k1': k1, 'b': b}
+    with open(os.path.join(directory, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    logger.info(f"BM25 색인 생성 완료: 문서 {doc_count}개, 단어 {len(terms)}개 ({directory})")
+    return meta
+
+class BM25Index:
+    """메모리 맵 포스팅 파일을 여는 BM25 색인 (읽기 전용, 여러 스레드에서 동시에 검색 가능)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('version') != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 색인 형식입니다: {self.meta.get('version')}")
+        with open(os.path.join(directory, 'terms.json'), encoding='utf-8') as f:
+            self.terms: Dict[str, int] = json.load(f)
+
+        self.k1 = self.meta['k1']
+        self.doc_count = self.meta['documents']
+        self.term_offsets = np.load(os.path.join(directory, 'term_offsets.npy'))
+        self.postings_docs = np.load(os.path.join(directory, 'postings_docs.npy'), mmap_mode='r')
+        self.postings_tf = np.load(os.path.join(directory, 'postings_tf.npy'), mmap_mode='r')
+        self.doc_norms = np.load(os.path.join(directory, 'doc_norms.npy'), mmap_mode='r')
+        self.doc_offsets = np.load(os.path.join(directory, 'doc_offsets.npy'), mmap_mode='r')
+        self._documents_path = os.path.join(directory, 'documents.jsonl')
+
+    def idf(self, df: int) -> float:
+        return math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+
+    def top_documents(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        """BM25 점수 상위 k 개 (문서 번호, 점수), 점수가 같으면 문서 번호 순"""
+        query_terms = Counter(term for term in tokenize(query) if term in self.terms)
+        if not query_terms or k <= 0:
+            return []
+
+        doc_parts, score_parts = [], []
+        for term, query_count in query_terms.items():
+            term_id = self.terms[term]
+            start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+            docs = np.asarray(self.postings_docs[start:end])
+            tf = np.asarray(self.postings_tf[start:end], dtype=np.float32)
+            weight = self.idf(int(end - start)) * query_count
+            doc_parts.append(docs)
+            score_parts.append(weight * tf * (self.k1 + 1) / (tf + self.doc_norms[docs]))
+
+        docs, inverse = np.unique(np.concatenate(doc_parts), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(score_parts))
+        if len(docs) > k:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+            # 경계 점수와 같은 문서도 후보에 넣어 동점 순서를 결정적으로 유지
+            threshold = scores[candidates].min()
+            candidates = np.flatnonzero(scores >= threshold)
+        else:
+            candidates = np.arange(len(docs))
+        order = candidates[np.lexsort((docs[candidates], -scores[candidates]))][:k]
+        return [(int(docs[i]), float(scores[i])) for i in order]
+
+    def document(self, doc_id: int) -> Dict[str, str]:
+        """문서 정보 (제목, URL, 요약, 본문 앞부분)"""
+        with open(self._documents_path, 'rb') as f:
+            f.seek(int(self.doc_offsets[doc_id]))
+            return json.loads(f.readline())
+
+    def search(self, query: str, k: int = 10) -> List[SearchHit]:
+        hits = []
+        for doc_id, score in self.top_documents(query, k):
+            document = self.document(doc_id)
+            hits.append(SearchHit(title=document['title'], url=document['url'], snippet=document['snippet'],
+                                  domain=urlparse(document['url']).netloc or 'local', score=score,
+                                  content=document['content']))
+        return hits
+
+class LocalSearchBackend(SearchBackend):
+    """로컬 BM25 색인 검색 백엔드"""
+
+    name = 'local'
+
+    def __init__(self, directory: str):
+        self.index = BM25Index(directory)
+
+    def search(self, query: str, max_results: int = 5) -> List[SearchHit]:
+        return self.index.search(query, max_results)
+
+def configured_backends() -> Dict[str, SearchBackend]:
+    """RESEARCH_LOCAL_INDEX 환경 변수에 색인 디렉터리가 있으면 로컬 백엔드 (없으면 빈 dict)"""
+    directory = os.getenv('RESEARCH_LOCAL_INDEX')
+    if not directory:
+        return {}
+    try:
+        return {LocalSearchBackend.name: LocalSearchBackend(directory)}
+    except (OSError, ValueError) as e:
+        logger.warning(f"로컬 검색 색인을 열 수 없습니다 ({directory}): {e}")
+        return {}
+
+def offline_mode() -> bool:
+    """RESEARCH_OFFLINE 이 켜져 있으면 외부 검색 엔진을 쓰지 않고 검색 백엔드만 사용"""
+    return os.getenv('RESEARCH_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, str]]:
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 BM25 검색 색인')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='JSON Lines 문서 모음으로 색인 생성')
+    build.add_argument('corpus', help='줄마다 {"title", "url", "text"} 인 파일')
+    build.add_argument('directory')
+    build.add_argument('--k1', type=float, default=1.2)
+    build.add_argument('--b', type=float, default=0.75)
+    query = commands.add_parser('search', help='색인 검색')
+    query.add_argument('directory')
+    query.add_argument('query')
+    query.add_argument('-k', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        print(json.dumps(build_index(iter_jsonl(args.corpus), args.directory, args.k1, args.b), ensure_ascii=False))
+    else:
+        for hit in BM25Index(args.directory).search(args.query, args.k):
+            print(f"{hit.score:8.3f}  {hit.title}  {hit.url}")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,268 @@
+"""
+2단계 공유 결과 캐시
+프로세스 내 LRU 캐시 뒤에 Redis를 두어 gunicorn 작업자와 여러 노드가
+분석 결과를 공유하도록 하는 모듈 (Redis가 없으면 프로세스 내 캐시로만 동작)
+"""
+
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from response_cache import ResponseCache
+
+try:
+    import msgpack
+except ImportError:  # msgpack 이 없으면 JSON 으로 직렬화
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# 잠금 해제 - 아직 내 토큰일 때만 삭제 (조회와 삭제 사이에 다른 작업자가 잡은 잠금을 지우지 않도록 원자적으로 실행)
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+def pack_value(value: Dict[str, Any]) -> bytes:
+    """캐시 값 직렬화 (msgpack, 없으면 JSON)"""
+    if msgpack is not None:
+        return msgpack.packb(value, use_bin_type=True)
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+def unpack_value(data: bytes) -> Dict[str, Any]:
+    """캐시 값 역직렬화"""
+    if msgpack is not None:
+        return msgpack.unpackb(data, raw=False)
+    return json.loads(data.decode('utf-8'))
+
+def create_redis_client(url: Optional[str] = None):
+    """
+    결과 캐시용 Redis 클라이언트 생성
+
+    msgpack 바이트를 그대로 주고받아야 하므로 database_config.REDIS_CONFIG 와 같은
+    환경 변수를 쓰되 decode_responses 는 끈다. REDIS_URL 과 REDIS_HOST 가 모두 없으면 None.
+    """
+    url = url or os.getenv('REDIS_URL')
+    if not url and not os.getenv('REDIS_HOST'):
+        return None
+    try:
+        import redis
+        if url:
+            client = redis.Redis.from_url(url, decode_responses=False)
+        else:
+            client = redis.Redis(
+                host=os.getenv('REDIS_HOST', 'localhost'),
+                port=int(os.getenv('REDIS_PORT', '6379')),
+                db=int(os.getenv('REDIS_DB', '0')),
+                decode_responses=False
+            )
+        client.ping()
+        return client
+    except Exception as e:
+        logger.warning(f"Redis 연결 실패 - 프로세스 내 캐시만 사용합니다: {e}")
+        return None
+
+class TwoTierCache:
+    """프로세스 내 LRU + Redis 2단계 캐시 (동일 키 동시 미스는 한 번만 계산)"""
+
+    def __init__(self, redis_client=None, namespace: str = 'ai_truth', ttl: int = 3600,
+                 local_max_bytes: int = 16 * 1024 * 1024, lock_timeout: float = 5.0):
+        self.redis = redis_client
+        self.namespace = namespace
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self._local = ResponseCache(max_bytes=local_max_bytes, default_ttl=ttl)
+        self._release_lock = redis_client.register_script(RELEASE_LOCK_SCRIPT) if redis_client is not None else None
+
+        self._flight_lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'local_hits': 0,
+            'redis_hits': 0,
+            'misses': 0,
+            'computations': 0,
+            'single_flight_waits': 0,
+            'redis_errors': 0
+        }
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _redis_error(self, operation: str, error: Exception):
+        self._count('redis_errors')
+        logger.error(f"Redis 캐시 {operation} 실패: {error}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (프로세스 내 → Redis 순)"""
+        return self.get_many([key])[key]
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """여러 키 조회 (프로세스 내 미스는 Redis 파이프라인 한 번으로 조회)"""
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing: List[str] = []
+        for key in keys:
+            value = self._local.get(key)
+            if value is not None:
+                results[key] = value
+                self._count('local_hits')
+            elif key not in results:
+                results[key] = None
+                missing.append(key)
+
+        if missing and self.redis is not None:
+            try:
+                pipeline = self.redis.pipeline(transaction=False)
+                for key in missing:
+                    pipeline.get(self._redis_key(key))
+                for key, data in zip(missing, pipeline.execute()):
+                    if data is None:
+                        continue
+                    value = unpack_value(data)
+                    results[key] = value
+                    self._local.set(key, value, len(data))
+                    self._count('redis_hits')
+            except Exception as e:
+                self._redis_error('조회', e)
+
+        self._count('misses', sum(1 for key in missing if results[key] is None))
+        return results
+
+    def set(self, key: str, value: Dict[str, Any]):
+        self.set_many({key: value})
+
+    def set_many(self, items: Dict[str, Dict[str, Any]]):
+        """여러 값 저장 (Redis 는 파이프라인 한 번으로 저장)"""
+        packed = {key: pack_value(value) for key, value in items.items()}
+        for key, value in items.items():
+            self._local.set(key, value, len(packed[key]))
+
+        if self.redis is not None and packed:
+            try:
+                pipeline = self.redis.pipeline(transaction=False)
+                for key, data in packed.items():
+                    pipeline.set(self._redis_key(key), data, ex=self.ttl)
+                pipeline.execute()
+            except Exception as e:
+                self._redis_error('저장', e)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        캐시 값 반환, 없으면 계산 후 저장
+
+        같은 프로세스에서 동시에 미스가 나면 한 스레드만 계산하고 나머지는 그 결과를 기다린다.
+        여러 프로세스/노드 사이에서는 Redis 잠금 키로 계산을 하나로 모은다.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._flight_lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+
+        if not owner:
+            self._count('single_flight_waits')
+            return future.result()
+
+        try:
+            value = self._compute_once(key, compute)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._flight_lock:
+                self._in_flight.pop(key, None)
+
+    def _compute_once(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Redis 잠금을 잡은 쪽만 계산 (잠금을 못 잡으면 결과가 저장될 때까지 대기)"""
+        # 첫 조회와 소유권 획득 사이에 앞선 소유자가 저장을 마쳤을 수 있으므로 다시 확인
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        lock_key = self._redis_key(f"lock:{key}")
+        token = uuid.uuid4().hex
+        locked = False
+
+        if self.redis is not None:
+            try:
+                locked = bool(self.redis.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000)))
+                if not locked:
+                    value = self._wait_for_remote(key)
+                    if value is not None:
+                        return value
+            except Exception as e:
+                self._redis_error('잠금', e)
+
+        try:
+            if locked:
+                # 잠금을 잡기 직전에 다른 노드가 계산을 끝내고 잠금을 풀었을 수 있음
+                value = self.get(key)
+                if value is not None:
+                    return value
+            value = compute()
+            self._count('computations')
+            self.set(key, value)
+            return value
+        finally:
+            if locked:
+                try:
+                    self._release_lock(keys=[lock_key], args=[token])
+                except Exception as e:
+                    self._redis_error('잠금 해제', e)
+
+    def _wait_for_remote(self, key: str) -> Optional[Dict[str, Any]]:
+        """다른 작업자가 계산 중인 값을 잠금 제한 시간까지 대기"""
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            data = self.redis.get(self._redis_key(key))
+            if data is not None:
+                value = unpack_value(data)
+                self._local.set(key, value, len(data))
+                self._count('redis_hits')
+                return value
+            time.sleep(0.05)
+        return None
+
+    def clear(self):
+        """프로세스 내 캐시와 이 네임스페이스의 Redis 키 삭제"""
+        self._local.clear()
+        if self.redis is not None:
+            try:
+                keys = list(self.redis.scan_iter(match=f"{self.namespace}:*"))
+                if keys:
+                    self.redis.delete(*keys)
+            except Exception as e:
+                self._redis_error('삭제', e)
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats['local_hits'] + stats['redis_hits'] + stats['misses']
+        stats.update({
+            'local_entries': len(self._local),
+            'redis_enabled': self.redis is not None,
+            'hit_rate': (stats['local_hits'] + stats['redis_hits']) / lookups if lookups else 0.0,
+            'serializer': 'msgpack' if msgpack is not None else 'json'
+        })
+        return stats
@@ -0,0 +1,153 @@
+"""
+스트림 순서 보장 작업자 풀
+여러 출력 스트림(예: 동시에 생성 중인 LLM 응답)의 문장을 작업자 여러 개가 나눠 처리하되,
+같은 스트림의 문장은 항상 같은 작업자의 큐로 보내 들어온 순서대로 처리하는 모듈
+작업자는 큐에서 막혀서 기다리고 (폴링/sleep 없음), 깨어났을 때 쌓여 있는 항목은 한 묶음으로 꺼내 처리한다.
+StreamMonitor 는 실시간/메타 모니터가 공유하는 시작/중지/제출 연결이다.
+"""
+
+import queue
+import logging
+import threading
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 스트림을 지정하지 않은 문장의 스트림 키
+DEFAULT_STREAM = 'default'
+
+_STOP = object()
+
+class StreamWorkerPool:
+    """스트림별로 순서를 지키며 묶음 단위로 처리하는 블로킹 큐 소비자 풀"""
+
+    def __init__(self, handle_batch: Callable[[List[Tuple[Hashable, Any]]], None], workers: int = 4,
+                 max_batch: int = 32, max_queue: int = 0, name: str = 'stream-worker'):
+        """
+        Args:
+            handle_batch: [(스트림 키, 항목), ...] 을 받아 처리하는 함수 (같은 스트림 항목은 들어온 순서)
+            workers: 작업자 스레드 수
+            max_batch: 한 번에 꺼내 처리할 최대 항목 수
+            max_queue: 작업자별 큐 크기 (0 이면 제한 없음, 가득 차면 submit 이 기다림)
+        """
+        self.handle_batch = handle_batch
+        self.max_batch = max(1, max_batch)
+        self._queues = [queue.Queue(maxsize=max_queue) for _ in range(max(1, workers))]
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.processed = 0
+        self._threads = [threading.Thread(target=self._run, args=(q,), name=f'{name}-{i}', daemon=True)
+                         for i, q in enumerate(self._queues)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, stream_id: Hashable, item: Any, timeout: Optional[float] = None):
+        """항목 제출 (스트림 키로 작업자 선택)"""
+        self._queues[hash(stream_id) % len(self._queues)].put((stream_id, item), timeout=timeout)
+
+    def _run(self, work_queue: queue.Queue):
+        while True:
+            first = work_queue.get()
+            if first is _STOP:
+                return
+            batch = [first]
+            stopping = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                self.handle_batch(batch)
+            except Exception as e:
+                logger.error(f"스트림 묶음 처리 오류 ({len(batch)}개): {e}")
+            with self._stats_lock:
+                self.batches += 1
+                self.processed += len(batch)
+            if stopping:
+                return
+
+    def pending(self) -> int:
+        """처리를 기다리는 항목 수"""
+        return sum(q.qsize() for q in self._queues)
+
+    def stats(self):
+        with self._stats_lock:
+            return {'workers': len(self._threads), 'pending': self.pending(),
+                    'batches': self.batches, 'processed': self.processed}
+
+    def stop(self, timeout: Optional[float] = None):
+        """이미 제출된 항목을 모두 처리한 뒤 작업자 종료 (timeout 이 0 이면 기다리지 않음)"""
+        for work_queue in self._queues:
+            work_queue.put(_STOP)
+        if timeout != 0:
+            for thread in self._threads:
+                thread.join(timeout)
+
+class StreamMonitor:
+    """
+    모니터의 시작/중지/문장 제출 연결
+
+    시작 전에 제출된 항목은 보관했다가 시작할 때 넘기고, 풀 교체와 제출을 한 잠금으로 묶어
+    중지 중에 제출된 항목이 종료 신호 뒤에 들어가 사라지지 않도록 한다 (중지 후 제출은 다음 시작 때 처리).
+    """
+
+    def __init__(self, workers: int = 4, max_batch: int = 32, name: str = 'stream-monitor'):
+        """
+        Args:
+            workers: 작업자 스레드 수
+            max_batch: 작업자가 깨어났을 때 큐에서 한 번에 꺼내는 최대 항목 수 (항목은 하나씩 처리)
+        """
+        self.workers = workers
+        self.max_batch = max_batch
+        self.name = name
+        self._lock = threading.Lock()
+        self._pool: Optional[StreamWorkerPool] = None
+        self._waiting: List[Tuple[Hashable, Any]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._pool is not None
+
+    def start(self, handle: Callable[[Hashable, Any], None]):
+        """항목마다 handle(스트림 키, 항목) 을 호출하는 작업자 시작 (보관된 항목부터 처리)"""
+        def handle_each(batch: List[Tuple[Hashable, Any]]):
+            for stream_id, item in batch:
+                try:
+                    handle(stream_id, item)
+                except Exception as e:
+                    logger.error(f"스트림 항목 처리 오류 ({self.name}, {stream_id}): {e}")
+
+        with self._lock:
+            previous = self._pool
+            self._pool = StreamWorkerPool(handle_each, workers=self.workers, max_batch=self.max_batch, name=self.name)
+            waiting, self._waiting = self._waiting, []
+            for stream_id, item in waiting:
+                self._pool.submit(stream_id, item)
+        if previous is not None:
+            previous.stop(0)
+
+    def stop(self, timeout: Optional[float] = 0):
+        """제출된 항목을 처리한 뒤 작업자 종료 (timeout 초까지 기다림 - None 이면 끝날 때까지)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.stop(timeout)
+
+    def submit(self, stream_id: Hashable, item: Any):
+        """항목 제출 (실행 중이 아니면 보관)"""
+        with self._lock:
+            if self._pool is None:
+                self._waiting.append((stream_id, item))
+            else:
+                self._pool.submit(stream_id, item)
+
+    def pending(self) -> int:
+        """처리를 기다리는 항목 수"""
+        with self._lock:
+            return self._pool.pending() if self._pool is not None else len(self._waiting)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 컨텍스트 테스트
+요청 단위로 기본 진실성 분석, 문장 분리, 패턴 스캔이 한 번만 수행되는지 검증
+"""
+
+import unittest
+from ai_truth_detector import TruthDetector
+import pickle
+from analysis_context import AnalysisContext
+from context_awareness_detector import ContextAwarenessDetector
+from meta_truth_detector import MetaTruthDetector
+from compound_sentence_analyzer import CompoundSentenceAnalyzer
+
+class TestAnalysisContext(unittest.TestCase):
+    """분석 컨텍스트 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.detector = TruthDetector()
+
+    def test_primary_analysis_memoized(self):
+        """동일 문장 기본 분석 메모이즈 테스트"""
+        analysis_context = AnalysisContext("지구는 평평하다.", "", self.detector)
+
+        first = analysis_context.analyze()
+        second = analysis_context.analyze("지구는 평평하다.", "")
+
+        self.assertIs(first, second)
+        self.assertEqual(analysis_context.primary_analysis_count, 1)
+        self.assertEqual(analysis_context.primary_cache_hits, 1)
+
+    def test_result_matches_direct_analysis(self):
+        """컨텍스트 결과와 직접 분석 결과 일치 테스트"""
+        statement = "물은 200도에서 끓는다."
+        analysis_context = AnalysisContext(statement, "", self.detector)
+        direct = self.detector.analyze_statement(statement, "")
+        shared = analysis_context.analyze()
+
+        self.assertEqual(shared.truth_percentage, direct.truth_percentage)
+        self.assertEqual(shared.detected_lies, direct.detected_lies)
+
+    def test_wrappers_share_primary_analysis(self):
+        """여러 탐지기가 기본 분석을 공유하는지 테스트"""
+        statement = "지구는 구형이다. 그리고 자동차는 구형이다."
+        analysis_context = AnalysisContext(statement, "", self.detector)
+
+        MetaTruthDetector().analyze_with_meta_check(statement, "", analysis_context)
+        CompoundSentenceAnalyzer().analyze_compound_sentence(statement, "", analysis_context)
+        count_after_first_pass = analysis_context.primary_analysis_count
+
+        MetaTruthDetector().analyze_with_meta_check(statement, "", analysis_context)
+        CompoundSentenceAnalyzer().analyze_compound_sentence(statement, "", analysis_context)
+
+        self.assertEqual(analysis_context.primary_analysis_count, count_after_first_pass)
+        self.assertGreater(analysis_context.primary_cache_hits, 0)
+
+    def test_wrappers_share_tokens_and_pattern_scans(self):
+        """맥락 탐지기와 복합 문장 분석기가 문장 분리/패턴 스캔 결과를 공유하는지 테스트"""
+        statement = "일반적으로 지구는 둥글다."
+        analysis_context = AnalysisContext(statement, "", self.detector)
+        direct = ContextAwarenessDetector().analyze_with_context_awareness(statement, "")
+
+        shared = ContextAwarenessDetector().analyze_with_context_awareness(statement, "", analysis_context)
+        self.assertEqual(analysis_context.memo_hits, 0)
+        CompoundSentenceAnalyzer().analyze_compound_sentence(statement, "", analysis_context)
+
+        self.assertEqual(shared['context_analysis'], direct['context_analysis'])
+        # 복합 문장 분석기 안의 맥락 스캔과 두 번째 문장 분리는 메모에서 가져옴
+        self.assertGreaterEqual(analysis_context.get_stats()['memo_hits'], 2)
+        self.assertEqual(analysis_context.tokens(statement), statement.split())
+
+    def test_pickled_context_keeps_primary_analysis(self):
+        """피클된 컨텍스트가 기본 분석을 다시 수행하지 않는지 테스트"""
+        analysis_context = AnalysisContext("지구는 평평하다.", "", self.detector)
+        analysis_context.analyze()
+        analysis_context.search("평평")
+
+        restored = pickle.loads(pickle.dumps(analysis_context))
+        restored.analyze()
+
+        self.assertEqual(restored.primary_analysis_count, 1)
+        self.assertEqual(restored.primary_cache_hits, 1)
+
+if __name__ == "__main__":
+    unittest.main()
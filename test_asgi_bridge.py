@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ASGI-WSGI 브리지 테스트
+"""
+
+import json
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Response, jsonify, request
+from asgi_bridge import ASGIBridge
+
+def create_app(events):
+    app = Flask(__name__)
+
+    @app.route('/echo', methods=['POST'])
+    def echo():
+        return jsonify({'data': request.get_json(), 'query': request.args.get('q'), 'thread': threading.current_thread().name})
+
+    @app.route('/stream')
+    def stream():
+        def generate():
+            try:
+                for i in range(1000):
+                    events['produced'] = i + 1
+                    yield f"{i}\n"
+                    events['first_chunk'].set()
+                    events['release'].wait(5)
+            finally:
+                events['closed'].set()
+        return Response(generate(), mimetype='application/x-ndjson')
+
+    return app
+
+class TestASGIBridge(unittest.TestCase):
+    """ASGI-WSGI 브리지 테스트"""
+
+    def setUp(self):
+        self.events = {'first_chunk': threading.Event(), 'release': threading.Event(),
+                       'closed': threading.Event(), 'produced': 0}
+        self.default_executor = ThreadPoolExecutor(2, thread_name_prefix='default')
+        self.slow_executor = ThreadPoolExecutor(2, thread_name_prefix='slow')
+        self.bridge = ASGIBridge(create_app(self.events).wsgi_app, self.default_executor,
+                                 routes=[('/stream', self.slow_executor)])
+
+    def tearDown(self):
+        self.events['release'].set()
+        self.default_executor.shutdown()
+        self.slow_executor.shutdown()
+
+    def call(self, method, path, body=b'', query=b'', disconnect=None):
+        """브리지를 호출하고 보낸 메시지 목록 반환 (disconnect 이벤트가 설정되면 연결 끊김 전달)"""
+        async def run():
+            sent = []
+            pending = [{'type': 'http.request', 'body': body, 'more_body': False}]
+            gone = asyncio.Event()
+
+            async def receive():
+                if pending:
+                    return pending.pop(0)
+                await gone.wait()
+                return {'type': 'http.disconnect'}
+
+            async def send(message):
+                sent.append(message)
+
+            if disconnect is not None:
+                loop = asyncio.get_running_loop()
+                threading.Thread(target=lambda: disconnect.wait(5) and loop.call_soon_threadsafe(gone.set),
+                                 daemon=True).start()
+
+            scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query,
+                     'headers': [(b'content-type', b'application/json')],
+                     'server': ('testserver', 80), 'client': ('127.0.0.1', 5000)}
+            await asyncio.wait_for(self.bridge(scope, receive, send), 5)
+            return sent
+        return asyncio.run(run())
+
+    def test_request_and_response(self):
+        """본문, 쿼리 문자열, 상태 코드가 그대로 전달되고 기본 실행기에서 처리되는지 테스트"""
+        sent = self.call('POST', '/echo', json.dumps({'statement': '지구는 둥글다.'}).encode('utf-8'), b'q=1')
+
+        self.assertEqual(sent[0]['type'], 'http.response.start')
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertIn((b'content-type', b'application/json'), sent[0]['headers'])
+        self.assertFalse(sent[-1]['more_body'])
+
+        data = json.loads(b''.join(message.get('body', b'') for message in sent[1:]))
+        self.assertEqual(data['data'], {'statement': '지구는 둥글다.'})
+        self.assertEqual(data['query'], '1')
+        self.assertTrue(data['thread'].startswith('default'))
+
+    def test_unknown_route(self):
+        """WSGI 앱의 404 응답 전달 테스트"""
+        sent = self.call('GET', '/missing')
+        self.assertEqual(sent[0]['status'], 404)
+
+    def test_disconnect_stops_streaming(self):
+        """연결이 끊기면 스트리밍 응답 생성을 멈추고 본문을 닫는지 테스트"""
+        sent = self.call('GET', '/stream', disconnect=self.events['first_chunk'])
+        self.events['release'].set()
+
+        self.assertTrue(self.events['closed'].wait(5))
+        self.assertLess(self.events['produced'], 1000)
+        self.assertFalse(any(message.get('more_body') is False for message in sent))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+배치 진실성 분석 엔진 테스트
+열 단위 점수 계산 결과가 문장 단위 분석과 동일한지 검증
+"""
+
+import json
+import unittest
+from ai_truth_detector import TruthDetector
+from batch_analyzer import BatchTruthScorer, dedupe_statements, iter_ndjson
+
+class TestBatchAnalyzer(unittest.TestCase):
+    """배치 분석 엔진 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.detector = TruthDetector()
+        self.scorer = BatchTruthScorer(self.detector)
+        self.statements = [
+            "지구는 평평하다.",
+            "지구는 둥글다. 물은 100도에서 끓는다.",
+            "완전히 절대적으로 100% 확실히 모든 것이 진실이다",
+            "오늘 어제 현재 과거 지금 미래",
+            "만약 비가 오면 그러면 땅이 젖는다",
+            "숫자 99999999999 와 12345678901 은 크다",
+            "ABC!!! WOW???",
+            "개 개 개 개 고양이",
+            "짧다",
+            "",
+            "1 + 1 = 3"
+        ]
+
+    def test_matches_single_statement_analysis(self):
+        """문장 단위 분석과 결과 일치 테스트"""
+        batch = self.scorer.analyze_batch(self.statements)
+
+        for statement, analysis in zip(self.statements, batch):
+            expected = self.detector.analyze_statement(statement)
+            with self.subTest(statement=statement):
+                self.assertEqual(analysis.verification_methods, expected.verification_methods)
+                self.assertAlmostEqual(analysis.truth_percentage, expected.truth_percentage, places=12)
+                self.assertAlmostEqual(analysis.confidence, expected.confidence, places=12)
+                self.assertEqual(analysis.detected_lies, expected.detected_lies)
+                self.assertEqual(analysis.correction_suggestions, expected.correction_suggestions)
+                self.assertEqual(analysis.corrected_statement, expected.corrected_statement)
+                self.assertEqual(analysis.auto_correction_applied, expected.auto_correction_applied)
+
+    def test_score_matrix_shape(self):
+        """점수 행렬 형태 테스트"""
+        matrix = self.scorer.score_matrix(self.statements)
+
+        self.assertEqual(matrix.shape, (len(self.statements), len(self.detector.verification_methods)))
+        self.assertEqual(self.scorer.score_matrix([]).shape, (0, len(self.detector.verification_methods)))
+
+    def test_dedupe_statements(self):
+        """중복 문장 제거 테스트"""
+        unique, inverse = dedupe_statements(["a", "b", "a", "c", "b"])
+
+        self.assertEqual(unique, ["a", "b", "c"])
+        self.assertEqual(inverse, [0, 1, 0, 2, 1])
+
+    def test_iter_ndjson(self):
+        """NDJSON 직렬화 테스트"""
+        lines = list(iter_ndjson([{'index': 0, 'statement': '문장'}, {'index': 1}]))
+
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(all(line.endswith('\n') for line in lines))
+        self.assertEqual(json.loads(lines[0])['statement'], '문장')
+
+if __name__ == "__main__":
+    unittest.main()
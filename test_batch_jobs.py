@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+영속 배치 작업 큐 테스트
+작업 등록, 청크 처리, 진행률 보고, 재시작 후 재개, 청크 선점/임대 검증
+"""
+
+import os
+import time
+import tempfile
+import threading
+import unittest
+from batch_jobs import BatchJobManager, BatchJobStore
+
+def echo_chunk(statements, context, start_index):
+    """문장 길이를 결과로 돌려주는 청크 처리 함수"""
+    return [{'index': start_index + i, 'statement': s, 'length': len(s)} for i, s in enumerate(statements)]
+
+class TestBatchJobs(unittest.TestCase):
+    """배치 작업 큐 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        handle, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.managers = []
+
+    def tearDown(self):
+        """테스트 정리"""
+        for manager in self.managers:
+            manager.stop(timeout=2)
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+    def _manager(self, process_chunk=echo_chunk, chunk_size=3):
+        manager = BatchJobManager(BatchJobStore(self.db_path), process_chunk, max_workers=2, chunk_size=chunk_size)
+        self.managers.append(manager)
+        return manager
+
+    def _wait(self, manager, job_id, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = manager.get_job(job_id)
+            if job['status'] not in ('queued', 'running'):
+                return job
+            time.sleep(0.01)
+        self.fail("배치 작업이 제한 시간 내에 끝나지 않았습니다.")
+
+    def test_submit_and_complete(self):
+        """작업 등록 및 완료 테스트"""
+        manager = self._manager()
+        statements = [f"문장 {i}" for i in range(10)]
+
+        job_id = manager.submit(statements)
+        job = self._wait(manager, job_id)
+
+        self.assertEqual(job['status'], 'completed')
+        self.assertEqual(job['processed_statements'], 10)
+        self.assertEqual(job['total_chunks'], 4)
+        self.assertEqual(len(job['chunk_latencies_ms']), 4)
+        self.assertEqual(job['eta_seconds'], 0.0)
+        self.assertEqual([r['index'] for r in manager.iter_results(job_id)], list(range(10)))
+
+    def test_resume_after_restart(self):
+        """재시작 후 미완료 작업 재개 테스트"""
+        store = BatchJobStore(self.db_path)
+        job_id = store.create_job(["a", "bb", "ccc", "dddd"], None, chunk_size=2)
+        store.complete_chunk(job_id, 0, echo_chunk(["a", "bb"], None, 0), 0.01)
+
+        manager = self._manager(chunk_size=2)
+        manager.start()
+        job = self._wait(manager, job_id)
+
+        self.assertEqual(job['status'], 'completed')
+        self.assertEqual([r['length'] for r in manager.iter_results(job_id)], [1, 2, 3, 4])
+
+    def test_claim_is_exclusive(self):
+        """같은 DB를 쓰는 저장소 두 개 중 하나만 청크를 선점하는지 테스트"""
+        store, other = BatchJobStore(self.db_path), BatchJobStore(self.db_path)
+        job_id = store.create_job(["a", "b"], None, chunk_size=1)
+
+        self.assertTrue(store.claim_chunk(job_id, 0, 'worker-a', 60))
+        self.assertFalse(other.claim_chunk(job_id, 0, 'worker-b', 60))
+        self.assertEqual([row['chunk_index'] for row in other.pending_chunks()], [1])
+
+    def test_resume_only_expired_leases(self):
+        """임대가 끝난 청크만 재개하는지 테스트"""
+        store = BatchJobStore(self.db_path)
+        job_id = store.create_job(["a", "bb"], None, chunk_size=1)
+        store.claim_chunk(job_id, 0, 'crashed', -1)       # 이미 만료된 임대
+        store.claim_chunk(job_id, 1, 'alive', 60)
+
+        manager = self._manager(chunk_size=1)
+        manager.start()
+        deadline = time.monotonic() + 5.0
+        while manager.get_job(job_id)['processed_statements'] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        self.assertEqual(store.get_chunk(job_id, 0)['status'], 'completed')
+        self.assertEqual(store.get_chunk(job_id, 1)['status'], 'running')
+        self.assertEqual(manager.get_job(job_id)['status'], 'running')
+
+    def test_store_created_on_first_use(self):
+        """저장소 생성 함수가 첫 사용 시에만 호출되는지 테스트"""
+        created = []
+
+        def create_store():
+            created.append(True)
+            return BatchJobStore(self.db_path)
+
+        manager = BatchJobManager(create_store, echo_chunk)
+        self.managers.append(manager)
+        self.assertEqual(created, [])
+        self.assertIsNone(manager.get_job('missing'))
+        self.assertIs(manager.store, manager.store)
+        self.assertEqual(created, [True])
+
+    def test_stop_leaves_queued_chunks_for_resume(self):
+        """종료 시 남은 청크를 처리하지 않고 재시작 후 재개하는지 테스트"""
+        started, release = threading.Event(), threading.Event()
+
+        def slow_chunk(statements, context, start_index):
+            started.set()
+            release.wait(2.0)
+            return echo_chunk(statements, context, start_index)
+
+        manager = BatchJobManager(BatchJobStore(self.db_path), slow_chunk, max_workers=1, chunk_size=1)
+        job_id = manager.submit([f"문장 {i}" for i in range(10)])
+        started.wait(2.0)
+        stopper = threading.Thread(target=manager.stop, kwargs={'timeout': 5.0})
+        stopper.start()
+        while not manager._stop_event.is_set():
+            time.sleep(0.01)
+        release.set()
+        stopper.join(5.0)
+
+        self.assertEqual(manager.get_job(job_id)['processed_statements'], 1)
+        self.assertEqual(len(manager.store.pending_chunks()), 9)
+
+        resumed = self._manager(chunk_size=1)
+        resumed.start()
+        self.assertEqual(self._wait(resumed, job_id)['processed_statements'], 10)
+
+    def test_failed_chunk_marks_job_failed(self):
+        """청크 처리 실패 테스트"""
+        def fail(statements, context, start_index):
+            raise RuntimeError("처리 실패")
+
+        manager = self._manager(process_chunk=fail)
+        job = self._wait(manager, manager.submit(["a"]))
+
+        self.assertEqual(job['status'], 'failed')
+        self.assertEqual(job['error'], "처리 실패")
+
+    def test_cancel_and_list(self):
+        """작업 취소 및 목록 테스트"""
+        manager = self._manager()
+        job_id = manager.store.create_job(["a", "b"], None, chunk_size=1)
+
+        self.assertTrue(manager.cancel(job_id))
+        self.assertFalse(manager.cancel(job_id))
+        self.assertEqual([job['job_id'] for job in manager.list_jobs(status='cancelled')], [job_id])
+
+if __name__ == "__main__":
+    unittest.main()
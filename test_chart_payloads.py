@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대시보드 차트 데이터 테스트
+값 배열로 만든 그림 JSON 이 plotly Figure 인코딩 결과와 같은지 검증
+"""
+
+import json
+import unittest
+from datetime import datetime
+from chart_payloads import VERIFICATION_COLORS, encode_figure, truth_trend_figure, verification_figure
+
+try:
+    import plotly
+    import plotly.graph_objs as go
+except ImportError:
+    plotly = None
+
+@unittest.skipIf(plotly is None, "plotly 가 설치되어 있지 않습니다.")
+class TestChartPayloads(unittest.TestCase):
+    """대시보드 차트 데이터 테스트"""
+
+    def encode(self, fig):
+        return json.loads(plotly.utils.PlotlyJSONEncoder().encode(fig))
+
+    def test_truth_trend_matches_plotly(self):
+        """진실성 트렌드 그림이 plotly 로 만든 것과 같은지 테스트"""
+        timestamps = ['2025-01-01T09:00:00', '2025-01-01T09:00:01.250000']
+        scores = [0.42, 0.995]
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=[datetime.fromisoformat(timestamp) for timestamp in timestamps], y=scores,
+            mode='lines+markers', name='통합 진실성 점수',
+            line=dict(color='#2E86AB', width=3), marker=dict(size=8)
+        ))
+        fig.add_hline(y=0.99, line_dash="dash", line_color="red", annotation_text="진실성 임계값 (99%)")
+        fig.add_hline(y=0.20, line_dash="dash", line_color="orange", annotation_text="교정 임계값 (20%)")
+        fig.update_layout(title='AI 통합 진실성 트렌드', xaxis_title='시간', yaxis_title='진실성 점수', yaxis=dict(range=[0, 1]))
+
+        self.assertEqual(json.loads(encode_figure(truth_trend_figure(timestamps, scores))), self.encode(fig))
+
+    def test_verification_matches_plotly(self):
+        """탐지기별 감지율 그림이 plotly 로 만든 것과 같은지 테스트"""
+        rates = {'기본 탐지기': 0.3, '메타-진실성': 0.0, '다국어': 1.0}
+
+        fig = go.Figure(data=[go.Bar(x=list(rates.keys()), y=list(rates.values()), marker_color=VERIFICATION_COLORS)])
+        fig.update_layout(title='탐지기별 감지율', xaxis_title='탐지기', yaxis_title='감지율',
+                          yaxis=dict(range=[0, 1]), xaxis_tickangle=-45)
+
+        self.assertEqual(json.loads(encode_figure(verification_figure(rates))), self.encode(fig))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대시보드 실시간 피드 테스트
+기록 추가 변경분 묶음 발송, 발송 간격 제한, 초기화 알림 검증
+"""
+
+import time
+import threading
+import unittest
+from dashboard_feed import DashboardFeed
+from history_store import HistoryStore
+from test_support import make_record
+
+class TestDashboardFeed(unittest.TestCase):
+    """대시보드 실시간 피드 테스트"""
+
+    def setUp(self):
+        self.sent = []
+        self.delivered = threading.Event()
+        self.history = HistoryStore(capacity=100)
+
+    def emit(self, event, data, room):
+        self.sent.append((event, data, room, time.monotonic()))
+        self.delivered.set()
+
+    def create_feed(self, **kwargs):
+        feed = DashboardFeed(self.emit, lambda: {'statistics': {'total_analyses': len(self.history)}},
+                             room='dashboard', **kwargs)
+        self.history.subscribe(feed)
+        self.addCleanup(feed.close)
+        return feed
+
+    def wait_for_updates(self, count):
+        deadline = time.monotonic() + 5
+        while len(self.sent) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.sent), count)
+
+    def test_appends_are_batched(self):
+        """간격 안에 추가된 기록이 한 번의 변경분으로 발송되는지 테스트"""
+        feed = self.create_feed(min_interval=0.2)
+        feed._last_sent = time.monotonic()      # 첫 발송도 간격 뒤로 미뤄 부하가 있어도 한 묶음으로 발송
+        for index in range(7):
+            self.history.append(make_record(index, pun=index % 2 == 0))
+
+        self.wait_for_updates(1)
+        event, data, room, _ = self.sent[0]
+        self.assertEqual((event, room), ('dashboard_update', 'dashboard'))
+        self.assertEqual(data['records'], 7)
+        self.assertEqual(data['statistics'], {'total_analyses': 7})
+        self.assertEqual([point['truth_percentage'] for point in data['trend_points']], [i / 100 for i in range(7)])
+        self.assertFalse(data['resync'])
+
+        # 최근 행은 표에 필요한 필드만
+        self.assertEqual([row['statement'] for row in data['recent_rows']], [f'문장 {i}' for i in range(2, 7)])
+        self.assertNotIn('basic_analysis', data['recent_rows'][0])
+        self.assertEqual(data['recent_rows'][0]['puns_analysis'], {'is_pun_detected': True})
+
+    def test_min_interval(self):
+        """연속 발송 사이에 최소 간격이 지켜지는지 테스트"""
+        self.create_feed(min_interval=0.3)
+        self.history.append(make_record(1))
+        self.wait_for_updates(1)
+        self.history.append(make_record(2))
+        self.wait_for_updates(2)
+
+        self.assertGreaterEqual(self.sent[1][3] - self.sent[0][3], 0.25)
+        self.assertEqual(self.sent[1][1]['records'], 1)
+
+    def test_overflow_requests_resync(self):
+        """한 번에 너무 많은 기록이 쌓이면 전체 다시 읽기를 요청하는지 테스트"""
+        self.create_feed(min_interval=0.2, max_points=3)
+        for index in range(10):
+            self.history.append(make_record(index))
+
+        self.wait_for_updates(1)
+        data = self.sent[0][1]
+        self.assertTrue(data['resync'])
+        self.assertEqual(data['trend_points'], [])
+        self.assertEqual(data['records'], 10)
+
+    def test_clear_discards_pending(self):
+        """히스토리 초기화 시 대기 중 변경분을 버리고 초기화 알림을 보내는지 테스트"""
+        self.create_feed(min_interval=10.0)
+        self.history.append(make_record(1))
+        self.wait_for_updates(1)
+
+        self.history.append(make_record(2))     # 다음 발송까지 대기
+        self.history.clear()
+        self.wait_for_updates(2)
+        self.assertEqual(self.sent[1][0], 'dashboard_reset')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지연 로딩 탐지기 레지스트리 테스트
+첫 사용 시 생성, 동시 요청 단일 생성, 워밍업, 기동 시간 보고서, 대리 객체 피클 검증
+"""
+
+import pickle
+import threading
+import unittest
+from detector_registry import DetectorRegistry
+
+class TestDetectorRegistry(unittest.TestCase):
+    """탐지기 레지스트리 테스트"""
+
+    def test_built_on_first_use(self):
+        """첫 속성 접근 시 생성 테스트"""
+        registry = DetectorRegistry()
+        proxy = registry.register('ordered', 'collections', 'OrderedDict', [('a', 1)])
+
+        self.assertFalse(registry.is_loaded('ordered'))
+        self.assertEqual(proxy.get('a'), 1)
+        self.assertTrue(registry.is_loaded('ordered'))
+        self.assertIs(registry.get('ordered'), registry.get('ordered'))
+
+    def test_proxy_pickles_without_registry(self):
+        """대리 객체가 레지스트리(잠금) 없이 피클되는지 테스트"""
+        registry = DetectorRegistry()
+        proxy = registry.register('ordered_pickle', 'collections', 'OrderedDict', [('a', 1)])
+
+        restored = pickle.loads(pickle.dumps(proxy))
+        again = pickle.loads(pickle.dumps(proxy))
+
+        self.assertEqual(restored.get('a'), 1)
+        self.assertIs(restored._registry.get('ordered_pickle'), again._registry.get('ordered_pickle'))
+        self.assertFalse(registry.is_loaded('ordered_pickle'))
+
+    def test_concurrent_first_use_builds_once(self):
+        """동시 첫 사용 시 한 번만 생성하는지 테스트"""
+        registry = DetectorRegistry()
+        registry.register('counter', 'collections', 'Counter')
+        instances = []
+
+        threads = [threading.Thread(target=lambda: instances.append(registry.get('counter'))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(instance) for instance in instances}), 1)
+
+    def test_warm_up_and_report(self):
+        """백그라운드 워밍업과 기동 시간 보고서 테스트"""
+        registry = DetectorRegistry()
+        registry.register('counter', 'collections', 'Counter')
+        registry.register('broken', 'collections', 'no_such_factory')
+        registry.record_phase('app.imports', 0.25)
+
+        registry.warm_up(background=True).join()
+        report = registry.startup_report()
+
+        self.assertEqual(report['loaded'], 1)
+        self.assertEqual(report['registered'], 2)
+        self.assertEqual(report['phases_ms'], {'app.imports': 250.0})
+        self.assertIn('collections', report['imports_ms'])
+        self.assertIsNotNone(report['detectors']['counter']['init_ms'])
+        self.assertEqual(report['detectors']['counter']['loaded_by'], 'detector-warmup')
+        self.assertFalse(report['detectors']['broken']['loaded'])
+        self.assertIn('no_such_factory', report['detectors']['broken']['error'])
+        self.assertFalse(report['warming_up'])
+
+    def test_duplicate_name_rejected(self):
+        """중복 등록 거부 테스트"""
+        registry = DetectorRegistry()
+        registry.register('counter', 'collections', 'Counter')
+
+        with self.assertRaises(ValueError):
+            registry.register('counter', 'collections', 'Counter')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+탐지기 병렬 실행 스케줄러 테스트
+의존성 순서, 탐지기별 제한 시간 (풀 대기 시간 제외), 부분 결과 처리, 멈춘 작업자 교체 검증
+"""
+
+import time
+import threading
+import unittest
+from ai_truth_detector import TruthDetector
+from analysis_context import AnalysisContext
+from detector_scheduler import DetectorScheduler, DetectorTask
+
+class TestDetectorScheduler(unittest.TestCase):
+    """탐지기 스케줄러 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.scheduler = DetectorScheduler(max_workers=4, default_timeout=2.0)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.scheduler.shutdown()
+
+    def test_independent_tasks_run_in_parallel(self):
+        """독립 작업 병렬 실행 테스트"""
+        tasks = [DetectorTask(f'task{i}', lambda x: time.sleep(0.2) or x) for i in range(4)]
+
+        start_time = time.monotonic()
+        results = self.scheduler.run(tasks, 'ok')
+        elapsed = time.monotonic() - start_time
+
+        self.assertLess(elapsed, 0.6)
+        self.assertTrue(all(result.value == 'ok' for result in results.values()))
+        self.assertTrue(all(result.latency >= 0.2 for result in results.values()))
+
+    def test_dependencies_run_in_order(self):
+        """의존성 순서 테스트"""
+        order = []
+        lock = threading.Lock()
+
+        def record(name):
+            def run():
+                with lock:
+                    order.append(name)
+                return name
+            return run
+
+        tasks = [
+            DetectorTask('compound', record('compound'), ('basic', 'context')),
+            DetectorTask('context', record('context'), ('basic',)),
+            DetectorTask('basic', record('basic'))
+        ]
+        results = self.scheduler.run(tasks)
+
+        self.assertEqual(order, ['basic', 'context', 'compound'])
+        self.assertEqual(list(results), ['compound', 'context', 'basic'])
+
+    def test_timeout_returns_partial_results(self):
+        """제한 시간 초과 시 부분 결과 테스트"""
+        tasks = [
+            DetectorTask('fast', lambda: 'fast'),
+            DetectorTask('slow', lambda: time.sleep(1.0), timeout=0.1),
+            DetectorTask('after_slow', lambda: 'never', ('slow',))
+        ]
+
+        start_time = time.monotonic()
+        results = self.scheduler.run(tasks)
+        elapsed = time.monotonic() - start_time
+
+        self.assertLess(elapsed, 0.8)
+        self.assertEqual(results['fast'].value, 'fast')
+        self.assertTrue(results['slow'].timed_out)
+        self.assertTrue(results['after_slow'].skipped)
+        self.assertTrue(results['slow'].to_dict()['timed_out'])
+
+    def test_queue_wait_does_not_count_against_timeout(self):
+        """풀 대기 시간이 제한 시간에 포함되지 않는지 테스트"""
+        scheduler = DetectorScheduler(max_workers=1, default_timeout=0.3)
+        self.addCleanup(scheduler.shutdown)
+        tasks = [DetectorTask(f'task{i}', lambda: time.sleep(0.1) or 'ok') for i in range(5)]
+
+        results = scheduler.run(tasks)
+
+        self.assertTrue(all(result.value == 'ok' for result in results.values()))
+
+    def test_stuck_workers_replace_executor(self):
+        """제한 시간 초과 작업이 작업자를 점유하면 실행기를 교체하는지 테스트"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        tasks = [DetectorTask(f'stuck{i}', lambda: release.wait(2.0), timeout=0.05) for i in range(2)]
+
+        first = self.scheduler.executor
+        results = self.scheduler.run(tasks)
+
+        self.assertTrue(all(result.timed_out for result in results.values()))
+        self.assertIsNot(self.scheduler.executor, first)
+        self.assertEqual(self.scheduler.run([DetectorTask('fast', lambda: 'fast', timeout=0.5)])['fast'].value, 'fast')
+
+    def test_error_is_isolated(self):
+        """탐지기 오류 격리 테스트"""
+        def fail():
+            raise RuntimeError("탐지 실패")
+
+        results = self.scheduler.run([DetectorTask('broken', fail), DetectorTask('ok', lambda: 1)])
+
+        self.assertEqual(results['broken'].error, "탐지 실패")
+        self.assertFalse(results['broken'].ok)
+        self.assertEqual(results['ok'].value, 1)
+
+    def test_invalid_graph(self):
+        """잘못된 의존성 그래프 테스트"""
+        with self.assertRaises(ValueError):
+            self.scheduler.run([DetectorTask('a', lambda: 1, ('missing',))])
+        with self.assertRaises(ValueError):
+            self.scheduler.run([DetectorTask('a', lambda: 1, ('b',)), DetectorTask('b', lambda: 1, ('a',))])
+
+    def test_shared_analysis_context_runs_primary_once(self):
+        """병렬 탐지기가 기본 분석을 한 번만 수행하는지 테스트"""
+        analysis_context = AnalysisContext("지구는 평평하다.", "", TruthDetector())
+        tasks = [DetectorTask(f'wrapper{i}', lambda ctx: ctx.analyze()) for i in range(8)]
+
+        results = self.scheduler.run(tasks, analysis_context)
+        analyses = {id(result.value) for result in results.values()}
+
+        self.assertEqual(len(analyses), 1)
+        self.assertEqual(analysis_context.primary_analysis_count, 1)
+        self.assertEqual(analysis_context.primary_cache_hits, 7)
+
+class TestProcessExecutor(unittest.TestCase):
+    """프로세스 풀 실행 테스트"""
+
+    def test_registered_detectors_run_in_process_pool(self):
+        """등록된 탐지기로 통합 분석 작업을 프로세스 풀에서 실행하는지 테스트"""
+        import app
+        statement = "지구는 평평하다."
+        scheduler = DetectorScheduler(max_workers=2, executor_type='process', default_timeout=60.0)
+        self.addCleanup(scheduler.shutdown)
+
+        results = scheduler.run(app.ANALYSIS_TASKS, statement, "", AnalysisContext(statement, "", app.detector))
+
+        self.assertEqual({name: result.error for name, result in results.items() if not result.ok}, {})
+        self.assertEqual(results['basic'].value.statement, statement)
+
+if __name__ == "__main__":
+    unittest.main()
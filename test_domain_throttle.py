@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+도메인별 요청 속도 조절 테스트
+토큰 버킷 간격, 도메인별 설정, Retry-After/지수 백오프, 마감 시각 검증
+"""
+
+import unittest
+from email.utils import formatdate
+from domain_throttle import DomainThrottle, parse_retry_after
+
+class FakeClock:
+    """sleep 하면 시각만 앞으로 가는 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+class TestDomainThrottle(unittest.TestCase):
+    """도메인별 요청 속도 조절 테스트"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def create_throttle(self, **kwargs):
+        return DomainThrottle(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_token_bucket(self):
+        """버스트만큼은 바로, 그 뒤로는 1/rate 간격으로 차례가 오는지 테스트"""
+        throttle = self.create_throttle(rate=2.0, burst=3, rates={})
+        waits = [throttle.reserve('example.com') for _ in range(6)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertEqual(waits[3:], [0.5, 1.0, 1.5])
+
+        # 다른 도메인은 따로 계산
+        self.assertEqual(throttle.reserve('example.org'), 0.0)
+
+        # 시간이 지나면 토큰이 다시 차지만 버스트를 넘지 않음
+        self.clock.now += 100
+        self.assertEqual([throttle.reserve('example.com') for _ in range(4)], [0.0, 0.0, 0.0, 0.5])
+
+    def test_domain_rates(self):
+        """도메인별 설정이 하위 도메인에도 적용되는지 테스트"""
+        throttle = self.create_throttle(rate=10.0, burst=10, rates={'google.com': (1.0, 1)})
+        self.assertEqual([throttle.reserve('www.google.com') for _ in range(3)], [0.0, 1.0, 2.0])
+        self.assertEqual(throttle.reserve('WWW.Google.com'), 3.0)
+        self.assertEqual(throttle.reserve('notgoogle.com'), 0.0)
+
+    def test_backoff(self):
+        """Retry-After 를 따르고, 없으면 연속 실패마다 두 배로 미루는지 테스트"""
+        throttle = self.create_throttle(rate=100.0, burst=100, base_backoff=1.0, max_backoff=5.0)
+        self.assertEqual(throttle.backoff('example.com', 3.0), 3.0)
+        self.assertAlmostEqual(throttle.reserve('example.com'), 3.0)
+
+        self.assertEqual([throttle.backoff('example.com') for _ in range(4)], [2.0, 4.0, 5.0, 5.0])
+        throttle.record_success('example.com')
+        self.assertEqual(throttle.backoff('example.com'), 1.0)
+
+    def test_deadline(self):
+        """마감 시각까지 차례가 오지 않으면 예약하지 않는지 테스트"""
+        throttle = self.create_throttle(rate=1.0, burst=1, rates={})
+        self.assertTrue(throttle.acquire('example.com'))
+        self.assertFalse(throttle.acquire('example.com', deadline=self.clock.now + 0.5))
+        self.assertEqual(self.clock.now, 1000.0)
+        self.assertTrue(throttle.acquire('example.com', deadline=self.clock.now + 1.0))
+        self.assertEqual(self.clock.now, 1001.0)
+
+    def test_parse_retry_after(self):
+        """Retry-After 초/HTTP 날짜 해석 테스트"""
+        self.assertEqual(parse_retry_after('120'), 120.0)
+        self.assertAlmostEqual(parse_retry_after(formatdate(1_000_030, usegmt=True), now=1_000_000), 30.0)
+        self.assertIsNone(parse_retry_after('곧'))
+        self.assertIsNone(parse_retry_after(None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BERT 임베딩 서비스 테스트
+마이크로 배치 묶음, 메모리 맵 float16 캐시 재사용/영속성, 링 버퍼 덮어쓰기 검증
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import numpy as np
+from embedding_service import EmbeddingService, EmbeddingStore, text_key
+
+class FakeBackend:
+    """문장 길이로 벡터를 만드는 테스트용 백엔드 (호출 배치 크기 기록)"""
+
+    name = 'fake'
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts):
+        self.batches.append(len(texts))
+        return np.array([[len(text), 0.5, -1.0, 2.0] for text in texts], dtype=np.float32)
+
+class TestEmbeddingService(unittest.TestCase):
+    """임베딩 서비스 테스트"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'embeddings.npy')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_embed_and_cache(self):
+        """추론 결과와 캐시 재사용 테스트"""
+        backend = FakeBackend()
+        service = EmbeddingService(backend, store=EmbeddingStore(self.path, dim=4), dim=4)
+
+        first = service.embed(['가', '나다', '가'])
+        second = service.embed(['나다'])
+        service.close()
+
+        np.testing.assert_array_equal(first[:, 0], [1, 2, 1])
+        np.testing.assert_array_equal(second, first[1:2])
+        self.assertEqual(sum(backend.batches), 2)
+        self.assertEqual(service.stats()['cache_hits'], 1)
+
+    def test_concurrent_requests_share_batches(self):
+        """동시 요청이 마이크로 배치로 묶이는지 테스트"""
+        backend = FakeBackend()
+        service = EmbeddingService(backend, dim=4, max_batch_size=64, max_wait_ms=50)
+        results = {}
+
+        def request(index):
+            results[index] = service.embed([f"문장 {index}" * (index + 1)])
+
+        threads = [threading.Thread(target=request, args=(index,)) for index in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        service.close()
+
+        self.assertEqual(sum(backend.batches), 32)
+        self.assertLess(len(backend.batches), 32)
+        self.assertEqual(results[3][0, 0], len("문장 3" * 4))
+
+    def test_store_persists_and_wraps(self):
+        """저장소 재시작 후 유지 및 용량 초과 시 오래된 행 덮어쓰기 테스트"""
+        store = EmbeddingStore(self.path, dim=4, capacity=2)
+        keys = [text_key(text) for text in ('a', 'b', 'c')]
+        for index, key in enumerate(keys):
+            store.put_many({key: np.full(4, index, dtype=np.float32)})
+        store.flush()
+
+        reopened = EmbeddingStore(self.path, dim=4, capacity=2)
+        cached = reopened.get_many(keys)
+
+        self.assertEqual(len(reopened), 2)
+        self.assertNotIn(keys[0], cached)
+        np.testing.assert_array_equal(cached[keys[2]], np.full(4, 2, dtype=np.float32))
+
+        reopened.put_many({text_key('d'): np.zeros(4, dtype=np.float32)})
+        self.assertNotIn(keys[1], reopened.get_many(keys))
+
+    def test_rows_overwritten_by_other_process_are_misses(self):
+        """다른 프로세스가 같은 파일에 덮어쓴 행은 미스로 처리하는지 테스트"""
+        first = EmbeddingStore(self.path, dim=4, capacity=2)
+        second = EmbeddingStore(self.path, dim=4, capacity=2)
+        keys = [text_key(text) for text in ('a', 'b', 'c', 'd')]
+        first.put_many({keys[0]: np.zeros(4, dtype=np.float32), keys[1]: np.ones(4, dtype=np.float32)})
+
+        # 두 번째 저장소는 파일의 마지막 기록 위치에서 이어 써서 가장 오래된 행부터 덮어씀
+        second.put_many({keys[2]: np.full(4, 2, dtype=np.float32)})
+        cached = first.get_many(keys)
+
+        self.assertEqual(list(cached), [keys[1]])
+        np.testing.assert_array_equal(cached[keys[1]], np.ones(4, dtype=np.float32))
+        self.assertEqual(len(first), 1)
+
+        first.put_many({keys[3]: np.full(4, 3, dtype=np.float32)})
+        self.assertEqual(list(second.get_many(keys)), [keys[2]])
+        self.assertNotIn(keys[1], first.get_many(keys))
+
+    def test_backend_error_propagates(self):
+        """추론 실패 시 대기 중인 요청에 예외 전달 테스트"""
+        class BrokenBackend:
+            def encode(self, texts):
+                raise RuntimeError("추론 실패")
+
+        service = EmbeddingService(BrokenBackend(), dim=4)
+        with self.assertRaises(RuntimeError):
+            service.embed(['가'])
+        service.close()
+        self.assertEqual(service.stats()['errors'], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 결과 스트리밍 내보내기 테스트
+중첩 결과 펼치기, CSV 열 구성, JSON 형태, 시각 구간 필터와 조각 단위 순회 검증
+"""
+
+import csv
+import io
+import json
+import unittest
+import export_stream
+from export_stream import ExportSchema, flatten_record, iter_csv, iter_json
+from history_store import HistoryStore
+from test_support import BASE, make_record
+
+class TestExportStream(unittest.TestCase):
+    """분석 결과 스트리밍 내보내기 테스트"""
+
+    def test_flatten_record(self):
+        """중첩 dict 는 점 이름 열, 목록은 JSON 문자열로 펼치는지 테스트"""
+        flat = flatten_record(make_record(3, lies=['과장'], context=None))
+        self.assertEqual(flat['final_analysis.truth_percentage'], 0.03)
+        self.assertEqual(json.loads(flat['basic_analysis.detected_lies']), ['과장'])
+        self.assertIsNone(flat['context'])
+        self.assertNotIn('final_analysis', flat)
+
+    def test_csv_columns(self):
+        """기록마다 다른 열을 합쳐 헤더를 만들고 앞쪽 열 순서를 지키는지 테스트"""
+        records = [make_record(1, pun=None), make_record(2, pun=True)]
+        schema = ExportSchema.scan(records)
+        self.assertEqual(schema.kind('final_analysis.truth_percentage'), 'float')
+        self.assertEqual(schema.kind('final_analysis.needs_correction'), 'bool')
+
+        rows = list(csv.DictReader(io.StringIO(''.join(iter_csv(records, schema)))))
+        self.assertEqual(schema.columns[:3], ['id', 'timestamp', 'statement'])
+        self.assertEqual([row['puns_analysis.is_pun_detected'] for row in rows], ['', 'True'])
+        self.assertEqual(rows[1]['final_analysis.truth_percentage'], '0.02')
+
+    def test_json_envelope(self):
+        """스트리밍 JSON 이 기존 응답 형태와 같은 필드를 갖는지 테스트"""
+        records = [make_record(index) for index in range(3)]
+        body = json.loads(''.join(iter_json(records, {'success': True, 'export_format': 'json'})))
+        self.assertEqual(body['data'], records)
+        self.assertEqual(body['total_records'], 3)
+        self.assertTrue(body['success'])
+        self.assertEqual(json.loads(''.join(iter_json([], {})))['data'], [])
+
+    def test_history_iter_records(self):
+        """시각 구간, limit, 밀려난 기록 제외, 순회 중 추가 무시, 끝 순번 고정 테스트"""
+        history = HistoryStore(capacity=100)
+        for index in range(150):
+            history.append(make_record(index))
+
+        self.assertEqual([r['id'] for r in history.iter_records(chunk_size=7)], [str(i) for i in range(50, 150)])
+        self.assertEqual([r['id'] for r in history.iter_records(limit=3)], ['147', '148', '149'])
+        ranged = history.iter_records(start=BASE + 60, end=BASE + 64.5)
+        self.assertEqual([r['id'] for r in ranged], [str(i) for i in range(60, 65)])
+
+        records = history.iter_records(chunk_size=10)
+        first = next(records)
+        for index in range(150, 170):       # 순회 중 추가 → 이미 꺼낸 조각 뒤의 밀려난 기록은 건너뛰고 새 기록은 대상 아님
+            history.append(make_record(index))
+        rest = [r['id'] for r in records]
+        self.assertEqual(first['id'], '50')
+        self.assertEqual(rest, [str(i) for i in range(51, 60)] + [str(i) for i in range(70, 150)])
+
+        # 끝 순번을 고정하면 그 뒤에 추가된 기록은 나중에 순회해도 포함하지 않음
+        stop = history.sequence
+        history.append(make_record(170))
+        self.assertEqual([r['id'] for r in history.iter_records(limit=2, stop=stop)], ['168', '169'])
+        self.assertEqual(history.sequence, 171)
+
+    def test_csv_chunks(self):
+        """CSV 가 ROWS_PER_CHUNK 행 단위로 나뉘어 생성되는지 테스트"""
+        records = [make_record(index) for index in range(25)]
+        original = export_stream.ROWS_PER_CHUNK
+        export_stream.ROWS_PER_CHUNK = 10
+        try:
+            chunks = list(iter_csv(records, ExportSchema.scan(records)))
+        finally:
+            export_stream.ROWS_PER_CHUNK = original
+        self.assertEqual([chunk.count('\n') for chunk in chunks], [11, 10, 5])
+
+if __name__ == '__main__':
+    unittest.main()
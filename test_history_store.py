@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 히스토리 저장소 테스트
+링 버퍼 용량 유지, 제거 시 집계 감소, 전체 순회 결과와의 일치 검증
+"""
+
+import random
+import unittest
+from history_store import FLAG_COUNTERS, HistoryStore
+from test_support import make_record
+
+class TestHistoryStore(unittest.TestCase):
+    """분석 히스토리 저장소 테스트"""
+
+    def test_capacity_and_recent_order(self):
+        """용량 유지 및 최근 기록 순서 테스트"""
+        history = HistoryStore(capacity=3)
+        for index in range(5):
+            history.append(make_record(index))
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual([r['id'] for r in history], ['2', '3', '4'])
+        self.assertEqual([r['id'] for r in history.recent(2)], ['3', '4'])
+        self.assertEqual([r['id'] for r in history.recent(10)], ['2', '3', '4'])
+
+    def test_eviction_decrements_counters(self):
+        """가장 오래된 기록 제거 시 카운터 감소 테스트"""
+        history = HistoryStore(capacity=2)
+        history.append(make_record(1, needs_correction=True, pun=True, languages=('ko', 'en')))
+        history.append(make_record(2))
+        self.assertEqual(history.flag_count('lies_detected'), 1)
+
+        history.append(make_record(3))
+        stats = history.stats()
+
+        self.assertEqual(stats['flags']['lies_detected'], 0)
+        self.assertEqual(stats['flags']['puns_detected'], 0)
+        self.assertEqual(stats['languages_used'], 0)
+        self.assertAlmostEqual(stats['average_truth'], 0.025)
+        self.assertEqual(stats['sections']['puns_analysis'], {'detected': 0, 'total': 2})
+
+    def test_stats_match_full_scan(self):
+        """증분 집계와 전체 순회 결과 일치 테스트"""
+        rng = random.Random(7)
+        history = HistoryStore(capacity=50)
+        for index in range(500):
+            history.append(make_record(
+                rng.randint(0, 100),
+                needs_correction=rng.random() < 0.3,
+                pun=rng.random() < 0.2,
+                languages=rng.sample(['ko', 'en', 'ja'], rng.randint(0, 3))
+            ))
+
+        records = list(history)
+        stats = history.stats()
+        for name, extract in FLAG_COUNTERS.items():
+            self.assertEqual(stats['flags'][name], sum(1 for r in records if extract(r)), name)
+        self.assertAlmostEqual(stats['truth_sum'], sum(r['final_analysis']['truth_percentage'] for r in records))
+        self.assertEqual(stats['languages_used'], sum(len(r['multilingual_analysis']['detected_languages']) for r in records))
+
+    def test_clear(self):
+        """초기화 테스트"""
+        history = HistoryStore(capacity=2)
+        history.append(make_record(1, needs_correction=True))
+        history.clear()
+
+        self.assertEqual(len(history), 0)
+        self.assertEqual(history.recent(5), [])
+        self.assertEqual(history.stats()['flags']['lies_detected'], 0)
+
+    def test_version_changes_with_content(self):
+        """기록 추가/초기화 때만 버전(ETag)이 바뀌는지 테스트"""
+        history = HistoryStore(capacity=2)
+        etags = [history.etag]
+        for index in range(3):
+            history.append(make_record(index))
+            etags.append(history.etag)
+        history.recent(2)
+        history.stats()
+        self.assertEqual(history.etag, etags[-1])
+
+        history.clear()
+        etags.append(history.etag)
+        self.assertEqual(len(set(etags)), len(etags))
+        self.assertNotEqual(HistoryStore(capacity=2).etag, HistoryStore(capacity=2).etag)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 HTML 본문 텍스트 추출 테스트
+script/style 건너뛰기, 텍스트가 모이면 읽기 중단, 바이트 상한, 문자 인코딩 검증
+"""
+
+import unittest
+from bs4 import BeautifulSoup
+from requests.structures import CaseInsensitiveDict
+from html_text import extract_chunks, extract_visible_text, read_visible_text
+
+PAGE = b"""<html><head><title>Earth</title><style>body { color: red }</style>
+<script>var hidden = "<p>not text</p>";</script></head>
+<body><h1>The   Earth</h1><p>is <b>round</b>.</p><noscript>enable js</noscript>
+<script type="text/template"><div>template</div></script><p>Third planet.</p></body></html>"""
+
+class FakeResponse:
+    """iter_content 로 읽힌 조각 수를 세는 스트리밍 응답"""
+
+    def __init__(self, chunks, content_type='text/html'):
+        self.chunks = chunks
+        self.read = 0
+        self.closed = False
+        self.headers = CaseInsensitiveDict({'Content-Type': content_type})
+
+    def iter_content(self, chunk_size):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+class TestHTMLText(unittest.TestCase):
+    """스트리밍 HTML 본문 텍스트 추출 테스트"""
+
+    def test_visible_text(self):
+        """script/style/noscript 내용을 빼고 공백을 줄인 텍스트를 반환하는지 테스트"""
+        text = extract_visible_text(PAGE)
+        self.assertEqual(text, 'Earth The Earth is round. Third planet.')
+
+        # BeautifulSoup 로 script/style 을 지운 결과와 같은 글자 (블록 경계의 공백만 다름)
+        soup = BeautifulSoup(PAGE, 'html.parser')
+        for tag in soup(['script', 'style', 'noscript']):
+            tag.decompose()
+        self.assertEqual(''.join(text.split()), ''.join(soup.get_text().split()))
+
+    def test_stops_when_enough_text(self):
+        """텍스트가 max_chars 자 모이면 나머지 조각을 읽지 않는지 테스트"""
+        chunks = [b'<html><body>'] + [b'<p>' + b'word ' * 200 + b'</p>' for _ in range(1000)]
+        response = FakeResponse(chunks)
+        text, consumed = read_visible_text(response, max_chars=2000)
+        self.assertEqual(len(text), 2000)
+        self.assertLess(response.read, 10)
+        self.assertLess(len(consumed), 10 * 1024)
+        self.assertTrue(response.closed)
+
+    def test_byte_cap(self):
+        """보이는 텍스트가 없어도 max_bytes 이상 읽지 않는지 테스트"""
+        chunks = [b'<html><body><script>'] + [b'x = 1;' * 1000] * 1000 + [b'</script><p>late</p></body></html>']
+        text, consumed = extract_chunks(iter(chunks), max_chars=2000, max_bytes=64 * 1024)
+        self.assertEqual(text, '')
+        self.assertEqual(len(consumed), 64 * 1024)
+
+    def test_encoding(self):
+        """Content-Type charset 과 meta charset 으로 한국어를 해석하는지 테스트"""
+        body = '<html><body><p>지구는 둥글다</p></body></html>'.encode('euc-kr')
+        text, _ = read_visible_text(FakeResponse([body[:20], body[20:]], 'text/html; charset=EUC-KR'))
+        self.assertEqual(text, '지구는 둥글다')
+
+        meta = '<html><head><meta charset="euc-kr"></head><body><p>물은 100도에서 끓는다</p></body></html>'
+        self.assertEqual(extract_visible_text(meta.encode('euc-kr')), '물은 100도에서 끓는다')
+        self.assertEqual(extract_visible_text('<p>달</p>'.encode('utf-8')), '달')
+        self.assertEqual(extract_visible_text(b''), '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공유 이벤트 루프 실행기 및 검증/신뢰도 동기 경로 테스트
+"""
+
+import asyncio
+import threading
+import unittest
+import contextvars
+from loop_runner import LoopRunner
+from advanced_validation_system import AdvancedValidationSystem, AnalysisRequest, ValidationLevel
+from advanced_confidence_system import AdvancedConfidenceSystem, validate_and_score
+
+request_var = contextvars.ContextVar('request_var')
+
+class TestLoopRunner(unittest.TestCase):
+    """공유 이벤트 루프 실행기 테스트"""
+
+    def setUp(self):
+        self.runner = LoopRunner()
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def test_single_loop_shared_by_threads(self):
+        """여러 스레드가 같은 루프를 쓰고 호출 스레드의 컨텍스트 변수를 보는지 테스트"""
+        async def current(value):
+            await asyncio.sleep(0.01)
+            return asyncio.get_running_loop(), request_var.get()
+
+        results = []
+
+        def worker(value):
+            request_var.set(value)
+            results.append((value, self.runner.run(current(value))))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(loop) for _, (loop, _) in results}), 1)
+        self.assertTrue(all(value == seen for value, (_, seen) in results))
+
+    def test_exception_and_timeout(self):
+        """코루틴 예외 전달 및 시간 초과 테스트"""
+        async def broken():
+            raise ValueError("실패")
+
+        async def slow():
+            await asyncio.sleep(5)
+
+        with self.assertRaises(ValueError):
+            self.runner.run(broken())
+        with self.assertRaises(TimeoutError):
+            self.runner.run(slow(), timeout=0.05)
+
+class TestValidationFastPath(unittest.TestCase):
+    """검증/신뢰도 동기 경로 테스트"""
+
+    def test_sync_matches_async(self):
+        """동기 경로와 코루틴 경로의 결과 일치 테스트"""
+        validation_system = AdvancedValidationSystem()
+        confidence_system = AdvancedConfidenceSystem()
+        request = AnalysisRequest(
+            statement="연구에 따르면 지구는 둥글다.",
+            context="과학적 사실",
+            analysis_mode='all',
+            validation_level=ValidationLevel.STRICT
+        )
+        analysis_result = {'final_analysis': {'truth_percentage': 0.9, 'confidence': 0.8, 'needs_correction': False}}
+
+        expected = asyncio.run(validation_system.validate_request(request))
+        expected_score = asyncio.run(AdvancedConfidenceSystem().evaluate_confidence(
+            request.statement, request.context, analysis_result, expected.__dict__
+        ))
+        validation_result, confidence_score = validate_and_score(
+            validation_system, confidence_system, request, analysis_result
+        )
+
+        self.assertEqual(validation_result.errors, expected.errors)
+        self.assertEqual(validation_result.warnings, expected.warnings)
+        self.assertEqual(validation_result.confidence, expected.confidence)
+        self.assertEqual(confidence_score.sources, expected_score.sources)
+        self.assertEqual(confidence_score.overall, expected_score.overall)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실시간 알림 발송기 테스트
+방별 묶음 발송, 대기 알림 상한, 느린 방 다운샘플링(다른 방은 막지 않음), 분석 대기열 통계 검증
+"""
+
+import time
+import threading
+import unittest
+from notification_dispatcher import NotificationDispatcher
+
+class TestNotificationDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.sent = []
+        self.lock = threading.Lock()
+
+    def emit(self, event, data, room):
+        with self.lock:
+            self.sent.append((event, data, room))
+
+    def create(self, emit=None, **kwargs):
+        dispatcher = NotificationDispatcher(emit or self.emit, **kwargs)
+        self.addCleanup(dispatcher.close, 1.0)
+        return dispatcher
+
+    def wait_for(self, condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_coalesces_per_room(self):
+        dispatcher = self.create(batch_window=0.05)
+        for i in range(3):
+            dispatcher.submit({'id': i})
+        dispatcher.submit({'id': 'admin'}, room='admin')
+
+        self.assertTrue(self.wait_for(lambda: len(self.sent) == 2))
+        batches = {room: data for event, data, room in self.sent}
+        self.assertEqual([n['id'] for n in batches[None]['notifications']], [0, 1, 2])
+        self.assertEqual(batches['admin']['count'], 1)
+        self.assertEqual({event for event, _, _ in self.sent}, {'notification_batch'})
+        stats = dispatcher.stats()
+        self.assertEqual((stats['batches'], stats['sent'], stats['rooms']), (2, 4, 0))
+
+    def test_pending_limit_drops_oldest(self):
+        dispatcher = self.create(batch_window=0.1, max_pending=5)
+        for i in range(8):
+            dispatcher.submit({'id': i})
+        self.assertTrue(self.wait_for(lambda: self.sent))
+        data = self.sent[0][1]
+        self.assertEqual([n['id'] for n in data['notifications']], [3, 4, 5, 6, 7])
+        self.assertEqual(data['dropped'], 3)
+
+    def test_slow_room_is_downsampled_without_blocking_others(self):
+        release = threading.Event()
+
+        def emit(event, data, room):
+            if room == 'slow':
+                release.wait(2.0)
+            self.emit(event, data, room)
+
+        dispatcher = self.create(emit, batch_window=0.01, slow_threshold=0.05, slow_interval=0.05, slow_batch=2)
+        dispatcher.submit({'id': 'first'}, room='slow')
+        time.sleep(0.05)
+        for i in range(5):
+            dispatcher.submit({'id': i}, room='slow')
+        dispatcher.submit({'id': 'fast'}, room='fast')
+
+        # 느린 방 발송이 막혀 있어도 다른 방은 바로 발송
+        self.assertTrue(self.wait_for(lambda: any(room == 'fast' for _, _, room in self.sent)))
+        release.set()
+        self.assertTrue(self.wait_for(lambda: sum(1 for _, _, room in self.sent if room == 'slow') == 2))
+        second = [data for _, data, room in self.sent if room == 'slow'][1]
+        self.assertEqual([n['id'] for n in second['notifications']], [3, 4])
+        self.assertEqual(second['dropped'], 3)
+
+    def test_emit_error_is_counted(self):
+        def emit(event, data, room):
+            raise ConnectionError('disconnected')
+
+        dispatcher = self.create(emit, batch_window=0.01)
+        dispatcher.submit({'id': 1}, room='gone')
+        self.assertTrue(self.wait_for(lambda: dispatcher.stats()['emit_errors'] == 1))
+        self.assertEqual(dispatcher.stats()['slow_rooms'], 1)
+
+class FakeSocketIO:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, data, namespace=None, to=None):
+        self.events.append((event, data, to))
+
+class TestNotificationManager(unittest.TestCase):
+    def test_analysis_notifications_sent_as_one_batch(self):
+        from realtime_notifications import NotificationManager
+        socketio = FakeSocketIO()
+        manager = NotificationManager(socketio, max_queue=1)
+        self.addCleanup(manager.dispatcher.close, 1.0)
+
+        manager.add_analysis_to_queue({'statement': '지구는 평평하다', 'truth_percentage': 10})
+        deadline = time.monotonic() + 2.0
+        while not socketio.events and time.monotonic() < deadline:
+            time.sleep(0.01)
+        event, data, room = socketio.events[0]
+        self.assertEqual((event, room), ('notification_batch', None))
+        self.assertEqual([n['type'] for n in data['notifications']],
+                         ['analysis_start', 'lie_detected', 'analysis_complete'])
+        self.assertIn('dropped_analyses', manager.get_stats())
+
+if __name__ == '__main__':
+    unittest.main()
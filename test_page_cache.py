@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹 연구 페이지 디스크 캐시 테스트
+URL 정규화, 신선도 계산, 캐시 적중 시 요청/파싱 생략, ETag 재검증, 내용 해시 중복 제거, LRU 용량 제한 검증
+"""
+
+import os
+import tempfile
+import unittest
+from requests.structures import CaseInsensitiveDict
+from page_cache import PageCache, freshness_lifetime, normalize_url
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers or {})
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+class FakePool:
+    """URL 별로 정해 둔 응답을 돌려주고 요청 헤더를 기록하는 풀"""
+
+    def __init__(self):
+        self.pages = {}
+        self.requests = []
+
+    def get(self, url, deadline=None, headers=None, stream=False):
+        self.requests.append((url, dict(headers or {})))
+        page = self.pages[url]
+        if page.get('etag') and (headers or {}).get('If-None-Match') == page['etag']:
+            return FakeResponse(304, headers={'ETag': page['etag']})
+        headers = dict(page.get('headers', {}))
+        if page.get('etag'):
+            headers['ETag'] = page['etag']
+        return FakeResponse(page.get('status', 200), page['body'], headers)
+
+class TestPageCache(unittest.TestCase):
+    """웹 연구 페이지 디스크 캐시 테스트"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.pool = FakePool()
+        self.extracted = []
+        self.cache = self.create_cache()
+
+    def create_cache(self, **kwargs):
+        cache = PageCache(self.directory.name, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def extract(self, html):
+        self.extracted.append(html)
+        return html.decode('utf-8').upper()
+
+    def test_normalize_url(self):
+        """URL 정규화 테스트"""
+        self.assertEqual(normalize_url('HTTPS://Example.COM:443/a?b=2&a=1#frag'), 'https://example.com/a?a=1&b=2')
+        self.assertEqual(normalize_url('http://example.com'), 'http://example.com/')
+        self.assertEqual(normalize_url('http://example.com:8080/x'), 'http://example.com:8080/x')
+
+    def test_freshness_lifetime(self):
+        """Cache-Control/Expires/Last-Modified 신선도 계산 테스트"""
+        now = 1_700_000_000.0
+        self.assertIsNone(freshness_lifetime({'Cache-Control': 'private, no-store'}, now, 60))
+        self.assertEqual(freshness_lifetime({'Cache-Control': 'no-cache'}, now, 60), 0.0)
+        self.assertEqual(freshness_lifetime({'Cache-Control': 'public, max-age=300', 'Age': '100'}, now, 60), 200.0)
+        self.assertEqual(freshness_lifetime({'Expires': 'Tue, 14 Nov 2023 22:14:20 GMT',
+                                             'Date': 'Tue, 14 Nov 2023 22:13:20 GMT'}, now, 60), 60.0)
+        self.assertEqual(freshness_lifetime({'Last-Modified': 'Tue, 14 Nov 2023 21:13:20 GMT'}, now, 9999), 360.0)
+        self.assertEqual(freshness_lifetime({}, now, 60), 60)
+
+    def test_fresh_hit_skips_network_and_parsing(self):
+        """신선한 항목은 요청과 텍스트 추출을 모두 생략하는지 테스트"""
+        url = 'https://example.com/wiki/Earth'
+        self.pool.pages[url] = {'body': b'earth is round', 'headers': {'Cache-Control': 'max-age=600'}}
+        self.assertEqual(self.cache.fetch_text(self.pool, url, self.extract), 'EARTH IS ROUND')
+        self.assertEqual(self.cache.fetch_text(self.pool, 'https://EXAMPLE.com/wiki/Earth#top', self.extract), 'EARTH IS ROUND')
+        self.assertEqual((len(self.pool.requests), len(self.extracted)), (1, 1))
+
+        # 다시 연 캐시에서도 유지, 추출 방식이 바뀌면 저장된 HTML 에서만 다시 추출
+        reopened = self.create_cache()
+        self.assertEqual(reopened.fetch_text(self.pool, url, lambda html: 'v2', extractor='v2'), 'v2')
+        self.assertEqual(reopened.fetch_html(self.pool, url), b'earth is round')
+        self.assertEqual(len(self.pool.requests), 1)
+
+    def test_revalidation(self):
+        """신선도가 지나면 ETag 로 재검증하고 304 면 저장된 텍스트를 쓰는지 테스트"""
+        url = 'https://example.com/news'
+        self.pool.pages[url] = {'body': b'news', 'etag': '"v1"', 'headers': {'Cache-Control': 'no-cache'}}
+        self.cache.fetch_text(self.pool, url, self.extract)
+        self.assertEqual(self.cache.fetch_text(self.pool, url, self.extract), 'NEWS')
+        self.assertEqual(self.pool.requests[1][1]['If-None-Match'], '"v1"')
+        self.assertEqual(len(self.extracted), 1)
+        self.assertEqual(self.cache.revalidated, 1)
+
+        # 내용이 바뀌면 새로 저장
+        self.pool.pages[url] = {'body': b'updated', 'etag': '"v2"', 'headers': {'Cache-Control': 'no-cache'}}
+        self.assertEqual(self.cache.fetch_text(self.pool, url, self.extract), 'UPDATED')
+
+    def test_uncacheable_responses(self):
+        """no-store 와 오류 응답은 저장하지 않는지 테스트"""
+        self.pool.pages['https://a.example/'] = {'body': b'secret', 'headers': {'Cache-Control': 'no-store'}}
+        self.pool.pages['https://b.example/'] = {'body': b'missing', 'status': 404}
+        for _ in range(2):
+            self.cache.fetch_text(self.pool, 'https://a.example/', self.extract)
+            self.cache.fetch_text(self.pool, 'https://b.example/', self.extract)
+        self.assertEqual(len(self.pool.requests), 4)
+        self.assertEqual(self.cache.total_bytes, 0)
+        with self.assertRaises(RuntimeError):
+            self.cache.fetch_html(self.pool, 'https://b.example/')
+
+    def test_content_addressed_and_lru(self):
+        """같은 내용은 한 번만 저장하고, 용량을 넘으면 오래 쓰지 않은 항목부터 지우는지 테스트"""
+        body = os.urandom(3000)
+        for name in ('a', 'b'):
+            self.pool.pages[f'https://{name}.example/'] = {'body': body}
+            self.cache.fetch_html(self.pool, f'https://{name}.example/')
+        self.assertEqual(len(os.listdir(os.path.join(self.directory.name, 'objects'))), 1)
+
+        cache = PageCache(os.path.join(self.directory.name, 'small'), max_bytes=7000)
+        self.addCleanup(cache.close)
+        for name in ('c', 'd', 'e'):
+            self.pool.pages[f'https://{name}.example/'] = {'body': os.urandom(3000)}
+        cache.fetch_html(self.pool, 'https://c.example/')
+        cache.fetch_html(self.pool, 'https://d.example/')
+        cache.fetch_html(self.pool, 'https://c.example/')      # c 를 최근에 사용
+        cache.fetch_html(self.pool, 'https://e.example/')      # 가장 오래 쓰지 않은 d 제거
+        self.assertLessEqual(cache.total_bytes, 7000)
+
+        requests_before = len(self.pool.requests)
+        cache.fetch_html(self.pool, 'https://c.example/')
+        cache.fetch_html(self.pool, 'https://e.example/')
+        self.assertEqual(len(self.pool.requests), requests_before)
+        cache.fetch_html(self.pool, 'https://d.example/')
+        self.assertEqual(len(self.pool.requests), requests_before + 1)
+
+if __name__ == '__main__':
+    unittest.main()
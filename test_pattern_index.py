@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다중 패턴 정규식 인덱스 테스트
+단일 스캔 결과가 패턴별 re.search 루프와 동일한지 검증
+"""
+
+import re
+import unittest
+from pattern_index import PatternIndex, get_pattern_index
+from ai_truth_detector import TruthDetector
+from puns_detector import PunsDetector
+from coding_quality_detector import CodingQualityDetector
+
+class TestPatternIndex(unittest.TestCase):
+    """패턴 인덱스 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.statements = [
+            "지구는 평평하다.",
+            "완전히 절대적으로 100% 확실히 모든 것이 진실이다.",
+            "개는 개다",
+            "바나나는 바나나가 아니다",
+            "물은 물이지만 얼음은 물이 아니다",
+            "a = a\nprint('debug')\n# FIXME",
+            "일반적인 문장입니다.",
+            ""
+        ]
+
+    def _naive_matches(self, table, statement, flags):
+        return [
+            (key, pattern)
+            for key, patterns in table.items()
+            for pattern in patterns
+            if re.search(pattern, statement, flags)
+        ]
+
+    def test_matches_equal_naive_loop(self):
+        """패턴별 루프와 결과 일치 테스트"""
+        tables = [
+            (TruthDetector().lie_patterns, re.IGNORECASE),
+            (PunsDetector().pun_patterns, re.IGNORECASE),
+            (CodingQualityDetector().unnecessary_code_patterns, re.MULTILINE | re.IGNORECASE)
+        ]
+
+        for table, flags in tables:
+            index = PatternIndex(table, flags)
+            for statement in self.statements:
+                with self.subTest(statement=statement):
+                    self.assertEqual(index.matches(statement), self._naive_matches(table, statement, flags))
+
+    def test_overlapping_patterns_same_start(self):
+        """같은 위치에서 시작하는 여러 패턴 탐지 테스트"""
+        index = PatternIndex(['지구', '지구는', r'지구는\s*둥글다'])
+
+        self.assertEqual(len(index.scan("지구는 둥글다")), 3)
+
+    def test_backreferences_are_preserved(self):
+        """역참조 패턴 테스트"""
+        index = PatternIndex({'동어반복': [r'(\w+)는\s+\1다'], '기타': [r'(\w+)\s*=\s*\1']})
+
+        self.assertEqual(index.matches("개는 개다"), [('동어반복', r'(\w+)는\s+\1다')])
+        self.assertEqual(index.matches("개는 고양이다"), [])
+        self.assertEqual(index.matches("x = x"), [('기타', r'(\w+)\s*=\s*\1')])
+
+    def test_finditer_returns_pattern_groups(self):
+        """finditer 그룹 결과 테스트"""
+        index = PatternIndex([r'(\w+)은\s+(\w+)다'])
+        results = [(entry.pattern, match.groups()) for entry, match in index.finditer("물은 액체다")]
+
+        self.assertEqual(results, [(r'(\w+)은\s+(\w+)다', ('물', '액체'))])
+
+    def test_shared_index_cache(self):
+        """동일 테이블 인덱스 공유 테스트"""
+        table = {'a': [r'foo', r'bar']}
+
+        self.assertIs(get_pattern_index(table), get_pattern_index({'a': [r'foo', r'bar']}))
+        self.assertIsNot(get_pattern_index(table), get_pattern_index(table, flags=0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GCRA 요청 제한 테스트
+버스트/회복 판정, 남은 횟수 헤더, 다 회복된 키 자동 삭제, 키 수 상한, Redis 스크립트 공유, 로그인 라우트 429 검증
+"""
+
+import unittest
+from flask import Flask
+from rate_limiter import GCRARateLimiter, RedisGCRARateLimiter
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def fakeredis_lua_available():
+    if fakeredis is None:
+        return False
+    try:
+        fakeredis.FakeRedis().eval("return 1", 0)
+        return True
+    except Exception:
+        return False
+
+class TestGCRARateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = GCRARateLimiter(clock=self.clock)
+
+    def test_burst_then_steady_rate(self):
+        results = [self.limiter.hit('client', limit=3, window=3) for _ in range(4)]
+        self.assertEqual([r.allowed for r in results], [True, True, True, False])
+        self.assertEqual([r.remaining for r in results], [2, 1, 0, 0])
+        self.assertAlmostEqual(results[3].retry_after, 1.0)
+
+        # 1초마다 한 번씩 회복
+        self.clock.now += 1.0
+        self.assertTrue(self.limiter.hit('client', limit=3, window=3).allowed)
+        self.assertFalse(self.limiter.hit('client', limit=3, window=3).allowed)
+
+    def test_headers(self):
+        self.limiter.hit('client', limit=2, window=60)
+        headers = self.limiter.hit('client', limit=2, window=60).headers()
+        self.assertEqual(headers['X-RateLimit-Limit'], '2')
+        self.assertEqual(headers['X-RateLimit-Remaining'], '0')
+        self.assertEqual(headers['X-RateLimit-Reset'], '60')
+        denied = self.limiter.hit('client', limit=2, window=60).headers()
+        self.assertEqual(denied['Retry-After'], '30')
+
+    def test_recovered_keys_are_dropped(self):
+        for i in range(100):
+            self.limiter.hit(f'client-{i}', limit=10, window=10)
+        self.assertEqual(len(self.limiter), 100)
+        self.clock.now += 1.0
+        self.limiter.hit('other', limit=10, window=10)
+        self.assertEqual(len(self.limiter), 1)
+
+    def test_expiry_ignores_access_order(self):
+        # 먼저 쓰였지만 오래 제한되는 키가 뒤의 회복된 키 삭제를 막지 않음
+        self.limiter.hit('login', limit=1, window=3600)
+        for i in range(50):
+            self.limiter.hit(f'client-{i}', limit=10, window=10)
+        self.clock.now += 1.0
+        self.limiter.hit('other', limit=10, window=10)
+        self.assertEqual(len(self.limiter), 2)
+        self.assertFalse(self.limiter.hit('login', limit=1, window=3600).allowed)
+
+    def test_stale_heap_entries_are_compacted(self):
+        for _ in range(1000):
+            self.limiter.hit('busy', limit=10000, window=3600)
+        self.assertEqual(len(self.limiter), 1)
+        self.assertLess(len(self.limiter._expiry), 100)
+
+    def test_max_keys(self):
+        limiter = GCRARateLimiter(max_keys=2, clock=self.clock)
+        for key in ('a', 'b', 'c'):
+            limiter.hit(key, limit=1, window=60)
+        self.assertEqual(len(limiter), 2)
+        self.assertTrue(limiter.hit('a', limit=1, window=60).allowed)
+
+    @unittest.skipUnless(fakeredis_lua_available(), "fakeredis Lua 스크립트를 쓸 수 없음 (lupa 미설치)")
+    def test_redis_limit_shared_between_workers(self):
+        server = fakeredis.FakeServer()
+        workers = [RedisGCRARateLimiter(fakeredis.FakeRedis(server=server)) for _ in range(2)]
+        results = [workers[i % 2].hit('client', limit=3, window=60).allowed for i in range(4)]
+        self.assertEqual(results, [True, True, True, False])
+
+    def test_redis_error_falls_back_to_local(self):
+        class BrokenRedis:
+            def register_script(self, script):
+                def run(keys, args):
+                    raise ConnectionError('down')
+                return run
+
+        limiter = RedisGCRARateLimiter(BrokenRedis(), fallback=GCRARateLimiter(clock=self.clock))
+        self.assertTrue(limiter.hit('client', limit=1, window=60).allowed)
+        self.assertFalse(limiter.hit('client', limit=1, window=60).allowed)
+
+class TestLoginRateLimit(unittest.TestCase):
+    def test_login_returns_429_with_headers(self):
+        from api_auth import auth_manager, create_auth_routes
+        app = Flask(__name__)
+        auth_manager.init_app(app)
+        auth_manager.rate_limiter = GCRARateLimiter()
+        create_auth_routes(app)
+        client = app.test_client()
+
+        responses = [client.post('/api/auth/login', json={'username': 'x', 'password': 'y'}) for _ in range(11)]
+        self.assertEqual(responses[0].status_code, 401)
+        self.assertEqual(responses[0].headers['X-RateLimit-Remaining'], '9')
+        self.assertEqual(responses[10].status_code, 429)
+        self.assertIn('Retry-After', responses[10].headers)
+
+if __name__ == '__main__':
+    unittest.main()
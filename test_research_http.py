@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹 연구 HTTP 연결 풀 테스트
+로컬 HTTP 스텁 서버로 동시 실행, 호스트별 동시 요청 제한, 연결 재사용, 마감 시각, 429 백오프 검증
+"""
+
+import time
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from ai_enhanced_researcher import AIEnhancedResearcher, EnhancedSearchResult
+from domain_throttle import DomainThrottle
+from page_cache import PageCache
+from research_http import DeadlineExceeded, HTTPPool, fan_out
+
+class StubHandler(BaseHTTPRequestHandler):
+    """?delay=초 만큼 기다렸다가 짧은 HTML 을 돌려주는 스텁"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.clients.add(self.client_address)
+        try:
+            query = parse_qs(urlparse(self.path).query)
+            time.sleep(float(query.get('delay', ['0'])[0]))
+            with server.lock:
+                server.hits[self.path] = server.hits.get(self.path, 0) + 1
+                limited = server.hits[self.path] <= int(query.get('limited', ['0'])[0])
+            if limited:
+                self.send_response(429)
+                self.send_header('Retry-After', query.get('retry_after', ['1'])[0])
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            body = f'<html><body><p>{self.path}</p><script>x()</script></body></html>'.encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+class TestResearchHTTP(unittest.TestCase):
+    """웹 연구 HTTP 연결 풀 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.active = self.server.peak = 0
+        self.server.clients = set()
+        self.server.hits = {}
+        self.pool = HTTPPool(max_workers=8, max_per_host=2, timeout=5, throttle=DomainThrottle(rate=100, burst=100))
+        self.addCleanup(self.pool.close)
+
+    def fetch(self, url):
+        return self.pool.get(url).text
+
+    def test_per_host_limit_and_keep_alive(self):
+        """같은 호스트 요청이 max_per_host 개씩 동시에 실행되고 연결을 재사용하는지 테스트"""
+        urls = [f'{self.base}/page{i}?delay=0.2' for i in range(6)]
+        start = time.monotonic()
+        results = {url: text for url, text, error in self.pool.fetch_all(urls, self.fetch)}
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(set(results), set(urls))
+        self.assertIn('/page3', results[urls[3]])
+        self.assertEqual(self.server.peak, 2)
+        self.assertLess(elapsed, 1.0)               # 순차 실행이면 1.2초
+        self.assertLessEqual(len(self.server.clients), 2)
+
+    def test_deadline(self):
+        """마감 시각이 지나면 느린 요청을 기다리지 않는지 테스트"""
+        urls = [f'{self.base}/fast?delay=0', f'{self.base}/slow?delay=2', f'{self.base}/slower?delay=2',
+                f'{self.base}/queued?delay=2']
+        start = time.monotonic()
+        outcomes = list(self.pool.fetch_all(urls, self.fetch, deadline=time.monotonic() + 0.5))
+        self.assertLess(time.monotonic() - start, 1.5)
+
+        self.assertEqual(outcomes[0][0], urls[0])
+        self.assertIsNone(outcomes[0][2])
+        self.assertTrue(all(error is not None for _, _, error in outcomes[1:]))
+        with self.assertRaises(DeadlineExceeded):
+            self.pool.get(urls[0], deadline=time.monotonic() - 1)
+
+    def test_retry_after(self):
+        """429 응답이면 Retry-After 만큼 도메인 요청을 미룬 뒤 다시 보내는지 테스트"""
+        url = f'{self.base}/limited?limited=1&retry_after=1'
+        start = time.monotonic()
+        response = self.pool.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertGreaterEqual(time.monotonic() - start, 0.9)
+        self.assertEqual(self.server.hits['/limited?limited=1&retry_after=1'], 2)
+
+        # 마감 시각 안에 다시 보낼 수 없으면 429 응답을 그대로 반환
+        url = f'{self.base}/limited?limited=5&retry_after=30'
+        self.assertEqual(self.pool.get(url, deadline=time.monotonic() + 2).status_code, 429)
+        with self.assertRaises(DeadlineExceeded):
+            self.pool.get(f'{self.base}/other', deadline=time.monotonic() + 2)
+
+    def test_fan_out_completion_order(self):
+        """끝난 순서대로 결과를 돌려주고 예외를 결과로 전달하는지 테스트"""
+        def sleeper(seconds):
+            time.sleep(seconds)
+            if seconds == 0.1:
+                raise ValueError('실패')
+            return seconds
+
+        calls = [(seconds, lambda seconds=seconds: sleeper(seconds)) for seconds in (0.3, 0.05, 0.1, 0.2)]
+        outcomes = list(fan_out(calls))
+        self.assertEqual([key for key, _, _ in outcomes], [0.05, 0.1, 0.2, 0.3])
+        self.assertIsInstance(outcomes[1][2], ValueError)
+        self.assertEqual(outcomes[3][1], 0.3)
+
+    def test_researcher_searches_concurrently(self):
+        """검색 엔진 × 키워드 검색과 페이지 가져오기가 동시에 실행되는지 테스트"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        page_cache = PageCache(directory.name)
+        self.addCleanup(page_cache.close)
+        researcher = AIEnhancedResearcher(http_pool=self.pool, page_cache=page_cache)
+
+        def engine(name):
+            def search(query, max_results, deadline=None):
+                urls = [f'{self.base}/{name}/{i}?delay=0.2' for i in range(2)]
+                contents = researcher._fetch_contents(urls, deadline)
+                return [EnhancedSearchResult(title=url, url=url, content=contents[url][0], snippet='', domain='nature.com',
+                                             credibility_score=0.9, relevance_score=0.9, fact_check_score=0.0,
+                                             search_engine=name, search_keyword=query,
+                                             processing_time=contents[url][1], timestamp=None)
+                        for url in urls]
+            return search
+
+        for engine_id, info in researcher.search_engines.items():
+            info['search_func'] = engine(engine_id)
+        researcher._analyze_question = lambda question: {'keywords': [question]}
+
+        start = time.monotonic()
+        answer = researcher.research_question('지구는 둥글다', max_sources=10)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(len(answer.sources), 6)
+        self.assertTrue(all('/page' not in source.content and 'x()' not in source.content for source in answer.sources))
+        self.assertLess(elapsed, 2.0)               # 순차 실행이면 대기 1.5초 + 요청 1.2초
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+응답 캐시 테스트
+바이트 상한 LRU 제거, TTL 만료, 내용 해시 키, 통계 검증
+"""
+
+import time
+import threading
+import unittest
+from response_cache import ResponseCache, canonical_cache_key
+
+class TestResponseCache(unittest.TestCase):
+    """응답 캐시 테스트"""
+
+    def test_get_set_and_counters(self):
+        """저장/조회 및 적중 통계 테스트"""
+        cache = ResponseCache(max_bytes=1024, shards=1)
+        cache.set('a', b'{"x":1}', 7)
+
+        self.assertEqual(cache.get('a'), b'{"x":1}')
+        self.assertIsNone(cache.get('b'))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size_bytes']), (1, 1, 7))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_lru_eviction_by_bytes(self):
+        """바이트 상한 초과 시 LRU 제거 테스트"""
+        cache = ResponseCache(max_bytes=30, shards=1)
+        cache.set('a', 'A', 10)
+        cache.set('b', 'B', 10)
+        cache.set('c', 'C', 10)
+        cache.get('a')                  # 'a' 를 최근 사용으로 갱신
+        cache.set('d', 'D', 10)         # 가장 오래 사용되지 않은 'b' 제거
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'A')
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertFalse(cache.set('huge', 'H', 31))
+
+    def test_ttl_expiration(self):
+        """TTL 만료 테스트"""
+        cache = ResponseCache(max_bytes=100, shards=1)
+        cache.set('a', 'A', 1, ttl=0.01)
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['expirations'], 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_canonical_cache_key(self):
+        """정규화된 내용 해시 키 테스트"""
+        key = canonical_cache_key('api_analyze', ' 지구는 둥글다 ', '', 'ALL', {'b': 1, 'a': 2})
+
+        self.assertEqual(key, canonical_cache_key('api_analyze', '지구는 둥글다', None, 'all', {'a': 2, 'b': 1}))
+        self.assertNotEqual(key, canonical_cache_key('api_analyze', '지구는 평평하다', '', 'all', {'a': 2, 'b': 1}))
+        self.assertNotEqual(key, canonical_cache_key('api_analyze', '지구는 둥글다', '', 'puns', {'a': 2, 'b': 1}))
+        self.assertEqual(len(key), 64)
+
+    def test_concurrent_access(self):
+        """동시 접근 시 용량 상한 유지 테스트"""
+        cache = ResponseCache(max_bytes=1600, shards=8)
+
+        def worker(offset):
+            for i in range(500):
+                cache.set(f'{offset}-{i}', i, 10)
+                cache.get(f'{offset}-{i // 2}')
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        self.assertLessEqual(stats['size_bytes'], 1600)
+        self.assertEqual(stats['hits'] + stats['misses'], 4000)
+
+if __name__ == "__main__":
+    unittest.main()
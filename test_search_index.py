@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 BM25 검색 백엔드 테스트
+한글 2-gram 토큰, 직접 계산한 BM25 점수와의 일치, 동점 순서 고정, 메모리 맵 로딩, 오프라인 연구원 검색, 연구원별 결과 변환 검증
+"""
+
+import math
+import tempfile
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from search_index import BM25Index, LocalSearchBackend, build_index, tokenize
+
+DOCUMENTS = [
+    {'title': '지구', 'url': 'https://ko.wikipedia.org/wiki/지구', 'text': '지구는 태양계의 세 번째 행성이다. 지구는 둥글다.'},
+    {'title': 'Moon', 'url': 'https://en.wikipedia.org/wiki/Moon', 'text': 'The Moon orbits the Earth. Moon phases.'},
+    {'title': 'Mars', 'url': 'https://en.wikipedia.org/wiki/Mars', 'text': 'Mars is the fourth planet from the Sun.'},
+    {'title': 'Venus', 'url': 'https://en.wikipedia.org/wiki/Venus', 'text': 'Venus is the second planet from the Sun.'},
+    {'title': 'Sun', 'url': 'https://en.wikipedia.org/wiki/Sun', 'text': 'The Sun is the star at the center of the Solar System.'},
+]
+
+def brute_force_bm25(documents, query, k1=1.2, b=0.75):
+    """색인 없이 문서마다 직접 계산한 BM25 점수"""
+    counts = [Counter(tokenize(f"{doc['title']}\n{doc['text']}")) for doc in documents]
+    average = sum(sum(c.values()) for c in counts) / len(counts)
+    scores = {}
+    for term, query_count in Counter(tokenize(query)).items():
+        df = sum(1 for c in counts if term in c)
+        if not df:
+            continue
+        idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+        for doc_id, c in enumerate(counts):
+            tf = c.get(term, 0)
+            if tf:
+                norm = k1 * (1 - b + b * sum(c.values()) / average)
+                scores[doc_id] = scores.get(doc_id, 0.0) + query_count * idf * tf * (k1 + 1) / (tf + norm)
+    return scores
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        build_index(DOCUMENTS, self.tempdir.name)
+        self.index = BM25Index(self.tempdir.name)
+
+    def tearDown(self):
+        del self.index
+        self.tempdir.cleanup()
+
+    def test_tokenize_korean_bigrams(self):
+        self.assertEqual(tokenize('지구는 Round!'), ['지구', '구는', 'round'])
+        # 조사가 붙어도 같은 2-gram 을 공유
+        self.assertIn('지구', tokenize('지구가'))
+
+    def test_scores_match_brute_force(self):
+        for query in ['sun planet', '지구 행성', 'the moon earth']:
+            expected = brute_force_bm25(DOCUMENTS, query)
+            ranked = self.index.top_documents(query, k=len(DOCUMENTS))
+            self.assertEqual({doc_id for doc_id, _ in ranked}, set(expected))
+            for doc_id, score in ranked:
+                self.assertAlmostEqual(score, expected[doc_id], places=4)
+            self.assertEqual([s for _, s in ranked], sorted((s for _, s in ranked), reverse=True))
+
+    def test_ties_ordered_by_document_id(self):
+        # Mars 와 Venus 는 'planet' 점수가 같음 → 문서 번호 순, k 경계에서도 같은 결과
+        ranked = self.index.top_documents('planet', k=2)
+        self.assertEqual([doc_id for doc_id, _ in ranked], [2, 3])
+        self.assertEqual(self.index.top_documents('planet', k=1)[0][0], 2)
+
+    def test_postings_are_memory_mapped(self):
+        self.assertIsInstance(self.index.postings_docs, np.memmap)
+        self.assertEqual(self.index.postings_docs.dtype, np.uint32)
+        self.assertEqual(self.index.top_documents('없는단어'), [])
+
+    def test_search_returns_stored_content(self):
+        hits = LocalSearchBackend(self.tempdir.name).search('지구는 둥글다', 3)
+        self.assertEqual(hits[0].title, '지구')
+        self.assertEqual(hits[0].domain, 'ko.wikipedia.org')
+        self.assertIn('둥글다', hits[0].content)
+
+    def test_offline_researcher_uses_only_backend(self):
+        from ai_web_researcher import AIWebResearcher
+        researcher = AIWebResearcher(search_backends={'local': LocalSearchBackend(self.tempdir.name)}, offline=True)
+        self.assertEqual(list(researcher.search_engines), ['local'])
+        results = researcher._search_web('Mars planet', max_results=2)
+        self.assertEqual([r.title for r in results], ['Mars', 'Venus'])
+
+    def test_every_researcher_converts_backend_hits(self):
+        from ai_web_researcher import AIWebResearcher
+        from ai_enhanced_researcher import AIEnhancedResearcher
+        from ai_advanced_researcher import AIAdvancedResearcher
+        backend = LocalSearchBackend(self.tempdir.name)
+        for researcher_type in (AIWebResearcher, AIEnhancedResearcher, AIAdvancedResearcher):
+            with self.subTest(researcher=researcher_type.__name__):
+                researcher = researcher_type(search_backends={'local': backend}, offline=True)
+                results = researcher._search_backend(backend, 'Mars planet', 2)
+                self.assertEqual([type(r) for r in results], [researcher.search_result_type] * 2)
+                self.assertEqual([r.url for r in results], ['https://en.wikipedia.org/wiki/Mars',
+                                                            'https://en.wikipedia.org/wiki/Venus'])
+
+if __name__ == '__main__':
+    unittest.main()
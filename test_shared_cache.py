@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+2단계 공유 결과 캐시 테스트
+프로세스 내 LRU + Redis(fakeredis) 공유, 다중 조회, 동시 미스 단일 계산, 잠금 해제 검증
+"""
+
+import time
+import threading
+import unittest
+from shared_cache import TwoTierCache, pack_value, unpack_value
+from ai_consistent_detector import AIConsistentDetector
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+def fakeredis_lua_available():
+    if fakeredis is None:
+        return False
+    try:
+        fakeredis.FakeRedis().eval("return 1", 0)
+        return True
+    except Exception:
+        return False
+
+class TestTwoTierCache(unittest.TestCase):
+    """2단계 캐시 테스트"""
+
+    def test_pack_roundtrip(self):
+        """직렬화 왕복 테스트"""
+        value = {'statement': '지구는 둥글다', 'truth_percentage': 0.95, 'needs_correction': False}
+
+        self.assertEqual(unpack_value(pack_value(value)), value)
+
+    def test_local_only(self):
+        """Redis 없이 프로세스 내 캐시 동작 테스트"""
+        cache = TwoTierCache()
+        cache.set('a', {'v': 1})
+
+        self.assertEqual(cache.get('a'), {'v': 1})
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.stats()['local_hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_single_flight(self):
+        """동일 키 동시 미스 시 한 번만 계산하는지 테스트"""
+        cache = TwoTierCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'v': 42}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'v': 42}] * 8)
+
+    @unittest.skipUnless(fakeredis, "fakeredis 가 설치되지 않음")
+    def test_shared_between_workers(self):
+        """Redis 를 통한 작업자 간 결과 공유 테스트"""
+        server = fakeredis.FakeServer()
+        worker_a = TwoTierCache(fakeredis.FakeRedis(server=server), namespace='test')
+        worker_b = TwoTierCache(fakeredis.FakeRedis(server=server), namespace='test')
+
+        worker_a.set_many({'x': {'v': 1}, 'y': {'v': 2}})
+        results = worker_b.get_many(['x', 'y', 'z'])
+
+        self.assertEqual(results, {'x': {'v': 1}, 'y': {'v': 2}, 'z': None})
+        self.assertEqual(worker_b.stats()['redis_hits'], 2)
+        self.assertEqual(worker_b.get('x'), {'v': 1})
+        self.assertEqual(worker_b.stats()['local_hits'], 1)
+
+        worker_a.clear()
+        self.assertEqual(list(fakeredis.FakeRedis(server=server).scan_iter('test:*')), [])
+
+    @unittest.skipUnless(fakeredis, "fakeredis 가 설치되지 않음")
+    def test_rechecks_cache_after_winning_ownership(self):
+        """첫 조회 직후 다른 작업자가 저장한 값은 다시 계산하지 않는지 테스트"""
+        server = fakeredis.FakeServer()
+        worker_a = TwoTierCache(fakeredis.FakeRedis(server=server), namespace='race')
+        worker_b = TwoTierCache(fakeredis.FakeRedis(server=server), namespace='race')
+        original_get = worker_b.get
+        lookups = []
+
+        def get(key):
+            lookups.append(key)
+            if len(lookups) == 1:
+                value = original_get(key)
+                worker_a.set(key, {'v': 'a'})        # 첫 조회가 미스난 뒤 다른 작업자가 저장
+                return value
+            return original_get(key)
+
+        worker_b.get = get
+        self.assertEqual(worker_b.get_or_compute('k', lambda: {'v': 'b'}), {'v': 'a'})
+        self.assertEqual(worker_b.stats()['computations'], 0)
+
+    @unittest.skipUnless(fakeredis, "fakeredis 가 설치되지 않음")
+    def test_values_expire_with_ttl(self):
+        """Redis 저장 값 만료 시간 테스트"""
+        client = fakeredis.FakeRedis()
+        TwoTierCache(client, namespace='ttl', ttl=60).set('x', {'v': 1})
+        self.assertTrue(0 < client.ttl('ttl:x') <= 60)
+
+    @unittest.skipUnless(fakeredis_lua_available(), "fakeredis Lua 스크립트를 쓸 수 없음 (lupa 미설치)")
+    def test_lock_released_only_by_owner(self):
+        """계산 후 자기 잠금만 해제하는지 테스트"""
+        client = fakeredis.FakeRedis()
+        cache = TwoTierCache(client, namespace='lock')
+
+        def compute():
+            # 계산 중 잠금이 만료되어 다른 작업자가 잡은 상황
+            client.set('lock:lock:a', b'other')
+            return {'v': 1}
+
+        self.assertEqual(cache.get_or_compute('a', compute), {'v': 1})
+        self.assertEqual(client.get('lock:lock:a'), b'other')
+        self.assertEqual(cache.get_or_compute('b', lambda: {'v': 2}), {'v': 2})
+        self.assertIsNone(client.get('lock:lock:b'))
+        self.assertEqual(cache.stats()['redis_errors'], 0)
+
+    @unittest.skipUnless(fakeredis, "fakeredis 가 설치되지 않음")
+    def test_consistent_detector_uses_shared_cache(self):
+        """AIConsistentDetector 결과 공유 테스트"""
+        server = fakeredis.FakeServer()
+        first = AIConsistentDetector(TwoTierCache(fakeredis.FakeRedis(server=server), namespace='c'))
+        second = AIConsistentDetector(TwoTierCache(fakeredis.FakeRedis(server=server), namespace='c'))
+
+        expected = first.analyze_statement("지구는 평평하다")
+        shared = second.analyze_statements(["지구는  평평하다!", "물은 100도에서 끓는다"])
+
+        self.assertEqual(shared[0], expected)
+        self.assertEqual(second.get_cache_stats()['tiers']['redis_hits'], 1)
+        self.assertEqual(second.get_cache_stats()['tiers']['computations'], 0)
+        self.assertEqual(shared[1].statement, "물은 100도에서 끓는다")
+
+if __name__ == "__main__":
+    unittest.main()
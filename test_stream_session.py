@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 출력 증분 분석 테스트
+패턴 완성 즉시 이벤트, 문장 단위 교정, 전체 분석과의 일치, 소수점 처리, 버퍼 크기 제한 검증
+"""
+
+import unittest
+from ai_real_time_truth_monitor import AIRealTimeTruthMonitor
+
+def feed_in_chunks(session, text, size):
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(session.feed(text[start:start + size]))
+    return events + session.close()
+
+class TestStreamSession(unittest.TestCase):
+    def setUp(self):
+        self.monitor = AIRealTimeTruthMonitor()
+
+    def test_pattern_reported_on_completing_delta(self):
+        session = self.monitor.stream_session()
+        self.assertEqual(session.feed('지구는 완전'), [])
+        events = session.feed('히 평평')
+        self.assertEqual([(e.kind, e.category, e.offset) for e in events],
+                         [('pattern', 'false_facts', 0), ('pattern', 'exaggeration', 4)])
+        # 같은 매칭은 다시 알리지 않음
+        self.assertEqual(session.feed('하'), [])
+
+    def test_sentence_events_match_full_analysis(self):
+        text = '일반적으로 지구는 둥글다. 그런데 물은 200도에서 끓는다! 연구에 따르면 그렇다\n마지막 문장'
+        for size in (1, 3, 7, len(text)):
+            with self.subTest(size=size):
+                sentences = [e for e in feed_in_chunks(self.monitor.stream_session(), text, size)
+                             if e.kind == 'sentence']
+                self.assertEqual(len(sentences), 4)
+                for event in sentences:
+                    statement = event.analysis.statement
+                    expected = self.monitor.analyze_statement(statement)
+                    self.assertEqual(event.analysis.truth_percentage, expected.truth_percentage)
+                    self.assertEqual(event.analysis.corrected_statement, expected.corrected_statement)
+                    self.assertTrue(text[event.offset:].lstrip().startswith(statement))
+
+    def test_decimals_do_not_split_sentences(self):
+        text = '원주율은 3.14이다. 물은 100.5도에서 끓는다!\n정말?'
+        for size in (1, 2, 5, len(text)):
+            with self.subTest(size=size):
+                events = feed_in_chunks(self.monitor.stream_session(), text, size)
+                statements = [e.analysis.statement for e in events if e.kind == 'sentence' and e.analysis]
+                self.assertEqual(statements, ['원주율은 3.14이다.', '물은 100.5도에서 끓는다!', '정말?'])
+                self.assertEqual(''.join(e.text for e in events if e.kind == 'sentence'), text)
+
+    def test_terminator_at_end_of_delta_waits_for_next_delta(self):
+        session = self.monitor.stream_session()
+        self.assertEqual([e for e in session.feed('물은 100.') if e.kind == 'sentence'], [])
+        self.assertEqual([e for e in session.feed('5도에서 끓는다.') if e.kind == 'sentence'], [])
+        sentences = [e for e in session.feed(' 다음') if e.kind == 'sentence']
+        self.assertEqual([e.analysis.statement for e in sentences], ['물은 100.5도에서 끓는다.'])
+        self.assertEqual([e.analysis.statement for e in session.close()], ['다음'])
+
+    def test_unchanged_text_passes_through(self):
+        text = '연구에 따르면 대부분의 경우 그렇다. 일반적으로 알려진 바에 따르면 그렇다.\n'
+        events = feed_in_chunks(self.monitor.stream_session(), text, 4)
+        self.assertEqual(''.join(e.text for e in events if e.kind == 'sentence'), text)
+
+    def test_buffers_stay_bounded(self):
+        session = self.monitor.stream_session(window=32, max_sentence_chars=100)
+        for _ in range(200):
+            session.feed('가나다라마바사 ' * 5)
+        self.assertLessEqual(len(session._suffix), 32)
+        self.assertLessEqual(session._sentence_length, 100)
+        self.assertIn('exaggeration', [e.category for e in session.feed('절대로')])
+
+    def test_closed_session_rejects_feed(self):
+        session = self.monitor.stream_session()
+        session.close()
+        with self.assertRaises(ValueError):
+            session.feed('문장')
+
+if __name__ == '__main__':
+    unittest.main()
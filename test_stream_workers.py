@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트림 순서 보장 작업자 풀 테스트
+스트림별 출력 순서, 쌓인 항목 묶음 처리, 종료 시 남은 항목 처리, 중지 중 제출 보존, 실시간/메타 모니터 연결 검증
+"""
+
+import time
+import threading
+import unittest
+from stream_workers import StreamMonitor, StreamWorkerPool
+
+class TestStreamWorkerPool(unittest.TestCase):
+    def test_per_stream_order_with_many_workers(self):
+        outputs = {}
+        lock = threading.Lock()
+
+        def handle(batch):
+            for stream_id, item in batch:
+                with lock:
+                    outputs.setdefault(stream_id, []).append(item)
+
+        pool = StreamWorkerPool(handle, workers=4, max_batch=8)
+        for i in range(200):
+            for stream_id in range(10):
+                pool.submit(stream_id, i)
+        pool.stop(timeout=5.0)
+
+        self.assertEqual(len(outputs), 10)
+        for items in outputs.values():
+            self.assertEqual(items, list(range(200)))
+
+    def test_waiting_items_are_batched(self):
+        started, release = threading.Event(), threading.Event()
+        batches = []
+
+        def handle(batch):
+            batches.append([item for _, item in batch])
+            started.set()
+            release.wait(2.0)
+
+        pool = StreamWorkerPool(handle, workers=1, max_batch=4)
+        pool.submit('s', 0)
+        started.wait(2.0)
+        for i in range(1, 7):
+            pool.submit('s', i)
+        self.assertEqual(pool.pending(), 6)
+        release.set()
+        pool.stop(timeout=5.0)
+
+        self.assertEqual(batches, [[0], [1, 2, 3, 4], [5, 6]])
+        self.assertEqual(pool.stats()['processed'], 7)
+
+    def test_handler_error_does_not_stop_worker(self):
+        handled = []
+
+        def handle(batch):
+            if batch[0][1] == 'bad':
+                raise ValueError('실패')
+            handled.extend(item for _, item in batch)
+
+        pool = StreamWorkerPool(handle, workers=1, max_batch=1)
+        pool.submit('s', 'bad')
+        pool.submit('s', 'good')
+        pool.stop(timeout=5.0)
+        self.assertEqual(handled, ['good'])
+
+class TestStreamMonitor(unittest.TestCase):
+    def test_items_submitted_during_stop_are_kept(self):
+        handled = []
+        lock = threading.Lock()
+
+        def handle(stream_id, item):
+            time.sleep(0.001)
+            with lock:
+                handled.append(item)
+
+        monitor = StreamMonitor(workers=2)
+        monitor.start(handle)
+        submitted = threading.Event()
+
+        def submit_all():
+            for i in range(300):
+                monitor.submit(i % 3, i)
+            submitted.set()
+
+        submitter = threading.Thread(target=submit_all)
+        submitter.start()
+        time.sleep(0.01)
+        monitor.stop(timeout=5.0)       # 제출 도중 중지 - 중지 후 제출은 보관
+        submitter.join()
+        monitor.start(handle)
+        monitor.stop(timeout=5.0)
+
+        self.assertTrue(submitted.is_set())
+        self.assertEqual(sorted(handled), list(range(300)))
+
+    def test_handler_error_skips_only_that_item(self):
+        handled = []
+
+        def handle(stream_id, item):
+            if item == 'bad':
+                raise ValueError('실패')
+            handled.append(item)
+
+        monitor = StreamMonitor(workers=1)
+        monitor.submit('s', 'first')
+        monitor.submit('s', 'bad')
+        monitor.submit('s', 'last')
+        self.assertEqual(monitor.pending(), 3)
+        monitor.start(handle)
+        monitor.stop(timeout=5.0)
+        self.assertEqual(handled, ['first', 'last'])
+
+class TestMonitors(unittest.TestCase):
+    def test_real_time_monitor_streams_keep_order(self):
+        from ai_real_time_truth_monitor import AIRealTimeTruthMonitor
+        monitor = AIRealTimeTruthMonitor(monitor_workers=3)
+        outputs = {}
+        lock = threading.Lock()
+
+        def output_callback(stream_id, text):
+            with lock:
+                outputs.setdefault(stream_id, []).append(text)
+
+        # 시작 전에 제출한 문장도 처리
+        monitor.submit_statement('스트림 0 문장 0', stream_id=0)
+        monitor.start_monitoring(output_callback, include_stream_id=True)
+        for i in range(1, 20):
+            for stream_id in range(5):
+                monitor.submit_statement(f'스트림 {stream_id} 문장 {i}', stream_id=stream_id)
+        monitor.stop_monitoring(timeout=10.0)
+
+        self.assertEqual(monitor.get_stats()['total_analyzed'], 96)
+        for stream_id in range(1, 5):
+            self.assertEqual(outputs[stream_id], [f'스트림 {stream_id} 문장 {i}' for i in range(1, 20)])
+        self.assertEqual(len(outputs[0]), 20)
+
+    def test_meta_system_output_callback(self):
+        from ai_meta_truth_system import AIMetaTruthSystem
+        system = AIMetaTruthSystem(monitor_workers=2)
+        outputs = []
+        system.start_continuous_monitoring(outputs.append)
+        for statement in ['첫 문장입니다.', '두 번째 문장입니다.', '세 번째 문장입니다.']:
+            system.submit_statement(statement)
+        system.stop_monitoring(timeout=10.0)
+
+        self.assertEqual(len(outputs), 3)
+        self.assertEqual(system.get_stats()['total_analyzed'], 3)
+
+if __name__ == '__main__':
+    unittest.main()
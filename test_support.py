@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+테스트 공용 도우미
+히스토리/내보내기/대시보드/트렌드 테스트가 함께 쓰는 분석 결과 기록 생성기
+"""
+
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+BASE = datetime(2025, 3, 1, 12, 0, 0).timestamp()
+
+def make_record(index: int = 0, seconds: Optional[float] = None, truth: Optional[float] = None,
+                needs_correction: bool = False, lies: Iterable[str] = (), pun: Optional[bool] = False,
+                languages: Iterable[str] = (), **extra: Any) -> dict:
+    """
+    분석 결과 기록 (/api/analyze 응답과 같은 모양)
+
+    index 로 id, 문장, 시각 (BASE + index 초), 진실성 (index / 100)을 정하고
+    seconds/truth 를 주면 시각과 진실성을 직접 지정한다. pun 이 None 이면 puns_analysis 섹션을 넣지 않고,
+    extra 는 최상위 필드를 추가하거나 덮어쓴다.
+    """
+    languages = list(languages)
+    record = {
+        'id': str(index),
+        'timestamp': datetime.fromtimestamp(BASE + index if seconds is None else seconds).isoformat(),
+        'statement': f'문장 {index}',
+        'final_analysis': {
+            'truth_percentage': index / 100 if truth is None else truth,
+            'confidence': 0.9,
+            'needs_correction': needs_correction,
+            'final_corrected_statement': '교정됨' if needs_correction else None
+        },
+        'basic_analysis': {'detected_lies': list(lies)},
+        'multilingual_analysis': {'is_multilingual': len(languages) > 1, 'detected_languages': languages}
+    }
+    if pun is not None:
+        record['puns_analysis'] = {'is_pun_detected': pun, 'puns': ['말장난'] if pun else []}
+    record.update(extra)
+    return record
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+진실성 트렌드 시간 색인 테스트
+버킷 집계와 전체 순회 결과 일치, 링 버퍼 제거 반영, LTTB 축약 검증
+"""
+
+import math
+import random
+import unittest
+from history_store import HistoryStore
+from test_support import BASE, make_record
+from trend_index import TrendIndex, lttb, parse_bucket
+
+def brute_force(points, start, end, bucket):
+    """버킷 경계로 넓힌 구간의 버킷별 (개수, 평균, 최소, 최대)"""
+    first = math.floor(start / bucket) * bucket
+    last = math.floor(end / bucket) * bucket + bucket
+    buckets = {}
+    for seconds, value in points:
+        if first <= seconds < last:
+            buckets.setdefault(int(seconds // bucket) * bucket, []).append(value)
+    return [(len(values), sum(values) / len(values), min(values), max(values))
+            for _, values in sorted(buckets.items())]
+
+class TestTrendIndex(unittest.TestCase):
+    """진실성 트렌드 시간 색인 테스트"""
+
+    def setUp(self):
+        random.seed(7)
+
+    def test_aggregate_matches_full_scan(self):
+        """여러 버킷 크기에서 집계가 전체 순회 결과와 같은지 테스트"""
+        index = TrendIndex()
+        points = [(BASE + random.uniform(0, 3 * 86400), random.random()) for _ in range(3000)]
+        for seconds, value in points:
+            index.add(seconds, value, '')
+
+        for bucket in (1, 45, 60, 300, 3600, 7200, 86400):
+            start, end = BASE + 5000.5, BASE + 200000.25
+            expected = brute_force(points, start, end, bucket)
+            actual = [(row['count'], row['mean'], row['min'], row['max']) for row in index.aggregate(start, end, bucket)]
+            self.assertEqual(len(actual), len(expected), bucket)
+            for row, want in zip(actual, expected):
+                self.assertEqual(row[0], want[0])
+                self.assertAlmostEqual(row[1], want[1])
+                self.assertEqual(row[2:], want[2:])
+
+    def test_history_eviction_updates_index(self):
+        """링 버퍼에서 밀려난 기록이 색인에서도 빠지는지 테스트"""
+        history = HistoryStore(capacity=500)
+        points = []
+        for i in range(2000):
+            seconds = BASE + i * 37 + random.random()
+            value = random.random()
+            points.append((seconds, value))
+            history.append(make_record(seconds=seconds, truth=value))
+        kept = points[-500:]
+
+        trend = history.trend(bucket_seconds=3600, max_points=1000)
+        self.assertEqual(trend['mode'], 'minmax')
+        self.assertEqual(sum(row['count'] for row in trend['points']), 500)
+        expected = brute_force(kept, kept[0][0], kept[-1][0], 3600)
+        self.assertEqual([(row['min'], row['max']) for row in trend['points']], [want[2:] for want in expected])
+
+    def test_raw_and_automatic_bucket(self):
+        """점이 적으면 원본 점, 많으면 max_points 이하의 버킷으로 집계되는지 테스트"""
+        history = HistoryStore(capacity=10000)
+        for i in range(50):
+            history.append(make_record(seconds=BASE + i, truth=i / 50))
+        raw = history.trend(max_points=100)
+        self.assertEqual(raw['mode'], 'raw')
+        self.assertEqual([point['value'] for point in raw['points']], [i / 50 for i in range(50)])
+
+        for i in range(50, 5000):
+            history.append(make_record(seconds=BASE + i * 10, truth=0.5))
+        trend = history.trend(max_points=100)
+        self.assertEqual(trend['mode'], 'minmax')
+        self.assertLessEqual(len(trend['points']), 100)
+        self.assertEqual(sum(row['count'] for row in trend['points']), 5000)
+
+        ranged = history.trend(start=BASE, end=BASE + 49, bucket_seconds=10, max_points=100)
+        self.assertEqual([row['count'] for row in ranged['points']], [10] * 5)
+
+    def test_lttb(self):
+        """LTTB 가 점 수를 줄이고 처음/끝과 극값을 남기는지 테스트"""
+        points = [(float(i), 0.5) for i in range(1000)]
+        points[400] = (400.0, 1.0)
+        sampled = lttb(points, 50)
+        self.assertEqual(len(sampled), 50)
+        self.assertEqual(sampled[0], points[0])
+        self.assertEqual(sampled[-1], points[-1])
+        self.assertIn((400.0, 1.0), sampled)
+
+        history = HistoryStore(capacity=10000)
+        for i in range(1500):
+            history.append(make_record(seconds=BASE + i, truth=random.random()))
+        trend = history.trend(max_points=200, mode='lttb')
+        self.assertEqual(trend['mode'], 'lttb')
+        self.assertEqual(len(trend['points']), 200)
+
+        # 초 버킷이 너무 많으면 분 버킷 평균을 입력으로 사용
+        for i in range(1500, 3000):
+            history.append(make_record(seconds=BASE + i, truth=random.random()))
+        self.assertEqual(len(history.trend(max_points=200, mode='lttb')['points']), 50)
+
+    def test_parse_bucket(self):
+        """버킷 크기 문자열 해석 테스트"""
+        self.assertEqual([parse_bucket(value) for value in ('90', '30s', '5m', '1h', '2d')], [90, 30, 300, 3600, 172800])
+        for value in ('0', 'abc', '-5m'):
+            with self.assertRaises(ValueError):
+                parse_bucket(value)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+공통 텍스트 통계
+입력 검증(AdvancedValidationSystem)과 신뢰도 평가(AdvancedConfidenceSystem)가 각각 다시 계산하던
+단어 분할, 소문자 단어 집합, 문장 분할 등을 요청당 한 번만 계산해 공유하는 모듈
+"""
+
+import re
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+@dataclass(frozen=True)
+class TextStatistics:
+    """한 텍스트의 분할 결과"""
+    text: str
+    stripped: str
+    words: Tuple[str, ...]              # text.split()
+    lower_words: Tuple[str, ...]        # text.lower().split()
+    lower_word_set: FrozenSet[str]
+    sentences: Tuple[str, ...]          # re.split(r'[.!?]+', text)
+    ends_with_terminal: bool            # 마침표/느낌표/물음표로 끝나는지
+
+    @classmethod
+    def of(cls, text: str) -> 'TextStatistics':
+        text = text or ''
+        stripped = text.strip()
+        lower_words = tuple(text.lower().split())
+        return cls(
+            text=text,
+            stripped=stripped,
+            words=tuple(text.split()),
+            lower_words=lower_words,
+            lower_word_set=frozenset(lower_words),
+            sentences=tuple(re.split(r'[.!?]+', text)),
+            ends_with_terminal=stripped.endswith(('.', '!', '?'))
+        )
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+@dataclass(frozen=True)
+class RequestTextStatistics:
+    """요청의 문장과 문맥 통계"""
+    statement: TextStatistics
+    context: TextStatistics
+
+    @classmethod
+    def compute(cls, statement: str, context: Optional[str] = '') -> 'RequestTextStatistics':
+        return cls(statement=TextStatistics.of(statement), context=TextStatistics.of(context))
+
+    def matches(self, statement: str, context: Optional[str] = '') -> bool:
+        """같은 문장/문맥으로 계산된 통계인지 확인"""
+        return self.statement.text == (statement or '') and self.context.text == (context or '')
+
+def ensure_statistics(stats: Optional[RequestTextStatistics], statement: str,
+                      context: Optional[str] = '') -> RequestTextStatistics:
+    """전달된 통계가 없거나 다른 텍스트의 것이면 새로 계산"""
+    if stats is not None and stats.matches(statement, context):
+        return stats
+    return RequestTextStatistics.compute(statement, context)
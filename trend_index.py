@@ -0,0 +1,280 @@
+"""
+진실성 트렌드 시간 색인
+기록 시각별 점수를 초/분/시/일 해상도의 버킷(개수, 합계, 최소, 최대)으로 미리 집계해 두고,
+조회 구간과 버킷 크기에 맞는 가장 거친 해상도에서 합쳐 min/mean/max 시계열이나
+LTTB(Largest-Triangle-Three-Buckets) 축약 시계열을 만드는 모듈
+"""
+
+import math
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# 색인 해상도 (초), 버킷은 유닉스 시각 기준으로 정렬됨 (시/일 버킷은 UTC 경계)
+RESOLUTIONS = (1, 60, 3600, 86400)
+
+# 자동 버킷 크기 후보 (초)
+NICE_BUCKETS = (1, 2, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600, 7200, 10800, 21600, 43200,
+                86400, 2 * 86400, 7 * 86400, 30 * 86400, 90 * 86400, 365 * 86400)
+
+# 한 번의 조회에서 훑는 색인 버킷 수 상한 (max_points 의 배수)
+SCAN_FACTOR = 10
+
+def parse_bucket(value: str) -> int:
+    """버킷 크기 문자열 ('90', '30s', '5m', '1h', '1d') → 초"""
+    units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+    value = value.strip().lower()
+    multiplier = units.get(value[-1:], None)
+    number = value[:-1] if multiplier else value
+    seconds = int(number) * (multiplier or 1)
+    if seconds <= 0:
+        raise ValueError("버킷 크기는 1초 이상이어야 합니다.")
+    return seconds
+
+def format_time(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds).isoformat()
+
+class _Bucket:
+    __slots__ = ('count', 'total', 'minimum', 'maximum', 'points')
+
+    def __init__(self, keep_points: bool):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.points: Optional[List[Tuple[float, float, str]]] = [] if keep_points else None
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+class _Level:
+    """한 해상도의 버킷들 (시작 시각 정렬 목록 + 사전)"""
+
+    def __init__(self, resolution: int):
+        self.resolution = resolution
+        self.buckets: Dict[int, _Bucket] = {}
+        self.starts: List[int] = []
+        self.head = 0           # starts 앞쪽의 삭제된 항목 수 (가장 오래된 버킷 제거를 O(1)로)
+
+    def key(self, seconds: float) -> int:
+        return int(seconds // self.resolution) * self.resolution
+
+    def bucket(self, start: int, keep_points: bool) -> _Bucket:
+        bucket = self.buckets.get(start)
+        if bucket is None:
+            bucket = self.buckets[start] = _Bucket(keep_points)
+            if 0 < self.head < len(self.starts) and start < self.starts[self.head]:
+                self.head -= 1                  # 삭제된 앞자리 재사용
+                self.starts[self.head] = start
+            else:
+                insort(self.starts, start, lo=self.head)
+        return bucket
+
+    def discard(self, start: int):
+        del self.buckets[start]
+        index = bisect_left(self.starts, start, lo=self.head)
+        if index == self.head:
+            self.head += 1
+            if self.head > 64 and self.head * 2 > len(self.starts):
+                del self.starts[:self.head]
+                self.head = 0
+        else:
+            del self.starts[index]
+
+    def span(self, start: float, end: float) -> Tuple[int, int]:
+        """[start, end] 와 겹치는 버킷들의 starts 색인 범위"""
+        lo = bisect_left(self.starts, self.key(start), lo=self.head)
+        return lo, bisect_left(self.starts, math.floor(end) + 1, lo=lo)
+
+    def range(self, start: float, end: float) -> List[int]:
+        """[start, end] 와 겹치는 버킷 시작 시각들"""
+        lo, hi = self.span(start, end)
+        return self.starts[lo:hi]
+
+class TrendIndex:
+    """다중 해상도 트렌드 색인 (스레드 안전하지 않음, HistoryStore 잠금 안에서 사용)"""
+
+    def __init__(self, resolutions: Tuple[int, ...] = RESOLUTIONS):
+        self.levels = [_Level(resolution) for resolution in resolutions]
+        self.count = 0
+
+    def add(self, seconds: float, value: float, label: str):
+        base = self.levels[0]
+        for level in self.levels:
+            bucket = level.bucket(level.key(seconds), level is base)
+            bucket.add(value)
+            if level is base:
+                bucket.points.append((seconds, value, label))
+        self.count += 1
+
+    def remove(self, seconds: float, value: float, label: str):
+        """점 제거 (해당 버킷만 다시 집계: 초 버킷은 점들로, 상위 버킷은 바로 아래 해상도 버킷들로)"""
+        for position, level in enumerate(self.levels):
+            start = level.key(seconds)
+            bucket = level.buckets[start]
+            bucket.count -= 1
+            bucket.total -= value
+            if bucket.count == 0:
+                level.discard(start)
+                continue
+
+            if position == 0:
+                bucket.points.remove((seconds, value, label))
+                values = [point[1] for point in bucket.points]
+                bucket.minimum, bucket.maximum = min(values), max(values)
+            elif value in (bucket.minimum, bucket.maximum):
+                child = self.levels[position - 1]
+                children = [child.buckets[key] for key in child.range(start, start + level.resolution - 1)]
+                bucket.minimum = min(item.minimum for item in children)
+                bucket.maximum = max(item.maximum for item in children)
+        self.count -= 1
+
+    def extent(self) -> Optional[Tuple[float, float]]:
+        """가장 이른/늦은 점 시각"""
+        base = self.levels[0]
+        if not self.count:
+            return None
+        first = base.buckets[base.starts[base.head]].points
+        last = base.buckets[base.starts[-1]].points
+        return min(point[0] for point in first), max(point[0] for point in last)
+
+    def _level_for(self, bucket_seconds: int) -> _Level:
+        """버킷 크기를 나누어떨어지게 하는 가장 거친 해상도"""
+        return [level for level in self.levels if bucket_seconds % level.resolution == 0][-1]
+
+    def _finest_level(self, start: float, end: float, max_points: int) -> _Level:
+        """구간의 버킷 수가 max_points * SCAN_FACTOR 이하인 가장 고운 해상도"""
+        for level in self.levels:
+            lo, hi = level.span(start, end)
+            if hi - lo <= max_points * SCAN_FACTOR:
+                return level
+        return self.levels[-1]
+
+    def _upper_bound(self, start: float, end: float, max_points: int) -> int:
+        """구간의 점 수 상한 (구간과 겹치는 버킷들의 개수 합)"""
+        level = self._finest_level(start, end, max_points)
+        return sum(level.buckets[key].count for key in level.range(start, end))
+
+    def raw(self, start: float, end: float) -> List[Dict[str, Any]]:
+        """구간의 모든 점 (시각 순서)"""
+        base = self.levels[0]
+        points = [point for key in base.range(start, end) for point in base.buckets[key].points
+                  if start <= point[0] <= end]
+        points.sort(key=lambda point: point[0])
+        return [{'time': label, 'value': value} for _, value, label in points]
+
+    def aggregate(self, start: float, end: float, bucket_seconds: int) -> List[Dict[str, Any]]:
+        """버킷별 개수/평균/최소/최대 (구간은 버킷 경계로 넓혀짐)"""
+        level = self._level_for(bucket_seconds)
+        first = math.floor(start / bucket_seconds) * bucket_seconds
+        last = math.floor(end / bucket_seconds) * bucket_seconds + bucket_seconds - 1
+        merged: Dict[int, List[float]] = {}
+        for key in level.range(first, last):
+            source = level.buckets[key]
+            target = int(key // bucket_seconds) * bucket_seconds
+            if target in merged:
+                item = merged[target]
+                item[0] += source.count
+                item[1] += source.total
+                item[2] = min(item[2], source.minimum)
+                item[3] = max(item[3], source.maximum)
+            else:
+                merged[target] = [source.count, source.total, source.minimum, source.maximum]
+
+        return [
+            {'time': format_time(key), 'count': int(count), 'mean': total / count, 'min': minimum, 'max': maximum}
+            for key, (count, total, minimum, maximum) in merged.items()
+        ]
+
+    def lttb(self, start: float, end: float, max_points: int) -> List[Dict[str, Any]]:
+        """
+        LTTB 축약 시계열
+
+        버킷 수가 max_points 의 SCAN_FACTOR 배 이하인 가장 고운 해상도의 버킷 평균을 입력으로 쓰므로
+        비용은 구간 길이와 무관하다. 그 해상도의 버킷이 max_points 보다 적으면 점도 그만큼만 반환한다.
+        """
+        level = self._finest_level(start, end, max_points)
+        half = level.resolution / 2
+        source = []
+        for key in level.range(start, end):
+            bucket = level.buckets[key]
+            source.append((key + half, bucket.total / bucket.count))
+        return [{'time': format_time(seconds), 'value': value} for seconds, value in lttb(source, max_points)]
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None, bucket_seconds: Optional[int] = None,
+              max_points: int = 1000, mode: str = 'minmax') -> Dict[str, Any]:
+        """
+        트렌드 조회
+
+        Args:
+            start, end: 구간 (유닉스 초, None 이면 색인의 처음/끝)
+            bucket_seconds: 버킷 크기 (None 이면 점 수가 max_points 이하일 때 원본 점, 아니면 자동 선택)
+            max_points: 반환할 최대 점 수 (버킷 크기가 작아 넘치면 더 큰 후보 크기로 넓힘)
+            mode: 'minmax' (버킷별 최소/평균/최대) 또는 'lttb'
+
+        Returns:
+            Dict: mode('raw', 'minmax', 'lttb'), bucket_seconds, start, end, points
+        """
+        if mode not in ('minmax', 'lttb'):
+            raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+        if max_points < 3:
+            raise ValueError("max_points 는 3 이상이어야 합니다.")
+
+        extent = self.extent()
+        if extent is None:
+            return {'mode': 'raw', 'bucket_seconds': None, 'start': None, 'end': None, 'points': []}
+        start = extent[0] if start is None else start
+        end = extent[1] if end is None else end
+        if start > end:
+            raise ValueError("시작 시각이 끝 시각보다 늦습니다.")
+        result = {'start': format_time(start), 'end': format_time(end)}
+
+        if bucket_seconds is None and self._upper_bound(start, end, max_points) <= max_points:
+            return {**result, 'mode': 'raw', 'bucket_seconds': None, 'points': self.raw(start, end)}
+
+        if mode == 'lttb':
+            return {**result, 'mode': 'lttb', 'bucket_seconds': None, 'points': self.lttb(start, end, max_points)}
+
+        # 버킷 경계로 넓힌 구간의 버킷 수가 max_points 를 넘지 않는 가장 작은 크기
+        minimum = bucket_seconds or 1
+        for candidate in (minimum,) + tuple(size for size in NICE_BUCKETS if size > minimum):
+            if (math.floor(end / candidate) - math.floor(start / candidate) + 1) <= max_points:
+                bucket_seconds = candidate
+                break
+        else:
+            bucket_seconds = NICE_BUCKETS[-1]
+        return {**result, 'mode': 'minmax', 'bucket_seconds': bucket_seconds,
+                'points': self.aggregate(start, end, bucket_seconds)}
+
+def lttb(points: List[Tuple[float, float]], threshold: int) -> List[Tuple[float, float]]:
+    """Largest-Triangle-Three-Buckets 축약 (처음/끝 점은 항상 포함, x 기준 정렬된 입력)"""
+    if threshold >= len(points) or threshold < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    every = (len(points) - 2) / (threshold - 2)
+    selected = 0
+    for i in range(threshold - 2):
+        # 다음 버킷의 평균 점
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, len(points))
+        window = points[next_start:next_end]
+        average_x = sum(point[0] for point in window) / len(window)
+        average_y = sum(point[1] for point in window) / len(window)
+
+        # 현재 버킷에서 (선택된 점, 다음 버킷 평균) 과 만드는 삼각형이 가장 큰 점
+        ax, ay = points[selected]
+        best, best_area = None, -1.0
+        for index in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            x, y = points[index]
+            area = abs((ax - average_x) * (y - ay) - (ax - x) * (average_y - ay))
+            if area > best_area:
+                best, best_area = index, area
+        sampled.append(points[best])
+        selected = best
+
+    sampled.append(points[-1])
+    return sampled